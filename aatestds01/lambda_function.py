@@ -3,6 +3,8 @@ from datetime import datetime, timedelta, time
 import re
 import logging
 
+from holidayrules import holidays_for
+
 s3 = boto3.client('s3')
 sns = boto3.client('sns')
 sns_topic_arn = 'arn:aws:sns:ca-central-1:507525864454:aatesttopic' 
@@ -53,45 +55,9 @@ file_slo_mapping = {
     }
 }
 
-# Define US public holidays for the relevant year(s)
-us_public_holidays = {
-    2025: [
-        datetime(2025, 1, 1),   # New Year's Day
-        datetime(2025, 1, 20),  # Martin Luther King Jr. Day
-        datetime(2025, 2, 17),  # Presidents' Day
-        datetime(2025, 5, 26),  # Memorial Day
-        datetime(2025, 6, 19),  # Juneteenth
-        datetime(2025, 7, 4),   # Independence Day
-        datetime(2025, 9, 1),   # Labor Day
-        datetime(2025, 10, 13), # Columbus Day
-        datetime(2025, 11, 11), # Veterans Day
-        datetime(2025, 11, 27), # Thanksgiving Day
-        datetime(2025, 12, 25), # Christmas Day
-    ],
-    # Add more years as needed
-}
-
-# Define Canadian holidays for 2025
-canadian_holidays_2025 = {
-    2025: [
-        datetime(2025, 1, 1),   # New Year's Day
-        datetime(2025, 1, 2),   # New Year's Day Observed in Quebec (since Jan 1 is a Wednesday)
-        datetime(2025, 2, 17),  # Family Day (example for some provinces, adjust as necessary)
-        datetime(2025, 4, 18),  # Good Friday
-        datetime(2025, 5, 19),  # Victoria Day
-        datetime(2025, 7, 1),   # Canada Day
-        datetime(2025, 8, 4),   # Civic Holiday
-        datetime(2025, 9, 1),   # Labour Day
-        datetime(2025, 9, 30),  # National Day for Truth and Reconciliation
-        datetime(2025, 10, 13), # Thanksgiving
-        datetime(2025, 12, 25), # Christmas Day
-        datetime(2025, 12, 26), # Boxing Day
-    ]
-}
-
 def is_holiday(date, holidays):
-    """Check if a date is a holiday."""
-    return date in holidays
+    """Check if a date (or datetime) is a holiday."""
+    return (date.date() if isinstance(date, datetime) else date) in holidays
 
 def is_business_day(date, holidays):
     """Check if a date is a business day (Monday to Friday and not a holiday)."""
@@ -244,10 +210,9 @@ def lambda_handler(event, context):
     use_canadian_holidays = event.get('useCanadianHolidays', False)
     year = datetime.now().year
     
-    if use_canadian_holidays:
-        holidays = canadian_holidays_2025.get(year, [])
-    else:
-        holidays = us_public_holidays.get(year, [])
+    # US federal or the Canadian business calendar from the rules in
+    # holidayrules.py (packaged next to this file), for any year.
+    holidays = holidays_for('CA' if use_canadian_holidays else 'US', year)
     
     # Use these holidays for checking business days
     check_monthly_files(holidays)
@@ -0,0 +1,145 @@
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from ratelimit import TokenBucket
+from s3state import QueuedRecorder, S3JsonState
+
+logger = logging.getLogger(__name__)
+
+# SNS alert digests for the SLO checker.
+#
+# Alerts raised during an invocation are queued with add() and sent by
+# flush() at the end of it. Each alert has a dedupe key, e.g.
+# 'FILE_202503.dat.pgp:missing'. Keys already sent, according to the state
+# store, are suppressed, so a missing file pages once instead of on every
+# 5-minute run. The remaining alerts are coalesced into one digest per topic
+# (split when a digest would exceed max_message_bytes) and sent with
+# publish_batch, ten entries per call, paced by a token bucket.
+
+SNS_BATCH_ENTRIES = 10
+SNS_BATCH_BYTES = 256 * 1024
+SNS_SUBJECT_CHARS = 100
+
+
+class S3AlertState(S3JsonState):
+    # Sent alerts as {dedupe key: ISO UTC time}. A lost write can send an
+    # alert twice, never drop one.
+
+    def load(self):
+        return self.read() or {}
+
+    def save(self, sent):
+        self.write(sent)
+
+
+class AlertDispatcher(QueuedRecorder):
+    # Collects alerts for one invocation and sends them as SNS digests.
+
+    def __init__(self, sns, rate=10.0, burst=10, realert_after=None,
+                 retention=timedelta(days=45), max_message_bytes=24 * 1024,
+                 subject="File Arrival Alert"):
+        super().__init__()
+        self.sns = sns
+        self.bucket = TokenBucket(rate, burst)
+        # Send a suppressed alert again once this much time has passed; None
+        # means once per dedupe key until it expires from the state.
+        self.realert_after = realert_after
+        self.retention = retention
+        self.max_message_bytes = max_message_bytes
+        self.subject = subject
+
+    def add(self, topic_arn, message, dedupe_key=None):
+        # Queue an alert. Repeats within the invocation collapse to one.
+        key = dedupe_key if dedupe_key is not None else message
+        self._pending.setdefault((topic_arn, key), message)
+
+    def _digests(self, lines):
+        # Split alert lines into digest bodies no larger than max_message_bytes.
+        digests = []
+        current = []
+        size = 0
+        for line in lines:
+            line_size = len(line.encode('utf-8')) + 1
+            if current and size + line_size > self.max_message_bytes:
+                digests.append(current)
+                current, size = [], 0
+            current.append(line)
+            size += line_size
+        if current:
+            digests.append(current)
+        return digests
+
+    def _batches(self, entries):
+        # Group publish_batch entries by the SNS count and payload limits.
+        batch, size = [], 0
+        for entry in entries:
+            entry_size = len(entry['Message'].encode('utf-8')) + len(entry['Subject'].encode('utf-8'))
+            if batch and (len(batch) == SNS_BATCH_ENTRIES or size + entry_size > SNS_BATCH_BYTES):
+                yield batch
+                batch, size = [], 0
+            batch.append(entry)
+            size += entry_size
+        if batch:
+            yield batch
+
+    def flush(self, state=None, now=None):
+        # Send everything queued and clear the queue. state is an
+        # S3AlertState (or anything with load/save) used to skip alerts sent
+        # by earlier invocations; without it every queued alert is sent.
+        # Returns counts of alerts sent, suppressed and failed, and API calls.
+        now = now or datetime.now(timezone.utc)
+        pending = self._take()
+        result = {'sent': 0, 'suppressed': 0, 'failed': 0, 'publish_calls': 0}
+        if not pending:
+            return result
+
+        sent = state.load() if state is not None else {}
+        by_topic = OrderedDict()
+        for (topic_arn, key), message in pending.items():
+            previous = sent.get(key)
+            if previous is not None:
+                age = now - datetime.fromisoformat(previous)
+                if self.realert_after is None or age < self.realert_after:
+                    result['suppressed'] += 1
+                    continue
+            by_topic.setdefault(topic_arn, []).append((key, message))
+
+        for topic_arn, alerts in by_topic.items():
+            entries = []
+            keys = {}
+            for digest in self._digests([message for _, message in alerts]):
+                entry_id = str(len(entries))
+                count = len(digest)
+                entries.append({
+                    'Id': entry_id,
+                    'Subject': f"{self.subject}: {count} file{'s' if count != 1 else ''}"[:SNS_SUBJECT_CHARS],
+                    'Message': '\n'.join(digest),
+                })
+                keys[entry_id] = [key for key, _ in alerts[:count]]
+                alerts = alerts[count:]
+            for batch in self._batches(entries):
+                self.bucket.acquire()
+                result['publish_calls'] += 1
+                try:
+                    response = self.sns.publish_batch(TopicArn=topic_arn, PublishBatchRequestEntries=batch)
+                except Exception:
+                    # Left unmarked, so the next invocation tries again.
+                    logger.exception(f"Failed to publish {len(batch)} alert digests to {topic_arn}")
+                    result['failed'] += sum(len(keys[entry['Id']]) for entry in batch)
+                    continue
+                for success in response.get('Successful', []):
+                    for key in keys[success['Id']]:
+                        sent[key] = now.isoformat()
+                        result['sent'] += 1
+                for failure in response.get('Failed', []):
+                    logger.info(f"SNS rejected alert digest {failure['Id']}: {failure.get('Message')}")
+                    result['failed'] += len(keys[failure['Id']])
+
+        if state is not None:
+            cutoff = now - self.retention
+            kept = {key: when for key, when in sent.items() if datetime.fromisoformat(when) >= cutoff}
+            # Runs that only suppressed alerts leave the state untouched.
+            if result['sent'] or len(kept) != len(sent):
+                state.save(kept)
+        return result
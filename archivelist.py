@@ -0,0 +1,177 @@
+import heapq
+import queue
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Parallel, keyspace-partitioned listing of large S3 prefixes.
+#
+# One list_objects_v2 paginator walks an archive of millions of keys one
+# page (1000 keys, one round trip) at a time. ParallelLister splits the
+# keyspace into disjoint partitions, lists them concurrently and merges the
+# pages back into a single stream in key order. Partitions come from:
+#
+#   prefix_partitions  the literal prefixes of the file_slo_mapping.json
+#                      patterns (archive/L1_, archive/BCL_, ...), cut short
+#                      enough to keep the number of partitions bounded, so
+#                      keys no rule could match are never listed
+#   range_partitions   ranges of keys between split points, for listings
+#                      that are not driven by the patterns; the split
+#                      points should follow how the keys are distributed
+#
+# Each partition is (prefix, start, end): keys under prefix, after start
+# (like StartAfter) and up to end inclusive, either of which may be None.
+# Each page is one task on a pool of `workers` threads, and a partition
+# queues its next page as soon as the last one arrives, so a slow partition
+# does not stall the others. With max_buffered_pages set, a partition
+# holding that many pages stops fetching until the merge takes one; no
+# worker ever waits on a full buffer, so partitions not started yet still
+# get a thread when there are more partitions than workers.
+
+Partition = namedtuple('Partition', 'prefix start end')
+Partition.__new__.__defaults__ = (None, None)
+
+# Default split points for range_partitions, after the listed prefix.
+DEFAULT_BOUNDARIES = ('0', 'A', 'E', 'I', 'M', 'Q', 'U', 'a')
+
+_DONE = object()
+
+
+def prefix_partitions(patterns, prefix='archive/', max_partitions=64):
+    # Partitions by the literal prefixes of the patterns, cut to the longest
+    # length that gives at most max_partitions of them, and leaving out
+    # prefixes that extend another one so the partitions are disjoint. A
+    # pattern starting with '*' needs the whole prefix.
+    literals = {pattern.partition('*')[0] for pattern in patterns}
+    longest = max(map(len, literals), default=0)
+    cut = longest
+    while cut > 0 and len({literal[:cut] for literal in literals}) > max_partitions:
+        cut -= 1
+    kept = []
+    for literal in sorted({literal[:cut] for literal in literals}):
+        if kept and literal.startswith(kept[-1]):
+            continue
+        kept.append(literal)
+    return [Partition(prefix + literal) for literal in kept]
+
+
+def range_partitions(prefix='archive/', boundaries=DEFAULT_BOUNDARIES):
+    # Partitions split at prefix + each boundary: (None, b0], (b0, b1], ...
+    # (bn, None). Together they cover every key under prefix exactly once.
+    bounds = [None] + [prefix + boundary for boundary in sorted(boundaries)] + [None]
+    return [Partition(prefix, start, end) for start, end in zip(bounds, bounds[1:])]
+
+
+class ParallelLister(object):
+    # Lists partitions of a bucket concurrently and merges them by key.
+
+    def __init__(self, s3, bucket_name, workers=8, page_size=1000, key_filter=None,
+                 max_buffered_pages=None):
+        self.s3 = s3
+        self.bucket_name = bucket_name
+        self.workers = workers
+        self.page_size = page_size
+        # Objects whose key fails key_filter are dropped from the stream.
+        self.key_filter = key_filter
+        self.max_buffered_pages = max_buffered_pages
+        self.calls = 0
+        self.listed = 0
+        self._lock = threading.Lock()
+
+    def list(self, partitions):
+        # Yield list_objects_v2 Contents entries of every partition in key order.
+        partitions = list(partitions)
+        if not partitions:
+            return
+        stop = threading.Event()
+        limit = self.max_buffered_pages or float('inf')
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(partitions))) as pool:
+            streams = [_PartitionStream(self, pool, partition, limit, stop) for partition in partitions]
+            for stream in streams:
+                stream.schedule()
+            try:
+                for obj in heapq.merge(*(stream.objects() for stream in streams), key=lambda obj: obj['Key']):
+                    yield obj
+            finally:
+                stop.set()
+
+    def _page(self, partition, kwargs):
+        # Fetch the next page of a partition. Returns (kept objects, done) and
+        # moves kwargs on to the following page.
+        response = self.s3.list_objects_v2(**kwargs)
+        contents = response.get('Contents', [])
+        with self._lock:
+            self.calls += 1
+            self.listed += len(contents)
+        done = not response.get('NextContinuationToken')
+        if partition.end is not None and contents and contents[-1]['Key'] > partition.end:
+            contents = [obj for obj in contents if obj['Key'] <= partition.end]
+            done = True
+        if self.key_filter is not None:
+            contents = [obj for obj in contents if self.key_filter(obj['Key'])]
+        if not done:
+            kwargs['ContinuationToken'] = response['NextContinuationToken']
+        return contents, done
+
+
+class _PartitionStream(object):
+    # One partition's pages: fetched one task at a time on the lister's pool,
+    # at most `limit` of them waiting for the merge.
+
+    def __init__(self, lister, pool, partition, limit, stop):
+        self.lister = lister
+        self.pool = pool
+        self.partition = partition
+        self.limit = limit
+        self.stop = stop
+        self.kwargs = {'Bucket': lister.bucket_name, 'Prefix': partition.prefix, 'MaxKeys': lister.page_size}
+        if partition.start is not None:
+            self.kwargs['StartAfter'] = partition.start
+        self.buffer = queue.Queue()
+        self.buffered = 0
+        self.paused = False
+        self.lock = threading.Lock()
+
+    def schedule(self):
+        if self.stop.is_set():
+            return
+        try:
+            self.pool.submit(self._fetch)
+        except RuntimeError:
+            pass  # the pool is shutting down after the merge stopped
+
+    def _fetch(self):
+        if self.stop.is_set():
+            return
+        try:
+            contents, done = self.lister._page(self.partition, self.kwargs)
+        except Exception as e:
+            self.buffer.put(e)
+            return
+        if contents:
+            with self.lock:
+                self.buffered += 1
+            self.buffer.put(contents)
+        if done:
+            self.buffer.put(_DONE)
+            return
+        with self.lock:
+            self.paused = self.buffered >= self.limit
+            if self.paused:
+                return
+        self.schedule()
+
+    def objects(self):
+        # The partition's objects in key order, resuming fetches as pages are taken.
+        while True:
+            item = self.buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            with self.lock:
+                self.buffered -= 1
+                resume, self.paused = self.paused, False
+            if resume:
+                self.schedule()
+            yield from item
@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta, timezone
+
+from archivelist import ParallelLister, Partition
+from keymatcher import KeyMatcher
+from s3state import S3JsonState
+
+# Incremental arrival tracking for the archive/ prefix.
+#
+# Instead of a head_object per due file on every run, the poll can keep an
+# arrival index: {s3 key: LastModified} for the archive objects seen
+# recently, persisted as one JSON object in the config bucket together with
+# a StartAfter cursor per listed prefix and a watermark (the newest
+# LastModified seen). A run lists only where a due file is still
+# outstanding, and only the keys after the cursor, so files that already
+# arrived cost nothing and the S3 cost follows the new arrivals rather than
+# the size of the archive. Two archive layouts are supported:
+#
+#   sorted  keys sort in arrival order (e.g. archive/2025/03/20/...). One
+#           listing of archive/ after the last key seen.
+#   window  feed-first names ending in the file date, as in
+#           file_slo_mapping.json. One listing per pattern prefix, after
+#           the last dated key seen for it, but never before the first date
+#           inside `window` of the watermark. It stops at the first key whose
+#           date part is not a number (a longer feed name). The prefixes are
+#           listed concurrently (see archivelist.py).
+#
+# A file dated before the newest one already seen for its prefix is not
+# listed (nor, in the sorted layout, an object rewritten under an existing
+# key). Neither matters to the poll: due files are dated this month or
+# today. Entries whose LastModified is older than `retention` are dropped,
+# which keeps the index at about a month of arrivals.
+
+LAYOUTS = ('sorted', 'window')
+
+
+class ArrivalIndex(object):
+    # Seen archive keys, the listing cursors and the watermark.
+
+    def __init__(self, keys=None, cursors=None, watermark=None):
+        self.keys = keys if keys is not None else {}
+        self.cursors = cursors if cursors is not None else {}
+        self.watermark = watermark
+        self.changed = False
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.keys
+
+    def get(self, key):
+        # LastModified of key as an aware datetime, or None if never seen.
+        value = self.keys.get(key)
+        return datetime.fromisoformat(value) if value is not None else None
+
+    def merge(self, key, last_modified):
+        value = last_modified.astimezone(timezone.utc).isoformat()
+        if self.keys.get(key) != value:
+            self.keys[key] = value
+            self.changed = True
+        if self.watermark is None or value > self.watermark:
+            self.watermark = value
+
+    def advance(self, prefix, key):
+        if key > self.cursors.get(prefix, ''):
+            self.cursors[prefix] = key
+            self.changed = True
+
+    def expire(self, before):
+        # Drop entries that last changed before `before`.
+        cutoff = before.astimezone(timezone.utc).isoformat()
+        stale = [key for key, value in self.keys.items() if value < cutoff]
+        for key in stale:
+            del self.keys[key]
+        self.changed = self.changed or bool(stale)
+        return len(stale)
+
+    def to_json(self):
+        return {'keys': self.keys, 'cursors': self.cursors, 'watermark': self.watermark}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data.get('keys', {}), data.get('cursors', {}), data.get('watermark'))
+
+
+class S3ArrivalIndexStore(S3JsonState):
+    # An ArrivalIndex in S3. A lost write's arrivals are listed again next run.
+
+    def load(self):
+        data = self.read()
+        return ArrivalIndex.from_json(data) if data is not None else ArrivalIndex()
+
+    def save(self, index):
+        self.write(index.to_json())
+        index.changed = False
+
+
+class ArrivalTracker(object):
+    # Lists the new objects under prefix and merges them into an index.
+
+    def __init__(self, s3, bucket_name, patterns=(), layout='window', prefix='archive/',
+                 window=timedelta(days=62), retention=timedelta(days=40), page_size=1000, workers=8):
+        if layout not in LAYOUTS:
+            raise ValueError(f"Unknown archive layout {layout!r}; expected one of {LAYOUTS}")
+        self.s3 = s3
+        self.bucket_name = bucket_name
+        self.layout = layout
+        self.prefix = prefix
+        self.window = window
+        self.retention = retention
+        self.page_size = page_size
+        self.workers = workers
+        # Date digits per literal pattern prefix: 6 (YYYYMM) for monthly
+        # files, 8 (YYYYMMDD) for daily ones. A prefix shared by both is
+        # listed once, from the earlier start.
+        self.digits = {}
+        self.matcher = KeyMatcher()
+        for pattern in patterns:
+            literal, star, _ = pattern.partition('*')
+            if star:
+                digits = 6 if "dat.pgp" in pattern else 8
+                self.digits[literal] = min(self.digits.get(literal, digits), digits)
+                self.matcher.add(pattern)
+
+    def refresh(self, index, now, wanted=None):
+        # Merge new arrivals into index; return counts of listed objects,
+        # list calls and expired entries. With `wanted` (keys the caller is
+        # about to look up), only prefixes with a wanted key missing from the
+        # index are listed.
+        outstanding = None
+        if wanted is not None:
+            outstanding = [key for key in wanted if key not in index]
+        if self.layout == 'sorted':
+            listed, calls = self._list_sorted(index) if outstanding != [] else (0, 0)
+        else:
+            literals = sorted(self.digits)
+            if outstanding is not None:
+                literals = sorted({literal for literal in map(self._literal_of, outstanding)
+                                   if literal is not None})
+            listed, calls = self._list_window(index, now, literals)
+        expired = index.expire(now - self.retention)
+        return {'listed': listed, 'list_calls': calls, 'expired': expired, 'indexed': len(index)}
+
+    def _literal_of(self, key):
+        if not key.startswith(self.prefix):
+            return None
+        matched = self.matcher.match(key[len(self.prefix):])
+        return matched[0].partition('*')[0] if matched else None
+
+    def _pages(self, **kwargs):
+        token = None
+        while True:
+            if token:
+                kwargs['ContinuationToken'] = token
+            response = self.s3.list_objects_v2(Bucket=self.bucket_name, MaxKeys=self.page_size, **kwargs)
+            yield response.get('Contents', [])
+            token = response.get('NextContinuationToken')
+            if not token:
+                return
+
+    def _list_sorted(self, index):
+        listed = calls = 0
+        kwargs = {'Prefix': self.prefix}
+        if self.prefix in index.cursors:
+            kwargs['StartAfter'] = index.cursors[self.prefix]
+        for contents in self._pages(**kwargs):
+            calls += 1
+            for obj in contents:
+                index.merge(obj['Key'], obj['LastModified'])
+                listed += 1
+            if contents:
+                index.advance(self.prefix, contents[-1]['Key'])
+        return listed, calls
+
+    def _list_window(self, index, now, literals):
+        since = now
+        if index.watermark is not None:
+            since = min(since, datetime.fromisoformat(index.watermark))
+        window_start = (since - self.window).strftime('%Y%m%d')
+        partitions = []
+        for literal in literals:
+            list_prefix = self.prefix + literal
+            start = max(list_prefix + window_start[:self.digits[literal]], index.cursors.get(list_prefix, ''))
+            # Keys up to list_prefix + ':' continue with a digit: past them
+            # are longer feed names, listed by their own partitions.
+            partitions.append(Partition(list_prefix, start, list_prefix + ':'))
+        lister = ParallelLister(self.s3, self.bucket_name, self.workers, self.page_size)
+        listed = 0
+        literals = set(literals)
+        for obj in lister.list(partitions):
+            index.merge(obj['Key'], obj['LastModified'])
+            literal = self._literal_of(obj['Key'])
+            if literal is not None and literal in literals:
+                index.advance(self.prefix + literal, obj['Key'])
+            listed += 1
+        return listed, lister.calls
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+from collections import Counter
+
+from lambda_function import note_arrival, put_cloudwatch_metric_counts
+from ratelimit import AsyncLimitedClient, limiter_for
+
+logger = logging.getLogger(__name__)
+
+# asyncio engine for the scheduled check (event engine='async').
+#
+# lambda_handler works out the due files with due_monthly_files() and
+# due_daily_files(), as the sync engine does. This engine then drives
+# head_object and tagging for all of them through one async S3 client, with
+# at most `concurrency` requests in flight. Every result goes through
+# lambda_function.note_arrival(), as in the sync engine's record_arrival();
+# only the tagging is awaited here.
+# Metrics are counted per (name, reason) and sent in one put_metric_data
+# call per 1000 datums at the end, instead of one call per file. S3 calls
+# share the sync clients' S3 rate limiter (see ratelimit.py).
+#
+# When the Lambda context says time is running out (less than
+# safety_margin_ms left), files not yet checked are cancelled. The next
+# scheduled run picks them up.
+
+
+def aiobotocore_s3():
+    # Async context manager yielding an aiobotocore S3 client.
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+    # Throttles and transient errors are retried by the rate limiter, not botocore.
+    return get_session().create_client('s3', config=AioConfig(retries={'total_max_attempts': 1}))
+
+
+# Called for each run to open the S3 client. Benchmarks swap in
+# fakeaws.FakeClients.async_s3.
+S3_CLIENT_FACTORY = aiobotocore_s3
+
+async def _check_file(client, semaphore, due, bucket_name, sns_topic_arn, record_arrivals, metrics,
+                      arrivals=None):
+    metric_prefix, expected_file_name, s3_key, expected_arrival_time = due
+    async with semaphore:
+        if arrivals is not None and s3_key in arrivals:
+            last_modified = arrivals[s3_key]
+        else:
+            try:
+                file_metadata = await client.head_object(Bucket=bucket_name, Key=s3_key)
+                last_modified = file_metadata['LastModified']
+            except client.exceptions.ClientError as e:
+                if e.response['Error']['Code'] != '404':
+                    logger.info(f"Error checking file {expected_file_name}: {e}")
+                    return
+                last_modified = None
+        if last_modified is not None and not record_arrivals:
+            return
+        status, metric_name, reason = note_arrival(metric_prefix, s3_key, expected_file_name, last_modified,
+                                                   expected_arrival_time, sns_topic_arn)
+        if status is not None:
+            await client.put_object_tagging(
+                Bucket=bucket_name, Key=s3_key,
+                Tagging={'TagSet': [{'Key': 'slo_status', 'Value': status}]})
+        metrics[metric_name, reason] += 1
+
+
+async def run_checks(due, bucket_name, sns_topic_arn, record_arrivals=True, concurrency=64,
+                     context=None, safety_margin_ms=5000, arrivals=None):
+    # Check every due file; return counts of files checked and cancelled.
+    # Files in arrivals (from the arrival index or a partition probe) are
+    # not looked up with head_object.
+    semaphore = asyncio.Semaphore(concurrency)
+    metrics = Counter()
+    async with S3_CLIENT_FACTORY() as raw_client:
+        client = AsyncLimitedClient(raw_client, limiter_for('s3'))
+        tasks = [asyncio.ensure_future(_check_file(client, semaphore, item, bucket_name, sns_topic_arn,
+                                                   record_arrivals, metrics, arrivals))
+                 for item in due]
+        timeout = None
+        if context is not None:
+            timeout = max(0, context.get_remaining_time_in_millis() - safety_margin_ms) / 1e3
+        done, pending = await asyncio.wait(tasks, timeout=timeout) if tasks else (set(), set())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        if task.exception() is not None:
+            logger.error(f"File check failed: {task.exception()!r}")
+    if pending:
+        logger.info(f"Lambda time is running out. Cancelled {len(pending)} of {len(tasks)} file checks.")
+    put_cloudwatch_metric_counts(metrics)
+    return {'checked': len(done), 'cancelled': len(pending)}
+
+
+def check_files(due, bucket_name, sns_topic_arn, record_arrivals=True, concurrency=64, context=None,
+                arrivals=None):
+    # Sync entry point for lambda_handler.
+    return asyncio.run(run_checks(list(due), bucket_name, sns_topic_arn, record_arrivals, concurrency, context,
+                                  arrivals=arrivals))
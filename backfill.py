@@ -0,0 +1,283 @@
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from urllib.parse import unquote
+
+import pytz
+
+from deadlines import deadline_columns, deadline_keys, deadline_rows, open_output
+from lambda_function import DEFAULT_TIMEZONE, get_holidays
+
+# Historical SLO backfill.
+#
+# Evaluates every deadline in a date range against a bulk listing of the
+# bucket instead of one head_object per file. The listing is either an S3
+# Inventory report (its manifest.json, local or s3://, with CSV or Parquet
+# data files) or a local CSV with 'key' and 'last_modified' columns. Every
+# listing file is streamed once, in a process pool, keeping only the keys
+# some deadline expects. Uncompressed CSV files are split into byte ranges
+# of about chunk_bytes, so a single large listing is read by every worker;
+# gzipped and Parquet files cannot be split and are one work item each.
+# Holidays come from holidays.json where it lists the year, as in the
+# checker, and deadlines are the checker's aware UTC ones.
+#
+#     PYTHONPATH=python python backfill.py --start 2025-01-01 --end 2025-12-31 \
+#         --inventory s3://inventory-bucket/myaatest01/archive/2025-12-31T01-00Z/manifest.json
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Keys a worker is looking for, set by the pool initializer.
+_expected_keys = None
+
+# boto3 S3 client of this process, created on first use.
+_s3_client = None
+
+def _init_worker(expected_keys):
+    global _expected_keys
+    _expected_keys = expected_keys
+
+def _s3():
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+        _s3_client = boto3.client('s3')
+    return _s3_client
+
+def _split_s3_url(url):
+    return url[len('s3://'):].split('/', 1)
+
+def _source_size(path):
+    if path.startswith('s3://'):
+        bucket, key = _split_s3_url(path)
+        return _s3().head_object(Bucket=bucket, Key=key)['ContentLength']
+    return os.path.getsize(path)
+
+def _open_source(path, start=0):
+    # Binary stream for a local path or an s3://bucket/key URL, from byte
+    # start on. S3 objects are streamed (a ranged GET when start is set).
+    if path.startswith('s3://'):
+        bucket, key = _split_s3_url(path)
+        extra = {'Range': f'bytes={start}-'} if start else {}
+        return _s3().get_object(Bucket=bucket, Key=key, **extra)['Body']
+    f = open(path, 'rb')
+    f.seek(start)
+    return f
+
+def _lines(stream, size=1024 * 1024):
+    # Lines of a binary stream, newline included, reading size bytes at a time.
+    pending = b''
+    while True:
+        block = stream.read(size)
+        if not block:
+            break
+        lines = (pending + block).split(b'\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + b'\n'
+    if pending:
+        yield pending
+
+def _range_lines(path, start, end):
+    # Lines starting at a byte offset in [start, end). A line that starts
+    # before start belongs to the previous range and one that starts before
+    # end is read to its end, so ranges split a file without overlap.
+    stream = _open_source(path, max(start - 1, 0))
+    lines = _lines(stream)
+    position = 0
+    if start:
+        # Skip the rest of the line holding byte start - 1; when that byte
+        # is a newline, a line starts exactly at start and is kept.
+        position = start - 1 + len(next(lines, b''))
+    try:
+        for line in lines:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            yield line
+    finally:
+        stream.close()
+
+def _text_rows(path, start=0, end=None):
+    # CSV rows from a (possibly gzipped) local or S3 file, or from the
+    # lines starting in the byte range [start, end) of an uncompressed one.
+    # Listing keys are URL-encoded or plain keys without newlines, so rows
+    # never span lines.
+    if path.endswith('.gz'):
+        lines = _lines(gzip.GzipFile(fileobj=_open_source(path)))
+    else:
+        lines = _range_lines(path, start, end)
+    return csv.reader(line.decode('utf-8') for line in lines)
+
+def parse_last_modified(value):
+    # Inventory and manifest timestamps are ISO 8601 UTC, e.g. 2025-03-10T14:22:05.000Z.
+    value = value.strip().replace('Z', '+00:00')
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=pytz.utc)
+    return parsed.astimezone(pytz.utc)
+
+def scan_listing_file(source):
+    # Worker: stream one listing file, or one byte range of it, returning
+    # {key: latest LastModified} for the expected keys only. source is
+    # (path, format, key column, last-modified column, has header,
+    # url-encoded keys, start, end); end is None to read to the end. CSV
+    # columns are indices; with a header, the range at 0 skips it.
+    path, file_format, key_column, modified_column, has_header, encoded, start, end = source
+    arrivals = {}
+    if file_format == 'Parquet':
+        import pyarrow.parquet as pq
+        # Parquet needs random access to its footer, so it is read whole.
+        table = pq.read_table(io.BytesIO(_open_source(path).read()), columns=[key_column, modified_column])
+        rows = zip(table.column(key_column).to_pylist(), table.column(modified_column).to_pylist())
+    else:
+        reader = _text_rows(path, start, end)
+        if has_header and start == 0:
+            next(reader, None)
+        rows = ((row[key_column], row[modified_column]) for row in reader if row)
+    expected_keys = _expected_keys
+    for key, last_modified in rows:
+        if encoded:
+            key = unquote(key)
+        if key not in expected_keys:
+            continue
+        if not isinstance(last_modified, datetime):
+            last_modified = parse_last_modified(last_modified)
+        elif last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=pytz.utc)
+        if key not in arrivals or last_modified > arrivals[key]:
+            arrivals[key] = last_modified
+    return arrivals
+
+def listing_sources(inventory, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    # Work items for scan_listing_file() from an inventory manifest.json or
+    # a local key,last_modified CSV.
+    if not inventory.endswith('manifest.json'):
+        header = next(_text_rows(inventory, 0, 1))
+        source = (inventory, 'CSV', header.index('key'), header.index('last_modified'), True, False)
+        return split_source(source, chunk_bytes)
+    with _open_source(inventory) as f:
+        manifest = json.load(f)
+    schema = [field.strip() for field in manifest['fileSchema'].split(',')]
+    file_format = manifest.get('fileFormat', 'CSV')
+    if file_format == 'CSV':
+        key_column, modified_column = schema.index('Key'), schema.index('LastModifiedDate')
+    else:
+        key_column, modified_column = 'key', 'last_modified_date'
+    if inventory.startswith('s3://'):
+        bucket = manifest['destinationBucket'].split(':::')[-1]
+        paths = [f"s3://{bucket}/{entry['key']}" for entry in manifest['files']]
+    else:
+        # A downloaded report keeps its data files next to manifest.json.
+        base = os.path.dirname(inventory)
+        paths = [os.path.join(base, os.path.basename(entry['key'])) for entry in manifest['files']]
+    # CSV inventories URL-encode keys; Parquet ones do not.
+    sources = []
+    for path in paths:
+        sources.extend(split_source((path, file_format, key_column, modified_column,
+                                     False, file_format == 'CSV'), chunk_bytes))
+    return sources
+
+def split_source(source, chunk_bytes):
+    # Split an uncompressed CSV listing file into byte ranges of about
+    # chunk_bytes; anything else is one work item for the whole file.
+    path, file_format = source[0], source[1]
+    if file_format != 'CSV' or path.endswith('.gz') or not chunk_bytes:
+        return [source + (0, None)]
+    size = _source_size(path)
+    return [source + (start, min(start + chunk_bytes, size)) for start in range(0, max(size, 1), chunk_bytes)]
+
+def expected_files(file_slo_mapping, start, end, holidays, as_of, zone=DEFAULT_TIMEZONE):
+    # {s3 key: (pattern, period, expected file name, deadline)} for every
+    # deadline whose local date is between start and end and that had passed
+    # by as_of (aware). Deadlines are aware UTC and keys follow each rule's
+    # key_template, as in the checker.
+    tz = pytz.timezone(zone)
+    columns = deadline_columns(file_slo_mapping, start.year, end.year, holidays, zone)
+    keys = deadline_keys(columns, file_slo_mapping, holidays, zone)
+    expected = {}
+    for pattern, period, expected_file_name, s3_key, deadline in deadline_rows(columns, keys):
+        if start <= deadline.astimezone(tz).date() <= end and deadline < as_of:
+            expected[s3_key] = (pattern, period, expected_file_name, deadline)
+    return expected
+
+def evaluate(expected, arrivals, tz):
+    # Yield (pattern, period, file, deadline, arrival, status) rows, with
+    # the deadline and arrival as aware datetimes in tz.
+    for s3_key, (pattern, period, expected_file_name, deadline) in sorted(expected.items()):
+        last_modified = arrivals.get(s3_key)
+        if last_modified is None:
+            yield pattern, period, expected_file_name, deadline.astimezone(tz), None, 'missing'
+            continue
+        status = 'met' if last_modified <= deadline else 'late'
+        yield pattern, period, expected_file_name, deadline.astimezone(tz), last_modified.astimezone(tz), status
+
+def load_listed_holidays(path, region):
+    # The region's {year: [YYYY-MM-DD, ...]} from a holidays.json (local or
+    # s3://), as the checker reads it; {} without a path.
+    if not path:
+        return {}
+    with _open_source(path) as f:
+        data = json.load(f)
+    return data.get('ca_public_holidays' if region == 'CA' else 'us_public_holidays', {})
+
+def run_backfill(file_slo_mapping, start, end, inventory, region='CA', zone=DEFAULT_TIMEZONE,
+                 workers=None, as_of=None, listed_holidays=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    # Return the evaluated rows for every deadline between start and end
+    # that had passed by as_of (an aware datetime, default now). Years in
+    # listed_holidays use those holidays, others the region's rules.
+    tz = pytz.timezone(zone)
+    if as_of is None:
+        as_of = datetime.now(pytz.utc)
+    holidays = get_holidays(listed_holidays or {}, region, range(start.year, end.year + 2))
+    expected = expected_files(file_slo_mapping, start, end, holidays, as_of, zone)
+    sources = listing_sources(inventory, chunk_bytes)
+    arrivals = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(frozenset(expected),)) as pool:
+        for partial in pool.map(scan_listing_file, sources):
+            for key, last_modified in partial.items():
+                if key not in arrivals or last_modified > arrivals[key]:
+                    arrivals[key] = last_modified
+    return list(evaluate(expected, arrivals, tz))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate past SLO deadlines from a bucket listing.")
+    parser.add_argument('--start', required=True, type=date.fromisoformat)
+    parser.add_argument('--end', required=True, type=date.fromisoformat)
+    parser.add_argument('--inventory', required=True,
+                        help="S3 Inventory manifest.json (local or s3://) or a key,last_modified CSV")
+    parser.add_argument('--mapping', default='file_slo_mapping.json')
+    parser.add_argument('--holidays', default='holidays.json',
+                        help="holidays.json (local or s3://) as used by the checker; '' for rules only")
+    parser.add_argument('--region', default='CA', help="holidayrules region, e.g. CA or US")
+    parser.add_argument('--timezone', default=DEFAULT_TIMEZONE)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--chunk-mb', type=int, default=DEFAULT_CHUNK_BYTES // (1024 * 1024),
+                        help="split uncompressed CSV listings into ranges of this size")
+    parser.add_argument('--out', default='backfill.csv.gz')
+    args = parser.parse_args(argv)
+
+    with open(args.mapping) as f:
+        file_slo_mapping = json.load(f)
+    rows = run_backfill(file_slo_mapping, args.start, args.end, args.inventory,
+                        args.region, args.timezone, args.workers,
+                        listed_holidays=load_listed_holidays(args.holidays, args.region),
+                        chunk_bytes=args.chunk_mb * 1024 * 1024)
+    with open_output(args.out) as f:
+        writer = csv.writer(f)
+        writer.writerow(['pattern', 'period', 'expected_file_name', 'deadline', 'arrived', 'status'])
+        for pattern, period, expected_file_name, deadline, arrived, status in rows:
+            writer.writerow([pattern, period, expected_file_name, deadline.isoformat(),
+                             arrived.isoformat() if arrived else '', status])
+    counts = Counter(row[-1] for row in rows)
+    print(f"Wrote {len(rows)} results to {args.out}: "
+          f"{counts['met']} met, {counts['late']} late, {counts['missing']} missing")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Alert traffic for a day of 5-minute checker runs, with and without digests.
+
+    python benchmarks/bench_alerts.py [--missing 1 10 100 1000] [--runs 288]
+
+Every run raises one 'missing' alert per missing file, as the checker does
+until the file arrives. 'naive' is one sns.publish per alert per run, which
+is what enabling the old send_alert would do. 'digest' is alerts.AlertDispatcher
+with state kept in the fake S3 between runs. Reports SNS API calls,
+messages delivered and dispatcher time per run.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import fakeaws  # noqa: E402
+from alerts import AlertDispatcher, S3AlertState  # noqa: E402
+
+TOPIC = 'arn:aws:sns:us-east-1:000000000000:file-slo'
+
+
+def alerts_for(missing):
+    for i in range(missing):
+        name = f"FEED_{i:05d}.202503.dat.pgp"
+        yield (f"File {name} is missing in the archive folder. "
+               f"SLO not met. Expected by: 2025-03-12 21:00:00+00:00"), f"{name}:missing"
+
+
+def naive(clients, missing, runs):
+    for _ in range(runs):
+        for message, _ in alerts_for(missing):
+            clients.sns.publish(TopicArn=TOPIC, Message=message, Subject="File Arrival Alert")
+
+
+def digest(clients, missing, runs):
+    dispatcher = AlertDispatcher(clients.sns, rate=1000, burst=1000)
+    state = S3AlertState(clients.s3, 'bucket', 'state/sent_alerts.json')
+    for _ in range(runs):
+        for message, key in alerts_for(missing):
+            dispatcher.add(TOPIC, message, key)
+        dispatcher.flush(state)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--missing', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--runs', type=int, default=288)
+    args = parser.parse_args()
+
+    results = []
+    for missing in args.missing:
+        row = {'missing': missing, 'runs': args.runs}
+        for name, fn in (('naive', naive), ('digest', digest)):
+            clients = fakeaws.FakeClients()
+            t0 = time.perf_counter()
+            fn(clients, missing, args.runs)
+            elapsed = time.perf_counter() - t0
+            row[name] = {
+                'sns_calls': sum(count for op, count in clients.calls.items() if op.startswith('sns.')),
+                'messages': len(clients.sns.messages),
+                's3_calls': sum(count for op, count in clients.calls.items() if op.startswith('s3.')),
+                'ms_per_run': elapsed / args.runs * 1e3,
+            }
+        results.append(row)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""S3 calls per poll with head_object, a full listing, and the arrival index.
+
+    python benchmarks/bench_arrivals.py [--patterns 1000] [--history-days 90]
+
+Seeds the synthetic bucket from bench_checker.py, plus --history-days of
+older daily files and the matching monthly files, so the archive is much
+larger than the set of due files. Then runs lambda_handler:
+
+  head         the default poll, one head_object per due file
+  index-cold   arrivalIndex=True with no index yet
+  index-warm   the next run, nothing new
+  index-new    after the missing files arrive
+  index-done   the next run, with every due file indexed
+
+and reports the S3 calls of each, next to what one full listing of
+archive/ would cost. Checks that the head and index polls tag the same
+files with the same statuses.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS, NOW, ZONE, seed_bucket, synthetic_mapping  # noqa: E402
+
+import lambda_function  # noqa: E402
+
+EVENT = {
+    'bucket_name': BUCKET,
+    'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+    'holidays_file_key': 'config/holidays.json',
+    'slo_mapping_file_key': 'config/file_slo_mapping.json',
+    'useCanadianHolidays': True,
+    'timezone': ZONE,
+}
+
+
+def seed_history(count, days):
+    # Older archive objects for every pattern: a daily file per weekday and a
+    # monthly file per month.
+    for pattern in synthetic_mapping(count):
+        monthly = "dat.pgp" in pattern
+        periods = set()
+        for back in range(1, days + 1):
+            day = NOW - timedelta(days=back)
+            if not monthly and day.weekday() >= 5:
+                continue
+            periods.add((day.strftime('%Y%m' if monthly else '%Y%m%d'), day))
+        for period, day in periods:
+            if monthly and period == NOW.strftime('%Y%m'):
+                continue
+            CLIENTS.s3.add_object(BUCKET, 'archive/' + pattern.replace('*', period), b'x', day)
+
+
+def tags():
+    return {key: obj['Tags'] for key, obj in CLIENTS.s3.buckets[BUCKET].items()
+            if key.startswith('archive/') and obj['Tags']}
+
+
+def clear_tags():
+    for obj in CLIENTS.s3.buckets[BUCKET].values():
+        obj['Tags'] = []
+
+
+def run(label, event):
+    CLIENTS.reset_counts()
+    t0 = time.perf_counter()
+    lambda_function.lambda_handler(event, None)
+    wall = time.perf_counter() - t0
+    s3_calls = {op: n for op, n in sorted(CLIENTS.calls.items()) if op.startswith('s3.')}
+    return {'run': label, 'wall_s': wall, 's3_calls': s3_calls,
+            'reads': sum(n for op, n in s3_calls.items() if op != 's3.put_object_tagging')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=1000)
+    parser.add_argument('--history-days', type=int, default=90)
+    args = parser.parse_args()
+    lambda_function.logger.setLevel('WARNING')
+
+    CLIENTS.reset()
+    records = seed_bucket(args.patterns)
+    seed_history(args.patterns, args.history_days)
+    archive = sum(key.startswith('archive/') for key in CLIENTS.s3.buckets[BUCKET])
+
+    results = [run('head', EVENT)]
+    head_tags = tags()
+    clear_tags()
+    index_event = dict(EVENT, arrivalIndex=True)
+    results.append(run('index-cold', index_event))
+    same_tags = tags() == head_tags
+    results.append(run('index-warm', index_event))
+
+    # The files that were missing arrive now.
+    arrived = {record['s3']['object']['key'] for record in records}
+    for pattern in synthetic_mapping(args.patterns):
+        period = NOW.strftime('%Y%m' if "dat.pgp" in pattern else '%Y%m%d')
+        key = 'archive/' + pattern.replace('*', period)
+        if key not in arrived:
+            CLIENTS.s3.add_object(BUCKET, key, b'x', NOW)
+    results.append(run('index-new', index_event))
+    results.append(run('index-done', index_event))
+
+    print(json.dumps({
+        'patterns': args.patterns,
+        'archive_objects': archive,
+        'full_listing_calls': -(-archive // 1000),
+        'same_tags_as_head': same_tags,
+        'runs': results,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
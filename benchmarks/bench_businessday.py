@@ -0,0 +1,109 @@
+"""Benchmark and cross-check the business-day engine in businessday.py.
+
+    python benchmarks/bench_businessday.py [--years 10] [--max-n 20]
+
+Computes the nth business day of every month for n = 1..--max-n over
+--years years with each available backend: stdlib, numpy and, when pandas
+is installed, the CustomBusinessDay approach businessday.py used to take.
+Every backend's results must match the stdlib ones exactly.
+
+The pandas reference rolls the 1st forward to a business day first. The
+old `first_day_of_month + 8 * CustomBusinessDay` returned the 8th, not
+9th, business day whenever the 1st was a weekend or holiday. Backends that
+cannot run here are listed under "skipped"; tests/test_businessday.py
+checks the results against fixtures generated with pandas either way.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import businessday  # noqa: E402
+
+START_YEAR = 2025
+
+
+def synthetic_holidays(years):
+    # holidays.json only covers 2025; repeat its dates for the later years
+    # so every backend sees holidays, then roll weekend ones to Monday.
+    base = businessday.load_holidays()
+    holidays = set()
+    for offset in range(years):
+        for day in base:
+            day = day.replace(year=START_YEAR + offset)
+            while day.weekday() >= 5:
+                day += timedelta(days=1)
+            holidays.add(day)
+    return holidays
+
+
+def pandas_nth_business_days(n, start_year, end_year, holidays):
+    import pandas as pd
+    from pandas.tseries.offsets import CustomBusinessDay
+    bday = CustomBusinessDay(holidays=sorted(holidays))
+    starts = businessday.month_starts(start_year, end_year)
+    days = [(bday.rollforward(pd.Timestamp(first_day)) + (n - 1) * bday).date() for first_day in starts]
+    return businessday.MonthSeries(starts, days)
+
+
+def import_ms(module):
+    output = subprocess.check_output([
+        sys.executable, '-c',
+        'import time; t = time.perf_counter(); import %s; '
+        'print((time.perf_counter() - t) * 1e3)' % module,
+    ], cwd=ROOT)
+    return float(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--max-n', type=int, default=20)
+    args = parser.parse_args()
+
+    end_year = START_YEAR + args.years - 1
+    holidays = synthetic_holidays(args.years)
+
+    backends = {
+        'stdlib': lambda n: businessday.nth_business_days(
+            n, START_YEAR, end_year, holidays, backend='stdlib'),
+    }
+    if businessday.HAVE_NUMPY:
+        backends['numpy'] = lambda n: businessday.nth_business_days(
+            n, START_YEAR, end_year, holidays, backend='numpy')
+    skipped = {}
+    if not businessday.HAVE_NUMPY:
+        skipped['numpy'] = 'NumPy is not installed'
+    try:
+        import pandas  # noqa: F401
+    except ImportError:
+        skipped['pandas'] = 'pandas is not installed'
+    else:
+        backends['pandas'] = lambda n: pandas_nth_business_days(
+            n, START_YEAR, end_year, holidays)
+
+    results = {}
+    reference = {}
+    for name, compute in backends.items():
+        t0 = time.perf_counter()
+        for n in range(1, args.max_n + 1):
+            days = compute(n)
+            if name == 'stdlib':
+                reference[n] = days
+            elif not days.equals(reference[n]):
+                raise AssertionError('%s differs from stdlib for n=%d' % (name, n))
+        results[name] = {'compute_ms': (time.perf_counter() - t0) * 1e3}
+        module = 'businessday' if name != 'pandas' else 'pandas'
+        results[name]['import_ms'] = import_ms(module)
+    results['skipped'] = skipped
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
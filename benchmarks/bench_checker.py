@@ -0,0 +1,110 @@
+"""End-to-end benchmark of the SLO checker in lambda_function.py.
+
+    python benchmarks/bench_checker.py [--patterns 10 100 1000 10000]
+        [--latency-ms 0] [--out results.json]
+
+The checker runs against the in-process fakes in tests/fakeaws.py, so no
+AWS access is needed. For each feed count, the synthetic mapping of
+tests/synthetic.py is written to the fake bucket with monthly and daily
+files. About 70% of the files arrive on time, 20% arrive late and 10% are
+missing. Two paths are measured:
+
+  poll    lambda_handler, the scheduled head_object check
+  events  s3_event_handler over one ObjectCreated record per arrived file
+
+Each result records wall time, API calls per operation and peak traced
+Python memory. The clock is frozen at NOW so runs are reproducible.
+Compare --out files between commits to spot hot-path regressions.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'python'))
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+import fakeaws  # noqa: E402
+
+CLIENTS = fakeaws.FakeClients().install()
+
+import lambda_function  # noqa: E402
+import synthetic  # noqa: E402
+from synthetic import BUCKET, NOW, ZONE, frozen_local_time, synthetic_mapping  # noqa: E402,F401
+
+lambda_function.get_local_time = frozen_local_time
+
+
+def seed_bucket(count, seed=11):
+    # Write config and archive objects; return the S3 event records for arrivals.
+    return synthetic.seed_bucket(CLIENTS.s3, count, seed)
+
+
+def measure(fn):
+    CLIENTS.reset_counts()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    fn()
+    wall = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'wall_s': wall,
+        'api_calls': dict(sorted(CLIENTS.calls.items())),
+        'peak_traced_kib': peak / 1024,
+    }
+
+
+def run(count):
+    CLIENTS.reset()
+    records = seed_bucket(count)
+    event = {
+        'bucket_name': BUCKET,
+        'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+        'holidays_file_key': 'config/holidays.json',
+        'slo_mapping_file_key': 'config/file_slo_mapping.json',
+        'useCanadianHolidays': True,
+        'timezone': ZONE,
+    }
+    os.environ.update({
+        'HOLIDAYS_FILE_KEY': event['holidays_file_key'],
+        'SLO_MAPPING_FILE_KEY': event['slo_mapping_file_key'],
+        'USE_CANADIAN_HOLIDAYS': 'true',
+        'SLO_TIMEZONE': ZONE,
+    })
+    lambda_function._event_configs.clear()
+    return {
+        'patterns': count,
+        'arrived': len(records),
+        'poll': measure(lambda: lambda_function.lambda_handler(event, None)),
+        'events': measure(lambda: lambda_function.s3_event_handler({'Records': records}, None)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help="simulated latency of every AWS call")
+    parser.add_argument('--out', help="also write the results to this JSON file")
+    args = parser.parse_args()
+
+    CLIENTS.set_latency(args.latency_ms / 1e3)
+    results = {
+        'latency_ms': args.latency_ms,
+        'python': sys.version.split()[0],
+        'runs': [run(count) for count in args.patterns],
+    }
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Cold-start latency of the SLO checker Lambda.
+
+    python benchmarks/bench_coldstart.py [--runs 30] [--patterns 100]
+        [--session-ms 250] [--client-ms 40]
+
+Each sample starts a fresh interpreter, installs the fakeaws clients and
+times from the import of lambda_function to the return of one
+lambda_handler call. Real boto3 cost is modelled with the fake's session
+and per-client latency: by default 250 ms to build the first session and
+load the service models, plus 40 ms per client. Three scenarios run:
+
+  idle          deadlines not reached yet; the pre-check returns early
+                after confirming the deployed config matches its copy
+  idle-nocheck  same clock with the pre-check turned off (event precheck=False)
+  busy          deadlines passed; the full check runs
+
+Prints p50/p99 per scenario as JSON.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FAKES_DIR = os.path.join(ROOT, 'tests')
+
+SCENARIOS = {
+    # Saturday morning, before the first business day of the month.
+    'idle': ('2025-03-01T07:00', True),
+    'idle-nocheck': ('2025-03-01T07:00', False),
+    'busy': ('2025-03-20T15:00', True),
+}
+
+SNIPPET = '''
+import json, sys, time
+from datetime import datetime
+sys.path[:0] = [{root!r}, {layer!r}, {fakes!r}]
+import fakeaws
+clients = fakeaws.FakeClients(session_latency={session}, client_latency={client}).install()
+for name in ('file_slo_mapping.json', 'holidays.json'):
+    with open({config_dir!r} + '/' + name, 'rb') as f:
+        clients.s3.add_object('bucket', 'config/' + name, f.read())
+t1 = time.perf_counter()
+import pytz
+import lambda_function
+now = pytz.timezone('America/Toronto').localize(datetime.fromisoformat({now!r}))
+lambda_function.get_local_time = lambda zone='America/Toronto': now.astimezone(pytz.timezone(zone))
+t2 = time.perf_counter()
+response = lambda_function.lambda_handler({{
+    'bucket_name': 'bucket', 'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+    'holidays_file_key': 'config/holidays.json', 'slo_mapping_file_key': 'config/file_slo_mapping.json',
+    'useCanadianHolidays': True, 'precheck': {precheck!r}}}, None)
+t3 = time.perf_counter()
+print(json.dumps({{'import_ms': (t2 - t1) * 1e3, 'total_ms': (t3 - t1) * 1e3,
+                  'clients': clients.clients_created, 'body': response['body']}}))
+'''
+
+
+def synthetic_mapping(count):
+    mapping = {}
+    for i in range(count):
+        if i % 3 == 0:
+            mapping[f"FEED_{i:05d}.*.dat.pgp"] = {
+                'slo_days': 1 + i % 10, 'slo_time': f"{8 + i % 10:02d}:00"}
+        else:
+            mapping[f"FEED_{i:05d}_*.xlsx"] = {
+                'slo_days': 0, 'slo_time': f"{8 + i % 4:02d}:{(i % 2) * 30:02d}"}
+    return mapping
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--patterns', type=int, default=100)
+    parser.add_argument('--session-ms', type=float, default=250.0)
+    parser.add_argument('--client-ms', type=float, default=40.0)
+    args = parser.parse_args()
+
+    config_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(config_dir, 'file_slo_mapping.json'), 'w') as f:
+            json.dump(synthetic_mapping(args.patterns), f)
+        shutil.copy(os.path.join(ROOT, 'holidays.json'), config_dir)
+        env = dict(os.environ, SLO_BUNDLED_CONFIG_DIR=config_dir)
+
+        results = {}
+        for name, (now, precheck) in SCENARIOS.items():
+            code = SNIPPET.format(root=ROOT, layer=os.path.join(ROOT, 'python'), fakes=FAKES_DIR,
+                                  session=args.session_ms / 1e3, client=args.client_ms / 1e3,
+                                  config_dir=config_dir, now=now, precheck=precheck)
+            samples = []
+            for _ in range(args.runs):
+                out = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                                     capture_output=True, text=True).stdout
+                samples.append(json.loads(out.strip().splitlines()[-1]))
+            totals = [sample['total_ms'] for sample in samples]
+            results[name] = {
+                'body': samples[-1]['body'],
+                'clients_created': samples[-1]['clients'],
+                'import_ms_p50': percentile([sample['import_ms'] for sample in samples], 0.5),
+                'total_ms_p50': percentile(totals, 0.5),
+                'total_ms_p99': percentile(totals, 0.99),
+            }
+    finally:
+        shutil.rmtree(config_dir)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
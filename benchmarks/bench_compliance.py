@@ -0,0 +1,147 @@
+"""Cost and correctness of the compliance rollups in compliance.py.
+
+    python benchmarks/bench_compliance.py [--patterns 1000] [--feeds 500] [--days 200]
+
+Checker: runs lambda_handler over the synthetic bucket from bench_checker.py
+and checks the month-to-date rollup against the tags it wrote (met, not met)
+and the untagged due files (missing). A second run sees the same outcomes
+and must not rewrite the state object. Then the missing files land late and
+a third run must move them from missing to late.
+
+Simulation: --feeds feeds report one outcome per business day for --days
+days, each seen by several polls and some first missing then late, through
+ComplianceRollup.record/expire day by day. At the end the monthly and
+rolling counters are compared with a recount of the final outcomes, and the
+cost per outcome and the size of the state are reported next to the number
+of status log lines a Logs Insights query would have scanned instead.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS, NOW, ZONE, seed_bucket  # noqa: E402
+
+import lambda_function  # noqa: E402
+from compliance import OUTCOMES, ComplianceRollup, S3ComplianceState  # noqa: E402
+
+EVENT = {
+    'bucket_name': BUCKET,
+    'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+    'holidays_file_key': 'config/holidays.json',
+    'slo_mapping_file_key': 'config/file_slo_mapping.json',
+    'useCanadianHolidays': True,
+    'timezone': ZONE,
+}
+STATE_KEY = lambda_function.DEFAULT_COMPLIANCE_STATE_KEY
+
+
+def rollup_totals():
+    rollup = S3ComplianceState(CLIENTS.s3, BUCKET, STATE_KEY).load()
+    return dict(zip(OUTCOMES, rollup.totals(NOW.strftime('%Y-%m'))))
+
+
+def run(label):
+    CLIENTS.reset_counts()
+    t0 = time.perf_counter()
+    lambda_function.lambda_handler(EVENT, None)
+    wall = time.perf_counter() - t0
+    return {'run': label, 'wall_s': wall, 'state_writes': CLIENTS.calls.get('s3.put_object', 0),
+            'totals': rollup_totals()}
+
+
+def bench_checker(patterns):
+    CLIENTS.reset()
+    seed_bucket(patterns)
+    holidays = lambda_function.get_holidays({}, 'CA', [NOW.year, NOW.year + 1])
+    mapping = lambda_function.parse_slo_mapping(
+        lambda_function.load_json_from_s3(BUCKET, EVENT['slo_mapping_file_key']))
+    due = [*lambda_function.due_monthly_files(holidays, mapping, NOW, ZONE),
+           *lambda_function.due_daily_files(holidays, mapping, NOW, ZONE)]
+    objects = CLIENTS.s3.buckets[BUCKET]
+
+    results = [run('first')]
+    tags = Counter(objects[s3_key]['Tags'][0]['Value'] for _, _, s3_key, _ in due if s3_key in objects)
+    expected = {'met': tags['met'], 'late': tags['not met'],
+                'missing': sum(s3_key not in objects for _, _, s3_key, _ in due)}
+    results.append(run('second'))
+
+    for _, _, s3_key, deadline in due:
+        if s3_key not in objects:
+            CLIENTS.s3.add_object(BUCKET, s3_key, b'x', NOW)
+    results.append(run('missing-arrive'))
+    after = {'met': expected['met'], 'late': expected['late'] + expected['missing'], 'missing': 0}
+    return {
+        'patterns': patterns,
+        'due': len(due),
+        'first_matches_tags': results[0]['totals'] == expected,
+        'second_unchanged': results[1]['state_writes'] == 0 and results[1]['totals'] == expected,
+        'missing_moved_to_late': results[2]['totals'] == after,
+        'state_bytes': len(objects[STATE_KEY]['Body']),
+        'runs': results,
+    }
+
+
+def bench_simulation(feeds, days, polls=3, seed=5):
+    rng = random.Random(seed)
+    rollup = ComplianceRollup()
+    final = {}
+    records = 0
+    start = date(2025, 1, 1)
+    t0 = time.perf_counter()
+    for offset in range(days):
+        today = start + timedelta(days=offset)
+        rollup.expire(today)
+        if today.weekday() >= 5:
+            continue
+        for feed in range(feeds):
+            s3_key = f"archive/FEED_{feed:05d}_{today:%Y%m%d}.xlsx"
+            roll = rng.random()
+            outcome = 'met' if roll < 0.8 else 'late' if roll < 0.95 else 'missing'
+            seen = ['missing', 'late'] if outcome == 'late' and rng.random() < 0.5 else [outcome]
+            for status in seen:
+                for _ in range(polls):
+                    rollup.record(f"FEED_{feed:05d}_*.xlsx", status, today)
+                    records += 1
+            final[s3_key] = (f"FEED_{feed:05d}_*.xlsx", outcome, today)
+    elapsed = time.perf_counter() - t0
+
+    end = start + timedelta(days=days - 1)
+    window_start = end - timedelta(days=rollup.window - 1)
+    months, rolling = {}, {}
+    for feed, outcome, day in final.values():
+        column = OUTCOMES.index(outcome)
+        months.setdefault(f"{day:%Y-%m}", {}).setdefault(feed, [0, 0, 0])[column] += 1
+        if day >= window_start:
+            rolling.setdefault(feed, [0, 0, 0])[column] += 1
+    kept = set(sorted(months)[-rollup.months_kept:])
+    months = {month: feeds for month, feeds in months.items() if month in kept}
+    return {
+        'feeds': feeds, 'days': days, 'records': records,
+        'us_per_record': elapsed / records * 1e6,
+        'months_match': rollup.months == months,
+        'rolling_match': rollup.rolling == rolling,
+        'state_bytes': len(json.dumps(rollup.to_json())),
+        'log_lines_scanned_instead': records,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=1000)
+    parser.add_argument('--feeds', type=int, default=500)
+    parser.add_argument('--days', type=int, default=200)
+    args = parser.parse_args()
+    lambda_function.logger.setLevel('WARNING')
+    print(json.dumps({'checker': bench_checker(args.patterns),
+                      'simulation': bench_simulation(args.feeds, args.days)}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark the batch deadline table in deadlines.py.
+
+    python benchmarks/bench_deadlines.py [--years 1 10] [--patterns 10 100 1000 5000]
+
+Synthetic mappings mix monthly and daily patterns with a spread of
+slo_days/slo_time values. Reports the time to compute the deadline matrix
+and, separately, to write it as gzip CSV.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'python'))
+
+import deadlines  # noqa: E402
+from holidayrules import holidays_between  # noqa: E402
+
+START_YEAR = 2025
+
+
+def synthetic_mapping(count):
+    mapping = {}
+    for i in range(count):
+        if i % 3 == 0:
+            mapping[f"FEED_{i:05d}.*.dat.pgp"] = {
+                'slo_days': 1 + i % 10, 'slo_time': f"{8 + i % 10:02d}:00"}
+        else:
+            mapping[f"FEED_{i:05d}_*.xlsx"] = {
+                'slo_days': 0, 'slo_time': f"{8 + i % 4:02d}:{(i % 2) * 30:02d}"}
+    return mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--patterns', type=int, nargs='+', default=[10, 100, 1000, 5000])
+    parser.add_argument('--write', action='store_true', help="also time writing the CSV")
+    args = parser.parse_args()
+
+    results = []
+    for years in args.years:
+        end_year = START_YEAR + years - 1
+        holidays = holidays_between('CA', START_YEAR, end_year + 1)
+        for count in args.patterns:
+            mapping = synthetic_mapping(count)
+            t0 = time.perf_counter()
+            columns = deadlines.deadline_columns(mapping, START_YEAR, end_year, holidays)
+            t1 = time.perf_counter()
+            result = {
+                'years': years,
+                'patterns': count,
+                'deadlines': sum(len(periods) for periods, _ in columns.values()),
+                'compute_ms': (t1 - t0) * 1e3,
+            }
+            if args.write:
+                with tempfile.TemporaryDirectory() as workdir:
+                    path = os.path.join(workdir, 'deadlines.csv.gz')
+                    t2 = time.perf_counter()
+                    deadlines.write_deadline_table(columns, path)
+                    result['write_ms'] = (time.perf_counter() - t2) * 1e3
+                    result['bytes'] = os.path.getsize(path)
+            results.append(result)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Sync versus asyncio checker engines under simulated AWS latency.
+
+    python benchmarks/bench_engines.py [--patterns 100 1000] [--latency-ms 5]
+        [--concurrency 64]
+
+Uses the same synthetic bucket as bench_checker.py and runs lambda_handler
+once with the default sync engine and once with engine='async'. Every
+fake AWS call sleeps --latency-ms: time.sleep for the sync client,
+asyncio.sleep for the async one. Reports wall time, API calls, and whether
+both engines tagged the same files with the same statuses.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import bench_checker  # noqa: E402  (installs the fake AWS clients)
+from bench_checker import BUCKET, CLIENTS, ZONE, seed_bucket  # noqa: E402
+
+import async_checker  # noqa: E402
+import lambda_function  # noqa: E402
+
+async_checker.S3_CLIENT_FACTORY = CLIENTS.async_s3
+
+
+def tags():
+    return {key: obj['Tags'] for key, obj in CLIENTS.s3.buckets[BUCKET].items() if obj['Tags']}
+
+
+def run(count, engine, concurrency):
+    CLIENTS.reset()
+    seed_bucket(count)
+    event = {
+        'bucket_name': BUCKET,
+        'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+        'holidays_file_key': 'config/holidays.json',
+        'slo_mapping_file_key': 'config/file_slo_mapping.json',
+        'useCanadianHolidays': True,
+        'timezone': ZONE,
+        'engine': engine,
+        'concurrency': concurrency,
+    }
+    t0 = time.perf_counter()
+    lambda_function.lambda_handler(event, None)
+    wall = time.perf_counter() - t0
+    return {'wall_s': wall, 'api_calls': dict(sorted(CLIENTS.calls.items()))}, tags()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--latency-ms', type=float, default=5.0)
+    parser.add_argument('--concurrency', type=int, default=64)
+    args = parser.parse_args()
+
+    CLIENTS.set_latency(args.latency_ms / 1e3)
+    results = []
+    for count in args.patterns:
+        sync_result, sync_tags = run(count, 'sync', args.concurrency)
+        async_result, async_tags = run(count, 'async', args.concurrency)
+        results.append({
+            'patterns': count,
+            'latency_ms': args.latency_ms,
+            'concurrency': args.concurrency,
+            'sync': sync_result,
+            'async': async_result,
+            'speedup': sync_result['wall_s'] / async_result['wall_s'],
+            'same_tags': sync_tags == async_tags,
+        })
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    bench_checker.lambda_function.logger.setLevel('WARNING')
+    main()
@@ -0,0 +1,70 @@
+"""Throughput of the coordinator/worker fan-out in fanout.py.
+
+    python benchmarks/bench_fanout.py [--patterns 2000] [--partitions 32]
+        [--workers 1 2 4 8 16] [--latency-ms 5]
+
+Runs fanout.run_local() over the synthetic bucket from bench_checker.py
+with every fake AWS call sleeping --latency-ms. Workers are threads
+draining a LocalQueue, standing in for concurrent Lambda invocations.
+Reports wall time, files checked per second and scaling relative to one
+worker. Also checks that the merged metric totals match a single sync
+lambda_handler run.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import CLIENTS, seed_bucket  # noqa: E402
+
+import fanout  # noqa: E402
+import lambda_function  # noqa: E402
+import synthetic  # noqa: E402
+from synthetic import EVENT  # noqa: E402
+
+
+def metric_totals():
+    return synthetic.metric_totals(CLIENTS.cloudwatch)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=2000)
+    parser.add_argument('--partitions', type=int, default=32)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--latency-ms', type=float, default=5.0)
+    args = parser.parse_args()
+    lambda_function.logger.setLevel('WARNING')
+
+    CLIENTS.reset()
+    seed_bucket(args.patterns)
+    lambda_function.lambda_handler(EVENT, None)
+    expected = metric_totals()
+
+    CLIENTS.set_latency(args.latency_ms / 1e3)
+    results = []
+    for workers in args.workers:
+        CLIENTS.reset()
+        seed_bucket(args.patterns)
+        fanout._worker_configs.clear()
+        t0 = time.perf_counter()
+        fanout.run_local(dict(EVENT, partitions=args.partitions), workers)
+        wall = time.perf_counter() - t0
+        results.append({
+            'workers': workers,
+            'partitions': args.partitions,
+            'wall_s': wall,
+            'files_per_s': args.patterns / wall,
+            'api_calls': dict(sorted(CLIENTS.calls.items())),
+            'metrics_match_sync': metric_totals() == expected,
+        })
+    for result in results:
+        result['speedup'] = results[0]['wall_s'] / result['wall_s']
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""Benchmark mapping S3 keys to SLO patterns with keymatcher.KeyMatcher.
+
+    python benchmarks/bench_keymatcher.py [--patterns 10000] [--keys 1000000]
+
+Synthetic patterns come in overlapping families like the real mapping
+(FEED_0042_*.xlsx, FEED_0042_CATEGORY_*.xlsx, ...). Keys are a mix of
+daily and monthly files for those patterns plus unrelated misses. The trie
+runs over every key. The naive loop (fnmatch over every pattern, keeping
+the longest prefix) and a single regex alternation run over --sample keys
+and are extrapolated. They also check that the trie picks the same pattern.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from keymatcher import KeyMatcher  # noqa: E402
+
+SUFFIXES = ['', 'CATEGORY_', 'HIERARCHY_EXPLOSION_', 'HIERARCHY_EXPLOSION_DETAIL_']
+
+
+def synthetic_patterns(count):
+    patterns = []
+    family = 0
+    while len(patterns) < count:
+        for suffix in SUFFIXES:
+            if family % 5 == 0:
+                patterns.append(f"FEED_{family:05d}_{suffix}REPORT.*.dat.pgp")
+            else:
+                patterns.append(f"FEED_{family:05d}_{suffix}*.xlsx")
+        family += 1
+    return patterns[:count]
+
+
+def synthetic_keys(patterns, count, seed=7):
+    rng = random.Random(seed)
+    keys = []
+    for i in range(count):
+        if i % 10 == 9:
+            keys.append(f"incoming/unrelated_{rng.randrange(10 ** 6)}.csv")
+            continue
+        pattern = rng.choice(patterns)
+        period = f"2025{rng.randrange(1, 13):02d}"
+        if pattern.endswith('.xlsx'):
+            period += f"{rng.randrange(1, 29):02d}"
+        keys.append(pattern.replace('*', period))
+    return keys
+
+
+def naive_match(patterns, key):
+    # The glob loop the trie replaces: test every pattern, keep the longest prefix.
+    best = None
+    for pattern in patterns:
+        if fnmatch.fnmatchcase(key, pattern):
+            if best is None or len(pattern.partition('*')[0]) > len(best.partition('*')[0]):
+                best = pattern
+    return best
+
+
+def regex_matcher(patterns):
+    # One alternation, longest prefix first so the first branch that matches wins.
+    ordered = sorted(patterns, key=lambda p: (-len(p.partition('*')[0]), p))
+    branches = ['%s(.*)%s' % tuple(re.escape(part) for part in p.split('*', 1)) for p in ordered]
+    return re.compile('|'.join(branches)), ordered
+
+
+def timed(fn, keys):
+    t0 = time.perf_counter()
+    results = [fn(key) for key in keys]
+    return time.perf_counter() - t0, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=10000)
+    parser.add_argument('--keys', type=int, default=1000000)
+    parser.add_argument('--sample', type=int, default=200,
+                        help="keys run through the naive and regex matchers")
+    args = parser.parse_args()
+
+    patterns = synthetic_patterns(args.patterns)
+    keys = synthetic_keys(patterns, args.keys)
+    sample = keys[:args.sample]
+
+    t0 = time.perf_counter()
+    matcher = KeyMatcher(patterns)
+    build_s = time.perf_counter() - t0
+
+    def trie(key):
+        found = matcher.match(key)
+        return found and found[0]
+
+    trie_s, trie_results = timed(trie, keys)
+    naive_s, naive_results = timed(lambda key: naive_match(patterns, key), sample)
+
+    t0 = time.perf_counter()
+    regex, ordered = regex_matcher(patterns)
+    regex.fullmatch('')
+    regex_build_s = time.perf_counter() - t0
+
+    def alternation(key):
+        found = regex.fullmatch(key)
+        return found and ordered[found.lastindex - 1]
+
+    regex_s, regex_results = timed(alternation, sample)
+
+    assert trie_results[:len(sample)] == naive_results == regex_results
+    per_key = lambda seconds, n: seconds / n * 1e6
+    print(json.dumps({
+        'patterns': len(patterns),
+        'keys': len(keys),
+        'matched': sum(result is not None for result in trie_results),
+        'trie_build_ms': build_s * 1e3,
+        'trie_total_s': trie_s,
+        'trie_us_per_key': per_key(trie_s, len(keys)),
+        'naive_us_per_key': per_key(naive_s, len(sample)),
+        'naive_total_s_extrapolated': per_key(naive_s, len(sample)) * len(keys) / 1e6,
+        'regex_build_ms': regex_build_s * 1e3,
+        'regex_us_per_key': per_key(regex_s, len(sample)),
+        'regex_total_s_extrapolated': per_key(regex_s, len(sample)) * len(keys) / 1e6,
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""Accuracy and cost of the arrival lateness distributions in lateness.py.
+
+    python benchmarks/bench_lateness.py [--samples 100000] [--patterns 1000]
+
+Sketch: adds --samples synthetic lateness values (mostly early, with a
+long late tail) to a QuantileSketch, in one sketch and split across eight
+merged ones, and reports the relative error of p50/p95/p99 against the
+exact quantiles, with the serialized size of the sketch.
+
+Checker: runs lambda_handler twice over the synthetic bucket from
+bench_checker.py and reports the arrivals recorded and the put_metric_data
+calls of each run. The second run sees the same files and must record none
+of them again.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS, ZONE, seed_bucket  # noqa: E402
+
+import lambda_function  # noqa: E402
+from lateness import QuantileSketch, S3LatenessState  # noqa: E402
+
+EVENT = {
+    'bucket_name': BUCKET,
+    'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+    'holidays_file_key': 'config/holidays.json',
+    'slo_mapping_file_key': 'config/file_slo_mapping.json',
+    'useCanadianHolidays': True,
+    'timezone': ZONE,
+}
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def synthetic_lateness(count, seed=7):
+    # Minutes relative to the deadline: 80% early, the rest late with a
+    # heavy tail of files that land days after.
+    rng = random.Random(seed)
+    values = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            values.append(-rng.expovariate(1 / 120))
+        else:
+            values.append(rng.paretovariate(1.2) * 15)
+    return values
+
+
+def exact_quantile(ordered, q):
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def bench_sketch(samples):
+    values = synthetic_lateness(samples)
+    ordered = sorted(values)
+    t0 = time.perf_counter()
+    single = QuantileSketch()
+    for value in values:
+        single.add(value)
+    add_s = time.perf_counter() - t0
+    merged = QuantileSketch()
+    for part in range(8):
+        sketch = QuantileSketch()
+        for value in values[part::8]:
+            sketch.add(value)
+        merged.merge(QuantileSketch.from_json(json.loads(json.dumps(sketch.to_json()))))
+
+    result = {'samples': samples, 'add_us': add_s / samples * 1e6,
+              'buckets': len(single.positive) + len(single.negative),
+              'json_bytes': len(json.dumps(single.to_json())), 'quantiles': {}}
+    for q in QUANTILES:
+        exact = exact_quantile(ordered, q)
+        result['quantiles'][f"p{q * 100:g}"] = {
+            'exact': round(exact, 2), 'sketch': round(single.quantile(q), 2),
+            'merged': round(merged.quantile(q), 2),
+            'max_rel_error': max(abs(single.quantile(q) - exact), abs(merged.quantile(q) - exact)) / abs(exact),
+        }
+    return result
+
+
+def run(label):
+    CLIENTS.reset_counts()
+    del CLIENTS.cloudwatch.metrics[:]
+    t0 = time.perf_counter()
+    lambda_function.lambda_handler(EVENT, None)
+    wall = time.perf_counter() - t0
+    recorded = sum(count for _, datum in CLIENTS.cloudwatch.metrics
+                   if datum['MetricName'].endswith('LatenessMinutes') for count in datum['Counts'])
+    return {'run': label, 'wall_s': wall, 'arrivals_published': int(recorded),
+            'put_metric_data': CLIENTS.calls.get('cloudwatch.put_metric_data', 0)}
+
+
+def bench_checker(patterns):
+    CLIENTS.reset()
+    seed_bucket(patterns)
+    results = [run('first'), run('second')]
+    feeds, _ = S3LatenessState(CLIENTS.s3, BUCKET, lambda_function.DEFAULT_LATENESS_STATE_KEY).load()
+    return {'patterns': patterns, 'feeds': len(feeds), 'arrivals_in_state': sum(lateness.minutes.count for lateness in feeds.values()),
+            'state_bytes': len(CLIENTS.s3.buckets[BUCKET][lambda_function.DEFAULT_LATENESS_STATE_KEY]['Body']),
+            'runs': results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--samples', type=int, default=100000)
+    parser.add_argument('--patterns', type=int, default=1000)
+    args = parser.parse_args()
+    lambda_function.logger.setLevel('WARNING')
+    print(json.dumps({'sketch': bench_sketch(args.samples), 'checker': bench_checker(args.patterns)},
+                     indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Sequential versus parallel partitioned listing of a large archive prefix.
+
+    python benchmarks/bench_listing.py [--feeds 3000] [--days 100]
+        [--other 0.3] [--latency-ms 20] [--workers 16]
+
+Fills the fake bucket with --days of daily files for --feeds feeds, plus a
+share (--other) of keys that match no rule, then lists archive/ three ways:
+
+  sequential  one list_objects_v2 paginator over archive/
+  prefixes    archivelist.prefix_partitions of the feed patterns, in parallel
+  ranges      archivelist.range_partitions of archive/, in parallel, split
+              evenly across the feed names and the unrelated keys
+
+Every list call sleeps --latency-ms. Each result keeps only keys that match
+a rule (lambda_function.match_key) and is checked against the sequential
+one. Reports wall time, list calls and keys transferred.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS  # noqa: E402
+
+import lambda_function  # noqa: E402
+from archivelist import ParallelLister, prefix_partitions, range_partitions  # noqa: E402
+
+
+def seed(feeds, days, other):
+    CLIENTS.reset()
+    patterns = [f"FEED_{i:05d}_*.xlsx" for i in range(feeds)]
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for pattern in patterns:
+        for day in range(days):
+            date = start + timedelta(days=day)
+            CLIENTS.s3.add_object(BUCKET, 'archive/' + pattern.replace('*', f"{date:%Y%m%d}"), b'', date)
+    unrelated = int(feeds * days * other)
+    for i in range(unrelated):
+        CLIENTS.s3.add_object(BUCKET, f"archive/tmp/upload_{i:07d}.part", b'', start)
+    return patterns
+
+
+def sequential(key_filter):
+    calls = 0
+    token = None
+    keys = []
+    while True:
+        kwargs = {'Bucket': BUCKET, 'Prefix': 'archive/'}
+        if token:
+            kwargs['ContinuationToken'] = token
+        response = CLIENTS.s3.list_objects_v2(**kwargs)
+        calls += 1
+        keys.extend(obj['Key'] for obj in response.get('Contents', []) if key_filter(obj['Key']))
+        token = response.get('NextContinuationToken')
+        if not token:
+            return keys, calls, None
+
+
+def parallel(partitions, workers, key_filter):
+    lister = ParallelLister(CLIENTS.s3, BUCKET, workers=workers, key_filter=key_filter)
+    keys = [obj['Key'] for obj in lister.list(partitions)]
+    return keys, lister.calls, len(partitions)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--feeds', type=int, default=3000)
+    parser.add_argument('--days', type=int, default=100)
+    parser.add_argument('--other', type=float, default=0.3)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--workers', type=int, default=16)
+    args = parser.parse_args()
+
+    patterns = seed(args.feeds, args.days, args.other)
+    matcher = lambda_function.compile_pattern_matcher(dict.fromkeys(patterns))
+    key_filter = lambda key: lambda_function.match_key(matcher, key) is not None  # noqa: E731
+    step = max(1, args.feeds // (2 * args.workers))
+    boundaries = [f"FEED_{i:05d}" for i in range(step, args.feeds, step)] + ['tmp/upload_']
+    CLIENTS.set_latency({'list_objects_v2': args.latency_ms / 1e3})
+
+    runs = {
+        'sequential': lambda: sequential(key_filter),
+        'prefixes': lambda: parallel(prefix_partitions(patterns), args.workers, key_filter),
+        'ranges': lambda: parallel(range_partitions(boundaries=boundaries), args.workers, key_filter),
+    }
+    results = []
+    expected = None
+    for name, fn in runs.items():
+        t0 = time.perf_counter()
+        keys, calls, partitions = fn()
+        wall = time.perf_counter() - t0
+        if expected is None:
+            expected = keys
+        results.append({
+            'mode': name,
+            'partitions': partitions,
+            'wall_s': wall,
+            'list_calls': calls,
+            'keys_kept': len(keys),
+            'same_as_sequential': keys == expected,
+        })
+    for result in results:
+        result['speedup'] = results[0]['wall_s'] / result['wall_s']
+    print(json.dumps({'objects': len(CLIENTS.s3.buckets[BUCKET]), 'workers': args.workers,
+                      'latency_ms': args.latency_ms, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+"""Lead time and cost of the early warnings from predictor.py.
+
+    python benchmarks/bench_predictor.py [--feeds 500] [--days 120] [--sigmas 2 3]
+
+Simulation: --feeds daily feeds arrive at their own usual offset before the
+deadline, with noise, a slow drift, and on 3% of days a delay that makes
+the file late. Each feed's ArrivalModel learns every arrival; on each day
+after the first 20, polls every 5 minutes decide whether the file is at
+risk. Reported per k (--sigmas): the share of late files flagged before
+their deadline, the median lead time, and the share of on-time files
+flagged anyway (false alarms).
+
+Checker: lambda_handler with earlyWarning=True an hour before the
+deadline of --feeds daily feeds with trained models, half of which have
+already arrived. Checks that exactly the missing half is flagged, that
+only flagged files are looked up, and that a second run sends no alert
+again.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS, ZONE  # noqa: E402
+
+import pytz  # noqa: E402
+import lambda_function  # noqa: E402
+from predictor import ArrivalModel, ArrivalPredictor, S3ArrivalModelState  # noqa: E402
+
+POLL = timedelta(minutes=5)
+
+
+def simulate(feeds, days, sigmas, seed=3):
+    rng = random.Random(seed)
+    predictor = ArrivalPredictor(sigmas=sigmas)
+    base = datetime(2025, 1, 6, 16, 0, tzinfo=pytz.utc)
+    usual = [(-rng.uniform(30, 240), rng.uniform(3, 25)) for _ in range(feeds)]
+    models = [ArrivalModel() for _ in range(feeds)]
+    late = flagged_late = on_time = false_alarms = 0
+    leads = []
+    evaluations = 0
+    t0 = time.perf_counter()
+    for day in range(days):
+        deadline = base + timedelta(days=day)
+        for feed, (mean, sd) in enumerate(usual):
+            offset = rng.gauss(mean + day * 0.2, sd)
+            if rng.random() < 0.03:
+                offset = rng.uniform(1, 120)
+            arrival = deadline + timedelta(minutes=offset)
+            if day >= 20:
+                warned = None
+                now = deadline - timedelta(hours=6)
+                while now < min(arrival, deadline):
+                    evaluations += 1
+                    if predictor.at_risk(models[feed], deadline, now) is not None:
+                        warned = now
+                        break
+                    now += POLL
+                if arrival > deadline:
+                    late += 1
+                    if warned is not None:
+                        flagged_late += 1
+                        leads.append((deadline - warned).total_seconds() / 60)
+                else:
+                    on_time += 1
+                    false_alarms += warned is not None
+            models[feed].update(offset, deadline, predictor.alpha)
+    elapsed = time.perf_counter() - t0
+    return {
+        'sigmas': sigmas,
+        'late_files': late,
+        'late_flagged': round(flagged_late / late, 3) if late else None,
+        'median_lead_minutes': statistics.median(leads) if leads else None,
+        'false_alarm_rate': round(false_alarms / on_time, 4) if on_time else None,
+        'us_per_evaluation': elapsed / max(evaluations, 1) * 1e6,
+    }
+
+
+def bench_checker(feeds):
+    CLIENTS.reset()
+    zone = pytz.timezone(ZONE)
+    today = datetime(2025, 3, 20).date()
+    mapping = {f"EW_{i:05d}_*.xlsx": {'slo_days': 0, 'slo_time': '12:00'} for i in range(feeds)}
+    CLIENTS.s3.add_json(BUCKET, 'config/holidays.json', {})
+    CLIENTS.s3.add_json(BUCKET, 'config/file_slo_mapping.json', mapping)
+    deadline = lambda_function.get_expected_arrival_time(today, datetime.strptime('12:00', '%H:%M').time(), ZONE)
+    S3ArrivalModelState(CLIENTS.s3, BUCKET, lambda_function.DEFAULT_ARRIVAL_MODEL_KEY).save(
+        {pattern: ArrivalModel(-120.0, 100.0, 30, (deadline - timedelta(days=1)).isoformat()) for pattern in mapping})
+    for i, pattern in enumerate(mapping):
+        if i % 2 == 0:
+            CLIENTS.s3.add_object(BUCKET, 'archive/' + pattern.replace('*', today.strftime('%Y%m%d')), b'x',
+                                  deadline - timedelta(minutes=130))
+
+    now = zone.localize(datetime(2025, 3, 20, 11, 0))
+    lambda_function.get_local_time = lambda zone_name=ZONE: now.astimezone(pytz.timezone(zone_name))
+    event = {
+        'bucket_name': BUCKET,
+        'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+        'holidays_file_key': 'config/holidays.json',
+        'slo_mapping_file_key': 'config/file_slo_mapping.json',
+        'useCanadianHolidays': True,
+        'timezone': ZONE,
+        'precheck': False,
+        'earlyWarning': True,
+        'sendAlerts': True,
+    }
+    runs = []
+    for label in ('first', 'second'):
+        CLIENTS.reset_counts()
+        del CLIENTS.sns.messages[:]
+        del CLIENTS.cloudwatch.metrics[:]
+        t0 = time.perf_counter()
+        lambda_function.lambda_handler(event, None)
+        runs.append({
+            'run': label, 'wall_s': time.perf_counter() - t0,
+            'at_risk': sum(datum['Value'] for _, datum in CLIENTS.cloudwatch.metrics
+                           if datum['MetricName'] == 'DailySLOAtRisk'),
+            'head_object': CLIENTS.calls.get('s3.head_object', 0),
+            'alerts_sent': sum(message.count('at risk of missing') for _, _, message in CLIENTS.sns.messages),
+        })
+    missing = feeds - (feeds + 1) // 2
+    return {
+        'feeds': feeds,
+        'missing': missing,
+        'flags_exactly_missing': runs[0]['at_risk'] == missing,
+        'looks_up_only_flagged': runs[0]['head_object'] == feeds,
+        'second_run_silent': runs[1]['alerts_sent'] == 0,
+        'runs': runs,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--feeds', type=int, default=500)
+    parser.add_argument('--days', type=int, default=120)
+    parser.add_argument('--sigmas', type=float, nargs='+', default=[2.0, 3.0])
+    args = parser.parse_args()
+    lambda_function.logger.setLevel('WARNING')
+    print(json.dumps({
+        'simulation': [simulate(args.feeds, args.days, sigmas) for sigmas in args.sigmas],
+        'checker': bench_checker(args.feeds),
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
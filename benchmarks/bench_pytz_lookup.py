@@ -0,0 +1,64 @@
+"""First-lookup latency of the vendored pytz in a fresh interpreter.
+
+    python benchmarks/bench_pytz_lookup.py [--runs 20]
+
+Each sample starts a new Python process with python/ on sys.path, imports
+pytz and times the first timezone() call for one spelling of a zone name.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAYER_DIR = os.path.join(ROOT, 'python')
+
+NAMES = [
+    'America/Toronto',   # exact match
+    'america/toronto',   # case-insensitive match
+    'US/Eastern',        # link to America/New_York
+    'Not/A_Zone',        # miss
+]
+
+SNIPPET = '''
+import time
+t0 = time.perf_counter()
+import pytz
+t1 = time.perf_counter()
+try:
+    pytz.timezone(%r)
+except pytz.UnknownTimeZoneError:
+    pass
+t2 = time.perf_counter()
+print((t1 - t0) * 1e3, (t2 - t1) * 1e3)
+'''
+
+
+def run_once(name):
+    env = dict(os.environ, PYTHONPATH=LAYER_DIR)
+    output = subprocess.check_output(
+        [sys.executable, '-c', SNIPPET % name], env=env)
+    import_ms, lookup_ms = output.split()
+    return float(import_ms), float(lookup_ms)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    results = {}
+    for name in NAMES:
+        samples = [run_once(name) for _ in range(args.runs)]
+        results[name] = {
+            'import_ms_median': statistics.median(s[0] for s in samples),
+            'first_lookup_ms_median': statistics.median(s[1] for s in samples),
+            'first_lookup_ms_max': max(s[1] for s in samples),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Round-trip pickling throughput for pytz-localized datetimes.
+
+    python benchmarks/bench_pytz_pickle.py [--count 20000]
+
+Pickles each datetime on its own, as a process pool does when tasks are
+submitted one at a time, then unpickles them all. Modes:
+
+    unmemoized  (zone, utcoffset, dst, tzname) pickles, memo cleared per
+                load, i.e. the previous behaviour
+    standard    the same pickles with the per-process unpickle memo
+    compact     (zone, transition index) pickles (PYTZ_COMPACTPICKLE)
+"""
+import argparse
+import datetime
+import json
+import os
+import pickle
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'python'))
+
+import pytz  # noqa: E402
+
+ZONES = ['America/Toronto', 'America/New_York', 'Europe/London',
+         'Asia/Tokyo', 'Australia/Sydney']
+
+
+def make_datetimes(count):
+    random.seed(0)
+    start = datetime.datetime(2015, 1, 1)
+    return [
+        pytz.timezone(random.choice(ZONES)).localize(
+            start + datetime.timedelta(minutes=random.randrange(6000000)))
+        for _ in range(count)
+    ]
+
+
+def run(mode, datetimes):
+    pytz._compact_pickle = mode == 'compact'
+    pytz._clear_unpickle_memo()
+    t0 = time.perf_counter()
+    payloads = [pickle.dumps(dt, pickle.HIGHEST_PROTOCOL) for dt in datetimes]
+    t1 = time.perf_counter()
+    if mode == 'unmemoized':
+        for payload in payloads:
+            pytz._clear_unpickle_memo()
+            pickle.loads(payload)
+    else:
+        for payload in payloads:
+            pickle.loads(payload)
+    t2 = time.perf_counter()
+    return {
+        'dumps_per_s': len(payloads) / (t1 - t0),
+        'loads_per_s': len(payloads) / (t2 - t1),
+        'bytes_per_pickle': sum(map(len, payloads)) / len(payloads),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+
+    datetimes = make_datetimes(args.count)
+    results = {}
+    for mode in ('unmemoized', 'standard', 'compact'):
+        results[mode] = run(mode, datetimes)
+        pytz._compact_pickle = mode == 'compact'
+        assert all(pickle.loads(pickle.dumps(dt)).tzinfo is dt.tzinfo
+                   for dt in datetimes[:1000])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Compare the vendored pytz resource backends.
+
+    python benchmarks/bench_pytz_resources.py [--runs 10] [--zones 100]
+
+Builds a layer zip and a zoneinfo blob with tools/build_pytz_data.py in a
+temporary directory, then in a fresh interpreter per sample times the
+import, the first timezone() and loading the first --zones zones from:
+
+    filesystem  python/ on sys.path, one open() per zone file
+    zip         the layer zip on sys.path (zipimport, no extraction)
+    blob        python/ on sys.path with PYTZ_TZDATABLOB set
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'tools'))
+
+import build_pytz_data  # noqa: E402
+
+SNIPPET = '''
+import json, sys, time
+t0 = time.perf_counter()
+import pytz
+t1 = time.perf_counter()
+pytz.timezone('America/Toronto')
+t2 = time.perf_counter()
+for zone in pytz.all_timezones[:%d]:
+    pytz.timezone(zone)
+t3 = time.perf_counter()
+print(json.dumps({
+    'import_ms': (t1 - t0) * 1e3,
+    'first_timezone_ms': (t2 - t1) * 1e3,
+    'load_zones_ms': (t3 - t2) * 1e3,
+    'pkg_resources_imported': 'pkg_resources' in sys.modules,
+}))
+'''
+
+
+def run_once(env, zones):
+    output = subprocess.check_output(
+        [sys.executable, '-c', SNIPPET % zones], env=env)
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--zones', type=int, default=100)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    try:
+        layer_zip = os.path.join(workdir, 'pytz_layer.zip')
+        blob = os.path.join(workdir, 'zoneinfo.blob')
+        build_pytz_data.build_layer_zip(layer_zip)
+        build_pytz_data.build_zoneinfo_blob(blob)
+
+        base = dict(os.environ)
+        base.pop('PYTZ_TZDATADIR', None)
+        base.pop('PYTZ_TZDATABLOB', None)
+        modes = {
+            'filesystem': dict(base, PYTHONPATH=os.path.join(ROOT, 'python')),
+            'zip': dict(base, PYTHONPATH=os.path.join(layer_zip, 'python')),
+            'blob': dict(base, PYTHONPATH=os.path.join(ROOT, 'python'),
+                         PYTZ_TZDATABLOB=blob),
+        }
+
+        results = {}
+        for mode, env in modes.items():
+            samples = [run_once(env, args.zones) for _ in range(args.runs)]
+            results[mode] = dict(
+                (key, statistics.median(s[key] for s in samples))
+                for key in ('import_ms', 'first_timezone_ms', 'load_zones_ms'))
+            results[mode]['pkg_resources_imported'] = any(
+                s['pkg_resources_imported'] for s in samples)
+        print(json.dumps(results, indent=2))
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""Startup cost of the vendored pytz layer.
+
+    python benchmarks/bench_pytz_startup.py [--runs 10] [--importtime]
+
+Times each startup phase (import, first timezone(), the zone lists and the
+country tables) in a fresh interpreter, once with the build-time manifest
+and once with PYTZ_TZDATADIR pointing at the same data, which forces the
+old per-file existence checks and zone.tab parsing. --importtime also
+prints the `python -X importtime` breakdown for `import pytz`.
+
+Note that PYTHONDONTWRITEBYTECODE makes every run recompile the modules.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAYER_DIR = os.path.join(ROOT, 'python')
+ZONEINFO_DIR = os.path.join(LAYER_DIR, 'pytz', 'zoneinfo')
+
+PHASES = '''
+import json, time
+timings = {}
+t = time.perf_counter()
+def phase(name):
+    global t
+    now = time.perf_counter()
+    timings[name] = (now - t) * 1e3
+    t = now
+import pytz
+phase('import')
+pytz.timezone('America/Toronto')
+phase('first_timezone')
+len(pytz.all_timezones)
+phase('all_timezones')
+len(pytz.common_timezones)
+phase('common_timezones')
+pytz.country_timezones['CA']
+phase('country_timezones')
+pytz.country_names['CA']
+phase('country_names')
+print(json.dumps(timings))
+'''
+
+MODES = {
+    'manifest': {},
+    'verified': {'PYTZ_TZDATADIR': ZONEINFO_DIR},
+}
+
+
+def layer_env(extra=None):
+    env = dict(os.environ, PYTHONPATH=LAYER_DIR)
+    env.pop('PYTZ_TZDATADIR', None)
+    env.update(extra or {})
+    return env
+
+
+def run_phases(mode):
+    output = subprocess.check_output(
+        [sys.executable, '-c', PHASES], env=layer_env(MODES[mode]))
+    return json.loads(output)
+
+
+def import_time_report():
+    # Parse `python -X importtime` output into (module, self_us, cumulative_us).
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import pytz'],
+        env=layer_env(), stderr=subprocess.PIPE, universal_newlines=True,
+        check=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--importtime', action='store_true')
+    args = parser.parse_args()
+
+    if args.importtime:
+        for name, self_us, cumulative_us in import_time_report():
+            if name.startswith('pytz'):
+                print('%-20s self %6d us  cumulative %6d us' % (
+                    name, self_us, cumulative_us))
+
+    results = {}
+    for mode in MODES:
+        samples = [run_phases(mode) for _ in range(args.runs)]
+        results[mode] = dict(
+            (phase, statistics.median(s[phase] for s in samples))
+            for phase in samples[0])
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
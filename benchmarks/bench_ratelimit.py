@@ -0,0 +1,108 @@
+"""Throughput and throttling with and without the adaptive rate limiter.
+
+    python benchmarks/bench_ratelimit.py [--calls 20000] [--threads 32]
+        [--service-rate 2000] [--latency-ms 2]
+
+The fake S3 client accepts --service-rate calls per second and answers the
+rest with 503 SlowDown. --threads threads share --calls head_object calls,
+made two ways:
+
+  retry    the raw client with botocore-style retries: up to 3 attempts,
+           full-jitter exponential backoff, no shared state
+  limiter  the client wrapped in ratelimit.LimitedClient, starting from
+           the S3 default rate (above --service-rate) and adapting
+
+Reports successful calls per second, throttled responses, calls that gave
+up, and the limiter's final rate.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS  # noqa: E402
+
+import ratelimit  # noqa: E402
+
+
+def retrying_head(key, attempts=3, base=0.05, cap=5.0):
+    for attempt in range(1, attempts + 1):
+        try:
+            return CLIENTS.s3.head_object(Bucket=BUCKET, Key=key)
+        except CLIENTS.s3.exceptions.ClientError as e:
+            if not ratelimit.is_throttle(e) or attempt == attempts:
+                raise
+            time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+
+def run(mode, calls, threads, service_rate):
+    CLIENTS.reset_counts()
+    CLIENTS.set_throughput({'s3': service_rate})
+    limiter = ratelimit.AdaptiveLimiter(ratelimit.SERVICE_RATES['s3'])
+    client = ratelimit.LimitedClient(CLIENTS.s3, limiter)
+    if mode == 'limiter':
+        head = lambda key: client.head_object(Bucket=BUCKET, Key=key)  # noqa: E731
+    else:
+        head = retrying_head
+    remaining = iter(range(calls))
+    lock = threading.Lock()
+    counts = {'ok': 0, 'gave_up': 0}
+
+    def work():
+        while True:
+            with lock:
+                i = next(remaining, None)
+            if i is None:
+                return
+            try:
+                head('config/holidays.json')
+                outcome = 'ok'
+            except CLIENTS.s3.exceptions.ClientError:
+                outcome = 'gave_up'
+            with lock:
+                counts[outcome] += 1
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    t0 = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    wall = time.perf_counter() - t0
+    result = {
+        'mode': mode,
+        'wall_s': wall,
+        'ok_per_s': counts['ok'] / wall,
+        'gave_up': counts['gave_up'],
+        'requests': CLIENTS.calls['s3.head_object'],
+        'throttled': CLIENTS.calls['s3.throttled'],
+    }
+    if mode == 'limiter':
+        result['final_rate'] = limiter.snapshot()['rate']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=20000)
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--service-rate', type=float, default=2000)
+    parser.add_argument('--latency-ms', type=float, default=2.0)
+    args = parser.parse_args()
+
+    CLIENTS.reset()
+    CLIENTS.s3.add_json(BUCKET, 'config/holidays.json', {})
+    CLIENTS.set_latency(args.latency_ms / 1e3)
+    results = [run(mode, args.calls, args.threads, args.service_rate) for mode in ('retry', 'limiter')]
+    for result in results:
+        result['service_rate'] = args.service_rate
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
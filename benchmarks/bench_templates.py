@@ -0,0 +1,141 @@
+"""Flat keys with head_object versus a date-partitioned key template with probes.
+
+    python benchmarks/bench_templates.py [--patterns 1000] [--history-days 60]
+        [--latency-ms 5]
+
+Seeds the synthetic feeds of bench_checker.py twice over: once flat
+(archive/{name}) and once under key_template
+archive/{yyyy}/{mm}/{dd}/{name}, each with --history-days of older daily
+files, and runs lambda_handler on both. The flat poll makes a head_object
+per due file; the templated one lists today's partitions. Reports S3 calls
+and wall time with --latency-ms per call, checks that both tag the same
+files with the same statuses, and that s3_event_handler records the
+templated arrivals.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_checker import BUCKET, CLIENTS, NOW, ZONE, seed_bucket, synthetic_mapping  # noqa: E402
+
+import lambda_function  # noqa: E402
+from keytemplates import render_key  # noqa: E402
+
+TEMPLATE = 'archive/{yyyy}/{mm}/{dd}/{name}'
+EVENT = {
+    'bucket_name': BUCKET,
+    'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+    'holidays_file_key': 'config/holidays.json',
+    'slo_mapping_file_key': 'config/file_slo_mapping.json',
+    'useCanadianHolidays': True,
+    'timezone': ZONE,
+}
+
+
+def templated_mapping(count):
+    mapping = synthetic_mapping(count)
+    for slo in mapping.values():
+        slo['key_template'] = TEMPLATE
+    return mapping
+
+
+def move_to_template(count):
+    # Re-key the flat archive objects under TEMPLATE, keeping their contents.
+    mapping = lambda_function.parse_slo_mapping(templated_mapping(count))
+    holidays = lambda_function.get_holidays({}, 'CA', [NOW.year, NOW.year + 1])
+    objects = CLIENTS.s3.buckets[BUCKET]
+    moved = {}
+    for pattern, slo in mapping.items():
+        if "dat.pgp" in pattern:
+            period = NOW.strftime('%Y%m')
+            date = lambda_function.get_nth_business_day(NOW.year, NOW.month, slo['slo_days'], holidays).date()
+        else:
+            period = NOW.strftime('%Y%m%d')
+            date = NOW.date()
+        name = pattern.replace('*', period)
+        if 'archive/' + name in objects:
+            moved['archive/' + name] = render_key(TEMPLATE, name, period, date)
+    for old, new in moved.items():
+        objects[new] = objects.pop(old)
+    CLIENTS.s3.add_json(BUCKET, 'config/file_slo_mapping.json', templated_mapping(count))
+    CLIENTS.s3._sorted.clear()
+    return moved
+
+
+def seed_history(count, days, templated):
+    for pattern in synthetic_mapping(count):
+        if "dat.pgp" in pattern:
+            continue
+        for back in range(1, days + 1):
+            day = (NOW - timedelta(days=back)).date()
+            name = pattern.replace('*', f"{day:%Y%m%d}")
+            key = render_key(TEMPLATE, name, f"{day:%Y%m%d}", day) if templated else 'archive/' + name
+            CLIENTS.s3.add_object(BUCKET, key, b'x', NOW - timedelta(days=back))
+
+
+def tags():
+    return {key.rpartition('/')[2]: obj['Tags'] for key, obj in CLIENTS.s3.buckets[BUCKET].items()
+            if key.startswith('archive/') and obj['Tags']}
+
+
+def run():
+    CLIENTS.reset_counts()
+    t0 = time.perf_counter()
+    lambda_function.lambda_handler(EVENT, None)
+    wall = time.perf_counter() - t0
+    return {'wall_s': wall,
+            's3_calls': {op: n for op, n in sorted(CLIENTS.calls.items()) if op.startswith('s3.')}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--patterns', type=int, default=1000)
+    parser.add_argument('--history-days', type=int, default=60)
+    parser.add_argument('--latency-ms', type=float, default=5.0)
+    args = parser.parse_args()
+    lambda_function.logger.setLevel('WARNING')
+
+    CLIENTS.reset()
+    seed_bucket(args.patterns)
+    seed_history(args.patterns, args.history_days, False)
+    CLIENTS.set_latency(args.latency_ms / 1e3)
+    flat = run()
+    flat_tags = tags()
+
+    CLIENTS.set_latency(0)
+    CLIENTS.reset()
+    records = seed_bucket(args.patterns)
+    moved = move_to_template(args.patterns)
+    seed_history(args.patterns, args.history_days, True)
+    CLIENTS.set_latency(args.latency_ms / 1e3)
+    templated = run()
+    templated_tags = tags()
+
+    # The same arrivals as S3 notifications for the templated keys.
+    CLIENTS.set_latency(0)
+    for record in records:
+        record['s3']['object']['key'] = moved[record['s3']['object']['key']]
+    os.environ.update({'HOLIDAYS_FILE_KEY': EVENT['holidays_file_key'],
+                       'SLO_MAPPING_FILE_KEY': EVENT['slo_mapping_file_key'],
+                       'USE_CANADIAN_HOLIDAYS': 'true', 'SNS_TOPIC_ARN': EVENT['sns_topic_arn']})
+    lambda_function._event_configs.clear()
+    response = lambda_function.s3_event_handler({'Records': records}, None)
+
+    print(json.dumps({
+        'patterns': args.patterns,
+        'archive_objects': sum(key.startswith('archive/') for key in CLIENTS.s3.buckets[BUCKET]),
+        'latency_ms': args.latency_ms,
+        'flat': flat,
+        'templated': templated,
+        'same_tags': flat_tags == templated_tags,
+        'events': response['body'],
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,147 @@
-import pandas as pd
-from workalendar.america import Canada
-from pandas.tseries.offsets import CustomBusinessDay
-
-def get_9th_business_day(year):
-    cal = Canada()
-    # Create a custom business day offset that includes Canadian holidays
-    can_bus_day = CustomBusinessDay(calendar=cal)
-    
-    dates = []
-    for month in range(1, 13):  # Loop through all months
-        first_day_of_month = pd.Timestamp(year=year, month=month, day=1)
-        # Calculate the 9th business day
-        ninth_business_day = first_day_of_month + 8 * can_bus_day
-        dates.append(ninth_business_day.date())
-    
-    return pd.Series(dates, index=pd.date_range(start=f'{year}-01-01', end=f'{year}-12-01', freq='MS')).rename('9th Business Day')
-
-# Example use for the current year
-current_year = 2025
-result = get_9th_business_day(current_year)
-print(result)
\ No newline at end of file
+import importlib.util
+import json
+import os
+from datetime import date, datetime, timedelta
+
+from holidayrules import holidays_between
+
+# NumPy is optional and only imported when its backend is used, so the
+# stdlib backend keeps imports cheap.
+HAVE_NUMPY = importlib.util.find_spec('numpy') is not None
+
+HOLIDAYS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'holidays.json')
+
+def load_holidays(key='ca_public_holidays', path=HOLIDAYS_FILE):
+    # Load every year of one holiday list from holidays.json as a set of dates.
+    with open(path) as f:
+        data = json.load(f)
+    return {
+        datetime.strptime(day, '%Y-%m-%d').date()
+        for days in data[key].values()
+        for day in days
+    }
+
+def month_starts(start_year, end_year=None):
+    # First day of every month from start_year to end_year, inclusive.
+    end_year = start_year if end_year is None else end_year
+    return [date(year, month, 1) for year in range(start_year, end_year + 1) for month in range(1, 13)]
+
+def nth_business_day_of_month(first_day, n, holidays):
+    # Walk forward from the first of the month to its nth business day.
+    day = first_day
+    business_days = 0
+    while True:
+        if day.weekday() < 5 and day not in holidays:
+            business_days += 1
+            if business_days == n:
+                return day
+        day += timedelta(days=1)
+
+class MonthSeries(object):
+    # The nth business day of each month, in month order: the part of the
+    # pandas Series the pandas/workalendar version of this module returned
+    # that its callers use. The index is the first day of each month as a
+    # date (it was a DatetimeIndex), values are dates, and as with a Series
+    # result[first_day] looks a month up, `in` and keys() are the index,
+    # iterating yields the values and items() yields (month, day) pairs.
+    # to_series() builds the real Series when pandas is installed.
+
+    def __init__(self, index, values, name=None):
+        self.index = list(index)
+        self.values = list(values)
+        self.name = name
+        self._positions = {label: position for position, label in enumerate(self.index)}
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __contains__(self, label):
+        return label in self._positions
+
+    def __getitem__(self, label):
+        return self.values[self._positions[label]]
+
+    def get(self, label, default=None):
+        position = self._positions.get(label)
+        return default if position is None else self.values[position]
+
+    def keys(self):
+        return list(self.index)
+
+    def items(self):
+        return zip(self.index, self.values)
+
+    def equals(self, other):
+        # Same index, values and order, as Series.equals (the name is ignored).
+        return self.index == list(other.index) and self.values == list(other.values)
+
+    def rename(self, name):
+        return MonthSeries(self.index, self.values, name)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def to_series(self):
+        import pandas as pd
+        return pd.Series(self.values, index=pd.DatetimeIndex(self.index, freq='MS'), name=self.name)
+
+    def __repr__(self):
+        lines = [f"{label}    {value}" for label, value in self.items()]
+        return '\n'.join(lines + [f"Name: {self.name}, Length: {len(self)}"])
+
+def ordinal(n):
+    # 1st, 2nd, 3rd, 4th, ..., 11th, 12th, 13th, ..., 21st.
+    suffix = 'th' if 10 <= n % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+def _nth_business_days_stdlib(starts, n, holidays):
+    return [nth_business_day_of_month(first_day, n, holidays) for first_day in starts]
+
+def _nth_business_days_numpy(starts, n, holidays):
+    # One vectorized busday_offset call for every month: roll the first of the
+    # month forward to its 1st business day, then step n - 1 business days.
+    import numpy as np
+    calendar = np.busdaycalendar(holidays=np.array(sorted(holidays), dtype='datetime64[D]'))
+    offsets = np.busday_offset(np.array(starts, dtype='datetime64[D]'), n - 1, roll='forward', busdaycal=calendar)
+    return offsets.tolist()
+
+def nth_business_days(n, start_year, end_year=None, holidays=None, backend=None):
+    # Return a MonthSeries of the nth business day of every month from
+    # start_year to end_year, named e.g. '9th Business Day'.
+    # holidays defaults to the rule-generated 'CA' calendar in holidayrules.
+    # backend is 'stdlib', 'numpy' or None to use NumPy when it is installed.
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+    end_year = start_year if end_year is None else end_year
+    if holidays is None:
+        # Canadian business holidays, plus the next year for late spill-over.
+        holidays = holidays_between('CA', start_year, end_year + 1)
+    holidays = set(holidays)
+    if backend is None:
+        backend = 'numpy' if HAVE_NUMPY else 'stdlib'
+    starts = month_starts(start_year, end_year)
+    if backend == 'numpy':
+        if not HAVE_NUMPY:
+            raise ImportError("The numpy backend needs NumPy installed")
+        days = _nth_business_days_numpy(starts, n, holidays)
+    elif backend == 'stdlib':
+        days = _nth_business_days_stdlib(starts, n, holidays)
+    else:
+        raise ValueError(f"Unknown backend {backend!r}")
+    return MonthSeries(starts, days, f"{ordinal(n)} Business Day")
+
+def get_9th_business_day(year, holidays=None):
+    # MonthSeries '9th Business Day' of year. The pandas version computed
+    # first + 8 * CustomBusinessDay, which is the 8th business day when the
+    # 1st is a weekend or holiday; this is always the 9th, so monthly
+    # deadlines in those months are one business day later than they were.
+    return nth_business_days(9, year, holidays=holidays)
+
+if __name__ == '__main__':
+    # Example use for the current year
+    current_year = 2025
+    for month_start, business_day in get_9th_business_day(current_year).items():
+        print(month_start, business_day)
@@ -6,12 +6,19 @@ import * as iam from 'aws-cdk-lib/aws-iam';
 import * as events from 'aws-cdk-lib/aws-events';
 import * as targets from 'aws-cdk-lib/aws-events-targets';
 import * as cloudwatch from 'aws-cdk-lib/aws-cloudwatch';
+import * as sqs from 'aws-cdk-lib/aws-sqs';
+import * as s3n from 'aws-cdk-lib/aws-s3-notifications';
+import { SqsEventSource } from 'aws-cdk-lib/aws-lambda-event-sources';
+import * as path from 'path';
 
 export class LambdaCdkStack extends cdk.Stack {
     constructor(scope: Construct, id: string, props?: cdk.StackProps) {
         super(scope, id, props);
 
         const bucketName = 'myaatest01';
+        const topicArn = 'arn:aws:sns:ca-central-1:507525864454:aatesttopic';
+        const holidaysFileKey = 'files/holidays.json';
+        const sloMappingFileKey = 'files/file_slo_mapping.json';
 
         let bucket: s3.IBucket;
         try {
@@ -35,36 +42,139 @@ export class LambdaCdkStack extends cdk.Stack {
             }
         });
 
-        // Grant Lambda permissions to read from S3
-        bucket.grantRead(lambdaFunction);
+        // What every function that checks files needs
+        const grantChecker = (fn: lambda.Function) => {
+            // Read the config, archive and state objects, and list the archive
+            bucket.grantRead(fn);
 
-        // Grant Lambda permissions to put object tagging in S3
-        bucket.grantPut(lambdaFunction);
+            // Tag checked files and write state/ (s3:PutObject, which also
+            // covers conditional puts with If-None-Match)
+            bucket.grantPut(fn);
 
-        // Grant Lambda permissions to publish to SNS (if needed)
-        lambdaFunction.addToRolePolicy(new iam.PolicyStatement({
-            actions: ['sns:Publish'],
-            resources: ['arn:aws:sns:ca-central-1:507525864454:aatesttopic']
-        }));
+            // Publish alerts; sns:Publish also authorizes PublishBatch
+            fn.addToRolePolicy(new iam.PolicyStatement({
+                actions: ['sns:Publish'],
+                resources: [topicArn]
+            }));
+
+            // Put metrics to CloudWatch
+            fn.addToRolePolicy(new iam.PolicyStatement({
+                actions: ['cloudwatch:PutMetricData'],
+                resources: ['*']
+            }));
+        };
+        grantChecker(lambdaFunction);
 
-        // Grant Lambda permissions to put metrics to CloudWatch
-        lambdaFunction.addToRolePolicy(new iam.PolicyStatement({
-            actions: ['cloudwatch:PutMetricData'],
-            resources: ['*']
+        // The checker modules at the repository root, with the pytz layer,
+        // for the fan-out and S3 event functions below
+        const repoRoot = path.join(__dirname, '..', '..');
+        const checkerCode = lambda.Code.fromAsset(repoRoot, {
+            exclude: [
+                '.git*', '.pytest_cache', '**/__pycache__', '*.zip', '*.jsonl', '*.patch',
+                'calendar-cdk-stack', 'aatestds01', 'redshift', 'benchmarks', 'tests', 'tools', 'python'
+            ]
+        });
+        const pytzLayer = new lambda.LayerVersion(this, 'PytzLayer', {
+            code: lambda.Code.fromAsset(path.join(repoRoot, 'pytz_layer.zip')),
+            compatibleRuntimes: [lambda.Runtime.PYTHON_3_11]
+        });
+
+        const checkEvent = {
+            bucket_name: bucket.bucketName,
+            sns_topic_arn: topicArn,
+            holidays_file_key: holidaysFileKey,
+            slo_mapping_file_key: sloMappingFileKey
+        };
+
+        // Fan-out (see fanout.py): the coordinator sends one SQS message per
+        // partition; workers check their partition, write runs/{run_id}/
+        // partials, and the worker that writes the last one claims
+        // runs/{run_id}/reduced and merges them. Expire runs/ with a
+        // lifecycle rule on the bucket.
+        const partitionDeadLetters = new sqs.Queue(this, 'PartitionDeadLetterQueue', {
+            retentionPeriod: cdk.Duration.days(14)
+        });
+        const partitionQueue = new sqs.Queue(this, 'PartitionQueue', {
+            visibilityTimeout: cdk.Duration.minutes(30),  // 6x the worker timeout
+            deadLetterQueue: { queue: partitionDeadLetters, maxReceiveCount: 3 }
+        });
+
+        const coordinator = new lambda.Function(this, 'S3FileSLOCoordinator', {
+            runtime: lambda.Runtime.PYTHON_3_11,
+            handler: 'fanout.coordinator_handler',
+            code: checkerCode,
+            layers: [pytzLayer],
+            timeout: cdk.Duration.minutes(1)
+        });
+        partitionQueue.grantSendMessages(coordinator);
+
+        const worker = new lambda.Function(this, 'S3FileSLOWorker', {
+            runtime: lambda.Runtime.PYTHON_3_11,
+            handler: 'fanout.worker_handler',
+            code: checkerCode,
+            layers: [pytzLayer],
+            memorySize: 512,
+            timeout: cdk.Duration.minutes(5)
+        });
+        grantChecker(worker);
+        // A failed reduce deletes its claim so the retried message can reduce
+        bucket.grantDelete(worker, 'runs/*');
+        worker.addEventSource(new SqsEventSource(partitionQueue, {
+            batchSize: 1,
+            reportBatchItemFailures: true
         }));
 
-        // Create an EventBridge rule to trigger the Lambda function every 5 minutes
+        // Create an EventBridge rule to trigger the checker every 5 minutes,
+        // or the fan-out coordinator when deployed with -c fanout=true
         const rule = new events.Rule(this, 'Rule', {
             schedule: events.Schedule.rate(cdk.Duration.minutes(5))
         });
 
-        rule.addTarget(new targets.LambdaFunction(lambdaFunction, {
-            event: events.RuleTargetInput.fromObject({
-                bucket_name: bucket.bucketName,
-                sns_topic_arn: 'arn:aws:sns:ca-central-1:507525864454:aatesttopic',
-                holidays_file_key: 'files/holidays.json',
-                slo_mapping_file_key: 'files/file_slo_mapping.json'
-            })
+        if (String(this.node.tryGetContext('fanout')) === 'true') {
+            rule.addTarget(new targets.LambdaFunction(coordinator, {
+                event: events.RuleTargetInput.fromObject({
+                    ...checkEvent,
+                    queue_url: partitionQueue.queueUrl,
+                    partitions: 8
+                })
+            }));
+        } else {
+            rule.addTarget(new targets.LambdaFunction(lambdaFunction, {
+                event: events.RuleTargetInput.fromObject(checkEvent)
+            }));
+        }
+
+        // Arrivals as they happen (see s3_event_handler): S3 ObjectCreated
+        // notifications for archive/ go through SQS, so failed records are
+        // retried on their own through batchItemFailures.
+        const arrivalDeadLetters = new sqs.Queue(this, 'ArrivalDeadLetterQueue', {
+            retentionPeriod: cdk.Duration.days(14)
+        });
+        const arrivalQueue = new sqs.Queue(this, 'ArrivalQueue', {
+            visibilityTimeout: cdk.Duration.minutes(6),  // 6x the handler timeout
+            deadLetterQueue: { queue: arrivalDeadLetters, maxReceiveCount: 5 }
+        });
+        bucket.addEventNotification(s3.EventType.OBJECT_CREATED, new s3n.SqsDestination(arrivalQueue), {
+            prefix: 'archive/'
+        });
+
+        const arrivalRecorder = new lambda.Function(this, 'S3FileArrivalRecorder', {
+            runtime: lambda.Runtime.PYTHON_3_11,
+            handler: 'lambda_function.s3_event_handler',
+            code: checkerCode,
+            layers: [pytzLayer],
+            timeout: cdk.Duration.minutes(1),
+            environment: {
+                SLO_CONFIG_BUCKET: bucket.bucketName,
+                HOLIDAYS_FILE_KEY: holidaysFileKey,
+                SLO_MAPPING_FILE_KEY: sloMappingFileKey,
+                SNS_TOPIC_ARN: topicArn
+            }
+        });
+        grantChecker(arrivalRecorder);
+        arrivalRecorder.addEventSource(new SqsEventSource(arrivalQueue, {
+            batchSize: 10,
+            reportBatchItemFailures: true
         }));
 
         // Create a CloudWatch dashboard
@@ -90,6 +200,23 @@ fields @timestamp, @message
                 markdown: '# SLO Status for Files',
                 width: 24
             }),
+            // Fleet-wide compliance, published from the rollups in
+            // state/compliance.json (see compliance.py) rather than queried
+            // from the logs.
+            new cloudwatch.GraphWidget({
+                title: 'SLO Compliance (%)',
+                left: ['MonthToDate', 'Rolling'].map(window => new cloudwatch.Metric({
+                    namespace: 'FileSLO-Metrics',
+                    metricName: 'SLOCompliance',
+                    dimensionsMap: { Window: window },
+                    statistic: 'Minimum',
+                    period: cdk.Duration.hours(1),
+                    label: window
+                })),
+                leftYAxis: { min: 0, max: 100 },
+                width: 24,
+                height: 6
+            }),
             new cloudwatch.LogQueryWidget({
                 title: 'SLO Status',
                 logGroupNames: [logGroupName],
@@ -104,5 +231,9 @@ fields @timestamp, @message
         new cdk.CfnOutput(this, 'LambdaFunctionArn', {
             value: lambdaFunction.functionArn
         });
+
+        new cdk.CfnOutput(this, 'PartitionQueueUrl', {
+            value: partitionQueue.queueUrl
+        });
     }
 }
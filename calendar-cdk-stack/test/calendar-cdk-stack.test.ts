@@ -1,17 +1,70 @@
-// import * as cdk from 'aws-cdk-lib';
-// import { Template } from 'aws-cdk-lib/assertions';
-// import * as CalendarCdkStack from '../lib/calendar-cdk-stack-stack';
-
-// example test. To run these tests, uncomment this file along with the
-// example resource in lib/calendar-cdk-stack-stack.ts
-test('SQS Queue Created', () => {
-//   const app = new cdk.App();
-//     // WHEN
-//   const stack = new CalendarCdkStack.CalendarCdkStackStack(app, 'MyTestStack');
-//     // THEN
-//   const template = Template.fromStack(stack);
-
-//   template.hasResourceProperties('AWS::SQS::Queue', {
-//     VisibilityTimeout: 300
-//   });
+import * as cdk from 'aws-cdk-lib';
+import { Match, Template } from 'aws-cdk-lib/assertions';
+import { LambdaCdkStack } from '../lib/lambda-cdk-stack';
+
+function synth(context?: Record<string, string>): Template {
+    const app = new cdk.App({ context });
+    return Template.fromStack(new LambdaCdkStack(app, 'TestStack'));
+}
+
+function functionId(template: Template, handler: string): string {
+    const found = template.findResources('AWS::Lambda::Function', {
+        Properties: { Handler: handler }
+    });
+    const ids = Object.keys(found);
+    expect(ids).toHaveLength(1);
+    return ids[0];
+}
+
+test('Fan-out workers consume the partition queue', () => {
+    const template = synth();
+    const worker = functionId(template, 'fanout.worker_handler');
+    functionId(template, 'fanout.coordinator_handler');
+
+    template.resourceCountIs('AWS::SQS::Queue', 4);
+    template.hasResourceProperties('AWS::Lambda::EventSourceMapping', {
+        FunctionName: { Ref: worker },
+        BatchSize: 1,
+        FunctionResponseTypes: ['ReportBatchItemFailures']
+    });
+    template.hasResourceProperties('AWS::IAM::Policy', {
+        PolicyDocument: {
+            Statement: Match.arrayWith([
+                Match.objectLike({ Action: 'sns:Publish' }),
+                Match.objectLike({ Action: 's3:DeleteObject*' })
+            ])
+        }
+    });
+});
+
+test('Archive arrivals reach the S3 event handler through SQS', () => {
+    const template = synth();
+    const recorder = functionId(template, 'lambda_function.s3_event_handler');
+
+    template.resourceCountIs('Custom::S3BucketNotifications', 1);
+    template.hasResourceProperties('AWS::Lambda::EventSourceMapping', {
+        FunctionName: { Ref: recorder },
+        FunctionResponseTypes: ['ReportBatchItemFailures']
+    });
+    template.hasResourceProperties('AWS::Lambda::Function', {
+        Handler: 'lambda_function.s3_event_handler',
+        Environment: {
+            Variables: Match.objectLike({
+                HOLIDAYS_FILE_KEY: 'files/holidays.json',
+                SLO_MAPPING_FILE_KEY: 'files/file_slo_mapping.json'
+            })
+        }
+    });
+});
+
+test('The schedule targets the coordinator only with fanout=true', () => {
+    const single = synth();
+    single.hasResourceProperties('AWS::Events::Rule', {
+        Targets: [Match.objectLike({ Arn: { 'Fn::GetAtt': [functionId(single, 'lambda_function.lambda_handler'), 'Arn'] } })]
+    });
+
+    const fanout = synth({ fanout: 'true' });
+    fanout.hasResourceProperties('AWS::Events::Rule', {
+        Targets: [Match.objectLike({ Arn: { 'Fn::GetAtt': [functionId(fanout, 'fanout.coordinator_handler'), 'Arn'] } })]
+    });
 });
@@ -0,0 +1,197 @@
+from datetime import date, datetime, timedelta
+
+from s3state import QueuedRecorder, S3JsonState
+
+# SLO compliance rollups for the SLO checker.
+#
+# Every checked file has an outcome: met, late or missing. The checkers queue
+# outcomes with add(); flush() at the end of an invocation folds them into
+# running counters kept as one small JSON object in S3:
+#
+#   months   {YYYY-MM: {feed: [met, late, missing]}}, for `months` months
+#   rolling  {feed: [met, late, missing]} over the last `window` days
+#   days     the same per deadline date, so a day leaving the rolling
+#            window can be subtracted from it
+#
+# so monthly and rolling compliance come from the object alone instead of a
+# Logs Insights query over the "SLO met" log lines (see
+# tools/compliance_report.py). A file is counted once, under the local date
+# of its deadline. A feed has one file per deadline date, so its counters
+# for that date hold the file's current outcome. When the outcome changes
+# (missing, then late when it finally lands) the old outcome is moved to
+# the new one, so each outcome costs O(1) however many runs see the file
+# and nothing is kept per file. An outcome is final once its date is
+# `settle` days old (the poll stops seeing a monthly file at the end of its
+# month); later reports of it are ignored. Fleet-wide compliance is also
+# published as the SLOCompliance metric, per Window (MonthToDate,
+# Rolling), for dashboards.
+
+# Where the rollups are kept, in the config bucket.
+DEFAULT_COMPLIANCE_STATE_KEY = 'state/compliance.json'
+
+OUTCOMES = ('met', 'late', 'missing')
+
+
+def compliance_ratio(counts):
+    # Share of files that met the SLO, in percent, or None with no files.
+    total = sum(counts)
+    return round(100.0 * counts[0] / total, 2) if total else None
+
+
+class ComplianceRollup(object):
+    # Running met/late/missing counters by feed, per month and rolling.
+
+    def __init__(self, window=90, months=13, settle=35, data=None):
+        if settle > window:
+            # Changes are settled against the per-day counters, which are
+            # only kept for the rolling window.
+            raise ValueError(f"settle ({settle} days) must not be longer than window ({window} days)")
+        self.window = window
+        self.months_kept = months
+        self.settle = settle
+        data = data or {}
+        self.months = data.get('months', {})
+        self.rolling = data.get('rolling', {})
+        self.days = data.get('days', {})
+        self.as_of = data.get('as_of')
+        self.changed = False
+
+    def _start(self, days):
+        # First date of the last `days` days, as YYYY-MM-DD.
+        if self.as_of is None:
+            return ''
+        return (date.fromisoformat(self.as_of) - timedelta(days=days - 1)).isoformat()
+
+    def _count(self, feed, outcome, day, delta):
+        column = OUTCOMES.index(outcome)
+        self.months.setdefault(day[:7], {}).setdefault(feed, [0, 0, 0])[column] += delta
+        self.days.setdefault(day, {}).setdefault(feed, [0, 0, 0])[column] += delta
+        self.rolling.setdefault(feed, [0, 0, 0])[column] += delta
+
+    def outcome(self, feed, day):
+        # The outcome counted for feed's file due on day (a date), or None.
+        counts = self.days.get(day.isoformat(), {}).get(feed)
+        if counts is None or not any(counts):
+            return None
+        return OUTCOMES[max(range(len(OUTCOMES)), key=counts.__getitem__)]
+
+    def record(self, feed, outcome, day):
+        # Count the outcome of feed's file due on day (a date). Returns True
+        # when the counters changed.
+        if day.isoformat() < self._start(self.settle):
+            return False
+        previous = self.outcome(feed, day)
+        if previous == outcome:
+            return False
+        day = day.isoformat()
+        if previous is not None:
+            self._count(feed, previous, day, -1)
+        self._count(feed, outcome, day, 1)
+        self.changed = True
+        return True
+
+    def expire(self, today):
+        # Move the rolling window to end on today (a date): subtract the days
+        # that left it and drop old months.
+        if self.as_of is not None and today.isoformat() <= self.as_of:
+            return
+        self.as_of = today.isoformat()
+        self.changed = True
+        start = self._start(self.window)
+        for day in [day for day in self.days if day < start]:
+            for feed, counts in self.days.pop(day).items():
+                rolling = self.rolling[feed]
+                for column, count in enumerate(counts):
+                    rolling[column] -= count
+                if not any(rolling):
+                    del self.rolling[feed]
+        for month in sorted(self.months)[:-self.months_kept]:
+            del self.months[month]
+
+    def totals(self, month=None):
+        # [met, late, missing] over every feed, for month (YYYY-MM) or rolling.
+        feeds = self.months.get(month, {}) if month is not None else self.rolling
+        totals = [0, 0, 0]
+        for counts in feeds.values():
+            for column, count in enumerate(counts):
+                totals[column] += count
+        return totals
+
+    def summary(self, feed):
+        # {'rolling': {...}, 'months': {YYYY-MM: {...}}} for one feed.
+        def counts_summary(counts):
+            return dict(zip(OUTCOMES, counts), compliance=compliance_ratio(counts))
+        return {
+            'rolling': counts_summary(self.rolling.get(feed, [0, 0, 0])),
+            'months': {month: counts_summary(feeds[feed])
+                       for month, feeds in sorted(self.months.items()) if feed in feeds},
+        }
+
+    def feeds(self):
+        return sorted(set(self.rolling).union(*self.months.values()))
+
+    def to_json(self):
+        return {'window': self.window, 'settle': self.settle, 'as_of': self.as_of, 'months': self.months,
+                'rolling': self.rolling, 'days': self.days}
+
+
+class S3ComplianceState(S3JsonState):
+    # A ComplianceRollup in S3. A lost write's outcomes are counted by a
+    # later run.
+
+    def load(self, window=90, months=13, settle=35):
+        return ComplianceRollup(window, months, settle, self.read())
+
+    def save(self, rollup):
+        self.write(rollup.to_json())
+        rollup.changed = False
+
+
+class ComplianceRecorder(QueuedRecorder):
+    # Collects outcomes for one invocation; flush() folds them into the rollup.
+
+    def __init__(self, cloudwatch, namespace='FileSLO-Metrics', window=90, months=13, settle=35):
+        super().__init__()
+        self.cloudwatch = cloudwatch
+        self.namespace = namespace
+        self.window = window
+        self.months = months
+        self.settle = settle
+
+    def add(self, s3_key, outcome, deadline):
+        # Queue one file's outcome; the last one queued for a key wins.
+        self._pending[s3_key] = (outcome, deadline)
+
+    def flush(self, state, feed_of, zone, now=None):
+        # Fold the queued outcomes into the rollup, save it when it changed
+        # and publish fleet-wide compliance, then clear the queue. feed_of
+        # maps an S3 key to its feed (pattern) or None; zone (a tzinfo) gives
+        # each deadline its date. Returns counts of outcomes that changed the
+        # rollup and that did not.
+        now = now or datetime.now(zone)
+        pending = self._take()
+        result = {'changed': 0, 'unchanged': 0}
+        if not pending:
+            return result
+        rollup = state.load(self.window, self.months, self.settle)
+        rollup.expire(now.astimezone(zone).date())
+        for s3_key, (outcome, deadline) in pending.items():
+            feed = feed_of(s3_key)
+            if feed is not None and rollup.record(feed, outcome, deadline.astimezone(zone).date()):
+                result['changed'] += 1
+            else:
+                result['unchanged'] += 1
+        if rollup.changed:
+            state.save(rollup)
+        self._publish(rollup, now.astimezone(zone).strftime('%Y-%m'))
+        return result
+
+    def _publish(self, rollup, month):
+        metric_data = []
+        for window, counts in (('MonthToDate', rollup.totals(month)), ('Rolling', rollup.totals())):
+            ratio = compliance_ratio(counts)
+            if ratio is not None:
+                metric_data.append({'MetricName': 'SLOCompliance', 'Value': ratio, 'Unit': 'Percent',
+                                    'Dimensions': [{'Name': 'Window', 'Value': window}]})
+        if metric_data:
+            self.cloudwatch.put_metric_data(Namespace=self.namespace, MetricData=metric_data)
@@ -0,0 +1,166 @@
+import argparse
+import csv
+import gzip
+import json
+from datetime import date, datetime, timedelta
+from itertools import repeat
+
+import pytz
+
+from holidayrules import holidays_between
+from keytemplates import DEFAULT_KEY_TEMPLATE
+from lambda_function import DEFAULT_TIMEZONE, get_expected_arrival_time, get_expected_key
+
+# Batch SLO deadline tables: every deadline for every pattern in
+# file_slo_mapping.json over a range of years, for capacity planning and
+# the dashboard. As in the checker, slo_time is wall-clock time in the
+# feed's time zone and deadlines are aware UTC datetimes, so they compare
+# directly with S3 LastModified. Each file's S3 key follows its rule's
+# key_template, as in the checker (see keytemplates.py).
+
+def is_monthly_pattern(pattern):
+    # Monthly files are delivered as .dat.pgp, named with YYYYMM.
+    return "dat.pgp" in pattern
+
+def is_daily_pattern(pattern):
+    # Daily files are delivered as .xlsx, named with YYYYMMDD.
+    return "xlsx" in pattern
+
+def business_days(start, end, holidays):
+    # Sorted business days from start to end inclusive.
+    days = []
+    day = start
+    while day <= end:
+        if day.weekday() < 5 and day not in holidays:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+def month_first_business_day_index(days):
+    # Map (year, month) to the index in days of that month's 1st business day.
+    index = {}
+    for i, day in enumerate(days):
+        index.setdefault((day.year, day.month), i)
+    return index
+
+def parse_slo_time(value):
+    if isinstance(value, str):
+        return datetime.strptime(value, '%H:%M').time()
+    return value
+
+def deadline_columns(file_slo_mapping, start_year, end_year, holidays, zone=DEFAULT_TIMEZONE):
+    # Compute the deadline matrix as {pattern: (periods, deadlines)}.
+    # Deadlines only depend on the kind of file, slo_days and slo_time, so each
+    # distinct rule is computed once from a single business-day array and
+    # shared by every pattern using it.
+    # Run one year past end_year so late business days of December resolve.
+    days = business_days(date(start_year, 1, 1), date(end_year + 1, 12, 31), holidays)
+    first_index = month_first_business_day_index(days)
+    months = [(year, month) for year in range(start_year, end_year + 1) for month in range(1, 13)]
+    daily_days = [day for day in days if day.year <= end_year]
+
+    columns = {}
+    computed = {}
+    for pattern, slo in file_slo_mapping.items():
+        if is_monthly_pattern(pattern):
+            kind = 'monthly'
+        elif is_daily_pattern(pattern):
+            kind = 'daily'
+        else:
+            continue
+        slo_time = parse_slo_time(slo['slo_time'])
+        key = (kind, slo['slo_days'], slo_time)
+        if key not in computed:
+            if kind == 'monthly':
+                n = slo['slo_days']
+                periods = [f"{year}{month:02d}" for year, month in months]
+                if n < 1:
+                    # Same as the checker: no business days means the 1st.
+                    deadline_days = [date(year, month, 1) for year, month in months]
+                else:
+                    deadline_days = [days[first_index[month] + n - 1] for month in months]
+            else:
+                periods = [day.strftime('%Y%m%d') for day in daily_days]
+                deadline_days = daily_days
+            # The checker's conversion, so transition days agree with it.
+            deadlines = [get_expected_arrival_time(day, slo_time, zone) for day in deadline_days]
+            computed[key] = (periods, deadlines)
+        columns[pattern] = computed[key]
+    return columns
+
+def deadline_keys(columns, file_slo_mapping, holidays, zone=DEFAULT_TIMEZONE):
+    # {pattern: S3 keys} for the patterns whose rule sets a key_template, in
+    # the order of their periods. A file's date is its local deadline date:
+    # the file date for daily files, the slo_days-th business day for
+    # monthly ones.
+    tz = pytz.timezone(zone)
+    keys = {}
+    for pattern, (periods, deadlines) in columns.items():
+        slo = file_slo_mapping[pattern]
+        if slo.get('key_template', DEFAULT_KEY_TEMPLATE) == DEFAULT_KEY_TEMPLATE:
+            continue
+        keys[pattern] = [get_expected_key(slo, pattern.replace("*", period), period,
+                                          deadline.astimezone(tz).date(), holidays)
+                         for period, deadline in zip(periods, deadlines)]
+    return keys
+
+def deadline_rows(columns, keys=None):
+    # Flatten deadline_columns() into (pattern, period, expected file, S3 key,
+    # deadline). keys comes from deadline_keys(); other files are archive/{name}.
+    keys = keys or {}
+    for pattern, (periods, deadlines) in columns.items():
+        if pattern in keys:
+            for period, s3_key, deadline in zip(periods, keys[pattern], deadlines):
+                yield pattern, period, pattern.replace("*", period), s3_key, deadline
+        else:
+            for period, deadline in zip(periods, deadlines):
+                name = pattern.replace("*", period)
+                yield pattern, period, name, 'archive/' + name, deadline
+
+def open_output(path):
+    # Text output file, gzip-compressed (fast level) when path ends in .gz.
+    if path.endswith('.gz'):
+        return gzip.open(path, 'wt', compresslevel=1, newline='')
+    return open(path, 'w', newline='')
+
+def write_deadline_table(columns, path, keys=None):
+    # Write the table as CSV, gzip-compressed when path ends in .gz. Deadlines
+    # are written in UTC, e.g. 2025-03-13T14:30Z; keys is as for deadline_rows().
+    keys = keys or {}
+    formatted = {}
+    count = 0
+    with open_output(path) as f:
+        writer = csv.writer(f)
+        writer.writerow(['pattern', 'period', 'expected_file_name', 's3_key', 'deadline'])
+        for pattern, (periods, deadlines) in columns.items():
+            # Patterns sharing a rule share one column; format it only once.
+            if id(deadlines) not in formatted:
+                formatted[id(deadlines)] = [deadline.strftime('%Y-%m-%dT%H:%MZ') for deadline in deadlines]
+            names = [pattern.replace("*", period) for period in periods]
+            writer.writerows(zip(repeat(pattern), periods, names,
+                                 keys[pattern] if pattern in keys else ['archive/' + name for name in names],
+                                 formatted[id(deadlines)]))
+            count += len(periods)
+    return count
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write every SLO deadline for a range of years.")
+    parser.add_argument('--mapping', default='file_slo_mapping.json')
+    parser.add_argument('--start-year', type=int, default=date.today().year)
+    parser.add_argument('--years', type=int, default=1)
+    parser.add_argument('--region', default='CA', help="holidayrules region, e.g. CA or US")
+    parser.add_argument('--timezone', default=DEFAULT_TIMEZONE, help="time zone of slo_time")
+    parser.add_argument('--out', default='deadlines.csv.gz')
+    args = parser.parse_args(argv)
+
+    with open(args.mapping) as f:
+        file_slo_mapping = json.load(f)
+    end_year = args.start_year + args.years - 1
+    holidays = holidays_between(args.region, args.start_year, end_year + 1)
+    columns = deadline_columns(file_slo_mapping, args.start_year, end_year, holidays, args.timezone)
+    keys = deadline_keys(columns, file_slo_mapping, holidays, args.timezone)
+    count = write_deadline_table(columns, args.out, keys)
+    print(f"Wrote {count} deadlines for {len(columns)} patterns to {args.out}")
+
+if __name__ == '__main__':
+    main()
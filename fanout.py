@@ -0,0 +1,325 @@
+import bisect
+import hashlib
+import json
+import logging
+import queue
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime
+
+import pytz
+
+import lambda_function
+from lambda_function import (
+    DEFAULT_ALERT_STATE_KEY, DEFAULT_TIMEZONE, ArrivalRecords, LazyClient, check_file, due_daily_files,
+    due_monthly_files, DEFAULT_ARRIVAL_MODEL_KEY, DEFAULT_COMPLIANCE_STATE_KEY, DEFAULT_LATENESS_STATE_KEY,
+    compile_pattern_matcher, flush_alerts, flush_arrival_models, flush_compliance, flush_lateness,
+    get_holidays, get_local_time, load_json_from_s3, parse_slo_mapping, put_cloudwatch_metric_counts,
+    put_limiter_metrics,
+)
+from tracing import traced_handler
+
+logger = logging.getLogger(__name__)
+
+# Coordinator/worker mode for feed sets too large for one invocation.
+#
+# coordinator_handler takes the usual lambda_handler event plus 'partitions'
+# and 'queue_url'. It sends one small SQS message per partition:
+# {run_id, partition, partitions, now, config}. worker_handler (SQS-triggered)
+# loads the mapping itself, keeps the patterns that a consistent-hash ring
+# assigns to its partition, checks their due files as of the coordinator's
+# `now` with lambda_function.check_file(), as the sync engine does, and
+# writes a partial result (metric counts, alerts, outcomes and arrivals) to
+# runs/{run_id}/part-NNNN.json in the config bucket. The worker that writes
+# the last partial claims runs/{run_id}/reduced with a conditional put, then
+# merges every partial into one set of metrics and one alert flush. When
+# the reduce fails the claim is deleted, so the retried message can claim
+# it again. Expire runs/ with a lifecycle rule.
+#
+# run_local() does the same in-process with a LocalQueue and threads.
+
+RUNS_PREFIX = 'runs/'
+VIRTUAL_NODES = 64
+
+sqs = LazyClient('sqs')
+
+
+class HashRing(object):
+    # Consistent hash ring of partitions with virtual nodes. Growing from N to
+    # N + 1 partitions moves about 1/(N + 1) of the patterns.
+
+    def __init__(self, partitions, vnodes=VIRTUAL_NODES):
+        self.partitions = partitions
+        points = sorted((_hash(f'{partition}#{vnode}'), partition)
+                        for partition in range(partitions) for vnode in range(vnodes))
+        self._hashes = [point for point, _ in points]
+        self._owners = [partition for _, partition in points]
+
+    def partition_of(self, pattern):
+        i = bisect.bisect(self._hashes, _hash(pattern)) % len(self._hashes)
+        return self._owners[i]
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class SqsQueue(object):
+
+    def __init__(self, queue_url):
+        self.queue_url = queue_url
+
+    def send(self, messages):
+        for start in range(0, len(messages), 10):
+            entries = [{'Id': str(i), 'MessageBody': json.dumps(message)}
+                       for i, message in enumerate(messages[start:start + 10])]
+            response = sqs.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            if response.get('Failed'):
+                raise RuntimeError(f"Failed to enqueue partitions: {response['Failed']}")
+
+
+class LocalQueue(object):
+    # In-process stand-in for SQS, drained by worker threads.
+
+    def __init__(self):
+        self._queue = queue.Queue()
+
+    def send(self, messages):
+        for message in messages:
+            self._queue.put(json.dumps(message))
+
+    def drain(self, workers):
+        # Run process_partition on every queued message with `workers` threads.
+        errors = []
+
+        def work():
+            while True:
+                try:
+                    body = self._queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    process_partition(json.loads(body))
+                except Exception as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=work) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+
+def coordinate(event, work_queue):
+    # Enqueue one message per partition; return the run id.
+    partitions = int(event.get('partitions', 8))
+    zone = event.get('timezone', DEFAULT_TIMEZONE)
+    now = get_local_time(zone)
+    run_id = f"{now.astimezone(pytz.utc):%Y%m%dT%H%M%SZ}-{uuid.uuid4().hex[:8]}"
+    config = {key: event[key] for key in (
+        'bucket_name', 'sns_topic_arn', 'holidays_file_key', 'slo_mapping_file_key',
+        'useCanadianHolidays', 'timezone', 'missingOnly', 'sendAlerts', 'alert_state_key',
+        'recordLateness', 'lateness_state_key', 'recordCompliance', 'compliance_state_key',
+        'learnArrivals', 'arrival_model_key') if key in event}
+    work_queue.send([
+        {'run_id': run_id, 'partition': partition, 'partitions': partitions,
+         'now': now.isoformat(), 'config': config}
+        for partition in range(partitions)])
+    logger.info(f"Run {run_id}: enqueued {partitions} partitions.")
+    return run_id
+
+
+# Parsed config per (bucket, mapping key, holidays key), reused by warm workers.
+_worker_configs = {}
+
+
+def _load_config(config):
+    key = (config['bucket_name'], config['slo_mapping_file_key'], config['holidays_file_key'])
+    if key not in _worker_configs:
+        _worker_configs[key] = (
+            parse_slo_mapping(load_json_from_s3(config['bucket_name'], config['slo_mapping_file_key'])),
+            load_json_from_s3(config['bucket_name'], config['holidays_file_key']),
+        )
+    return _worker_configs[key]
+
+
+class PartialRecords(object):
+    # A partition's alerts, compliance outcomes and arrivals, queued by
+    # check_file() in place of lambda_function's recorders and written with
+    # the partial result. The reducer replays them with replay().
+
+    def __init__(self):
+        self.alerts = []
+        self.outcomes = []
+        self.lateness = []
+
+    def alert(self, sns_topic_arn, message, dedupe_key):
+        self.alerts.append([sns_topic_arn, message, dedupe_key])
+
+    def outcome(self, s3_key, last_modified, expected_arrival_time):
+        self.outcomes.append([s3_key, last_modified and last_modified.isoformat(),
+                              expected_arrival_time.isoformat()])
+
+    def arrival(self, metric_prefix, s3_key, last_modified, expected_arrival_time):
+        self.lateness.append([metric_prefix, s3_key, last_modified.isoformat(),
+                              expected_arrival_time.isoformat()])
+
+
+def replay(partial, records):
+    # Queue a partial result's alerts, outcomes and arrivals on records.
+    for topic_arn, message, dedupe_key in partial['alerts']:
+        records.alert(topic_arn, message, dedupe_key)
+    for s3_key, last_modified, deadline in partial.get('outcomes', []):
+        records.outcome(s3_key, last_modified and datetime.fromisoformat(last_modified),
+                        datetime.fromisoformat(deadline))
+    for metric_prefix, s3_key, last_modified, deadline in partial.get('lateness', []):
+        records.arrival(metric_prefix, s3_key, datetime.fromisoformat(last_modified),
+                        datetime.fromisoformat(deadline))
+
+
+def _holidays(config, holidays_data, now):
+    # The run's holidays, for the year of now and the next, as in lambda_handler.
+    region = 'CA' if config.get('useCanadianHolidays', False) else 'US'
+    listed = holidays_data.get('ca_public_holidays' if region == 'CA' else 'us_public_holidays', {})
+    return get_holidays(listed, region, [now.year, now.year + 1])
+
+
+def process_partition(message):
+    # Worker: check one partition and write its partial result.
+    config = message['config']
+    bucket_name = config['bucket_name']
+    zone = config.get('timezone', DEFAULT_TIMEZONE)
+    record_arrivals = not config.get('missingOnly', False)
+    now = datetime.fromisoformat(message['now']).astimezone(pytz.timezone(zone))
+    file_slo_mapping, holidays_data = _load_config(config)
+
+    ring = HashRing(message['partitions'])
+    shard = {pattern: slo for pattern, slo in file_slo_mapping.items()
+             if ring.partition_of(pattern) == message['partition']}
+    holidays = _holidays(config, holidays_data, now)
+
+    metrics = Counter()
+    records = PartialRecords()
+    due = [*due_monthly_files(holidays, shard, now, zone), *due_daily_files(holidays, shard, now, zone)]
+    for item in due:
+        check_file(*item, bucket_name, config['sns_topic_arn'], record_arrivals, metrics=metrics, records=records)
+
+    run_prefix = f"{RUNS_PREFIX}{message['run_id']}/"
+    partial = {
+        'partition': message['partition'],
+        'patterns': len(shard),
+        'checked': len(due),
+        'metrics': [[name, reason, count] for (name, reason), count in metrics.items()],
+        'alerts': records.alerts,
+        'lateness': records.lateness,
+        'outcomes': records.outcomes,
+    }
+    s3 = lambda_function.s3
+    s3.put_object(Bucket=bucket_name, Key=f"{run_prefix}part-{message['partition']:04d}.json",
+                  Body=json.dumps(partial).encode('utf-8'))
+    if _all_partials_written(bucket_name, run_prefix, message['partitions']) and _claim_reduce(bucket_name, run_prefix):
+        try:
+            reduce_run(config, run_prefix, message['partitions'], now)
+        except Exception:
+            _release_reduce(bucket_name, run_prefix)
+            raise
+    return partial
+
+
+def _all_partials_written(bucket_name, run_prefix, partitions):
+    s3 = lambda_function.s3
+    count = 0
+    token = None
+    while True:
+        kwargs = {'Bucket': bucket_name, 'Prefix': f"{run_prefix}part-"}
+        if token:
+            kwargs['ContinuationToken'] = token
+        response = s3.list_objects_v2(**kwargs)
+        count += response['KeyCount']
+        token = response.get('NextContinuationToken')
+        if not token:
+            return count >= partitions
+
+
+def _claim_reduce(bucket_name, run_prefix):
+    # Exactly one worker wins the conditional put and runs the reducer.
+    s3 = lambda_function.s3
+    try:
+        s3.put_object(Bucket=bucket_name, Key=f"{run_prefix}reduced", Body=b'', IfNoneMatch='*')
+    except s3.exceptions.ClientError as e:
+        if e.response['Error']['Code'] in ('PreconditionFailed', 'ConditionalRequestConflict'):
+            return False
+        raise
+    return True
+
+
+def _release_reduce(bucket_name, run_prefix):
+    # Give up a claim after a failed reduce, so the retried message reduces
+    # again. A worker that dies mid-reduce keeps the claim; its run is lost.
+    lambda_function.s3.delete_object(Bucket=bucket_name, Key=f"{run_prefix}reduced")
+
+
+def reduce_run(config, run_prefix, partitions, now=None):
+    # Merge every partial into one metrics publish and one alert flush. now
+    # is the run's time (default the current time), which dates the
+    # compliance rollups and picks the holiday years. Metrics are published
+    # last: the flushes before them are idempotent, so a reduce that fails
+    # and is retried does not count a file twice.
+    bucket_name = config['bucket_name']
+    zone = config.get('timezone', DEFAULT_TIMEZONE)
+    now = now or get_local_time(zone)
+    metrics = Counter()
+    records = ArrivalRecords()
+    checked = 0
+    for partition in range(partitions):
+        partial = load_json_from_s3(bucket_name, f"{run_prefix}part-{partition:04d}.json")
+        checked += partial['checked']
+        for name, reason, count in partial['metrics']:
+            metrics[name, reason] += count
+        replay(partial, records)
+    flush_alerts(config.get('sendAlerts', False), bucket_name,
+                 config.get('alert_state_key', DEFAULT_ALERT_STATE_KEY))
+    file_slo_mapping, holidays_data = _load_config(config)
+    matcher = compile_pattern_matcher(file_slo_mapping)
+    flush_lateness(config.get('recordLateness', True), bucket_name,
+                   config.get('lateness_state_key', DEFAULT_LATENESS_STATE_KEY),
+                   matcher, _holidays(config, holidays_data, now), zone)
+    flush_compliance(config.get('recordCompliance', True), bucket_name,
+                     config.get('compliance_state_key', DEFAULT_COMPLIANCE_STATE_KEY), matcher, zone, now)
+    flush_arrival_models(config.get('learnArrivals', True), bucket_name,
+                         config.get('arrival_model_key', DEFAULT_ARRIVAL_MODEL_KEY), matcher)
+    put_cloudwatch_metric_counts(metrics)
+    logger.info(f"Reduced {partitions} partitions of {run_prefix}: {checked} files checked.")
+    return {'checked': checked, 'metrics': sum(metrics.values())}
+
+
+@traced_handler
+def coordinator_handler(event, context):
+    run_id = coordinate(event, SqsQueue(event['queue_url']))
+    return {'statusCode': 200, 'body': f"Started run {run_id}."}
+
+
+@traced_handler
+def worker_handler(event, context):
+    # SQS-triggered; failed partitions are retried through batchItemFailures.
+    failures = []
+    for record in event.get('Records', []):
+        try:
+            process_partition(json.loads(record['body']))
+        except Exception:
+            logger.exception(f"Failed to process partition message {record['messageId']}")
+            failures.append({'itemIdentifier': record['messageId']})
+    put_limiter_metrics()
+    return {'batchItemFailures': failures}
+
+
+def run_local(event, workers=4):
+    # Coordinator, workers and reducer in one process, for local runs and
+    # benchmarks. Returns the run id.
+    work_queue = LocalQueue()
+    run_id = coordinate(event, work_queue)
+    work_queue.drain(workers)
+    return run_id
@@ -0,0 +1,203 @@
+from datetime import date, timedelta
+from functools import lru_cache
+
+MON, TUE, WED, THU, FRI, SAT, SUN = range(7)
+
+# Rules turn a year into the date a holiday falls on, or None when the
+# holiday does not exist that year.
+
+def fixed(month, day):
+    # Same calendar date every year.
+    return lambda year: date(year, month, day)
+
+def nth_weekday(month, weekday, n):
+    # nth given weekday of the month, e.g. the 3rd Monday of January.
+    def rule(year):
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    return rule
+
+def last_weekday(month, weekday):
+    # Last given weekday of the month, e.g. the last Monday of May.
+    def rule(year):
+        next_month = date(year + month // 12, month % 12 + 1, 1)
+        last = next_month - timedelta(days=1)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+    return rule
+
+def weekday_on_or_before(month, day, weekday):
+    # Given weekday on or before a date, e.g. Victoria Day is the Monday on
+    # or before May 24.
+    def rule(year):
+        anchor = date(year, month, day)
+        return anchor - timedelta(days=(anchor.weekday() - weekday) % 7)
+    return rule
+
+def easter(year):
+    # Gregorian Easter Sunday (anonymous Gregorian algorithm).
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+def easter_offset(days):
+    # Relative to Easter Sunday, e.g. Good Friday is -2.
+    return lambda year: easter(year) + timedelta(days=days)
+
+def since(first_year, rule):
+    # Holiday only observed from first_year on.
+    return lambda year: rule(year) if year >= first_year else None
+
+# Observed-shift policies for holidays that land on a weekend.
+
+def observe_us(day, taken):
+    # US federal: Saturday moves to Friday, Sunday to Monday.
+    if day.weekday() == SAT:
+        return day - timedelta(days=1)
+    if day.weekday() == SUN:
+        return day + timedelta(days=1)
+    return day
+
+def observe_as_is(day, taken):
+    # No weekend shift; rules that move a day do so themselves.
+    return day
+
+def sunday_to_monday(rule):
+    # Held on the Monday when the date is a Sunday, as the Quebec statutes
+    # do for the Fete nationale and Canada Day. A Saturday is not moved.
+    def shifted(year):
+        day = rule(year)
+        return day + timedelta(days=1) if day is not None and day.weekday() == SUN else day
+    return shifted
+
+def observe_next_weekday(day, taken):
+    # Canada: move to the next weekday that is not already a holiday, so
+    # Christmas and Boxing Day on a weekend become Monday and Tuesday.
+    while day.weekday() >= SAT or day in taken:
+        day += timedelta(days=1)
+    return day
+
+US_FEDERAL = [
+    ("New Year's Day", fixed(1, 1)),
+    ("Martin Luther King Jr. Day", nth_weekday(1, MON, 3)),
+    ("Presidents' Day", nth_weekday(2, MON, 3)),
+    ("Memorial Day", last_weekday(5, MON)),
+    ("Juneteenth", since(2021, fixed(6, 19))),
+    ("Independence Day", fixed(7, 4)),
+    ("Labor Day", nth_weekday(9, MON, 1)),
+    ("Columbus Day", nth_weekday(10, MON, 2)),
+    ("Veterans Day", fixed(11, 11)),
+    ("Thanksgiving Day", nth_weekday(11, THU, 4)),
+    ("Christmas Day", fixed(12, 25)),
+]
+
+NEW_YEARS_DAY = ("New Year's Day", fixed(1, 1))
+FAMILY_DAY = ("Family Day", nth_weekday(2, MON, 3))
+GOOD_FRIDAY = ("Good Friday", easter_offset(-2))
+VICTORIA_DAY = ("Victoria Day", weekday_on_or_before(5, 24, MON))
+CANADA_DAY = ("Canada Day", fixed(7, 1))
+CIVIC_HOLIDAY = ("Civic Holiday", nth_weekday(8, MON, 1))
+LABOUR_DAY = ("Labour Day", nth_weekday(9, MON, 1))
+TRUTH_AND_RECONCILIATION_DAY = ("National Day for Truth and Reconciliation", since(2021, fixed(9, 30)))
+THANKSGIVING = ("Thanksgiving", nth_weekday(10, MON, 2))
+REMEMBRANCE_DAY = ("Remembrance Day", fixed(11, 11))
+CHRISTMAS_DAY = ("Christmas Day", fixed(12, 25))
+BOXING_DAY = ("Boxing Day", fixed(12, 26))
+
+# The Canadian business calendar used by the SLO checker (the
+# ca_public_holidays list in holidays.json).
+CA_BUSINESS = [
+    NEW_YEARS_DAY,
+    ("Day after New Year's Day", fixed(1, 2)),
+    FAMILY_DAY,
+    GOOD_FRIDAY,
+    VICTORIA_DAY,
+    CANADA_DAY,
+    CIVIC_HOLIDAY,
+    LABOUR_DAY,
+    TRUTH_AND_RECONCILIATION_DAY,
+    THANKSGIVING,
+    CHRISTMAS_DAY,
+    BOXING_DAY,
+]
+
+CA_FEDERAL = [
+    NEW_YEARS_DAY, GOOD_FRIDAY, VICTORIA_DAY, CANADA_DAY, LABOUR_DAY,
+    TRUTH_AND_RECONCILIATION_DAY, THANKSGIVING, REMEMBRANCE_DAY,
+    CHRISTMAS_DAY, BOXING_DAY,
+]
+
+CA_ON = [
+    NEW_YEARS_DAY, FAMILY_DAY, GOOD_FRIDAY, VICTORIA_DAY, CANADA_DAY,
+    LABOUR_DAY, THANKSGIVING, CHRISTMAS_DAY, BOXING_DAY,
+]
+
+# Quebec's statutory holidays are not moved off a weekend, except that the
+# Fete nationale and Canada Day on a Sunday are held on the Monday.
+CA_QC = [
+    NEW_YEARS_DAY, GOOD_FRIDAY,
+    ("National Patriots' Day", weekday_on_or_before(5, 24, MON)),
+    ("Fete nationale", sunday_to_monday(fixed(6, 24))),
+    ("Canada Day", sunday_to_monday(fixed(7, 1))),
+    LABOUR_DAY, THANKSGIVING, CHRISTMAS_DAY,
+]
+
+CA_BC = [
+    NEW_YEARS_DAY, FAMILY_DAY, GOOD_FRIDAY, VICTORIA_DAY, CANADA_DAY,
+    ("British Columbia Day", nth_weekday(8, MON, 1)),
+    LABOUR_DAY,
+    ("National Day for Truth and Reconciliation", since(2023, fixed(9, 30))),
+    THANKSGIVING, REMEMBRANCE_DAY, CHRISTMAS_DAY,
+]
+
+CA_AB = [
+    NEW_YEARS_DAY, FAMILY_DAY, GOOD_FRIDAY, VICTORIA_DAY, CANADA_DAY,
+    LABOUR_DAY, THANKSGIVING, REMEMBRANCE_DAY, CHRISTMAS_DAY,
+]
+
+REGIONS = {
+    'US': (US_FEDERAL, observe_us),
+    'CA': (CA_BUSINESS, observe_next_weekday),
+    'CA-FEDERAL': (CA_FEDERAL, observe_next_weekday),
+    'CA-ON': (CA_ON, observe_next_weekday),
+    'CA-QC': (CA_QC, observe_as_is),
+    'CA-BC': (CA_BC, observe_next_weekday),
+    'CA-AB': (CA_AB, observe_next_weekday),
+}
+
+def _observed_holidays(region, year):
+    # Observed dates of one year's holidays, which may fall outside it
+    # (US New Year's Day on a Saturday is observed on December 31).
+    rules, observe = REGIONS[region]
+    taken = set()
+    for name, rule in rules:
+        day = rule(year)
+        if day is not None:
+            taken.add(observe(day, taken))
+    return taken
+
+@lru_cache(maxsize=256)
+def holidays_for(region, year):
+    # Return the frozenset of observed holiday dates in year for region.
+    # Neighbouring years are generated too so shifts across New Year land
+    # in the right year.
+    if region not in REGIONS:
+        raise KeyError(f"Unknown holiday region {region!r}; expected one of {sorted(REGIONS)}")
+    days = set()
+    for source_year in (year - 1, year, year + 1):
+        days.update(day for day in _observed_holidays(region, source_year) if day.year == year)
+    return frozenset(days)
+
+def holidays_between(region, start_year, end_year):
+    # Union of holidays_for() over start_year..end_year inclusive.
+    days = set()
+    for year in range(start_year, end_year + 1):
+        days |= holidays_for(region, year)
+    return days
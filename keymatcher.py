@@ -0,0 +1,77 @@
+# Map S3 keys to the most specific file_slo_mapping.json pattern.
+#
+# Patterns are globs with at most one '*', e.g. L1_PROFIT_CENTER_*.xlsx.
+# Their literal prefixes go into a character trie, so one walk down the key
+# finds every pattern whose prefix matches, in time proportional to the key
+# length rather than to the number of patterns. Overlapping patterns are
+# disambiguated deterministically by specificity:
+#
+#   1. longest literal prefix,
+#   2. then an exact (wildcard-free) pattern before a glob,
+#   3. then longest literal suffix,
+#   4. then the pattern string itself.
+#
+# So L1_PROFIT_CENTER_HIERARCHY_EXPLOSION_20250101.xlsx maps to
+# L1_PROFIT_CENTER_HIERARCHY_EXPLOSION_*.xlsx, not L1_PROFIT_CENTER_*.xlsx.
+
+# Trie node key holding the patterns that end at a node; not a character,
+# so it never collides with a key's characters.
+_END = None
+
+
+class KeyMatcher(object):
+    # Compiled matcher over a collection of glob patterns.
+
+    def __init__(self, patterns=()):
+        self._root = {}
+        self._count = 0
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, pattern):
+        # Add a pattern. Only the first '*' is a wildcard.
+        prefix, star, suffix = pattern.partition('*')
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        entries = node.setdefault(_END, [])
+        entry = (suffix if star else None, pattern)
+        if entry in entries:
+            return
+        entries.append(entry)
+        # Exact patterns first, then longest suffix, then by pattern.
+        entries.sort(key=lambda e: (e[0] is not None, -len(e[0] or ''), e[1]))
+        self._count += 1
+
+    def candidates(self, key):
+        # Yield (pattern, wildcard text) for every pattern matching key, most
+        # specific first. The wildcard text is None for exact patterns.
+        node = self._root
+        ends = []
+        if _END in node:
+            ends.append((0, node[_END]))
+        depth = 0
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                break
+            depth += 1
+            if _END in node:
+                ends.append((depth, node[_END]))
+        length = len(key)
+        for depth, entries in reversed(ends):
+            for suffix, pattern in entries:
+                if suffix is None:
+                    if depth == length:
+                        yield pattern, None
+                elif length - depth >= len(suffix) and key.endswith(suffix):
+                    yield pattern, key[depth:length - len(suffix)]
+
+    def match(self, key):
+        # Return (pattern, wildcard text) for the most specific match, or None.
+        for candidate in self.candidates(key):
+            return candidate
+        return None
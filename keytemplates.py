@@ -0,0 +1,56 @@
+import string
+
+# Key templates: where each rule's files are expected in the archive.
+#
+# A file_slo_mapping.json rule can set "key_template" to place its files in
+# a date-partitioned layout instead of the flat archive/{name}, e.g.
+#
+#   "L1_PROFIT_CENTER_*.xlsx": {"slo_days": 0, "slo_time": "10:30",
+#                               "key_template": "archive/{yyyy}/{mm}/{dd}/{name}"}
+#
+# Tokens:
+#
+#   {name}    the file name: the pattern with '*' replaced by the period
+#   {period}  YYYYMM for monthly files, YYYYMMDD for daily ones
+#   {yyyy} {mm} {dd}
+#             the file's date: the file date for daily files, the deadline
+#             (the slo_days-th business day) for monthly ones
+#   {bd}      that date's business day of the month (1, 2, ...), or {bd:02d}
+#
+# {name} must be the last path segment, so event notifications can be
+# matched by the key's basename. A template whose directory has a token is
+# partitioned: the poll lists each partition due today once (see
+# probe_partitions in lambda_function.py) instead of a head_object per file.
+
+DEFAULT_KEY_TEMPLATE = 'archive/{name}'
+TOKENS = frozenset(['name', 'period', 'yyyy', 'mm', 'dd', 'bd'])
+
+_formatter = string.Formatter()
+
+
+def template_fields(template):
+    return {field for _, field, _, _ in _formatter.parse(template) if field is not None}
+
+
+def validate_template(template):
+    # Raise ValueError unless template only uses known tokens and ends in {name}.
+    fields = template_fields(template)
+    unknown = fields - TOKENS
+    if unknown:
+        raise ValueError(f"Unknown token(s) {sorted(unknown)} in key template {template!r}")
+    if not template.endswith('/{name}') or '{name}' in template[:-len('{name}')]:
+        raise ValueError(f"Key template {template!r} must end with {{name}} as its last path segment")
+    if not template.startswith('archive/'):
+        raise ValueError(f"Key template {template!r} must be under archive/")
+    return template
+
+
+def is_partitioned(template):
+    # True when the directory part of template depends on the date.
+    return bool(template_fields(template.rpartition('/')[0]))
+
+
+def render_key(template, name, period, date, business_day=None):
+    # The S3 key for one expected file.
+    return template.format(name=name, period=period, yyyy=f"{date.year:04d}", mm=f"{date.month:02d}",
+                           dd=f"{date.day:02d}", bd=business_day)
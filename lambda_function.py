@@ -1,35 +1,145 @@
-import boto3
+import time as _time
+_IMPORT_START = _time.perf_counter()
+
+from calendar import monthrange
+from collections import Counter
 from datetime import datetime, timedelta, time
+from functools import partial
+import hashlib
 import json
 import logging
+import os
+import sys
+from urllib.parse import unquote_plus
+
+import pytz
+
+from alerts import AlertDispatcher, S3AlertState
+from archivelist import ParallelLister, Partition
+from arrivals import ArrivalTracker, S3ArrivalIndexStore
+from compliance import DEFAULT_COMPLIANCE_STATE_KEY, ComplianceRecorder, S3ComplianceState
+from holidayrules import holidays_for
+from keymatcher import KeyMatcher
+from keytemplates import DEFAULT_KEY_TEMPLATE, is_partitioned, render_key, template_fields, validate_template
+from lateness import DEFAULT_LATENESS_STATE_KEY, LatenessRecorder, S3LatenessState
+from predictor import ArrivalPredictor, S3ArrivalModelState
+from ratelimit import LimitedClient, limiter_for, snapshots
+from tracing import instrument, traced, traced_handler
+
+class LazyClient(object):
+    # boto3 client created on first use and then shared by warm invocations,
+    # so runs that exit early never import boto3 or build a client.
+    # Clients are wrapped for per-call timings when SLO_TRACE is set (see tracing.py),
+    # and every call goes through the service's shared rate limiter (see
+    # ratelimit.py), which does the retrying instead of botocore.
 
-s3 = boto3.client('s3')
-sns = boto3.client('sns')
-cloudwatch = boto3.client('cloudwatch')
+    def __init__(self, service_name):
+        self._service_name = service_name
+        self._client = None
+
+    def __getattr__(self, attr):
+        if self._client is None:
+            import boto3
+            from botocore.config import Config
+            client = boto3.client(self._service_name, config=Config(retries={'total_max_attempts': 1}))
+            self._client = LimitedClient(instrument(client, self._service_name),
+                                         limiter_for(self._service_name))
+        return getattr(self._client, attr)
+
+s3 = LazyClient('s3')
+sns = LazyClient('sns')
+cloudwatch = LazyClient('cloudwatch')
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-def load_json_from_s3(bucket_name, key):
-    # Load JSON data from an S3 bucket.
+# Copies of file_slo_mapping.json and holidays.json deployed with the
+# function. The pre-check reads them on a cold start, before any full
+# load from S3, but only skips the check when the S3 objects' ETags still
+# match the copies (see precheck_skips); a stale copy costs a full check.
+BUNDLED_CONFIG_DIR = os.environ.get('SLO_BUNDLED_CONFIG_DIR', os.path.dirname(os.path.abspath(__file__)))
+
+# (mapping summary, listed holidays, ETags) per config, from the last S3
+# load in this container. Preferred over the bundled copies by the pre-check.
+_schedules = {}
+
+# Set until the first invocation in this container has logged the import report.
+_cold_start = True
+
+# Where sent alerts are remembered between runs, in the config bucket.
+DEFAULT_ALERT_STATE_KEY = 'state/sent_alerts.json'
+
+# Where the arrival index is kept between runs, in the config bucket (see arrivals.py).
+DEFAULT_ARRIVAL_INDEX_KEY = 'state/arrival_index.json'
+
+# Alerts raised during an invocation, sent as SNS digests when it ends.
+_alerts = AlertDispatcher(sns)
+
+# Arrivals seen during an invocation, published and folded into the
+# lateness distributions when it ends.
+_lateness = LatenessRecorder(cloudwatch)
+
+# Outcomes (met, late, missing) seen during an invocation, folded into the
+# compliance rollups when it ends.
+_compliance = ComplianceRecorder(cloudwatch)
+
+# Where the per-feed arrival-time models are kept, in the config bucket (see predictor.py).
+DEFAULT_ARRIVAL_MODEL_KEY = 'state/arrival_model.json'
+
+# Arrivals seen during an invocation, learned by the arrival models when it
+# ends; the models then flag files at risk before their deadline.
+_predictor = ArrivalPredictor()
+
+# Zone the SLO deadlines are written in, unless the event overrides it.
+DEFAULT_TIMEZONE = 'America/Toronto'
+
+# UTC offset of each (zone, date), so the zone data is loaded once per
+# container. Days with a DST transition map to None and are localized per
+# deadline instead.
+_utc_offsets = {}
+
+@traced()
+def load_json_from_s3(bucket_name, key, with_etag=False):
+    # Load JSON data from an S3 bucket; with with_etag, as (data, ETag).
     response = s3.get_object(Bucket=bucket_name, Key=key)
     data = json.loads(response['Body'].read().decode('utf-8'))
+    if with_etag:
+        return data, response.get('ETag')
     return data
 
+@traced()
 def parse_slo_mapping(slo_mapping_data):
     # Parse the SLO mapping data and convert slo_time to time objects.
     for pattern, slo in slo_mapping_data.items():
         slo['slo_time'] = datetime.strptime(slo['slo_time'], '%H:%M').time()
+        if 'key_template' in slo:
+            validate_template(slo['key_template'])
     return slo_mapping_data
 
+@traced()
+def get_holidays(listed_holidays, region, years):
+    # Build the holiday set for the given years. Years listed in holidays.json
+    # are used as-is; any other year is generated from the region's rules.
+    holidays = set()
+    for year in years:
+        listed = listed_holidays.get(str(year))
+        if listed is not None:
+            holidays.update(datetime.strptime(date, '%Y-%m-%d').date() for date in listed)
+        else:
+            holidays.update(holidays_for(region, year))
+    return holidays
+
 def is_holiday(date, holidays):
-    # Check if a date is a holiday.
+    # Check if a date (or datetime) is a holiday.
+    if isinstance(date, datetime):
+        date = date.date()
     return date in holidays
 
 def is_business_day(date, holidays):
     # Check if a date is a business day (Monday to Friday and not a holiday).
     return date.weekday() < 5 and not is_holiday(date, holidays)
 
+@traced('business_days')
 def get_nth_business_day(year, month, n, holidays):
     # Calculate the nth business day of the month, excluding weekends and holidays.
     date = datetime(year, month, 1)  # Start from the first day of the month
@@ -41,20 +151,120 @@ def get_nth_business_day(year, month, n, holidays):
             date += timedelta(days=1)  # Move to the next day
     return date
   
-def get_expected_arrival_time(date, slo_time):
-    # Get the expected arrival time for a given date.
-    return datetime.combine(date, slo_time)
+def get_business_day_index(date, holidays):
+    # Business day of the month that date is (1 for the first), counting
+    # date itself even when it is not one.
+    day = date.replace(day=1)
+    index = 1
+    while day < date:
+        if is_business_day(day, holidays):
+            index += 1
+        day += timedelta(days=1)
+    return index
+
+def get_expected_key(slo, expected_file_name, period, date, holidays):
+    # S3 key of one expected file under its rule's key template (see keytemplates.py).
+    template = slo.get('key_template', DEFAULT_KEY_TEMPLATE)
+    business_day = get_business_day_index(date, holidays) if 'bd' in template_fields(template) else None
+    return render_key(template, expected_file_name, period, date, business_day)
+
+def get_utc_offset(zone, date):
+    # Return the UTC offset in effect all day on date in zone, or None when
+    # the offset changes during the day.
+    key = (zone, date)
+    try:
+        return _utc_offsets[key]
+    except KeyError:
+        pass
+    tz = pytz.timezone(zone)
+    start = tz.localize(datetime.combine(date, time.min)).utcoffset()
+    end = tz.localize(datetime.combine(date, time.max)).utcoffset()
+    offset = _utc_offsets[key] = start if start == end else None
+    return offset
+
+def get_expected_arrival_time(date, slo_time, zone=DEFAULT_TIMEZONE):
+    # Get the expected arrival time for a given date as an aware UTC datetime.
+    # slo_time is wall-clock time in zone.
+    local = datetime.combine(date, slo_time)
+    offset = get_utc_offset(zone, local.date())
+    if offset is None:
+        return pytz.timezone(zone).localize(local).astimezone(pytz.utc)
+    return (local - offset).replace(tzinfo=pytz.utc)
+
+def get_local_time(zone=DEFAULT_TIMEZONE):
+    # Get the current time in zone, as an aware datetime.
+    return datetime.now(pytz.utc).astimezone(pytz.timezone(zone))
+
+def send_alert(message, sns_topic_arn, dedupe_key=None):
+    # Queue an alert for SNS. The handler sends queued alerts as digests when
+    # it finishes; alerts with a dedupe_key already sent are not repeated.
+    _alerts.add(sns_topic_arn, message, dedupe_key)
+
+def flush_alerts(enabled, state_bucket, state_key):
+    # Send the queued alerts as digests, or drop them when alerts are disabled.
+    if not enabled:
+        if len(_alerts):
+            logger.info(f"Alerts are disabled. Dropping {len(_alerts)} queued alerts.")
+        _alerts.clear()
+        return
+    if not len(_alerts):
+        return
+    result = _alerts.flush(S3AlertState(s3, state_bucket, state_key))
+    logger.info(f"Alert digests: {json.dumps(result)}")
+
+def record_lateness(metric_prefix, s3_key, last_modified, expected_arrival_time):
+    # Queue an arrival's lateness; flush_lateness publishes each file once.
+    _lateness.add(metric_prefix, s3_key, last_modified, expected_arrival_time)
 
-def get_est_time():
-    # Get the current time in EST (UTC-5).
-    utc_now = datetime.utcnow()
-    est_offset = timedelta(hours=-5)  # EST is UTC-5
-    return utc_now + est_offset
+def flush_lateness(enabled, state_bucket, state_key, matcher, holidays, zone):
+    # Publish the queued arrivals' lateness and update the per-feed
+    # distributions, or drop them when lateness recording is disabled.
+    if not enabled or not len(_lateness):
+        _lateness.clear()
+        return
+    result = _lateness.flush(S3LatenessState(s3, state_bucket, state_key), partial(match_key, matcher), holidays,
+                             pytz.timezone(zone))
+    logger.info(f"Lateness: {json.dumps(result)}")
+
+def record_compliance(s3_key, last_modified, expected_arrival_time):
+    # Queue a file's outcome (missing when last_modified is None) for the
+    # compliance rollups.
+    if last_modified is None:
+        outcome = 'missing'
+    elif last_modified <= expected_arrival_time:
+        outcome = 'met'
+    else:
+        outcome = 'late'
+    _compliance.add(s3_key, outcome, expected_arrival_time)
 
-def send_alert(message, sns_topic_arn):
-    # Send an alert via SNS.
-    #sns.publish(TopicArn=sns_topic_arn, Message=message, Subject="File Arrival Alert")
-    return
+def flush_compliance(enabled, state_bucket, state_key, matcher, zone, now=None):
+    # Fold the queued outcomes into the compliance rollups as of now (default
+    # the current time), or drop them when rollups are disabled.
+    if not enabled or not len(_compliance):
+        _compliance.clear()
+        return
+    result = _compliance.flush(S3ComplianceState(s3, state_bucket, state_key), partial(feed_of, matcher),
+                               pytz.timezone(zone), now)
+    logger.info(f"Compliance: {json.dumps(result)}")
+
+def observe_arrival(s3_key, last_modified, expected_arrival_time):
+    # Queue an arrival for the arrival-time models.
+    _predictor.observe(s3_key, last_modified, expected_arrival_time)
+
+def flush_arrival_models(learn, state_bucket, state_key, matcher, load=False):
+    # Fold the queued arrivals into the per-feed arrival models, or drop them
+    # when learning is disabled. Returns the models, or None when there was
+    # nothing to learn and load is not set.
+    if not learn:
+        _predictor.clear()
+    if not len(_predictor) and not load:
+        return None
+    state = S3ArrivalModelState(s3, state_bucket, state_key)
+    if not len(_predictor):
+        return state.load()
+    models, result = _predictor.flush(state, partial(feed_of, matcher))
+    logger.info(f"Arrival models: {json.dumps(result)}")
+    return models
 
 def add_slo_status_tag(bucket_name, key, status):
     # Add an SLO status tag to the specified S3 object.
@@ -86,11 +296,107 @@ def put_cloudwatch_metric(metric_name, value, reason=None):
         MetricData=[metric_data]
     )
 
-def check_monthly_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping):
-    # Check for missing monthly files based on SLOs, using specified holidays.
-    today = datetime.now()
-    year = today.year
-    month = today.month
+def put_limiter_metrics():
+    # Publish each client limiter's current rate and its retries and
+    # throttles since the last publish, for services called since then.
+    metric_data = []
+    for service, snapshot in sorted(snapshots(reset=True).items()):
+        if not snapshot['calls'] and not snapshot['throttles']:
+            continue
+        dimensions = [{'Name': 'Service', 'Value': service}]
+        metric_data += [
+            {'MetricName': 'ClientRate', 'Value': snapshot['rate'], 'Unit': 'Count/Second', 'Dimensions': dimensions},
+            {'MetricName': 'ClientRetries', 'Value': snapshot['retries'], 'Unit': 'Count', 'Dimensions': dimensions},
+            {'MetricName': 'ClientThrottles', 'Value': snapshot['throttles'], 'Unit': 'Count', 'Dimensions': dimensions},
+        ]
+    if metric_data:
+        cloudwatch.put_metric_data(Namespace='FileSLO-Metrics', MetricData=metric_data)
+
+def evaluate_arrival(metric_prefix, expected_file_name, last_modified, expected_arrival_time):
+    # Decide the SLO result for one expected file; last_modified is None when
+    # the file is missing. Returns (tag status or None, metric name, metric
+    # reason, alert message or None, alert dedupe key). The sync, async and
+    # event-driven paths share this and only differ in how they do the I/O.
+    # metric_prefix is 'Monthly' or 'Daily'.
+    if last_modified is None:
+        alert_message = (
+            f"File {expected_file_name} is missing in the archive folder. "
+            f"SLO not met. Expected by: {expected_arrival_time}"
+        )
+        return None, f'{metric_prefix}SLONotMet', 'FileNotFound', alert_message, f"{expected_file_name}:missing"
+    if last_modified <= expected_arrival_time:
+        return 'met', f'{metric_prefix}SLOMet', None, None, None
+    alert_message = (
+        f"File {expected_file_name} exists but arrived late. "
+        f"SLO not met. Expected by: {expected_arrival_time}, Arrived on: {last_modified}"
+    )
+    return 'not met', f'{metric_prefix}SLONotMet', 'LateArrival', alert_message, f"{expected_file_name}:late"
+
+class ArrivalRecords(object):
+    # Where note_arrival() queues a file's alert, compliance outcome and, for
+    # a file that exists, its lateness and arrival-model observation: this
+    # container's recorders, flushed at the end of the invocation. fanout.py
+    # collects them in a partition's partial result instead.
+
+    def alert(self, sns_topic_arn, message, dedupe_key):
+        send_alert(message, sns_topic_arn, dedupe_key)
+
+    def outcome(self, s3_key, last_modified, expected_arrival_time):
+        record_compliance(s3_key, last_modified, expected_arrival_time)
+
+    def arrival(self, metric_prefix, s3_key, last_modified, expected_arrival_time):
+        record_lateness(metric_prefix, s3_key, last_modified, expected_arrival_time)
+        observe_arrival(s3_key, last_modified, expected_arrival_time)
+
+_records = ArrivalRecords()
+
+def note_arrival(metric_prefix, s3_key, expected_file_name, last_modified, expected_arrival_time,
+                 sns_topic_arn, records=None):
+    # Evaluate an expected file (missing when last_modified is None), log it
+    # and queue everything but its S3 tag and metric on records (default
+    # this container's recorders). Returns (tag status or None, metric name,
+    # metric reason) for the caller to tag and meter the file its own way.
+    records = records or _records
+    status, metric_name, reason, alert_message, dedupe_key = evaluate_arrival(
+        metric_prefix, expected_file_name, last_modified, expected_arrival_time)
+    if alert_message is None:
+        logger.info(f"File {expected_file_name} exists and arrived on time. SLO met.")
+    else:
+        logger.info(alert_message)
+        records.alert(sns_topic_arn, alert_message, dedupe_key)
+    records.outcome(s3_key, last_modified, expected_arrival_time)
+    if last_modified is not None:
+        records.arrival(metric_prefix, s3_key, last_modified, expected_arrival_time)
+    return status, metric_name, reason
+
+def record_arrival(metric_prefix, bucket_name, s3_key, expected_file_name, last_modified,
+                   expected_arrival_time, sns_topic_arn, metrics=None, records=None):
+    # Record the SLO result for an expected file: tag it, emit the metric and
+    # alert when it is late or missing (last_modified None). With metrics (a
+    # Counter), the metric is counted there for put_cloudwatch_metric_counts()
+    # instead of sent.
+    status, metric_name, reason = note_arrival(metric_prefix, s3_key, expected_file_name, last_modified,
+                                               expected_arrival_time, sns_topic_arn, records)
+    if status is not None:
+        add_slo_status_tag(bucket_name, s3_key, status)
+    if metrics is None:
+        put_cloudwatch_metric(metric_name, 1, reason)
+    else:
+        metrics[metric_name, reason] += 1
+
+def is_selected(now, expected_arrival_time, until=None):
+    # True when the deadline has passed at now or, with until, when it is
+    # still ahead but no later than until.
+    if until is None:
+        return now > expected_arrival_time
+    return now < expected_arrival_time <= until
+
+def due_monthly_files(holidays, file_slo_mapping, now, zone=DEFAULT_TIMEZONE, until=None):
+    # Yield (metric prefix, expected file name, s3 key, deadline) for every
+    # monthly file whose deadline this month has passed at now, or with
+    # until, whose deadline is between now and until.
+    year = now.year
+    month = now.month
 
     for pattern, slo in file_slo_mapping.items():
         if "dat.pgp" in pattern:  # Only process monthly files
@@ -99,56 +405,26 @@ def check_monthly_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping):
 
             # Calculate the expected arrival deadline
             expected_arrival_date = get_nth_business_day(year, month, slo_days, holidays)
-            expected_arrival_time = get_expected_arrival_time(expected_arrival_date, slo_time)
+            expected_arrival_time = get_expected_arrival_time(expected_arrival_date, slo_time, zone)
 
             # Check if the deadline has passed
-            if today > expected_arrival_time:
+            if is_selected(now, expected_arrival_time, until):
                 # Construct the expected file name
-                expected_file_name = pattern.replace("*", f"{year}{month:02d}")
-
-                s3_key = f"archive/{expected_file_name}"
-                try:
-                    # Check if the file exists in the S3 bucket
-                    file_metadata = s3.head_object(Bucket=bucket_name, Key=s3_key)
-                    last_modified = file_metadata['LastModified'].replace(tzinfo=None)
-
-                    if last_modified <= expected_arrival_time:
-                        logger.info(f"File {expected_file_name} exists and arrived on time. SLO met.")
-                        add_slo_status_tag(bucket_name, s3_key, 'met')
-                        put_cloudwatch_metric('MonthlySLOMet', 1)
-                    else:
-                        alert_message = (
-                            f"File {expected_file_name} exists but arrived late. "
-                            f"SLO not met. Expected by: {expected_arrival_time}, Arrived on: {last_modified}"
-                        )
-                        logger.info(alert_message)
-                        send_alert(alert_message, sns_topic_arn)
-                        add_slo_status_tag(bucket_name, s3_key, 'not met')
-                        put_cloudwatch_metric('MonthlySLONotMet', 1, 'LateArrival')
-
-                except s3.exceptions.ClientError as e:
-                    if e.response['Error']['Code'] == '404':
-                        # File not found
-                        alert_message = (
-                            f"File {expected_file_name} is missing in the archive folder. "
-                            f"SLO not met. Expected by: {expected_arrival_time}"
-                        )
-                        logger.info(alert_message)
-                        send_alert(alert_message, sns_topic_arn)
-                        put_cloudwatch_metric('MonthlySLONotMet', 1, 'FileNotFound')
-                    else:
-                        # Other S3 error
-                        logger.info(f"Error checking file {expected_file_name}: {e}")
-
-def check_daily_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping):
-    # Check for missing daily files based on SLOs, using specified holidays.
-    # Get the current date and time in EST
-    now = get_est_time()
+                period = f"{year}{month:02d}"
+                expected_file_name = pattern.replace("*", period)
+                s3_key = get_expected_key(slo, expected_file_name, period, expected_arrival_date.date(), holidays)
+                yield 'Monthly', expected_file_name, s3_key, expected_arrival_time
+
+def due_daily_files(holidays, file_slo_mapping, now, zone=DEFAULT_TIMEZONE, until=None):
+    # Yield (metric prefix, expected file name, s3 key, deadline) for every
+    # daily file due today whose deadline has passed at now, or with until,
+    # whose deadline is between now and until.
     today = now.date()
 
     # Check if today is a business day
     if not is_business_day(today, holidays):
-        logger.info(f"Today ({today}) is not a business day. Skipping daily file check.")
+        if until is None:
+            logger.info(f"Today ({today}) is not a business day. Skipping daily file check.")
         return
 
     # Process daily files
@@ -159,70 +435,524 @@ def check_daily_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping):
             # Construct the expected file name
             expected_file_name = pattern.replace("*", today.strftime('%Y%m%d'))
 
-            # Calculate the expected arrival time (10:30 AM EST)
-            expected_arrival_time = get_expected_arrival_time(today, slo_time)
+            # Calculate the expected arrival time (e.g. 10:30 AM Toronto time)
+            expected_arrival_time = get_expected_arrival_time(today, slo_time, zone)
 
             # Check if the deadline has passed
-            if now > expected_arrival_time:
-                s3_key = f"archive/{expected_file_name}"
-                try:
-                    # Check if the file exists in the S3 bucket
-                    file_metadata = s3.head_object(Bucket=bucket_name, Key=s3_key)
-                    last_modified = file_metadata['LastModified'].replace(tzinfo=None)
-
-                    if last_modified <= expected_arrival_time:
-                        logger.info(f"File {expected_file_name} exists and arrived on time. SLO met.")
-                        add_slo_status_tag(bucket_name, s3_key, 'met')
-                        put_cloudwatch_metric('DailySLOMet', 1)
-                    else:
-                        alert_message = (
-                            f"File {expected_file_name} exists but arrived late. "
-                            f"SLO not met. Expected by: {expected_arrival_time}, Arrived on: {last_modified}"
-                        )
-                        logger.info(alert_message)
-                        send_alert(alert_message, sns_topic_arn)
-                        add_slo_status_tag(bucket_name, s3_key, 'not met')
-                        put_cloudwatch_metric('DailySLONotMet', 1, 'LateArrival')
-
-                except s3.exceptions.ClientError as e:
-                    if e.response['Error']['Code'] == '404':
-                        # File not found
-                        alert_message = (
-                            f"File {expected_file_name} is missing in the archive folder. "
-                            f"SLO not met. Expected by: {expected_arrival_time}"
-                        )
-                        logger.info(alert_message)
-                        send_alert(alert_message, sns_topic_arn)
-                        put_cloudwatch_metric('DailySLONotMet', 1, 'FileNotFound')
-                    else:
-                        # Other S3 error
-                        logger.info(f"Error checking file {expected_file_name}: {e}")
+            if is_selected(now, expected_arrival_time, until):
+                s3_key = get_expected_key(slo, expected_file_name, today.strftime('%Y%m%d'), today, holidays)
+                yield 'Daily', expected_file_name, s3_key, expected_arrival_time
+
+def check_file(metric_prefix, expected_file_name, s3_key, expected_arrival_time, bucket_name,
+               sns_topic_arn, record_arrivals=True, arrivals=None, metrics=None, records=None):
+    # head_object one due file and record its result. With record_arrivals
+    # off, files that exist are left to s3_event_handler. When arrivals (from
+    # the arrival index or a partition probe) has the key, its LastModified,
+    # or None for a missing file, is used instead of head_object. metrics and
+    # records are passed to record_arrival().
+    if arrivals is not None and s3_key in arrivals:
+        last_modified = arrivals[s3_key]
+        if last_modified is None or record_arrivals:
+            record_arrival(metric_prefix, bucket_name, s3_key, expected_file_name, last_modified,
+                           expected_arrival_time, sns_topic_arn, metrics, records)
+        return
+    try:
+        # Check if the file exists in the S3 bucket
+        file_metadata = s3.head_object(Bucket=bucket_name, Key=s3_key)
+    except s3.exceptions.ClientError as e:
+        if e.response['Error']['Code'] == '404':
+            # File not found
+            record_arrival(metric_prefix, bucket_name, s3_key, expected_file_name, None,
+                           expected_arrival_time, sns_topic_arn, metrics, records)
+        else:
+            # Other S3 error
+            logger.info(f"Error checking file {expected_file_name}: {e}")
+        return
+    if record_arrivals:
+        record_arrival(metric_prefix, bucket_name, s3_key, expected_file_name, file_metadata['LastModified'],
+                       expected_arrival_time, sns_topic_arn, metrics, records)
+
+def put_cloudwatch_metric_counts(metrics):
+    # Send {(metric name, reason): count} in as few put_metric_data calls as
+    # possible (CloudWatch takes up to 1000 datums per call).
+    metric_data = []
+    for (metric_name, reason), count in sorted(metrics.items(), key=lambda item: (item[0][0], item[0][1] or '')):
+        datum = {'MetricName': metric_name, 'Value': count, 'Unit': 'Count'}
+        if reason:
+            datum['Dimensions'] = [{'Name': 'Reason', 'Value': reason}]
+        metric_data.append(datum)
+    for start in range(0, len(metric_data), 1000):
+        cloudwatch.put_metric_data(Namespace='FileSLO-Metrics', MetricData=metric_data[start:start + 1000])
+
+@traced()
+def check_monthly_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping, record_arrivals=True,
+                        zone=DEFAULT_TIMEZONE):
+    # Check for missing monthly files based on SLOs, using specified holidays.
+    # Deadlines are in zone; all comparisons are between UTC datetimes.
+    now = get_local_time(zone)
+    for due in due_monthly_files(holidays, file_slo_mapping, now, zone):
+        check_file(*due, bucket_name, sns_topic_arn, record_arrivals)
 
+@traced()
+def check_daily_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping, record_arrivals=True,
+                      zone=DEFAULT_TIMEZONE):
+    # Check for missing daily files based on SLOs, using specified holidays.
+    now = get_local_time(zone)
+    for due in due_daily_files(holidays, file_slo_mapping, now, zone):
+        check_file(*due, bucket_name, sns_topic_arn, record_arrivals)
+
+@traced()
+def check_at_risk(models, holidays, file_slo_mapping, now, until, bucket_name, sns_topic_arn, arrivals=None,
+                  sigmas=None, zone=DEFAULT_TIMEZONE):
+    # Early warning: alert on files due between now and until that have not
+    # arrived although their feed's model says they usually have by now (see
+    # predictor.py). Only files the models flag are looked up. Returns the
+    # number of files at risk.
+    matcher = compile_pattern_matcher(file_slo_mapping)
+    metrics = Counter()
+    for metric_prefix, expected_file_name, s3_key, expected_arrival_time in [
+            *due_monthly_files(holidays, file_slo_mapping, now, zone, until),
+            *due_daily_files(holidays, file_slo_mapping, now, zone, until)]:
+        matched = match_key(matcher, s3_key)
+        risk = _predictor.at_risk(models.get(matched[0]) if matched else None, expected_arrival_time, now, sigmas)
+        if risk is None:
+            continue
+        if arrivals is not None and s3_key in arrivals:
+            if arrivals[s3_key] is not None:
+                continue
+        else:
+            try:
+                s3.head_object(Bucket=bucket_name, Key=s3_key)
+                continue
+            except s3.exceptions.ClientError as e:
+                if e.response['Error']['Code'] != '404':
+                    logger.info(f"Error checking file {expected_file_name}: {e}")
+                    continue
+        predicted, sigma = risk
+        alert_message = (
+            f"File {expected_file_name} has not arrived and is at risk of missing its SLO. "
+            f"Usually arrives by: {predicted} (+/- {sigma:.0f} min), Expected by: {expected_arrival_time}"
+        )
+        logger.info(alert_message)
+        send_alert(alert_message, sns_topic_arn, f"{expected_file_name}:at-risk")
+        metrics[f'{metric_prefix}SLOAtRisk', None] += 1
+    if metrics:
+        put_cloudwatch_metric_counts(metrics)
+    return sum(metrics.values())
+
+@traced()
+def refresh_arrival_index(bucket_name, file_slo_mapping, now, due, layout='window',
+                          index_key=DEFAULT_ARRIVAL_INDEX_KEY):
+    # Load the arrival index, list the archive where due files are still
+    # outstanding, and save it back if anything changed.
+    store = S3ArrivalIndexStore(s3, bucket_name, index_key)
+    index = store.load()
+    wanted = [s3_key for _, _, s3_key, _ in due]
+    result = ArrivalTracker(s3, bucket_name, file_slo_mapping, layout).refresh(index, now, wanted)
+    if index.changed:
+        store.save(index)
+    logger.info(f"Arrival index: {json.dumps(result)}")
+    return index
+
+@traced()
+def probe_partitions(bucket_name, file_slo_mapping, due, workers=8, every_template=False):
+    # For due files under a partitioned key template, list each partition
+    # (the key's directory, e.g. archive/2025/03/10/) once, concurrently.
+    # With every_template, files under any other key template than
+    # archive/{name} are listed too, by directory and the pattern's literal
+    # prefix (e.g. archive/feeds/L1_NATURAL_GL_). Returns {s3 key:
+    # LastModified or None if missing} for those files.
+    matcher = compile_pattern_matcher(file_slo_mapping)
+    partitions = {}
+    for _, _, s3_key, _ in due:
+        matched = match_key(matcher, s3_key)
+        if matched is None:
+            continue
+        template = file_slo_mapping[matched[0]].get('key_template', DEFAULT_KEY_TEMPLATE)
+        directory = s3_key.rpartition('/')[0] + '/'
+        if is_partitioned(template):
+            partitions.setdefault(directory, []).append(s3_key)
+        elif every_template and template != DEFAULT_KEY_TEMPLATE:
+            partitions.setdefault(directory + matched[0].partition('*')[0], []).append(s3_key)
+    if not partitions:
+        return {}
+    wanted = {s3_key for keys in partitions.values() for s3_key in keys}
+    lister = ParallelLister(s3, bucket_name, workers, key_filter=wanted.__contains__)
+    arrivals = dict.fromkeys(wanted)
+    for obj in lister.list(Partition(prefix) for prefix in sorted(partitions)):
+        arrivals[obj['Key']] = obj['LastModified']
+    logger.info(f"Probed {len(partitions)} partitions for {len(wanted)} due files in {lister.calls} list calls.")
+    return arrivals
+
+def summarize_schedule(file_slo_mapping):
+    # Reduce a parsed mapping to what the pre-check needs: the distinct
+    # monthly (slo_days, slo_time) rules and the earliest daily slo_time.
+    monthly = sorted({(slo['slo_days'], slo['slo_time'])
+                      for pattern, slo in file_slo_mapping.items() if "dat.pgp" in pattern})
+    daily = min((slo['slo_time'] for pattern, slo in file_slo_mapping.items() if "xlsx" in pattern),
+                default=None)
+    return monthly, daily
+
+def etag_of(data):
+    # The ETag S3 gives a single-part upload of data: its quoted MD5.
+    return '"' + hashlib.md5(data).hexdigest() + '"'
+
+def load_bundled_schedule(holidays_key):
+    # Schedule from the copies deployed with the function, with the ETags
+    # of (mapping, holidays) the S3 objects have when they are the same
+    # files, or None.
+    try:
+        with open(os.path.join(BUNDLED_CONFIG_DIR, 'file_slo_mapping.json'), 'rb') as f:
+            mapping_data = f.read()
+        with open(os.path.join(BUNDLED_CONFIG_DIR, 'holidays.json'), 'rb') as f:
+            holidays_data = f.read()
+        file_slo_mapping = parse_slo_mapping(json.loads(mapping_data))
+        listed_holidays = json.loads(holidays_data).get(holidays_key, {})
+    except (OSError, ValueError):
+        return None
+    return summarize_schedule(file_slo_mapping), listed_holidays, (etag_of(mapping_data), etag_of(holidays_data))
+
+def deployed_etags(bucket_name, keys):
+    # ETags of the config objects in S3 now, or None when one cannot be read.
+    try:
+        return tuple(s3.head_object(Bucket=bucket_name, Key=key).get('ETag') for key in keys)
+    except s3.exceptions.ClientError as e:
+        logger.warning(f"Could not read the config ETags for the pre-check: {e}")
+        return None
+
+def precheck_skips(now, cached, bucket_name, config_keys, region, zone, lookahead):
+    # True when the cached or bundled schedule has no deadline passed yet
+    # and was made from the config that is in S3 now. Anything else, a
+    # changed mapping or holidays file included, runs the full check.
+    schedule, listed_holidays, etags = cached
+    if not nothing_to_do(now, schedule, listed_holidays, region, zone, lookahead):
+        return False
+    if None in etags or deployed_etags(bucket_name, config_keys) != etags:
+        logger.info("The SLO config in S3 differs from the pre-check's copy. Running the full check.")
+        return False
+    return True
+
+@traced()
+def nothing_to_do(now, schedule, listed_holidays, region, zone, lookahead=timedelta(0)):
+    # True when no monthly or daily deadline has passed yet at now, so the
+    # checks would not look at a single file. With a lookahead, deadlines
+    # count as passed that much earlier (for early warnings).
+    monthly, daily = schedule
+    horizon = now + lookahead
+    holidays = get_holidays(listed_holidays, region, [now.year, now.year + 1])
+    for slo_days, slo_time in monthly:
+        expected_arrival_date = get_nth_business_day(now.year, now.month, slo_days, holidays)
+        if horizon > get_expected_arrival_time(expected_arrival_date, slo_time, zone):
+            return False
+    today = now.date()
+    if daily is not None and is_business_day(today, holidays):
+        if horizon > get_expected_arrival_time(today, daily, zone):
+            return False
+    return True
+
+def import_report():
+    # How long this module took to import and which heavy modules are loaded.
+    return {
+        'import_ms': round(IMPORT_SECONDS * 1e3, 3),
+        'boto3_loaded': 'boto3' in sys.modules,
+        'clients_created': [client._service_name for client in (s3, sns, cloudwatch)
+                            if client._client is not None],
+    }
+
+@traced_handler
 def lambda_handler(event, context):
-    # Load holidays from S3
+    global _cold_start
+    if _cold_start:
+        _cold_start = False
+        logger.info(f"Cold start: {json.dumps(import_report())}")
+
     bucket_name = event['bucket_name']
     sns_topic_arn = event['sns_topic_arn']
     holidays_file_key = event['holidays_file_key']
     slo_mapping_file_key = event['slo_mapping_file_key']
-    
-    holidays_data = load_json_from_s3(bucket_name, holidays_file_key)
-    slo_mapping_data = load_json_from_s3(bucket_name, slo_mapping_file_key)
-    file_slo_mapping = parse_slo_mapping(slo_mapping_data)
-    
+
     # Switch based on if we want to check for Canadian or US holidays
     use_canadian_holidays = event.get('useCanadianHolidays', False)
-    year = datetime.now().year
-    
-    if use_canadian_holidays:
-        holidays = [datetime.strptime(date, '%Y-%m-%d') for date in holidays_data['ca_public_holidays'].get(str(year), [])]
-    else:
-        holidays = [datetime.strptime(date, '%Y-%m-%d') for date in holidays_data['us_public_holidays'].get(str(year), [])]
-    
+    holidays_key = 'ca_public_holidays' if use_canadian_holidays else 'us_public_holidays'
+    region = 'CA' if use_canadian_holidays else 'US'
+    zone = event.get('timezone', DEFAULT_TIMEZONE)
+    now = get_local_time(zone)
+    year = now.year
+
+    # With earlyWarning set, files due within the next earlyWarningMinutes
+    # are checked against their feed's arrival model and flagged when they
+    # are running late (see predictor.py).
+    early_warning = event.get('earlyWarning', False)
+    lookahead = timedelta(minutes=event.get('earlyWarningMinutes', 120)) if early_warning else timedelta(0)
+
+    # Pre-check before loading the config: stop early when no deadline has
+    # passed (or, for early warnings, is coming up) and the config in S3 is
+    # the one the schedule was made from.
+    config_key = (bucket_name, slo_mapping_file_key, holidays_file_key, holidays_key)
+    if event.get('precheck', True):
+        cached = _schedules.get(config_key) or load_bundled_schedule(holidays_key)
+        if cached is not None and precheck_skips(now, cached, bucket_name, (slo_mapping_file_key, holidays_file_key),
+                                                 region, zone, lookahead):
+            logger.info(f"No SLO deadline has passed yet at {now}. Nothing to check.")
+            return {
+                'statusCode': 200,
+                'body': 'Nothing to check yet.'
+            }
+
+    # Load holidays from S3
+    holidays_data, holidays_etag = load_json_from_s3(bucket_name, holidays_file_key, with_etag=True)
+    slo_mapping_data, mapping_etag = load_json_from_s3(bucket_name, slo_mapping_file_key, with_etag=True)
+    file_slo_mapping = parse_slo_mapping(slo_mapping_data)
+    _schedules[config_key] = (summarize_schedule(file_slo_mapping), holidays_data.get(holidays_key, {}),
+                              (mapping_etag, holidays_etag))
+
+    # Next year is included for deadlines that spill over into January.
+    holidays = get_holidays(holidays_data.get(holidays_key, {}), region, [year, year + 1])
+
+    # When s3_event_handler records arrivals as they happen, the poll only
+    # needs to report missing files.
+    record_arrivals = not event.get('missingOnly', False)
+
+    # Files under a partitioned key template are found with one listing per
+    # partition due today. With arrivalIndex set, the other due files are
+    # looked up in an arrival index kept current by incremental listings,
+    # instead of head_object (see arrivals.py). The window layout only lists
+    # archive/{name} keys, so with it every templated file is listed here.
+    use_index = event.get('arrivalIndex', False)
+    layout = event.get('archiveLayout', 'window')
+    probe_all = use_index and layout == 'window'
+    templates = {slo.get('key_template', DEFAULT_KEY_TEMPLATE) for slo in file_slo_mapping.values()}
+    partitioned = any(map(is_partitioned, templates))
+    arrivals = None
+
     # Use these holidays for checking business days
-    check_monthly_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping)
-    check_daily_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping)
+    if use_index or partitioned or event.get('engine') == 'async':
+        due = [*due_monthly_files(holidays, file_slo_mapping, now, zone),
+               *due_daily_files(holidays, file_slo_mapping, now, zone)]
+        if partitioned or (probe_all and templates != {DEFAULT_KEY_TEMPLATE}):
+            arrivals = probe_partitions(bucket_name, file_slo_mapping, due, every_template=probe_all)
+        if use_index:
+            arrivals = arrivals or {}
+            indexed = [item for item in due if item[2] not in arrivals]
+            index = refresh_arrival_index(bucket_name, file_slo_mapping, now, indexed, layout,
+                                          event.get('arrival_index_key', DEFAULT_ARRIVAL_INDEX_KEY))
+            arrivals.update((s3_key, index.get(s3_key)) for _, _, s3_key, _ in indexed)
+
+    if event.get('engine') == 'async':
+        # Same rules, with the S3 calls made concurrently (see async_checker.py).
+        from async_checker import check_files
+        result = check_files(due, bucket_name, sns_topic_arn, record_arrivals,
+                             event.get('concurrency', 64), context, arrivals)
+        logger.info(f"Async check: {json.dumps(result)}")
+    elif arrivals is not None:
+        for item in due:
+            check_file(*item, bucket_name, sns_topic_arn, record_arrivals, arrivals)
+    else:
+        check_monthly_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping, record_arrivals, zone)
+        check_daily_files(holidays, bucket_name, sns_topic_arn, file_slo_mapping, record_arrivals, zone)
+    matcher = compile_pattern_matcher(file_slo_mapping)
+    models = flush_arrival_models(event.get('learnArrivals', True), bucket_name,
+                                  event.get('arrival_model_key', DEFAULT_ARRIVAL_MODEL_KEY), matcher, early_warning)
+    if early_warning:
+        at_risk = check_at_risk(models, holidays, file_slo_mapping, now, now + lookahead, bucket_name,
+                                sns_topic_arn, arrivals, event.get('earlyWarningSigmas'), zone)
+        logger.info(f"Early warning: {at_risk} files at risk.")
+    flush_alerts(event.get('sendAlerts', False), bucket_name,
+                 event.get('alert_state_key', DEFAULT_ALERT_STATE_KEY))
+    flush_lateness(event.get('recordLateness', True), bucket_name,
+                   event.get('lateness_state_key', DEFAULT_LATENESS_STATE_KEY), matcher, holidays, zone)
+    flush_compliance(event.get('recordCompliance', True), bucket_name,
+                     event.get('compliance_state_key', DEFAULT_COMPLIANCE_STATE_KEY), matcher, zone, now)
+    put_limiter_metrics()
 
     return {
         'statusCode': 200,
         'body': 'File check completed.'
-    }
\ No newline at end of file
+    }
+
+# Event-driven arrivals.
+#
+# s3_event_handler consumes S3 ObjectCreated notifications, delivered either
+# directly or as SQS batches, and records each SLO result as the file lands.
+# Notifications carry no configuration, so it comes from the environment:
+# SNS_TOPIC_ARN, HOLIDAYS_FILE_KEY, SLO_MAPPING_FILE_KEY, USE_CANADIAN_HOLIDAYS
+# and optionally SLO_CONFIG_BUCKET (defaults to the notifying bucket),
+# SLO_TIMEZONE (defaults to DEFAULT_TIMEZONE), SEND_ALERTS, ALERT_STATE_KEY,
+# RECORD_LATENESS (defaults to true), LATENESS_STATE_KEY, RECORD_COMPLIANCE
+# (defaults to true), COMPLIANCE_STATE_KEY, LEARN_ARRIVALS (defaults to true)
+# and ARRIVAL_MODEL_KEY.
+
+# Loaded configuration per config bucket, kept while the container is warm.
+_event_configs = {}
+
+def env_flag(name, default=False):
+    # A boolean environment variable: 1, true or yes (any case) is set.
+    value = os.environ.get(name)
+    return default if value is None else value.lower() in ('1', 'true', 'yes')
+
+def compile_pattern_matcher(file_slo_mapping):
+    # Compile every monthly and daily pattern into a KeyMatcher, which maps a
+    # key to its most specific pattern in time proportional to the key length.
+    return KeyMatcher(pattern for pattern in file_slo_mapping
+                      if "dat.pgp" in pattern or "xlsx" in pattern)
+
+def is_valid_period(period):
+    # True when a string of 6 or 8 ASCII digits is a real YYYYMM or YYYYMMDD.
+    year, month = int(period[:4]), int(period[4:6])
+    if year < 1 or not 1 <= month <= 12:
+        return False
+    return len(period) == 6 or 1 <= int(period[6:]) <= monthrange(year, month)[1]
+
+def match_key(matcher, s3_key):
+    # Return (pattern, period) for an archive key, or None. The period must be
+    # a real YYYYMM for monthly files and YYYYMMDD for daily files; a key whose
+    # most specific pattern does not fit falls through to the next one. Keys in
+    # partitioned layouts (archive/2025/03/10/...) are matched by basename.
+    if not s3_key.startswith('archive/'):
+        return None
+    for pattern, period in matcher.candidates(s3_key.rpartition('/')[2]):
+        digits = 6 if "dat.pgp" in pattern else 8
+        if (period is not None and len(period) == digits and period.isascii() and period.isdigit()
+                and is_valid_period(period)):
+            return pattern, period
+    return None
+
+def feed_of(matcher, s3_key):
+    # The feed (pattern) of an archive key, or None; the recorders' flush()
+    # takes it as partial(feed_of, matcher).
+    matched = match_key(matcher, s3_key)
+    return matched[0] if matched else None
+
+@traced()
+def load_event_config(config_bucket):
+    # Load and compile the SLO configuration once per warm container.
+    config = _event_configs.get(config_bucket)
+    if config is None:
+        use_canadian_holidays = env_flag('USE_CANADIAN_HOLIDAYS')
+        holidays_data = load_json_from_s3(config_bucket, os.environ['HOLIDAYS_FILE_KEY'])
+        file_slo_mapping = parse_slo_mapping(
+            load_json_from_s3(config_bucket, os.environ['SLO_MAPPING_FILE_KEY']))
+        config = _event_configs[config_bucket] = {
+            'sns_topic_arn': os.environ.get('SNS_TOPIC_ARN'),
+            'file_slo_mapping': file_slo_mapping,
+            'matcher': compile_pattern_matcher(file_slo_mapping),
+            'listed_holidays': holidays_data.get(
+                'ca_public_holidays' if use_canadian_holidays else 'us_public_holidays', {}),
+            'region': 'CA' if use_canadian_holidays else 'US',
+            'zone': os.environ.get('SLO_TIMEZONE', DEFAULT_TIMEZONE),
+            'holidays': {},
+            'deadlines': {},
+        }
+    return config
+
+def get_deadline(config, pattern, period):
+    # UTC deadline for one file, computed once per (pattern, period). None when
+    # the period has no deadline (daily files dated on a non-business day).
+    key = (pattern, period)
+    if key in config['deadlines']:
+        return config['deadlines'][key]
+    year = int(period[:4])
+    holidays = config['holidays'].get(year)
+    if holidays is None:
+        # Next year is included for deadlines that spill over into January.
+        holidays = config['holidays'][year] = get_holidays(
+            config['listed_holidays'], config['region'], [year, year + 1])
+    slo = config['file_slo_mapping'][pattern]
+    if len(period) == 6:
+        expected_arrival_date = get_nth_business_day(year, int(period[4:]), slo['slo_days'], holidays)
+        deadline = get_expected_arrival_time(expected_arrival_date, slo['slo_time'], config['zone'])
+    else:
+        day = datetime.strptime(period, '%Y%m%d').date()
+        if is_business_day(day, holidays):
+            deadline = get_expected_arrival_time(day, slo['slo_time'], config['zone'])
+        else:
+            deadline = None
+    config['deadlines'][key] = deadline
+    return deadline
+
+def parse_event_time(value):
+    # S3 event times are UTC, e.g. 2025-03-10T14:22:05.123Z.
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%fZ').replace(tzinfo=pytz.utc)
+
+@traced()
+def process_s3_record(record):
+    # Record the SLO result for one S3 ObjectCreated record. Returns the
+    # status, or None when the key is not a tracked file.
+    if not record.get('eventName', '').startswith('ObjectCreated:'):
+        return None
+    bucket_name = record['s3']['bucket']['name']
+    s3_key = unquote_plus(record['s3']['object']['key'])
+    config = load_event_config(os.environ.get('SLO_CONFIG_BUCKET', bucket_name))
+    matched = match_key(config['matcher'], s3_key)
+    if matched is None:
+        return None
+    pattern, period = matched
+    expected_arrival_time = get_deadline(config, pattern, period)
+    if expected_arrival_time is None:
+        logger.info(f"File {s3_key} is dated on a non-business day. No SLO to record.")
+        return None
+    expected_file_name = s3_key.rpartition('/')[2]
+    slo = config['file_slo_mapping'][pattern]
+    if 'key_template' in slo:
+        # The file's date: the deadline for monthly files, the period for daily ones.
+        if len(period) == 6:
+            date = expected_arrival_time.astimezone(pytz.timezone(config['zone'])).date()
+        else:
+            date = datetime.strptime(period, '%Y%m%d').date()
+        expected_key = get_expected_key(slo, expected_file_name, period, date, config['holidays'][int(period[:4])])
+        if s3_key != expected_key:
+            logger.info(f"File {s3_key} is not where its rule expects it ({expected_key}). No SLO to record.")
+            return None
+    last_modified = parse_event_time(record['eventTime'])
+    metric_prefix = 'Monthly' if len(period) == 6 else 'Daily'
+    record_arrival(metric_prefix, bucket_name, s3_key, expected_file_name, last_modified,
+                   expected_arrival_time, config['sns_topic_arn'])
+    return 'met' if last_modified <= expected_arrival_time else 'not met'
+
+def flush_event_alerts():
+    # Alert state lives in the config bucket the event handler loaded from.
+    state_bucket = os.environ.get('SLO_CONFIG_BUCKET') or next(iter(_event_configs), None)
+    flush_alerts(env_flag('SEND_ALERTS'), state_bucket,
+                 os.environ.get('ALERT_STATE_KEY', DEFAULT_ALERT_STATE_KEY))
+    config = _event_configs.get(state_bucket)
+    if config is not None:
+        holidays = set().union(*config['holidays'].values())
+        flush_lateness(env_flag('RECORD_LATENESS', True), state_bucket,
+                       os.environ.get('LATENESS_STATE_KEY', DEFAULT_LATENESS_STATE_KEY),
+                       config['matcher'], holidays, config['zone'])
+        flush_compliance(env_flag('RECORD_COMPLIANCE', True), state_bucket,
+                         os.environ.get('COMPLIANCE_STATE_KEY', DEFAULT_COMPLIANCE_STATE_KEY),
+                         config['matcher'], config['zone'])
+        flush_arrival_models(env_flag('LEARN_ARRIVALS', True), state_bucket,
+                             os.environ.get('ARRIVAL_MODEL_KEY', DEFAULT_ARRIVAL_MODEL_KEY), config['matcher'])
+
+@traced_handler
+def s3_event_handler(event, context):
+    # Entry point for S3 notifications, sent directly or through SQS. For SQS
+    # batches, failed messages are returned as batchItemFailures so only they
+    # are retried (needs ReportBatchItemFailures on the event source mapping).
+    records = event.get('Records', [])
+    if records and records[0].get('eventSource') == 'aws:sqs':
+        failures = []
+        for message in records:
+            try:
+                body = json.loads(message['body'])
+                # s3:TestEvent messages have no Records.
+                for record in body.get('Records', []):
+                    process_s3_record(record)
+            except Exception:
+                logger.exception(f"Failed to process SQS message {message['messageId']}")
+                failures.append({'itemIdentifier': message['messageId']})
+        flush_event_alerts()
+        put_limiter_metrics()
+        return {'batchItemFailures': failures}
+
+    results = [process_s3_record(record) for record in records]
+    flush_event_alerts()
+    put_limiter_metrics()
+    return {
+        'statusCode': 200,
+        'body': f"Recorded {sum(result is not None for result in results)} of {len(results)} arrivals."
+    }
+
+IMPORT_SECONDS = _time.perf_counter() - _IMPORT_START
@@ -0,0 +1,262 @@
+import math
+from collections import Counter
+from datetime import timedelta
+
+from s3state import QueuedRecorder, S3JsonState
+
+# Arrival lateness for the SLO checker.
+#
+# Each arrival has a signed lateness: LastModified minus the deadline, in
+# minutes (negative when early) and in business days (0 when the file lands
+# on the deadline's date). The checkers queue arrivals with add(); flush()
+# at the end of an invocation publishes the ones not seen before as
+# CloudWatch Values/Counts arrays ({Daily,Monthly}LatenessMinutes and
+# ...LatenessBusinessDays), so CloudWatch percentile statistics work on
+# them, and folds them into per-feed distributions kept in S3:
+#
+#   minutes        a QuantileSketch (1% relative accuracy, mergeable)
+#   business_days  exact counts per day
+#
+# so p50/p95/p99 margins per feed come from the state object alone, without
+# re-reading history (see tools/lateness_report.py). The poll sees the same
+# file on every run, so the state also keeps the newest period (YYYYMM or
+# YYYYMMDD) folded in per feed, and only a later period counts. That is one
+# entry per feed however long the state lives. A file for an older period
+# that arrives after a newer one of its feed is not counted; the poll only
+# looks at this month's and today's files.
+
+# Where the per-feed distributions are kept, in the config bucket.
+DEFAULT_LATENESS_STATE_KEY = 'state/lateness.json'
+
+CLOUDWATCH_VALUES = 150
+CLOUDWATCH_DATUMS = 1000
+
+
+class QuantileSketch(object):
+    # DDSketch-style quantile sketch over signed values. Values fall in
+    # logarithmic buckets of width gamma = (1 + a) / (1 - a), so every
+    # quantile is within relative accuracy a of a real value; |values| below
+    # min_value count as zero. Two sketches merge by adding bucket counts.
+
+    def __init__(self, relative_accuracy=0.01, min_value=0.01, max_buckets=2048):
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.positive = Counter()
+        self.negative = Counter()
+        self.zero = 0
+        self.count = 0
+
+    def _index(self, value):
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _value(self, index):
+        # Midpoint of bucket index, within relative_accuracy of its values.
+        return 2 * self._gamma ** index / (1 + self._gamma)
+
+    def add(self, value, count=1):
+        if value > self.min_value:
+            self.positive[self._index(value)] += count
+        elif value < -self.min_value:
+            self.negative[self._index(-value)] += count
+        else:
+            self.zero += count
+        self.count += count
+        if len(self.positive) + len(self.negative) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other):
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.zero += other.zero
+        self.count += other.count
+        if len(self.positive) + len(self.negative) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        # Fold the smallest-magnitude buckets into zero, keeping the tails
+        # that the high quantiles read.
+        buckets = sorted([(index, self.positive) for index in self.positive] +
+                         [(index, self.negative) for index in self.negative], key=lambda item: item[0])
+        for index, store in buckets[:len(buckets) - self.max_buckets]:
+            self.zero += store.pop(index)
+
+    def quantile(self, q):
+        # Value at quantile q (0 to 1), or None when empty.
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self.zero
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.positive))
+
+    def to_json(self):
+        return {'relative_accuracy': self.relative_accuracy, 'min_value': self.min_value,
+                'positive': {str(k): v for k, v in self.positive.items()},
+                'negative': {str(k): v for k, v in self.negative.items()},
+                'zero': self.zero, 'count': self.count}
+
+    @classmethod
+    def from_json(cls, data):
+        sketch = cls(data['relative_accuracy'], data['min_value'])
+        sketch.positive = Counter({int(k): v for k, v in data['positive'].items()})
+        sketch.negative = Counter({int(k): v for k, v in data['negative'].items()})
+        sketch.zero = data['zero']
+        sketch.count = data['count']
+        return sketch
+
+
+def business_days_late(arrival_date, deadline_date, holidays):
+    # Signed business days from the deadline's date to the arrival's: 0 on
+    # the same date, n when the file landed n business days after, -n before.
+    if arrival_date >= deadline_date:
+        first, last, sign = deadline_date + timedelta(days=1), arrival_date, 1
+    else:
+        first, last, sign = arrival_date, deadline_date - timedelta(days=1), -1
+    count = 0
+    day = first
+    while day <= last:
+        if day.weekday() < 5 and day not in holidays:
+            count += 1
+        day += timedelta(days=1)
+    return sign * count
+
+
+class FeedLateness(object):
+    # Lateness distribution of one feed.
+
+    def __init__(self, minutes=None, business_days=None):
+        self.minutes = minutes if minutes is not None else QuantileSketch()
+        self.business_days = business_days if business_days is not None else Counter()
+
+    def add(self, minutes, business_days):
+        self.minutes.add(minutes)
+        self.business_days[business_days] += 1
+
+    def merge(self, other):
+        self.minutes.merge(other.minutes)
+        self.business_days.update(other.business_days)
+
+    def business_days_quantile(self, q):
+        total = sum(self.business_days.values())
+        if not total:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for days in sorted(self.business_days):
+            seen += self.business_days[days]
+            if seen > rank:
+                return days
+
+    def summary(self, quantiles=(0.5, 0.95, 0.99)):
+        result = {'count': self.minutes.count}
+        for q in quantiles:
+            minutes = self.minutes.quantile(q)
+            result[f"p{q * 100:g}_minutes"] = round(minutes, 1) if minutes is not None else None
+            result[f"p{q * 100:g}_business_days"] = self.business_days_quantile(q)
+        return result
+
+    def to_json(self):
+        return {'minutes': self.minutes.to_json(),
+                'business_days': {str(k): v for k, v in self.business_days.items()}}
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(QuantileSketch.from_json(data['minutes']),
+                   Counter({int(k): v for k, v in data['business_days'].items()}))
+
+
+class S3LatenessState(S3JsonState):
+    # {'feeds': {pattern: FeedLateness}, 'periods': {pattern: newest period
+    # recorded}} in S3. A lost write's arrivals are counted again by a later
+    # run.
+
+    def load(self):
+        data = self.read() or {}
+        feeds = {feed: FeedLateness.from_json(value) for feed, value in data.get('feeds', {}).items()}
+        return feeds, data.get('periods', {})
+
+    def save(self, feeds, periods):
+        data = {'feeds': {feed: lateness.to_json() for feed, lateness in feeds.items()},
+                'periods': periods}
+        self.write(data)
+
+
+class LatenessRecorder(QueuedRecorder):
+    # Collects arrivals for one invocation; flush() publishes and persists them.
+
+    def __init__(self, cloudwatch, namespace='FileSLO-Metrics'):
+        super().__init__()
+        self.cloudwatch = cloudwatch
+        self.namespace = namespace
+
+    def add(self, metric_prefix, s3_key, last_modified, deadline):
+        # Queue one arrival; repeats within the invocation collapse to one.
+        self._pending[s3_key] = (metric_prefix, last_modified, deadline)
+
+    def flush(self, state, match, holidays, zone):
+        # Publish and fold in the queued arrivals of periods not recorded
+        # before, then clear the queue. match maps an S3 key to its (feed,
+        # period) or None; holidays and zone (a tzinfo) define business
+        # days. Returns counts of arrivals recorded and skipped.
+        pending = self._take()
+        result = {'recorded': 0, 'skipped': 0}
+        if not pending:
+            return result
+        arrivals = []
+        for s3_key, arrival in pending.items():
+            matched = match(s3_key)
+            if matched is None:
+                result['skipped'] += 1
+                continue
+            arrivals.append((matched, arrival))
+        feeds, periods = state.load()
+        values = {}
+        # Oldest period first, so two new periods of a feed both count.
+        for (feed, period), (metric_prefix, last_modified, deadline) in sorted(arrivals, key=lambda item: item[0]):
+            if period <= periods.get(feed, ''):
+                result['skipped'] += 1
+                continue
+            minutes = (last_modified - deadline).total_seconds() / 60
+            days = business_days_late(last_modified.astimezone(zone).date(),
+                                      deadline.astimezone(zone).date(), holidays)
+            feeds.setdefault(feed, FeedLateness()).add(minutes, days)
+            values.setdefault(f"{metric_prefix}LatenessMinutes", Counter())[round(minutes, 1)] += 1
+            values.setdefault(f"{metric_prefix}LatenessBusinessDays", Counter())[days] += 1
+            periods[feed] = period
+            result['recorded'] += 1
+
+        self._publish(values)
+        if result['recorded']:
+            state.save(feeds, periods)
+        return result
+
+    def _publish(self, values):
+        # One datum per metric and up to 150 distinct values; up to 1000
+        # datums per put_metric_data call.
+        metric_data = []
+        for metric_name, counts in sorted(values.items()):
+            items = sorted(counts.items())
+            for start in range(0, len(items), CLOUDWATCH_VALUES):
+                chunk = items[start:start + CLOUDWATCH_VALUES]
+                metric_data.append({
+                    'MetricName': metric_name,
+                    'Values': [float(value) for value, _ in chunk],
+                    'Counts': [float(count) for _, count in chunk],
+                    'Unit': 'None',
+                })
+        for start in range(0, len(metric_data), CLOUDWATCH_DATUMS):
+            self.cloudwatch.put_metric_data(Namespace=self.namespace,
+                                            MetricData=metric_data[start:start + CLOUDWATCH_DATUMS])
@@ -0,0 +1,117 @@
+import math
+from datetime import timedelta
+
+from s3state import QueuedRecorder, S3JsonState
+
+# Learned arrival times for early warnings.
+#
+# The checker only looks at a file once its deadline has passed. To warn
+# before that, each feed has an ArrivalModel: an exponentially weighted mean
+# and variance of when its files arrive, as minutes relative to their
+# deadline (-90 is an hour and a half early). Deadlines are the slo_time on
+# the file's business day, or on the slo_days-th business day of the month,
+# so this is the arrival's offset within that business day. Every observed
+# arrival updates the model in O(1); the model is four numbers per feed, the
+# last one the deadline of the newest arrival folded in, so a file seen by
+# several runs (or an older file seen late) is learned once and in order.
+#
+# A file whose deadline is still ahead is at risk once now is past its
+# predicted arrival (deadline + mean) by k standard deviations and it has
+# not arrived. Models with fewer than min_samples arrivals never raise it,
+# and sigma is at least min_sigma minutes so a very regular feed is not
+# flagged a minute after its usual time.
+
+
+class ArrivalModel(object):
+    # Exponentially weighted mean/variance of one feed's arrival offsets.
+
+    def __init__(self, mean=0.0, variance=0.0, count=0, last=None):
+        self.mean = mean
+        self.variance = variance
+        self.count = count
+        self.last = last
+
+    def update(self, offset, deadline, alpha):
+        # Fold in one arrival, offset minutes from its deadline. Returns
+        # False for a deadline not after the last one learned.
+        key = deadline.isoformat()
+        if self.last is not None and key <= self.last:
+            return False
+        if self.count == 0:
+            self.mean, self.variance = offset, 0.0
+        else:
+            diff = offset - self.mean
+            increment = alpha * diff
+            self.mean += increment
+            self.variance = (1 - alpha) * (self.variance + diff * increment)
+        self.count += 1
+        self.last = key
+        return True
+
+    def sigma(self, min_sigma=0.0):
+        return max(math.sqrt(self.variance), min_sigma)
+
+    def to_json(self):
+        return [round(self.mean, 3), round(self.variance, 3), self.count, self.last]
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(*data)
+
+
+class S3ArrivalModelState(S3JsonState):
+    # {feed: ArrivalModel} in S3. A lost write's arrivals are not learned.
+
+    def load(self):
+        return {feed: ArrivalModel.from_json(model) for feed, model in (self.read() or {}).items()}
+
+    def save(self, models):
+        self.write({feed: model.to_json() for feed, model in models.items()})
+
+
+class ArrivalPredictor(QueuedRecorder):
+    # Collects arrivals for one invocation; flush() folds them into the
+    # models and at_risk() evaluates a file that is not due yet.
+
+    def __init__(self, alpha=0.1, sigmas=2.0, min_samples=5, min_sigma=5.0):
+        super().__init__()
+        self.alpha = alpha
+        self.sigmas = sigmas
+        self.min_samples = min_samples
+        self.min_sigma = min_sigma
+
+    def observe(self, s3_key, last_modified, deadline):
+        # Queue one arrival; repeats within the invocation collapse to one.
+        self._pending[s3_key] = (last_modified, deadline)
+
+    def flush(self, state, feed_of):
+        # Load the models, fold in the queued arrivals in deadline order,
+        # save the models when any changed and clear the queue. feed_of maps
+        # an S3 key to its feed (pattern) or None. Returns (models, counts
+        # of arrivals learned and skipped).
+        pending = self._take()
+        models = state.load()
+        result = {'learned': 0, 'skipped': 0}
+        for s3_key, (last_modified, deadline) in sorted(pending.items(), key=lambda item: item[1][1]):
+            feed = feed_of(s3_key)
+            model = models.setdefault(feed, ArrivalModel()) if feed is not None else None
+            if model is not None and model.update((last_modified - deadline).total_seconds() / 60,
+                                                  deadline, self.alpha):
+                result['learned'] += 1
+            else:
+                result['skipped'] += 1
+        if result['learned']:
+            state.save(models)
+        return models, result
+
+    def at_risk(self, model, deadline, now, sigmas=None):
+        # (predicted arrival, sigma in minutes) when a file with this deadline
+        # that has not arrived by now is at risk, else None.
+        if model is None or model.count < self.min_samples or now >= deadline:
+            return None
+        sigma = model.sigma(self.min_sigma)
+        predicted = deadline + timedelta(minutes=model.mean)
+        threshold = predicted + timedelta(minutes=(self.sigmas if sigmas is None else sigmas) * sigma)
+        if now <= threshold:
+            return None
+        return predicted, sigma
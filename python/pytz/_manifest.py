@@ -0,0 +1,1672 @@
+# Generated by tools/build_pytz_data.py from the tzdata 2024b files
+# in zoneinfo/. Do not edit by hand.
+from types import MappingProxyType
+
+ALL_TIMEZONES = ('Africa/Abidjan',
+ 'Africa/Accra',
+ 'Africa/Addis_Ababa',
+ 'Africa/Algiers',
+ 'Africa/Asmara',
+ 'Africa/Asmera',
+ 'Africa/Bamako',
+ 'Africa/Bangui',
+ 'Africa/Banjul',
+ 'Africa/Bissau',
+ 'Africa/Blantyre',
+ 'Africa/Brazzaville',
+ 'Africa/Bujumbura',
+ 'Africa/Cairo',
+ 'Africa/Casablanca',
+ 'Africa/Ceuta',
+ 'Africa/Conakry',
+ 'Africa/Dakar',
+ 'Africa/Dar_es_Salaam',
+ 'Africa/Djibouti',
+ 'Africa/Douala',
+ 'Africa/El_Aaiun',
+ 'Africa/Freetown',
+ 'Africa/Gaborone',
+ 'Africa/Harare',
+ 'Africa/Johannesburg',
+ 'Africa/Juba',
+ 'Africa/Kampala',
+ 'Africa/Khartoum',
+ 'Africa/Kigali',
+ 'Africa/Kinshasa',
+ 'Africa/Lagos',
+ 'Africa/Libreville',
+ 'Africa/Lome',
+ 'Africa/Luanda',
+ 'Africa/Lubumbashi',
+ 'Africa/Lusaka',
+ 'Africa/Malabo',
+ 'Africa/Maputo',
+ 'Africa/Maseru',
+ 'Africa/Mbabane',
+ 'Africa/Mogadishu',
+ 'Africa/Monrovia',
+ 'Africa/Nairobi',
+ 'Africa/Ndjamena',
+ 'Africa/Niamey',
+ 'Africa/Nouakchott',
+ 'Africa/Ouagadougou',
+ 'Africa/Porto-Novo',
+ 'Africa/Sao_Tome',
+ 'Africa/Timbuktu',
+ 'Africa/Tripoli',
+ 'Africa/Tunis',
+ 'Africa/Windhoek',
+ 'America/Adak',
+ 'America/Anchorage',
+ 'America/Anguilla',
+ 'America/Antigua',
+ 'America/Araguaina',
+ 'America/Argentina/Buenos_Aires',
+ 'America/Argentina/Catamarca',
+ 'America/Argentina/ComodRivadavia',
+ 'America/Argentina/Cordoba',
+ 'America/Argentina/Jujuy',
+ 'America/Argentina/La_Rioja',
+ 'America/Argentina/Mendoza',
+ 'America/Argentina/Rio_Gallegos',
+ 'America/Argentina/Salta',
+ 'America/Argentina/San_Juan',
+ 'America/Argentina/San_Luis',
+ 'America/Argentina/Tucuman',
+ 'America/Argentina/Ushuaia',
+ 'America/Aruba',
+ 'America/Asuncion',
+ 'America/Atikokan',
+ 'America/Atka',
+ 'America/Bahia',
+ 'America/Bahia_Banderas',
+ 'America/Barbados',
+ 'America/Belem',
+ 'America/Belize',
+ 'America/Blanc-Sablon',
+ 'America/Boa_Vista',
+ 'America/Bogota',
+ 'America/Boise',
+ 'America/Buenos_Aires',
+ 'America/Cambridge_Bay',
+ 'America/Campo_Grande',
+ 'America/Cancun',
+ 'America/Caracas',
+ 'America/Catamarca',
+ 'America/Cayenne',
+ 'America/Cayman',
+ 'America/Chicago',
+ 'America/Chihuahua',
+ 'America/Ciudad_Juarez',
+ 'America/Coral_Harbour',
+ 'America/Cordoba',
+ 'America/Costa_Rica',
+ 'America/Creston',
+ 'America/Cuiaba',
+ 'America/Curacao',
+ 'America/Danmarkshavn',
+ 'America/Dawson',
+ 'America/Dawson_Creek',
+ 'America/Denver',
+ 'America/Detroit',
+ 'America/Dominica',
+ 'America/Edmonton',
+ 'America/Eirunepe',
+ 'America/El_Salvador',
+ 'America/Ensenada',
+ 'America/Fort_Nelson',
+ 'America/Fort_Wayne',
+ 'America/Fortaleza',
+ 'America/Glace_Bay',
+ 'America/Godthab',
+ 'America/Goose_Bay',
+ 'America/Grand_Turk',
+ 'America/Grenada',
+ 'America/Guadeloupe',
+ 'America/Guatemala',
+ 'America/Guayaquil',
+ 'America/Guyana',
+ 'America/Halifax',
+ 'America/Havana',
+ 'America/Hermosillo',
+ 'America/Indiana/Indianapolis',
+ 'America/Indiana/Knox',
+ 'America/Indiana/Marengo',
+ 'America/Indiana/Petersburg',
+ 'America/Indiana/Tell_City',
+ 'America/Indiana/Vevay',
+ 'America/Indiana/Vincennes',
+ 'America/Indiana/Winamac',
+ 'America/Indianapolis',
+ 'America/Inuvik',
+ 'America/Iqaluit',
+ 'America/Jamaica',
+ 'America/Jujuy',
+ 'America/Juneau',
+ 'America/Kentucky/Louisville',
+ 'America/Kentucky/Monticello',
+ 'America/Knox_IN',
+ 'America/Kralendijk',
+ 'America/La_Paz',
+ 'America/Lima',
+ 'America/Los_Angeles',
+ 'America/Louisville',
+ 'America/Lower_Princes',
+ 'America/Maceio',
+ 'America/Managua',
+ 'America/Manaus',
+ 'America/Marigot',
+ 'America/Martinique',
+ 'America/Matamoros',
+ 'America/Mazatlan',
+ 'America/Mendoza',
+ 'America/Menominee',
+ 'America/Merida',
+ 'America/Metlakatla',
+ 'America/Mexico_City',
+ 'America/Miquelon',
+ 'America/Moncton',
+ 'America/Monterrey',
+ 'America/Montevideo',
+ 'America/Montreal',
+ 'America/Montserrat',
+ 'America/Nassau',
+ 'America/New_York',
+ 'America/Nipigon',
+ 'America/Nome',
+ 'America/Noronha',
+ 'America/North_Dakota/Beulah',
+ 'America/North_Dakota/Center',
+ 'America/North_Dakota/New_Salem',
+ 'America/Nuuk',
+ 'America/Ojinaga',
+ 'America/Panama',
+ 'America/Pangnirtung',
+ 'America/Paramaribo',
+ 'America/Phoenix',
+ 'America/Port-au-Prince',
+ 'America/Port_of_Spain',
+ 'America/Porto_Acre',
+ 'America/Porto_Velho',
+ 'America/Puerto_Rico',
+ 'America/Punta_Arenas',
+ 'America/Rainy_River',
+ 'America/Rankin_Inlet',
+ 'America/Recife',
+ 'America/Regina',
+ 'America/Resolute',
+ 'America/Rio_Branco',
+ 'America/Rosario',
+ 'America/Santa_Isabel',
+ 'America/Santarem',
+ 'America/Santiago',
+ 'America/Santo_Domingo',
+ 'America/Sao_Paulo',
+ 'America/Scoresbysund',
+ 'America/Shiprock',
+ 'America/Sitka',
+ 'America/St_Barthelemy',
+ 'America/St_Johns',
+ 'America/St_Kitts',
+ 'America/St_Lucia',
+ 'America/St_Thomas',
+ 'America/St_Vincent',
+ 'America/Swift_Current',
+ 'America/Tegucigalpa',
+ 'America/Thule',
+ 'America/Thunder_Bay',
+ 'America/Tijuana',
+ 'America/Toronto',
+ 'America/Tortola',
+ 'America/Vancouver',
+ 'America/Virgin',
+ 'America/Whitehorse',
+ 'America/Winnipeg',
+ 'America/Yakutat',
+ 'America/Yellowknife',
+ 'Antarctica/Casey',
+ 'Antarctica/Davis',
+ 'Antarctica/DumontDUrville',
+ 'Antarctica/Macquarie',
+ 'Antarctica/Mawson',
+ 'Antarctica/McMurdo',
+ 'Antarctica/Palmer',
+ 'Antarctica/Rothera',
+ 'Antarctica/South_Pole',
+ 'Antarctica/Syowa',
+ 'Antarctica/Troll',
+ 'Antarctica/Vostok',
+ 'Arctic/Longyearbyen',
+ 'Asia/Aden',
+ 'Asia/Almaty',
+ 'Asia/Amman',
+ 'Asia/Anadyr',
+ 'Asia/Aqtau',
+ 'Asia/Aqtobe',
+ 'Asia/Ashgabat',
+ 'Asia/Ashkhabad',
+ 'Asia/Atyrau',
+ 'Asia/Baghdad',
+ 'Asia/Bahrain',
+ 'Asia/Baku',
+ 'Asia/Bangkok',
+ 'Asia/Barnaul',
+ 'Asia/Beirut',
+ 'Asia/Bishkek',
+ 'Asia/Brunei',
+ 'Asia/Calcutta',
+ 'Asia/Chita',
+ 'Asia/Choibalsan',
+ 'Asia/Chongqing',
+ 'Asia/Chungking',
+ 'Asia/Colombo',
+ 'Asia/Dacca',
+ 'Asia/Damascus',
+ 'Asia/Dhaka',
+ 'Asia/Dili',
+ 'Asia/Dubai',
+ 'Asia/Dushanbe',
+ 'Asia/Famagusta',
+ 'Asia/Gaza',
+ 'Asia/Harbin',
+ 'Asia/Hebron',
+ 'Asia/Ho_Chi_Minh',
+ 'Asia/Hong_Kong',
+ 'Asia/Hovd',
+ 'Asia/Irkutsk',
+ 'Asia/Istanbul',
+ 'Asia/Jakarta',
+ 'Asia/Jayapura',
+ 'Asia/Jerusalem',
+ 'Asia/Kabul',
+ 'Asia/Kamchatka',
+ 'Asia/Karachi',
+ 'Asia/Kashgar',
+ 'Asia/Kathmandu',
+ 'Asia/Katmandu',
+ 'Asia/Khandyga',
+ 'Asia/Kolkata',
+ 'Asia/Krasnoyarsk',
+ 'Asia/Kuala_Lumpur',
+ 'Asia/Kuching',
+ 'Asia/Kuwait',
+ 'Asia/Macao',
+ 'Asia/Macau',
+ 'Asia/Magadan',
+ 'Asia/Makassar',
+ 'Asia/Manila',
+ 'Asia/Muscat',
+ 'Asia/Nicosia',
+ 'Asia/Novokuznetsk',
+ 'Asia/Novosibirsk',
+ 'Asia/Omsk',
+ 'Asia/Oral',
+ 'Asia/Phnom_Penh',
+ 'Asia/Pontianak',
+ 'Asia/Pyongyang',
+ 'Asia/Qatar',
+ 'Asia/Qostanay',
+ 'Asia/Qyzylorda',
+ 'Asia/Rangoon',
+ 'Asia/Riyadh',
+ 'Asia/Saigon',
+ 'Asia/Sakhalin',
+ 'Asia/Samarkand',
+ 'Asia/Seoul',
+ 'Asia/Shanghai',
+ 'Asia/Singapore',
+ 'Asia/Srednekolymsk',
+ 'Asia/Taipei',
+ 'Asia/Tashkent',
+ 'Asia/Tbilisi',
+ 'Asia/Tehran',
+ 'Asia/Tel_Aviv',
+ 'Asia/Thimbu',
+ 'Asia/Thimphu',
+ 'Asia/Tokyo',
+ 'Asia/Tomsk',
+ 'Asia/Ujung_Pandang',
+ 'Asia/Ulaanbaatar',
+ 'Asia/Ulan_Bator',
+ 'Asia/Urumqi',
+ 'Asia/Ust-Nera',
+ 'Asia/Vientiane',
+ 'Asia/Vladivostok',
+ 'Asia/Yakutsk',
+ 'Asia/Yangon',
+ 'Asia/Yekaterinburg',
+ 'Asia/Yerevan',
+ 'Atlantic/Azores',
+ 'Atlantic/Bermuda',
+ 'Atlantic/Canary',
+ 'Atlantic/Cape_Verde',
+ 'Atlantic/Faeroe',
+ 'Atlantic/Faroe',
+ 'Atlantic/Jan_Mayen',
+ 'Atlantic/Madeira',
+ 'Atlantic/Reykjavik',
+ 'Atlantic/South_Georgia',
+ 'Atlantic/St_Helena',
+ 'Atlantic/Stanley',
+ 'Australia/ACT',
+ 'Australia/Adelaide',
+ 'Australia/Brisbane',
+ 'Australia/Broken_Hill',
+ 'Australia/Canberra',
+ 'Australia/Currie',
+ 'Australia/Darwin',
+ 'Australia/Eucla',
+ 'Australia/Hobart',
+ 'Australia/LHI',
+ 'Australia/Lindeman',
+ 'Australia/Lord_Howe',
+ 'Australia/Melbourne',
+ 'Australia/NSW',
+ 'Australia/North',
+ 'Australia/Perth',
+ 'Australia/Queensland',
+ 'Australia/South',
+ 'Australia/Sydney',
+ 'Australia/Tasmania',
+ 'Australia/Victoria',
+ 'Australia/West',
+ 'Australia/Yancowinna',
+ 'Brazil/Acre',
+ 'Brazil/DeNoronha',
+ 'Brazil/East',
+ 'Brazil/West',
+ 'CET',
+ 'CST6CDT',
+ 'Canada/Atlantic',
+ 'Canada/Central',
+ 'Canada/Eastern',
+ 'Canada/Mountain',
+ 'Canada/Newfoundland',
+ 'Canada/Pacific',
+ 'Canada/Saskatchewan',
+ 'Canada/Yukon',
+ 'Chile/Continental',
+ 'Chile/EasterIsland',
+ 'Cuba',
+ 'EET',
+ 'EST',
+ 'EST5EDT',
+ 'Egypt',
+ 'Eire',
+ 'Etc/GMT',
+ 'Etc/GMT+0',
+ 'Etc/GMT+1',
+ 'Etc/GMT+10',
+ 'Etc/GMT+11',
+ 'Etc/GMT+12',
+ 'Etc/GMT+2',
+ 'Etc/GMT+3',
+ 'Etc/GMT+4',
+ 'Etc/GMT+5',
+ 'Etc/GMT+6',
+ 'Etc/GMT+7',
+ 'Etc/GMT+8',
+ 'Etc/GMT+9',
+ 'Etc/GMT-0',
+ 'Etc/GMT-1',
+ 'Etc/GMT-10',
+ 'Etc/GMT-11',
+ 'Etc/GMT-12',
+ 'Etc/GMT-13',
+ 'Etc/GMT-14',
+ 'Etc/GMT-2',
+ 'Etc/GMT-3',
+ 'Etc/GMT-4',
+ 'Etc/GMT-5',
+ 'Etc/GMT-6',
+ 'Etc/GMT-7',
+ 'Etc/GMT-8',
+ 'Etc/GMT-9',
+ 'Etc/GMT0',
+ 'Etc/Greenwich',
+ 'Etc/UCT',
+ 'Etc/UTC',
+ 'Etc/Universal',
+ 'Etc/Zulu',
+ 'Europe/Amsterdam',
+ 'Europe/Andorra',
+ 'Europe/Astrakhan',
+ 'Europe/Athens',
+ 'Europe/Belfast',
+ 'Europe/Belgrade',
+ 'Europe/Berlin',
+ 'Europe/Bratislava',
+ 'Europe/Brussels',
+ 'Europe/Bucharest',
+ 'Europe/Budapest',
+ 'Europe/Busingen',
+ 'Europe/Chisinau',
+ 'Europe/Copenhagen',
+ 'Europe/Dublin',
+ 'Europe/Gibraltar',
+ 'Europe/Guernsey',
+ 'Europe/Helsinki',
+ 'Europe/Isle_of_Man',
+ 'Europe/Istanbul',
+ 'Europe/Jersey',
+ 'Europe/Kaliningrad',
+ 'Europe/Kiev',
+ 'Europe/Kirov',
+ 'Europe/Kyiv',
+ 'Europe/Lisbon',
+ 'Europe/Ljubljana',
+ 'Europe/London',
+ 'Europe/Luxembourg',
+ 'Europe/Madrid',
+ 'Europe/Malta',
+ 'Europe/Mariehamn',
+ 'Europe/Minsk',
+ 'Europe/Monaco',
+ 'Europe/Moscow',
+ 'Europe/Nicosia',
+ 'Europe/Oslo',
+ 'Europe/Paris',
+ 'Europe/Podgorica',
+ 'Europe/Prague',
+ 'Europe/Riga',
+ 'Europe/Rome',
+ 'Europe/Samara',
+ 'Europe/San_Marino',
+ 'Europe/Sarajevo',
+ 'Europe/Saratov',
+ 'Europe/Simferopol',
+ 'Europe/Skopje',
+ 'Europe/Sofia',
+ 'Europe/Stockholm',
+ 'Europe/Tallinn',
+ 'Europe/Tirane',
+ 'Europe/Tiraspol',
+ 'Europe/Ulyanovsk',
+ 'Europe/Uzhgorod',
+ 'Europe/Vaduz',
+ 'Europe/Vatican',
+ 'Europe/Vienna',
+ 'Europe/Vilnius',
+ 'Europe/Volgograd',
+ 'Europe/Warsaw',
+ 'Europe/Zagreb',
+ 'Europe/Zaporozhye',
+ 'Europe/Zurich',
+ 'GB',
+ 'GB-Eire',
+ 'GMT',
+ 'GMT+0',
+ 'GMT-0',
+ 'GMT0',
+ 'Greenwich',
+ 'HST',
+ 'Hongkong',
+ 'Iceland',
+ 'Indian/Antananarivo',
+ 'Indian/Chagos',
+ 'Indian/Christmas',
+ 'Indian/Cocos',
+ 'Indian/Comoro',
+ 'Indian/Kerguelen',
+ 'Indian/Mahe',
+ 'Indian/Maldives',
+ 'Indian/Mauritius',
+ 'Indian/Mayotte',
+ 'Indian/Reunion',
+ 'Iran',
+ 'Israel',
+ 'Jamaica',
+ 'Japan',
+ 'Kwajalein',
+ 'Libya',
+ 'MET',
+ 'MST',
+ 'MST7MDT',
+ 'Mexico/BajaNorte',
+ 'Mexico/BajaSur',
+ 'Mexico/General',
+ 'NZ',
+ 'NZ-CHAT',
+ 'Navajo',
+ 'PRC',
+ 'PST8PDT',
+ 'Pacific/Apia',
+ 'Pacific/Auckland',
+ 'Pacific/Bougainville',
+ 'Pacific/Chatham',
+ 'Pacific/Chuuk',
+ 'Pacific/Easter',
+ 'Pacific/Efate',
+ 'Pacific/Enderbury',
+ 'Pacific/Fakaofo',
+ 'Pacific/Fiji',
+ 'Pacific/Funafuti',
+ 'Pacific/Galapagos',
+ 'Pacific/Gambier',
+ 'Pacific/Guadalcanal',
+ 'Pacific/Guam',
+ 'Pacific/Honolulu',
+ 'Pacific/Johnston',
+ 'Pacific/Kanton',
+ 'Pacific/Kiritimati',
+ 'Pacific/Kosrae',
+ 'Pacific/Kwajalein',
+ 'Pacific/Majuro',
+ 'Pacific/Marquesas',
+ 'Pacific/Midway',
+ 'Pacific/Nauru',
+ 'Pacific/Niue',
+ 'Pacific/Norfolk',
+ 'Pacific/Noumea',
+ 'Pacific/Pago_Pago',
+ 'Pacific/Palau',
+ 'Pacific/Pitcairn',
+ 'Pacific/Pohnpei',
+ 'Pacific/Ponape',
+ 'Pacific/Port_Moresby',
+ 'Pacific/Rarotonga',
+ 'Pacific/Saipan',
+ 'Pacific/Samoa',
+ 'Pacific/Tahiti',
+ 'Pacific/Tarawa',
+ 'Pacific/Tongatapu',
+ 'Pacific/Truk',
+ 'Pacific/Wake',
+ 'Pacific/Wallis',
+ 'Pacific/Yap',
+ 'Poland',
+ 'Portugal',
+ 'ROC',
+ 'ROK',
+ 'Singapore',
+ 'Turkey',
+ 'UCT',
+ 'US/Alaska',
+ 'US/Aleutian',
+ 'US/Arizona',
+ 'US/Central',
+ 'US/East-Indiana',
+ 'US/Eastern',
+ 'US/Hawaii',
+ 'US/Indiana-Starke',
+ 'US/Michigan',
+ 'US/Mountain',
+ 'US/Pacific',
+ 'US/Samoa',
+ 'UTC',
+ 'Universal',
+ 'W-SU',
+ 'WET',
+ 'Zulu')
+
+COMMON_TIMEZONES = ('Africa/Abidjan',
+ 'Africa/Accra',
+ 'Africa/Addis_Ababa',
+ 'Africa/Algiers',
+ 'Africa/Asmara',
+ 'Africa/Bamako',
+ 'Africa/Bangui',
+ 'Africa/Banjul',
+ 'Africa/Bissau',
+ 'Africa/Blantyre',
+ 'Africa/Brazzaville',
+ 'Africa/Bujumbura',
+ 'Africa/Cairo',
+ 'Africa/Casablanca',
+ 'Africa/Ceuta',
+ 'Africa/Conakry',
+ 'Africa/Dakar',
+ 'Africa/Dar_es_Salaam',
+ 'Africa/Djibouti',
+ 'Africa/Douala',
+ 'Africa/El_Aaiun',
+ 'Africa/Freetown',
+ 'Africa/Gaborone',
+ 'Africa/Harare',
+ 'Africa/Johannesburg',
+ 'Africa/Juba',
+ 'Africa/Kampala',
+ 'Africa/Khartoum',
+ 'Africa/Kigali',
+ 'Africa/Kinshasa',
+ 'Africa/Lagos',
+ 'Africa/Libreville',
+ 'Africa/Lome',
+ 'Africa/Luanda',
+ 'Africa/Lubumbashi',
+ 'Africa/Lusaka',
+ 'Africa/Malabo',
+ 'Africa/Maputo',
+ 'Africa/Maseru',
+ 'Africa/Mbabane',
+ 'Africa/Mogadishu',
+ 'Africa/Monrovia',
+ 'Africa/Nairobi',
+ 'Africa/Ndjamena',
+ 'Africa/Niamey',
+ 'Africa/Nouakchott',
+ 'Africa/Ouagadougou',
+ 'Africa/Porto-Novo',
+ 'Africa/Sao_Tome',
+ 'Africa/Tripoli',
+ 'Africa/Tunis',
+ 'Africa/Windhoek',
+ 'America/Adak',
+ 'America/Anchorage',
+ 'America/Anguilla',
+ 'America/Antigua',
+ 'America/Araguaina',
+ 'America/Argentina/Buenos_Aires',
+ 'America/Argentina/Catamarca',
+ 'America/Argentina/Cordoba',
+ 'America/Argentina/Jujuy',
+ 'America/Argentina/La_Rioja',
+ 'America/Argentina/Mendoza',
+ 'America/Argentina/Rio_Gallegos',
+ 'America/Argentina/Salta',
+ 'America/Argentina/San_Juan',
+ 'America/Argentina/San_Luis',
+ 'America/Argentina/Tucuman',
+ 'America/Argentina/Ushuaia',
+ 'America/Aruba',
+ 'America/Asuncion',
+ 'America/Atikokan',
+ 'America/Bahia',
+ 'America/Bahia_Banderas',
+ 'America/Barbados',
+ 'America/Belem',
+ 'America/Belize',
+ 'America/Blanc-Sablon',
+ 'America/Boa_Vista',
+ 'America/Bogota',
+ 'America/Boise',
+ 'America/Cambridge_Bay',
+ 'America/Campo_Grande',
+ 'America/Cancun',
+ 'America/Caracas',
+ 'America/Cayenne',
+ 'America/Cayman',
+ 'America/Chicago',
+ 'America/Chihuahua',
+ 'America/Ciudad_Juarez',
+ 'America/Costa_Rica',
+ 'America/Creston',
+ 'America/Cuiaba',
+ 'America/Curacao',
+ 'America/Danmarkshavn',
+ 'America/Dawson',
+ 'America/Dawson_Creek',
+ 'America/Denver',
+ 'America/Detroit',
+ 'America/Dominica',
+ 'America/Edmonton',
+ 'America/Eirunepe',
+ 'America/El_Salvador',
+ 'America/Fort_Nelson',
+ 'America/Fortaleza',
+ 'America/Glace_Bay',
+ 'America/Goose_Bay',
+ 'America/Grand_Turk',
+ 'America/Grenada',
+ 'America/Guadeloupe',
+ 'America/Guatemala',
+ 'America/Guayaquil',
+ 'America/Guyana',
+ 'America/Halifax',
+ 'America/Havana',
+ 'America/Hermosillo',
+ 'America/Indiana/Indianapolis',
+ 'America/Indiana/Knox',
+ 'America/Indiana/Marengo',
+ 'America/Indiana/Petersburg',
+ 'America/Indiana/Tell_City',
+ 'America/Indiana/Vevay',
+ 'America/Indiana/Vincennes',
+ 'America/Indiana/Winamac',
+ 'America/Inuvik',
+ 'America/Iqaluit',
+ 'America/Jamaica',
+ 'America/Juneau',
+ 'America/Kentucky/Louisville',
+ 'America/Kentucky/Monticello',
+ 'America/Kralendijk',
+ 'America/La_Paz',
+ 'America/Lima',
+ 'America/Los_Angeles',
+ 'America/Lower_Princes',
+ 'America/Maceio',
+ 'America/Managua',
+ 'America/Manaus',
+ 'America/Marigot',
+ 'America/Martinique',
+ 'America/Matamoros',
+ 'America/Mazatlan',
+ 'America/Menominee',
+ 'America/Merida',
+ 'America/Metlakatla',
+ 'America/Mexico_City',
+ 'America/Miquelon',
+ 'America/Moncton',
+ 'America/Monterrey',
+ 'America/Montevideo',
+ 'America/Montserrat',
+ 'America/Nassau',
+ 'America/New_York',
+ 'America/Nome',
+ 'America/Noronha',
+ 'America/North_Dakota/Beulah',
+ 'America/North_Dakota/Center',
+ 'America/North_Dakota/New_Salem',
+ 'America/Nuuk',
+ 'America/Ojinaga',
+ 'America/Panama',
+ 'America/Paramaribo',
+ 'America/Phoenix',
+ 'America/Port-au-Prince',
+ 'America/Port_of_Spain',
+ 'America/Porto_Velho',
+ 'America/Puerto_Rico',
+ 'America/Punta_Arenas',
+ 'America/Rankin_Inlet',
+ 'America/Recife',
+ 'America/Regina',
+ 'America/Resolute',
+ 'America/Rio_Branco',
+ 'America/Santarem',
+ 'America/Santiago',
+ 'America/Santo_Domingo',
+ 'America/Sao_Paulo',
+ 'America/Scoresbysund',
+ 'America/Sitka',
+ 'America/St_Barthelemy',
+ 'America/St_Johns',
+ 'America/St_Kitts',
+ 'America/St_Lucia',
+ 'America/St_Thomas',
+ 'America/St_Vincent',
+ 'America/Swift_Current',
+ 'America/Tegucigalpa',
+ 'America/Thule',
+ 'America/Tijuana',
+ 'America/Toronto',
+ 'America/Tortola',
+ 'America/Vancouver',
+ 'America/Whitehorse',
+ 'America/Winnipeg',
+ 'America/Yakutat',
+ 'Antarctica/Casey',
+ 'Antarctica/Davis',
+ 'Antarctica/DumontDUrville',
+ 'Antarctica/Macquarie',
+ 'Antarctica/Mawson',
+ 'Antarctica/McMurdo',
+ 'Antarctica/Palmer',
+ 'Antarctica/Rothera',
+ 'Antarctica/Syowa',
+ 'Antarctica/Troll',
+ 'Antarctica/Vostok',
+ 'Arctic/Longyearbyen',
+ 'Asia/Aden',
+ 'Asia/Almaty',
+ 'Asia/Amman',
+ 'Asia/Anadyr',
+ 'Asia/Aqtau',
+ 'Asia/Aqtobe',
+ 'Asia/Ashgabat',
+ 'Asia/Atyrau',
+ 'Asia/Baghdad',
+ 'Asia/Bahrain',
+ 'Asia/Baku',
+ 'Asia/Bangkok',
+ 'Asia/Barnaul',
+ 'Asia/Beirut',
+ 'Asia/Bishkek',
+ 'Asia/Brunei',
+ 'Asia/Chita',
+ 'Asia/Colombo',
+ 'Asia/Damascus',
+ 'Asia/Dhaka',
+ 'Asia/Dili',
+ 'Asia/Dubai',
+ 'Asia/Dushanbe',
+ 'Asia/Famagusta',
+ 'Asia/Gaza',
+ 'Asia/Hebron',
+ 'Asia/Ho_Chi_Minh',
+ 'Asia/Hong_Kong',
+ 'Asia/Hovd',
+ 'Asia/Irkutsk',
+ 'Asia/Jakarta',
+ 'Asia/Jayapura',
+ 'Asia/Jerusalem',
+ 'Asia/Kabul',
+ 'Asia/Kamchatka',
+ 'Asia/Karachi',
+ 'Asia/Kathmandu',
+ 'Asia/Khandyga',
+ 'Asia/Kolkata',
+ 'Asia/Krasnoyarsk',
+ 'Asia/Kuala_Lumpur',
+ 'Asia/Kuching',
+ 'Asia/Kuwait',
+ 'Asia/Macau',
+ 'Asia/Magadan',
+ 'Asia/Makassar',
+ 'Asia/Manila',
+ 'Asia/Muscat',
+ 'Asia/Nicosia',
+ 'Asia/Novokuznetsk',
+ 'Asia/Novosibirsk',
+ 'Asia/Omsk',
+ 'Asia/Oral',
+ 'Asia/Phnom_Penh',
+ 'Asia/Pontianak',
+ 'Asia/Pyongyang',
+ 'Asia/Qatar',
+ 'Asia/Qostanay',
+ 'Asia/Qyzylorda',
+ 'Asia/Riyadh',
+ 'Asia/Sakhalin',
+ 'Asia/Samarkand',
+ 'Asia/Seoul',
+ 'Asia/Shanghai',
+ 'Asia/Singapore',
+ 'Asia/Srednekolymsk',
+ 'Asia/Taipei',
+ 'Asia/Tashkent',
+ 'Asia/Tbilisi',
+ 'Asia/Tehran',
+ 'Asia/Thimphu',
+ 'Asia/Tokyo',
+ 'Asia/Tomsk',
+ 'Asia/Ulaanbaatar',
+ 'Asia/Urumqi',
+ 'Asia/Ust-Nera',
+ 'Asia/Vientiane',
+ 'Asia/Vladivostok',
+ 'Asia/Yakutsk',
+ 'Asia/Yangon',
+ 'Asia/Yekaterinburg',
+ 'Asia/Yerevan',
+ 'Atlantic/Azores',
+ 'Atlantic/Bermuda',
+ 'Atlantic/Canary',
+ 'Atlantic/Cape_Verde',
+ 'Atlantic/Faroe',
+ 'Atlantic/Madeira',
+ 'Atlantic/Reykjavik',
+ 'Atlantic/South_Georgia',
+ 'Atlantic/St_Helena',
+ 'Atlantic/Stanley',
+ 'Australia/Adelaide',
+ 'Australia/Brisbane',
+ 'Australia/Broken_Hill',
+ 'Australia/Darwin',
+ 'Australia/Eucla',
+ 'Australia/Hobart',
+ 'Australia/Lindeman',
+ 'Australia/Lord_Howe',
+ 'Australia/Melbourne',
+ 'Australia/Perth',
+ 'Australia/Sydney',
+ 'Canada/Atlantic',
+ 'Canada/Central',
+ 'Canada/Eastern',
+ 'Canada/Mountain',
+ 'Canada/Newfoundland',
+ 'Canada/Pacific',
+ 'Europe/Amsterdam',
+ 'Europe/Andorra',
+ 'Europe/Astrakhan',
+ 'Europe/Athens',
+ 'Europe/Belgrade',
+ 'Europe/Berlin',
+ 'Europe/Bratislava',
+ 'Europe/Brussels',
+ 'Europe/Bucharest',
+ 'Europe/Budapest',
+ 'Europe/Busingen',
+ 'Europe/Chisinau',
+ 'Europe/Copenhagen',
+ 'Europe/Dublin',
+ 'Europe/Gibraltar',
+ 'Europe/Guernsey',
+ 'Europe/Helsinki',
+ 'Europe/Isle_of_Man',
+ 'Europe/Istanbul',
+ 'Europe/Jersey',
+ 'Europe/Kaliningrad',
+ 'Europe/Kirov',
+ 'Europe/Kyiv',
+ 'Europe/Lisbon',
+ 'Europe/Ljubljana',
+ 'Europe/London',
+ 'Europe/Luxembourg',
+ 'Europe/Madrid',
+ 'Europe/Malta',
+ 'Europe/Mariehamn',
+ 'Europe/Minsk',
+ 'Europe/Monaco',
+ 'Europe/Moscow',
+ 'Europe/Oslo',
+ 'Europe/Paris',
+ 'Europe/Podgorica',
+ 'Europe/Prague',
+ 'Europe/Riga',
+ 'Europe/Rome',
+ 'Europe/Samara',
+ 'Europe/San_Marino',
+ 'Europe/Sarajevo',
+ 'Europe/Saratov',
+ 'Europe/Simferopol',
+ 'Europe/Skopje',
+ 'Europe/Sofia',
+ 'Europe/Stockholm',
+ 'Europe/Tallinn',
+ 'Europe/Tirane',
+ 'Europe/Ulyanovsk',
+ 'Europe/Vaduz',
+ 'Europe/Vatican',
+ 'Europe/Vienna',
+ 'Europe/Vilnius',
+ 'Europe/Volgograd',
+ 'Europe/Warsaw',
+ 'Europe/Zagreb',
+ 'Europe/Zurich',
+ 'GMT',
+ 'Indian/Antananarivo',
+ 'Indian/Chagos',
+ 'Indian/Christmas',
+ 'Indian/Cocos',
+ 'Indian/Comoro',
+ 'Indian/Kerguelen',
+ 'Indian/Mahe',
+ 'Indian/Maldives',
+ 'Indian/Mauritius',
+ 'Indian/Mayotte',
+ 'Indian/Reunion',
+ 'Pacific/Apia',
+ 'Pacific/Auckland',
+ 'Pacific/Bougainville',
+ 'Pacific/Chatham',
+ 'Pacific/Chuuk',
+ 'Pacific/Easter',
+ 'Pacific/Efate',
+ 'Pacific/Fakaofo',
+ 'Pacific/Fiji',
+ 'Pacific/Funafuti',
+ 'Pacific/Galapagos',
+ 'Pacific/Gambier',
+ 'Pacific/Guadalcanal',
+ 'Pacific/Guam',
+ 'Pacific/Honolulu',
+ 'Pacific/Kanton',
+ 'Pacific/Kiritimati',
+ 'Pacific/Kosrae',
+ 'Pacific/Kwajalein',
+ 'Pacific/Majuro',
+ 'Pacific/Marquesas',
+ 'Pacific/Midway',
+ 'Pacific/Nauru',
+ 'Pacific/Niue',
+ 'Pacific/Norfolk',
+ 'Pacific/Noumea',
+ 'Pacific/Pago_Pago',
+ 'Pacific/Palau',
+ 'Pacific/Pitcairn',
+ 'Pacific/Pohnpei',
+ 'Pacific/Port_Moresby',
+ 'Pacific/Rarotonga',
+ 'Pacific/Saipan',
+ 'Pacific/Tahiti',
+ 'Pacific/Tarawa',
+ 'Pacific/Tongatapu',
+ 'Pacific/Wake',
+ 'Pacific/Wallis',
+ 'US/Alaska',
+ 'US/Arizona',
+ 'US/Central',
+ 'US/Eastern',
+ 'US/Hawaii',
+ 'US/Mountain',
+ 'US/Pacific',
+ 'UTC')
+
+COUNTRY_TIMEZONES = MappingProxyType({'AD': ('Europe/Andorra',),
+ 'AE': ('Asia/Dubai',),
+ 'AF': ('Asia/Kabul',),
+ 'AG': ('America/Antigua',),
+ 'AI': ('America/Anguilla',),
+ 'AL': ('Europe/Tirane',),
+ 'AM': ('Asia/Yerevan',),
+ 'AO': ('Africa/Luanda',),
+ 'AQ': ('Antarctica/McMurdo',
+        'Antarctica/Casey',
+        'Antarctica/Davis',
+        'Antarctica/DumontDUrville',
+        'Antarctica/Mawson',
+        'Antarctica/Palmer',
+        'Antarctica/Rothera',
+        'Antarctica/Syowa',
+        'Antarctica/Troll',
+        'Antarctica/Vostok'),
+ 'AR': ('America/Argentina/Buenos_Aires',
+        'America/Argentina/Cordoba',
+        'America/Argentina/Salta',
+        'America/Argentina/Jujuy',
+        'America/Argentina/Tucuman',
+        'America/Argentina/Catamarca',
+        'America/Argentina/La_Rioja',
+        'America/Argentina/San_Juan',
+        'America/Argentina/Mendoza',
+        'America/Argentina/San_Luis',
+        'America/Argentina/Rio_Gallegos',
+        'America/Argentina/Ushuaia'),
+ 'AS': ('Pacific/Pago_Pago',),
+ 'AT': ('Europe/Vienna',),
+ 'AU': ('Australia/Lord_Howe',
+        'Antarctica/Macquarie',
+        'Australia/Hobart',
+        'Australia/Melbourne',
+        'Australia/Sydney',
+        'Australia/Broken_Hill',
+        'Australia/Brisbane',
+        'Australia/Lindeman',
+        'Australia/Adelaide',
+        'Australia/Darwin',
+        'Australia/Perth',
+        'Australia/Eucla'),
+ 'AW': ('America/Aruba',),
+ 'AX': ('Europe/Mariehamn',),
+ 'AZ': ('Asia/Baku',),
+ 'BA': ('Europe/Sarajevo',),
+ 'BB': ('America/Barbados',),
+ 'BD': ('Asia/Dhaka',),
+ 'BE': ('Europe/Brussels',),
+ 'BF': ('Africa/Ouagadougou',),
+ 'BG': ('Europe/Sofia',),
+ 'BH': ('Asia/Bahrain',),
+ 'BI': ('Africa/Bujumbura',),
+ 'BJ': ('Africa/Porto-Novo',),
+ 'BL': ('America/St_Barthelemy',),
+ 'BM': ('Atlantic/Bermuda',),
+ 'BN': ('Asia/Brunei',),
+ 'BO': ('America/La_Paz',),
+ 'BQ': ('America/Kralendijk',),
+ 'BR': ('America/Noronha',
+        'America/Belem',
+        'America/Fortaleza',
+        'America/Recife',
+        'America/Araguaina',
+        'America/Maceio',
+        'America/Bahia',
+        'America/Sao_Paulo',
+        'America/Campo_Grande',
+        'America/Cuiaba',
+        'America/Santarem',
+        'America/Porto_Velho',
+        'America/Boa_Vista',
+        'America/Manaus',
+        'America/Eirunepe',
+        'America/Rio_Branco'),
+ 'BS': ('America/Nassau',),
+ 'BT': ('Asia/Thimphu',),
+ 'BW': ('Africa/Gaborone',),
+ 'BY': ('Europe/Minsk',),
+ 'BZ': ('America/Belize',),
+ 'CA': ('America/St_Johns',
+        'America/Halifax',
+        'America/Glace_Bay',
+        'America/Moncton',
+        'America/Goose_Bay',
+        'America/Blanc-Sablon',
+        'America/Toronto',
+        'America/Iqaluit',
+        'America/Atikokan',
+        'America/Winnipeg',
+        'America/Resolute',
+        'America/Rankin_Inlet',
+        'America/Regina',
+        'America/Swift_Current',
+        'America/Edmonton',
+        'America/Cambridge_Bay',
+        'America/Inuvik',
+        'America/Creston',
+        'America/Dawson_Creek',
+        'America/Fort_Nelson',
+        'America/Whitehorse',
+        'America/Dawson',
+        'America/Vancouver'),
+ 'CC': ('Indian/Cocos',),
+ 'CD': ('Africa/Kinshasa', 'Africa/Lubumbashi'),
+ 'CF': ('Africa/Bangui',),
+ 'CG': ('Africa/Brazzaville',),
+ 'CH': ('Europe/Zurich',),
+ 'CI': ('Africa/Abidjan',),
+ 'CK': ('Pacific/Rarotonga',),
+ 'CL': ('America/Santiago', 'America/Punta_Arenas', 'Pacific/Easter'),
+ 'CM': ('Africa/Douala',),
+ 'CN': ('Asia/Shanghai', 'Asia/Urumqi'),
+ 'CO': ('America/Bogota',),
+ 'CR': ('America/Costa_Rica',),
+ 'CU': ('America/Havana',),
+ 'CV': ('Atlantic/Cape_Verde',),
+ 'CW': ('America/Curacao',),
+ 'CX': ('Indian/Christmas',),
+ 'CY': ('Asia/Nicosia', 'Asia/Famagusta'),
+ 'CZ': ('Europe/Prague',),
+ 'DE': ('Europe/Berlin', 'Europe/Busingen'),
+ 'DJ': ('Africa/Djibouti',),
+ 'DK': ('Europe/Copenhagen',),
+ 'DM': ('America/Dominica',),
+ 'DO': ('America/Santo_Domingo',),
+ 'DZ': ('Africa/Algiers',),
+ 'EC': ('America/Guayaquil', 'Pacific/Galapagos'),
+ 'EE': ('Europe/Tallinn',),
+ 'EG': ('Africa/Cairo',),
+ 'EH': ('Africa/El_Aaiun',),
+ 'ER': ('Africa/Asmara',),
+ 'ES': ('Europe/Madrid', 'Africa/Ceuta', 'Atlantic/Canary'),
+ 'ET': ('Africa/Addis_Ababa',),
+ 'FI': ('Europe/Helsinki',),
+ 'FJ': ('Pacific/Fiji',),
+ 'FK': ('Atlantic/Stanley',),
+ 'FM': ('Pacific/Chuuk', 'Pacific/Pohnpei', 'Pacific/Kosrae'),
+ 'FO': ('Atlantic/Faroe',),
+ 'FR': ('Europe/Paris',),
+ 'GA': ('Africa/Libreville',),
+ 'GB': ('Europe/London',),
+ 'GD': ('America/Grenada',),
+ 'GE': ('Asia/Tbilisi',),
+ 'GF': ('America/Cayenne',),
+ 'GG': ('Europe/Guernsey',),
+ 'GH': ('Africa/Accra',),
+ 'GI': ('Europe/Gibraltar',),
+ 'GL': ('America/Nuuk',
+        'America/Danmarkshavn',
+        'America/Scoresbysund',
+        'America/Thule'),
+ 'GM': ('Africa/Banjul',),
+ 'GN': ('Africa/Conakry',),
+ 'GP': ('America/Guadeloupe',),
+ 'GQ': ('Africa/Malabo',),
+ 'GR': ('Europe/Athens',),
+ 'GS': ('Atlantic/South_Georgia',),
+ 'GT': ('America/Guatemala',),
+ 'GU': ('Pacific/Guam',),
+ 'GW': ('Africa/Bissau',),
+ 'GY': ('America/Guyana',),
+ 'HK': ('Asia/Hong_Kong',),
+ 'HN': ('America/Tegucigalpa',),
+ 'HR': ('Europe/Zagreb',),
+ 'HT': ('America/Port-au-Prince',),
+ 'HU': ('Europe/Budapest',),
+ 'ID': ('Asia/Jakarta', 'Asia/Pontianak', 'Asia/Makassar', 'Asia/Jayapura'),
+ 'IE': ('Europe/Dublin',),
+ 'IL': ('Asia/Jerusalem',),
+ 'IM': ('Europe/Isle_of_Man',),
+ 'IN': ('Asia/Kolkata',),
+ 'IO': ('Indian/Chagos',),
+ 'IQ': ('Asia/Baghdad',),
+ 'IR': ('Asia/Tehran',),
+ 'IS': ('Atlantic/Reykjavik',),
+ 'IT': ('Europe/Rome',),
+ 'JE': ('Europe/Jersey',),
+ 'JM': ('America/Jamaica',),
+ 'JO': ('Asia/Amman',),
+ 'JP': ('Asia/Tokyo',),
+ 'KE': ('Africa/Nairobi',),
+ 'KG': ('Asia/Bishkek',),
+ 'KH': ('Asia/Phnom_Penh',),
+ 'KI': ('Pacific/Tarawa', 'Pacific/Kanton', 'Pacific/Kiritimati'),
+ 'KM': ('Indian/Comoro',),
+ 'KN': ('America/St_Kitts',),
+ 'KP': ('Asia/Pyongyang',),
+ 'KR': ('Asia/Seoul',),
+ 'KW': ('Asia/Kuwait',),
+ 'KY': ('America/Cayman',),
+ 'KZ': ('Asia/Almaty',
+        'Asia/Qyzylorda',
+        'Asia/Qostanay',
+        'Asia/Aqtobe',
+        'Asia/Aqtau',
+        'Asia/Atyrau',
+        'Asia/Oral'),
+ 'LA': ('Asia/Vientiane',),
+ 'LB': ('Asia/Beirut',),
+ 'LC': ('America/St_Lucia',),
+ 'LI': ('Europe/Vaduz',),
+ 'LK': ('Asia/Colombo',),
+ 'LR': ('Africa/Monrovia',),
+ 'LS': ('Africa/Maseru',),
+ 'LT': ('Europe/Vilnius',),
+ 'LU': ('Europe/Luxembourg',),
+ 'LV': ('Europe/Riga',),
+ 'LY': ('Africa/Tripoli',),
+ 'MA': ('Africa/Casablanca',),
+ 'MC': ('Europe/Monaco',),
+ 'MD': ('Europe/Chisinau',),
+ 'ME': ('Europe/Podgorica',),
+ 'MF': ('America/Marigot',),
+ 'MG': ('Indian/Antananarivo',),
+ 'MH': ('Pacific/Majuro', 'Pacific/Kwajalein'),
+ 'MK': ('Europe/Skopje',),
+ 'ML': ('Africa/Bamako',),
+ 'MM': ('Asia/Yangon',),
+ 'MN': ('Asia/Ulaanbaatar', 'Asia/Hovd'),
+ 'MO': ('Asia/Macau',),
+ 'MP': ('Pacific/Saipan',),
+ 'MQ': ('America/Martinique',),
+ 'MR': ('Africa/Nouakchott',),
+ 'MS': ('America/Montserrat',),
+ 'MT': ('Europe/Malta',),
+ 'MU': ('Indian/Mauritius',),
+ 'MV': ('Indian/Maldives',),
+ 'MW': ('Africa/Blantyre',),
+ 'MX': ('America/Mexico_City',
+        'America/Cancun',
+        'America/Merida',
+        'America/Monterrey',
+        'America/Matamoros',
+        'America/Chihuahua',
+        'America/Ciudad_Juarez',
+        'America/Ojinaga',
+        'America/Mazatlan',
+        'America/Bahia_Banderas',
+        'America/Hermosillo',
+        'America/Tijuana'),
+ 'MY': ('Asia/Kuala_Lumpur', 'Asia/Kuching'),
+ 'MZ': ('Africa/Maputo',),
+ 'NA': ('Africa/Windhoek',),
+ 'NC': ('Pacific/Noumea',),
+ 'NE': ('Africa/Niamey',),
+ 'NF': ('Pacific/Norfolk',),
+ 'NG': ('Africa/Lagos',),
+ 'NI': ('America/Managua',),
+ 'NL': ('Europe/Amsterdam',),
+ 'NO': ('Europe/Oslo',),
+ 'NP': ('Asia/Kathmandu',),
+ 'NR': ('Pacific/Nauru',),
+ 'NU': ('Pacific/Niue',),
+ 'NZ': ('Pacific/Auckland', 'Pacific/Chatham'),
+ 'OM': ('Asia/Muscat',),
+ 'PA': ('America/Panama',),
+ 'PE': ('America/Lima',),
+ 'PF': ('Pacific/Tahiti', 'Pacific/Marquesas', 'Pacific/Gambier'),
+ 'PG': ('Pacific/Port_Moresby', 'Pacific/Bougainville'),
+ 'PH': ('Asia/Manila',),
+ 'PK': ('Asia/Karachi',),
+ 'PL': ('Europe/Warsaw',),
+ 'PM': ('America/Miquelon',),
+ 'PN': ('Pacific/Pitcairn',),
+ 'PR': ('America/Puerto_Rico',),
+ 'PS': ('Asia/Gaza', 'Asia/Hebron'),
+ 'PT': ('Europe/Lisbon', 'Atlantic/Madeira', 'Atlantic/Azores'),
+ 'PW': ('Pacific/Palau',),
+ 'PY': ('America/Asuncion',),
+ 'QA': ('Asia/Qatar',),
+ 'RE': ('Indian/Reunion',),
+ 'RO': ('Europe/Bucharest',),
+ 'RS': ('Europe/Belgrade',),
+ 'RU': ('Europe/Kaliningrad',
+        'Europe/Moscow',
+        'Europe/Kirov',
+        'Europe/Volgograd',
+        'Europe/Astrakhan',
+        'Europe/Saratov',
+        'Europe/Ulyanovsk',
+        'Europe/Samara',
+        'Asia/Yekaterinburg',
+        'Asia/Omsk',
+        'Asia/Novosibirsk',
+        'Asia/Barnaul',
+        'Asia/Tomsk',
+        'Asia/Novokuznetsk',
+        'Asia/Krasnoyarsk',
+        'Asia/Irkutsk',
+        'Asia/Chita',
+        'Asia/Yakutsk',
+        'Asia/Khandyga',
+        'Asia/Vladivostok',
+        'Asia/Ust-Nera',
+        'Asia/Magadan',
+        'Asia/Sakhalin',
+        'Asia/Srednekolymsk',
+        'Asia/Kamchatka',
+        'Asia/Anadyr'),
+ 'RW': ('Africa/Kigali',),
+ 'SA': ('Asia/Riyadh',),
+ 'SB': ('Pacific/Guadalcanal',),
+ 'SC': ('Indian/Mahe',),
+ 'SD': ('Africa/Khartoum',),
+ 'SE': ('Europe/Stockholm',),
+ 'SG': ('Asia/Singapore',),
+ 'SH': ('Atlantic/St_Helena',),
+ 'SI': ('Europe/Ljubljana',),
+ 'SJ': ('Arctic/Longyearbyen',),
+ 'SK': ('Europe/Bratislava',),
+ 'SL': ('Africa/Freetown',),
+ 'SM': ('Europe/San_Marino',),
+ 'SN': ('Africa/Dakar',),
+ 'SO': ('Africa/Mogadishu',),
+ 'SR': ('America/Paramaribo',),
+ 'SS': ('Africa/Juba',),
+ 'ST': ('Africa/Sao_Tome',),
+ 'SV': ('America/El_Salvador',),
+ 'SX': ('America/Lower_Princes',),
+ 'SY': ('Asia/Damascus',),
+ 'SZ': ('Africa/Mbabane',),
+ 'TC': ('America/Grand_Turk',),
+ 'TD': ('Africa/Ndjamena',),
+ 'TF': ('Indian/Kerguelen',),
+ 'TG': ('Africa/Lome',),
+ 'TH': ('Asia/Bangkok',),
+ 'TJ': ('Asia/Dushanbe',),
+ 'TK': ('Pacific/Fakaofo',),
+ 'TL': ('Asia/Dili',),
+ 'TM': ('Asia/Ashgabat',),
+ 'TN': ('Africa/Tunis',),
+ 'TO': ('Pacific/Tongatapu',),
+ 'TR': ('Europe/Istanbul',),
+ 'TT': ('America/Port_of_Spain',),
+ 'TV': ('Pacific/Funafuti',),
+ 'TW': ('Asia/Taipei',),
+ 'TZ': ('Africa/Dar_es_Salaam',),
+ 'UA': ('Europe/Simferopol', 'Europe/Kyiv'),
+ 'UG': ('Africa/Kampala',),
+ 'UM': ('Pacific/Midway', 'Pacific/Wake'),
+ 'US': ('America/New_York',
+        'America/Detroit',
+        'America/Kentucky/Louisville',
+        'America/Kentucky/Monticello',
+        'America/Indiana/Indianapolis',
+        'America/Indiana/Vincennes',
+        'America/Indiana/Winamac',
+        'America/Indiana/Marengo',
+        'America/Indiana/Petersburg',
+        'America/Indiana/Vevay',
+        'America/Chicago',
+        'America/Indiana/Tell_City',
+        'America/Indiana/Knox',
+        'America/Menominee',
+        'America/North_Dakota/Center',
+        'America/North_Dakota/New_Salem',
+        'America/North_Dakota/Beulah',
+        'America/Denver',
+        'America/Boise',
+        'America/Phoenix',
+        'America/Los_Angeles',
+        'America/Anchorage',
+        'America/Juneau',
+        'America/Sitka',
+        'America/Metlakatla',
+        'America/Yakutat',
+        'America/Nome',
+        'America/Adak',
+        'Pacific/Honolulu'),
+ 'UY': ('America/Montevideo',),
+ 'UZ': ('Asia/Samarkand', 'Asia/Tashkent'),
+ 'VA': ('Europe/Vatican',),
+ 'VC': ('America/St_Vincent',),
+ 'VE': ('America/Caracas',),
+ 'VG': ('America/Tortola',),
+ 'VI': ('America/St_Thomas',),
+ 'VN': ('Asia/Ho_Chi_Minh',),
+ 'VU': ('Pacific/Efate',),
+ 'WF': ('Pacific/Wallis',),
+ 'WS': ('Pacific/Apia',),
+ 'YE': ('Asia/Aden',),
+ 'YT': ('Indian/Mayotte',),
+ 'ZA': ('Africa/Johannesburg',),
+ 'ZM': ('Africa/Lusaka',),
+ 'ZW': ('Africa/Harare',)})
+
+COUNTRY_NAMES = MappingProxyType({'AD': 'Andorra',
+ 'AE': 'United Arab Emirates',
+ 'AF': 'Afghanistan',
+ 'AG': 'Antigua & Barbuda',
+ 'AI': 'Anguilla',
+ 'AL': 'Albania',
+ 'AM': 'Armenia',
+ 'AO': 'Angola',
+ 'AQ': 'Antarctica',
+ 'AR': 'Argentina',
+ 'AS': 'Samoa (American)',
+ 'AT': 'Austria',
+ 'AU': 'Australia',
+ 'AW': 'Aruba',
+ 'AX': 'Åland Islands',
+ 'AZ': 'Azerbaijan',
+ 'BA': 'Bosnia & Herzegovina',
+ 'BB': 'Barbados',
+ 'BD': 'Bangladesh',
+ 'BE': 'Belgium',
+ 'BF': 'Burkina Faso',
+ 'BG': 'Bulgaria',
+ 'BH': 'Bahrain',
+ 'BI': 'Burundi',
+ 'BJ': 'Benin',
+ 'BL': 'St Barthelemy',
+ 'BM': 'Bermuda',
+ 'BN': 'Brunei',
+ 'BO': 'Bolivia',
+ 'BQ': 'Caribbean NL',
+ 'BR': 'Brazil',
+ 'BS': 'Bahamas',
+ 'BT': 'Bhutan',
+ 'BV': 'Bouvet Island',
+ 'BW': 'Botswana',
+ 'BY': 'Belarus',
+ 'BZ': 'Belize',
+ 'CA': 'Canada',
+ 'CC': 'Cocos (Keeling) Islands',
+ 'CD': 'Congo (Dem. Rep.)',
+ 'CF': 'Central African Rep.',
+ 'CG': 'Congo (Rep.)',
+ 'CH': 'Switzerland',
+ 'CI': "Côte d'Ivoire",
+ 'CK': 'Cook Islands',
+ 'CL': 'Chile',
+ 'CM': 'Cameroon',
+ 'CN': 'China',
+ 'CO': 'Colombia',
+ 'CR': 'Costa Rica',
+ 'CU': 'Cuba',
+ 'CV': 'Cape Verde',
+ 'CW': 'Curaçao',
+ 'CX': 'Christmas Island',
+ 'CY': 'Cyprus',
+ 'CZ': 'Czech Republic',
+ 'DE': 'Germany',
+ 'DJ': 'Djibouti',
+ 'DK': 'Denmark',
+ 'DM': 'Dominica',
+ 'DO': 'Dominican Republic',
+ 'DZ': 'Algeria',
+ 'EC': 'Ecuador',
+ 'EE': 'Estonia',
+ 'EG': 'Egypt',
+ 'EH': 'Western Sahara',
+ 'ER': 'Eritrea',
+ 'ES': 'Spain',
+ 'ET': 'Ethiopia',
+ 'FI': 'Finland',
+ 'FJ': 'Fiji',
+ 'FK': 'Falkland Islands',
+ 'FM': 'Micronesia',
+ 'FO': 'Faroe Islands',
+ 'FR': 'France',
+ 'GA': 'Gabon',
+ 'GB': 'Britain (UK)',
+ 'GD': 'Grenada',
+ 'GE': 'Georgia',
+ 'GF': 'French Guiana',
+ 'GG': 'Guernsey',
+ 'GH': 'Ghana',
+ 'GI': 'Gibraltar',
+ 'GL': 'Greenland',
+ 'GM': 'Gambia',
+ 'GN': 'Guinea',
+ 'GP': 'Guadeloupe',
+ 'GQ': 'Equatorial Guinea',
+ 'GR': 'Greece',
+ 'GS': 'South Georgia & the South Sandwich Islands',
+ 'GT': 'Guatemala',
+ 'GU': 'Guam',
+ 'GW': 'Guinea-Bissau',
+ 'GY': 'Guyana',
+ 'HK': 'Hong Kong',
+ 'HM': 'Heard Island & McDonald Islands',
+ 'HN': 'Honduras',
+ 'HR': 'Croatia',
+ 'HT': 'Haiti',
+ 'HU': 'Hungary',
+ 'ID': 'Indonesia',
+ 'IE': 'Ireland',
+ 'IL': 'Israel',
+ 'IM': 'Isle of Man',
+ 'IN': 'India',
+ 'IO': 'British Indian Ocean Territory',
+ 'IQ': 'Iraq',
+ 'IR': 'Iran',
+ 'IS': 'Iceland',
+ 'IT': 'Italy',
+ 'JE': 'Jersey',
+ 'JM': 'Jamaica',
+ 'JO': 'Jordan',
+ 'JP': 'Japan',
+ 'KE': 'Kenya',
+ 'KG': 'Kyrgyzstan',
+ 'KH': 'Cambodia',
+ 'KI': 'Kiribati',
+ 'KM': 'Comoros',
+ 'KN': 'St Kitts & Nevis',
+ 'KP': 'Korea (North)',
+ 'KR': 'Korea (South)',
+ 'KW': 'Kuwait',
+ 'KY': 'Cayman Islands',
+ 'KZ': 'Kazakhstan',
+ 'LA': 'Laos',
+ 'LB': 'Lebanon',
+ 'LC': 'St Lucia',
+ 'LI': 'Liechtenstein',
+ 'LK': 'Sri Lanka',
+ 'LR': 'Liberia',
+ 'LS': 'Lesotho',
+ 'LT': 'Lithuania',
+ 'LU': 'Luxembourg',
+ 'LV': 'Latvia',
+ 'LY': 'Libya',
+ 'MA': 'Morocco',
+ 'MC': 'Monaco',
+ 'MD': 'Moldova',
+ 'ME': 'Montenegro',
+ 'MF': 'St Martin (French)',
+ 'MG': 'Madagascar',
+ 'MH': 'Marshall Islands',
+ 'MK': 'North Macedonia',
+ 'ML': 'Mali',
+ 'MM': 'Myanmar (Burma)',
+ 'MN': 'Mongolia',
+ 'MO': 'Macau',
+ 'MP': 'Northern Mariana Islands',
+ 'MQ': 'Martinique',
+ 'MR': 'Mauritania',
+ 'MS': 'Montserrat',
+ 'MT': 'Malta',
+ 'MU': 'Mauritius',
+ 'MV': 'Maldives',
+ 'MW': 'Malawi',
+ 'MX': 'Mexico',
+ 'MY': 'Malaysia',
+ 'MZ': 'Mozambique',
+ 'NA': 'Namibia',
+ 'NC': 'New Caledonia',
+ 'NE': 'Niger',
+ 'NF': 'Norfolk Island',
+ 'NG': 'Nigeria',
+ 'NI': 'Nicaragua',
+ 'NL': 'Netherlands',
+ 'NO': 'Norway',
+ 'NP': 'Nepal',
+ 'NR': 'Nauru',
+ 'NU': 'Niue',
+ 'NZ': 'New Zealand',
+ 'OM': 'Oman',
+ 'PA': 'Panama',
+ 'PE': 'Peru',
+ 'PF': 'French Polynesia',
+ 'PG': 'Papua New Guinea',
+ 'PH': 'Philippines',
+ 'PK': 'Pakistan',
+ 'PL': 'Poland',
+ 'PM': 'St Pierre & Miquelon',
+ 'PN': 'Pitcairn',
+ 'PR': 'Puerto Rico',
+ 'PS': 'Palestine',
+ 'PT': 'Portugal',
+ 'PW': 'Palau',
+ 'PY': 'Paraguay',
+ 'QA': 'Qatar',
+ 'RE': 'Réunion',
+ 'RO': 'Romania',
+ 'RS': 'Serbia',
+ 'RU': 'Russia',
+ 'RW': 'Rwanda',
+ 'SA': 'Saudi Arabia',
+ 'SB': 'Solomon Islands',
+ 'SC': 'Seychelles',
+ 'SD': 'Sudan',
+ 'SE': 'Sweden',
+ 'SG': 'Singapore',
+ 'SH': 'St Helena',
+ 'SI': 'Slovenia',
+ 'SJ': 'Svalbard & Jan Mayen',
+ 'SK': 'Slovakia',
+ 'SL': 'Sierra Leone',
+ 'SM': 'San Marino',
+ 'SN': 'Senegal',
+ 'SO': 'Somalia',
+ 'SR': 'Suriname',
+ 'SS': 'South Sudan',
+ 'ST': 'Sao Tome & Principe',
+ 'SV': 'El Salvador',
+ 'SX': 'St Maarten (Dutch)',
+ 'SY': 'Syria',
+ 'SZ': 'Eswatini (Swaziland)',
+ 'TC': 'Turks & Caicos Is',
+ 'TD': 'Chad',
+ 'TF': 'French S. Terr.',
+ 'TG': 'Togo',
+ 'TH': 'Thailand',
+ 'TJ': 'Tajikistan',
+ 'TK': 'Tokelau',
+ 'TL': 'East Timor',
+ 'TM': 'Turkmenistan',
+ 'TN': 'Tunisia',
+ 'TO': 'Tonga',
+ 'TR': 'Turkey',
+ 'TT': 'Trinidad & Tobago',
+ 'TV': 'Tuvalu',
+ 'TW': 'Taiwan',
+ 'TZ': 'Tanzania',
+ 'UA': 'Ukraine',
+ 'UG': 'Uganda',
+ 'UM': 'US minor outlying islands',
+ 'US': 'United States',
+ 'UY': 'Uruguay',
+ 'UZ': 'Uzbekistan',
+ 'VA': 'Vatican City',
+ 'VC': 'St Vincent',
+ 'VE': 'Venezuela',
+ 'VG': 'Virgin Islands (UK)',
+ 'VI': 'Virgin Islands (US)',
+ 'VN': 'Vietnam',
+ 'VU': 'Vanuatu',
+ 'WF': 'Wallis & Futuna',
+ 'WS': 'Samoa (western)',
+ 'YE': 'Yemen',
+ 'YT': 'Mayotte',
+ 'ZA': 'South Africa',
+ 'ZM': 'Zambia',
+ 'ZW': 'Zimbabwe'})
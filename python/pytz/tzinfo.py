@@ -178,6 +178,7 @@ class DstTzInfo(BaseTzInfo):
 
     _tzinfos = None
     _dst = None  # DST offset
+    _transition_index = None  # Set by _pickle_index
 
     def __init__(self, _inf=None, _tzinfos=None):
         if _inf:
@@ -518,9 +519,30 @@ class DstTzInfo(BaseTzInfo):
                 self.zone, self._tzname, self._utcoffset, dst
             )
 
+    def _pickle_index(self):
+        """Index of the first transition using this instance's offsets
+
+        Used by compact pickles. None if no transition matches, which only
+        happens for instances unpickled from an older zone database.
+        """
+        if self._transition_index is None:
+            inf = (self._utcoffset, self._dst, self._tzname)
+            self._transition_index = -1
+            for i, transition_inf in enumerate(self._transition_info):
+                if transition_inf == inf:
+                    self._transition_index = i
+                    break
+        if self._transition_index < 0:
+            return None
+        return self._transition_index
+
     def __reduce__(self):
         # Special pickle to zone remains a singleton and to cope with
         # database changes.
+        if pytz._compact_pickle:
+            index = self._pickle_index()
+            if index is not None:
+                return pytz._d, (self.zone, index)
         return pytz._p, (
             self.zone,
             _to_seconds(self._utcoffset),
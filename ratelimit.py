@@ -0,0 +1,301 @@
+import asyncio
+import functools
+import random
+import threading
+import time
+
+# Client-side adaptive rate limiting for the AWS clients.
+#
+# Each service has one AdaptiveLimiter shared by every thread and task in the
+# container. It is a token bucket whose rate follows AIMD: each success adds
+# a little (about `increase` calls/s per second at full speed), and a
+# throttling response (S3 503 SlowDown, CloudWatch/SNS Throttling, ...)
+# multiplies it by `decrease`, at most once per `cooldown` so a burst of
+# in-flight throttles only counts once. Throttled calls are retried with
+# full-jitter exponential backoff, up to max_attempts. Transient failures
+# (5xx responses, timeouts and connection errors, which botocore's standard
+# mode would retry) are retried the same way, up to transient_attempts,
+# without touching the rate; every attempt of a call counts toward both
+# limits. Other errors (404s included) go straight to the caller. The
+# clients are built with botocore retries off, so this is the only retry
+# layer.
+#
+# Limits start at the documented service rates, so the limiter costs
+# nothing until the service pushes back, then settles just under the
+# throttling point instead of retrying in a storm. snapshot() returns the
+# current rate and the retry/throttle counts for publishing as metrics.
+
+THROTTLE_CODES = frozenset([
+    'SlowDown', 'Throttling', 'ThrottlingException', 'ThrottledException', 'RequestThrottled',
+    'RequestLimitExceeded', 'TooManyRequestsException', 'ProvisionedThroughputExceededException',
+    'RequestThrottledException', 'ServiceUnavailable', '503', 'Throttled',
+])
+
+# Error codes of transient failures worth retrying, besides any 5xx status.
+TRANSIENT_CODES = frozenset([
+    'InternalError', 'InternalFailure', 'InternalServerError', 'ServiceFailure', 'RequestTimeout',
+    'RequestTimeoutException', 'PriorRequestNotComplete', 'BadGateway', 'GatewayTimeout',
+])
+
+# Exceptions raised before a response arrives (botocore's ConnectionError
+# and HTTPClientError families, and the builtins behind them), matched by
+# class name so botocore does not have to be imported.
+TRANSIENT_EXCEPTIONS = frozenset([
+    'ConnectionError', 'HTTPClientError', 'EndpointConnectionError', 'ConnectionClosedError',
+    'ReadTimeoutError', 'ConnectTimeoutError', 'ProxyConnectionError', 'TimeoutError',
+])
+
+# Calls per second each limiter starts at and never exceeds.
+SERVICE_RATES = {
+    's3': 3500.0,          # per-prefix PUT limit; HEAD/GET allow 5500
+    'cloudwatch': 500.0,   # PutMetricData TPS
+    'sns': 300.0,
+    'sqs': 3000.0,
+}
+DEFAULT_RATE = 100.0
+
+# Bucket capacity in seconds of calls at the current rate. Small, so a cut
+# takes effect at once and a restart does not open with a burst.
+BURST_SECONDS = 0.1
+
+
+def is_throttle(error):
+    # True for a botocore-style ClientError that is a throttling response.
+    response = getattr(error, 'response', None)
+    if not isinstance(response, dict):
+        return False
+    code = response.get('Error', {}).get('Code')
+    status = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    return code in THROTTLE_CODES or status in (429, 503)
+
+
+def is_transient(error):
+    # True for a failure that is not a throttle but may succeed when retried:
+    # a 5xx or transient error code, a timeout or a connection error.
+    if any(cls.__name__ in TRANSIENT_EXCEPTIONS for cls in type(error).__mro__):
+        return True
+    response = getattr(error, 'response', None)
+    if not isinstance(response, dict):
+        return False
+    code = response.get('Error', {}).get('Code')
+    status = response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+    return code in TRANSIENT_CODES or (isinstance(status, int) and status >= 500)
+
+
+class TokenBucket(object):
+    # Token bucket: up to capacity calls at once, refilled at rate per second.
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate, capacity=None):
+        # Change the refill rate (and capacity), keeping tokens earned so far.
+        with self._lock:
+            self._refill()
+            self.rate = float(rate)
+            if capacity is not None:
+                self.capacity = float(capacity)
+                self._tokens = min(self._tokens, self.capacity)
+
+    def try_acquire(self, tokens=1):
+        # Take tokens if available now; never waits.
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens=1):
+        # Take tokens, sleeping until the bucket has refilled enough.
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            self._sleep(wait)
+
+
+
+class AdaptiveLimiter(object):
+    # Token bucket with an AIMD-adjusted rate.
+
+    def __init__(self, max_rate, min_rate=1.0, increase=None, decrease=0.7, cooldown=0.5,
+                 max_attempts=8, transient_attempts=3, backoff_base=0.05, backoff_cap=5.0,
+                 clock=time.monotonic):
+        self.max_rate = float(max_rate)
+        self.min_rate = float(min_rate)
+        self.increase = float(increase if increase is not None else max_rate * 0.05)
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.max_attempts = max_attempts
+        self.transient_attempts = transient_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._clock = clock
+        self._bucket = TokenBucket(self.max_rate, max(1.0, self.max_rate * BURST_SECONDS), clock=clock)
+        self._lock = threading.Lock()
+        self._last_decrease = None
+        self._counts = {'calls': 0, 'retries': 0, 'throttles': 0, 'failures': 0}
+
+    @property
+    def rate(self):
+        return self._bucket.rate
+
+    def on_success(self):
+        with self._lock:
+            self._counts['calls'] += 1
+            rate = self._bucket.rate
+            if rate < self.max_rate:
+                rate = min(self.max_rate, rate + self.increase / rate)
+                self._bucket.set_rate(rate, max(1.0, rate * BURST_SECONDS))
+
+    def on_throttle(self):
+        with self._lock:
+            self._counts['throttles'] += 1
+            now = self._clock()
+            if self._last_decrease is None or now - self._last_decrease >= self.cooldown:
+                self._last_decrease = now
+                rate = max(self.min_rate, self._bucket.rate * self.decrease)
+                self._bucket.set_rate(rate, max(1.0, rate * BURST_SECONDS))
+
+    def backoff(self, attempt):
+        # Full-jitter exponential backoff before retry number `attempt` (1-based).
+        with self._lock:
+            self._counts['retries'] += 1
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def on_failure(self):
+        with self._lock:
+            self._counts['failures'] += 1
+
+    def acquire(self):
+        self._bucket.acquire()
+
+    async def acquire_async(self):
+        while not self._bucket.try_acquire():
+            await asyncio.sleep(1.0 / self._bucket.rate)
+
+    def on_error(self, error, attempt):
+        # Account for failed attempt number `attempt` (1-based). Returns the
+        # backoff before retrying, or None when the error is to be raised.
+        if is_throttle(error):
+            self.on_throttle()
+            limit = self.max_attempts
+        elif is_transient(error):
+            limit = self.transient_attempts
+        else:
+            # The request was served; only throttles slow us down.
+            self.on_success()
+            return None
+        if attempt >= limit:
+            self.on_failure()
+            return None
+        return self.backoff(attempt)
+
+    def call(self, fn, *args, **kwargs):
+        # Call fn under the limiter, retrying throttles and transient failures.
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                delay = self.on_error(e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                continue
+            self.on_success()
+            return result
+
+    async def call_async(self, fn, *args, **kwargs):
+        attempt = 0
+        while True:
+            await self.acquire_async()
+            try:
+                result = await fn(*args, **kwargs)
+            except Exception as e:
+                attempt += 1
+                delay = self.on_error(e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            self.on_success()
+            return result
+
+    def snapshot(self, reset=False):
+        # Current rate plus counts since the last reset.
+        with self._lock:
+            counts = dict(self._counts, rate=round(self._bucket.rate, 3))
+            if reset:
+                for key in self._counts:
+                    self._counts[key] = 0
+        return counts
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(service):
+    # The container-wide limiter for a service.
+    with _limiters_lock:
+        if service not in _limiters:
+            _limiters[service] = AdaptiveLimiter(SERVICE_RATES.get(service, DEFAULT_RATE))
+        return _limiters[service]
+
+
+def snapshots(reset=False):
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {service: limiter.snapshot(reset) for service, limiter in limiters.items()}
+
+
+class LimitedClient(object):
+    # Proxy running every API method of a client through a limiter.
+
+    def __init__(self, client, limiter):
+        self._client = client
+        self._limiter = limiter
+
+    def __getattr__(self, attr):
+        value = getattr(self._client, attr)
+        if attr.startswith('_') or attr in ('exceptions', 'meta') or not callable(value):
+            return value
+        return functools.partial(self._limiter.call, value)
+
+
+class AsyncLimitedClient(object):
+    # LimitedClient for async clients (aiobotocore), as an async context manager.
+
+    def __init__(self, client, limiter):
+        self._client = client
+        self._limiter = limiter
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, attr):
+        value = getattr(self._client, attr)
+        if attr.startswith('_') or attr in ('exceptions', 'meta') or not callable(value):
+            return value
+        return functools.partial(self._limiter.call_async, value)
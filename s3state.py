@@ -0,0 +1,54 @@
+import json
+from collections import OrderedDict
+
+# State kept between invocations of the SLO checker.
+#
+# Sent alerts, the arrival index, lateness distributions, compliance rollups
+# and arrival models are each one small JSON object in the config bucket,
+# read at the start of a flush and written at its end. There is no locking:
+# concurrent writers can overwrite each other and the last write wins, so
+# each state says what a lost write costs. What is written is queued during
+# the invocation by a QueuedRecorder, keyed so that repeats collapse to one.
+
+
+class S3JsonState(object):
+    # One JSON object in S3. Subclasses turn it into their state in load()
+    # and back in save().
+
+    def __init__(self, s3, bucket, key):
+        self.s3 = s3
+        self.bucket = bucket
+        self.key = key
+
+    def read(self):
+        # The decoded object, or None when it does not exist yet.
+        try:
+            response = self.s3.get_object(Bucket=self.bucket, Key=self.key)
+        except self.s3.exceptions.ClientError as e:
+            if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+                return None
+            raise
+        return json.loads(response['Body'].read().decode('utf-8'))
+
+    def write(self, data):
+        self.s3.put_object(Bucket=self.bucket, Key=self.key,
+                           Body=json.dumps(data, sort_keys=True).encode('utf-8'))
+
+
+class QueuedRecorder(object):
+    # Items queued during one invocation, in order, by key; subclasses add
+    # them and _take() them in flush().
+
+    def __init__(self):
+        self._pending = OrderedDict()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def clear(self):
+        self._pending.clear()
+
+    def _take(self):
+        # The queued items, leaving the queue empty.
+        pending, self._pending = self._pending, OrderedDict()
+        return pending
@@ -0,0 +1,42 @@
+import os
+import sys
+
+# Tests run from a checkout: the root modules and the vendored pytz in
+# python/ are imported from the tree, the AWS fakes from tests/.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, 'tests'), os.path.join(ROOT, 'python'), ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import pytest  # noqa: E402
+
+import fakeaws  # noqa: E402
+import fanout  # noqa: E402
+import lambda_function  # noqa: E402
+from synthetic import frozen_local_time  # noqa: E402
+
+RECORDERS = ('_alerts', '_lateness', '_compliance', '_predictor')
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    # Fresh fake AWS clients behind lambda_function's lazy clients, with the
+    # clock frozen at synthetic.NOW and the checker's per-container caches
+    # and queued alerts and recordings empty. Everything is put back when
+    # the test ends. fanout imports get_local_time by name, so it is frozen
+    # there too.
+    clients = fakeaws.FakeClients()
+    for name, module in clients.modules().items():
+        monkeypatch.setitem(sys.modules, name, module)
+    for lazy in (lambda_function.s3, lambda_function.sns, lambda_function.cloudwatch):
+        monkeypatch.setattr(lazy, '_client', None)
+    monkeypatch.setattr(lambda_function, 'get_local_time', frozen_local_time)
+    monkeypatch.setattr(fanout, 'get_local_time', frozen_local_time)
+    monkeypatch.setattr(lambda_function, '_event_configs', {})
+    monkeypatch.setattr(lambda_function, '_schedules', {})
+    monkeypatch.setattr(fanout, '_worker_configs', {})
+    for name in RECORDERS:
+        getattr(lambda_function, name).clear()
+    yield clients
+    for name in RECORDERS:
+        getattr(lambda_function, name).clear()
@@ -0,0 +1,51 @@
+"""Regenerate pandas_business_days.json, the business-day fixtures.
+
+    PYTHONPATH=python python tests/data/generate_pandas_business_days.py
+
+Needs pandas; the tests only read the JSON it writes. For the CA calendar
+of holidayrules over 2020-2030 (plus 2031 for spill-over), records with
+pandas.tseries.offsets.CustomBusinessDay:
+
+    nth   the nth business day of every month, for a few n, as
+          rollforward(first of month) + (n - 1) * CustomBusinessDay
+    old   first of month + 8 * CustomBusinessDay, the expression the
+          pandas/workalendar businessday.py used for the 9th business day
+"""
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(os.path.dirname(HERE))
+sys.path.insert(0, ROOT)
+
+import pandas as pd  # noqa: E402
+from pandas.tseries.offsets import CustomBusinessDay  # noqa: E402
+
+from businessday import month_starts  # noqa: E402
+from holidayrules import holidays_between  # noqa: E402
+
+START_YEAR, END_YEAR = 2020, 2030
+NS = (1, 5, 9, 20)
+
+
+def main():
+    holidays = sorted(holidays_between('CA', START_YEAR, END_YEAR + 1))
+    bday = CustomBusinessDay(holidays=holidays)
+    starts = [pd.Timestamp(first_day) for first_day in month_starts(START_YEAR, END_YEAR)]
+    fixture = {
+        'pandas': pd.__version__,
+        'years': [START_YEAR, END_YEAR],
+        'holidays': [day.isoformat() for day in holidays],
+        'nth': {str(n): {first.date().isoformat(): (bday.rollforward(first) + (n - 1) * bday).date().isoformat()
+                         for first in starts}
+                for n in NS},
+        'old': {first.date().isoformat(): (first + 8 * bday).date().isoformat() for first in starts},
+    }
+    with open(os.path.join(HERE, 'pandas_business_days.json'), 'w') as f:
+        json.dump(fixture, f, indent=1, sort_keys=True)
+        f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+"""In-process stand-ins for the S3, CloudWatch and SNS clients the checker uses.
+
+Each fake counts its calls and can sleep for a fixed per-call latency, so a
+benchmark sees the same call pattern and roughly the same waits as the real
+service, without credentials or network:
+
+    clients = fakeaws.FakeClients(latency={'head_object': 0.005})
+    clients.install()          # boto3.client() now returns the fakes
+    import lambda_function
+
+install() replaces the boto3 module in sys.modules, so it must run before
+lambda_function builds its first client; tests set the entries from
+modules() with monkeypatch instead (see conftest.py). session_latency and
+client_latency model what a real boto3 pays to build its first session
+(loading the service models) and each client, for cold-start benchmarks.
+set_throughput() makes a service answer calls over a rate with the
+throttling error the real one sends (S3 503 SlowDown, Throttling
+elsewhere), for rate limiter benchmarks.
+"""
+import asyncio
+import bisect
+import hashlib
+import io
+import json
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from datetime import datetime, timezone
+
+
+def _etag(body):
+    # S3's ETag for a single-part upload: the quoted MD5 of the body.
+    return '"' + hashlib.md5(body).hexdigest() + '"'
+
+
+class ClientError(Exception):
+    # Shaped like botocore.exceptions.ClientError: callers read e.response.
+    def __init__(self, code, operation_name, status=None):
+        super().__init__(f"An error occurred ({code}) when calling the {operation_name} operation")
+        self.response = {'Error': {'Code': code, 'Message': code}}
+        if status is not None:
+            self.response['ResponseMetadata'] = {'HTTPStatusCode': status}
+        self.operation_name = operation_name
+
+
+class _Exceptions(object):
+    ClientError = ClientError
+
+
+class _Throughput(object):
+    # Server-side request rate limit: a token bucket holding a tenth of a
+    # second of calls, so bursts over the rate are throttled quickly.
+
+    def __init__(self, rate):
+        self.rate = float(rate)
+        self.capacity = max(1.0, self.rate / 10)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def admit(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class FakeClient(object):
+    # Base class: per-operation latency, call counting and throttling.
+    exceptions = _Exceptions
+    throttle_code = 'Throttling'
+    throttle_status = 400
+
+    def __init__(self, service, calls, latency):
+        self._service = service
+        self._calls = calls
+        self._latency = latency
+        self._throughput = None
+        self._lock = threading.Lock()
+
+    def _call(self, operation):
+        with self._lock:
+            self._calls[f'{self._service}.{operation}'] += 1
+        if isinstance(self._latency, dict):
+            delay = self._latency.get(operation, self._latency.get('default', 0))
+        else:
+            delay = self._latency
+        if delay:
+            time.sleep(delay)
+        self._admit(operation)
+
+    def _admit(self, operation):
+        if self._throughput is not None and not self._throughput.admit():
+            with self._lock:
+                self._calls[f'{self._service}.throttled'] += 1
+            raise ClientError(self.throttle_code, operation, self.throttle_status)
+
+
+class FakeS3(FakeClient):
+    # Objects live in a dict: key -> {'Body', 'LastModified', 'Tags'}, per bucket.
+    throttle_code = 'SlowDown'
+    throttle_status = 503
+
+    def __init__(self, calls, latency=0):
+        super().__init__('s3', calls, latency)
+        self.buckets = {}
+        self._sorted = {}
+
+    def add_object(self, bucket, key, body=b'', last_modified=None):
+        # Seed an object without counting an API call.
+        if last_modified is None:
+            last_modified = datetime.now(timezone.utc)
+        self.buckets.setdefault(bucket, {})[key] = {
+            'Body': body, 'LastModified': last_modified, 'Tags': []}
+
+    def add_json(self, bucket, key, data):
+        self.add_object(bucket, key, json.dumps(data).encode('utf-8'))
+
+    def _get(self, bucket, key, operation):
+        try:
+            return self.buckets[bucket][key]
+        except KeyError:
+            raise ClientError('404' if operation == 'HeadObject' else 'NoSuchKey', operation)
+
+    def _sorted_keys(self, bucket):
+        # Between deletes (which drop the cache) objects are only added, so
+        # the key count tells if the cache is stale.
+        objects = self.buckets.get(bucket, {})
+        cached = self._sorted.get(bucket)
+        if cached is None or len(cached) != len(objects):
+            cached = self._sorted[bucket] = sorted(objects)
+        return cached
+
+    def get_object(self, Bucket, Key):
+        self._call('get_object')
+        obj = self._get(Bucket, Key, 'GetObject')
+        return {'Body': io.BytesIO(obj['Body']), 'LastModified': obj['LastModified'],
+                'ContentLength': len(obj['Body']), 'ETag': _etag(obj['Body'])}
+
+    def head_object(self, Bucket, Key):
+        self._call('head_object')
+        obj = self._get(Bucket, Key, 'HeadObject')
+        return {'LastModified': obj['LastModified'], 'ContentLength': len(obj['Body']),
+                'ETag': _etag(obj['Body'])}
+
+    def put_object(self, Bucket, Key, Body=b'', IfNoneMatch=None):
+        self._call('put_object')
+        if IfNoneMatch == '*' and Key in self.buckets.get(Bucket, {}):
+            raise ClientError('PreconditionFailed', 'PutObject')
+        if isinstance(Body, str):
+            Body = Body.encode('utf-8')
+        self.add_object(Bucket, Key, Body)
+        return {}
+
+    def delete_object(self, Bucket, Key):
+        self._call('delete_object')
+        self.buckets.get(Bucket, {}).pop(Key, None)
+        self._sorted.pop(Bucket, None)
+        return {}
+
+    def put_object_tagging(self, Bucket, Key, Tagging):
+        self._call('put_object_tagging')
+        self._get(Bucket, Key, 'PutObjectTagging')['Tags'] = list(Tagging['TagSet'])
+        return {}
+
+    def get_object_tagging(self, Bucket, Key):
+        self._call('get_object_tagging')
+        return {'TagSet': list(self._get(Bucket, Key, 'GetObjectTagging')['Tags'])}
+
+    def list_objects_v2(self, Bucket, Prefix='', StartAfter='', ContinuationToken=None, MaxKeys=1000):
+        # Keys in UTF-8 binary order, like S3; ContinuationToken is the last key returned.
+        self._call('list_objects_v2')
+        after = max(ContinuationToken or StartAfter, Prefix)
+        objects = self.buckets.get(Bucket, {})
+        keys = self._sorted_keys(Bucket)
+        start = bisect.bisect_right(keys, after)
+        page = []
+        for key in keys[start:start + MaxKeys + 1]:
+            if not key.startswith(Prefix):
+                break
+            page.append(key)
+        truncated = len(page) > MaxKeys
+        page = page[:MaxKeys]
+        response = {
+            'KeyCount': len(page),
+            'IsTruncated': truncated,
+            'Contents': [{'Key': key, 'LastModified': objects[key]['LastModified'],
+                          'Size': len(objects[key]['Body'])} for key in page],
+        }
+        if not page:
+            del response['Contents']
+        if response['IsTruncated']:
+            response['NextContinuationToken'] = page[-1]
+        return response
+
+
+class AsyncFakeS3(object):
+    # Async view of a FakeS3 for the asyncio engine, like an aiobotocore
+    # client: an async context manager whose API methods are coroutines. It
+    # shares the objects and call counts, and waits its latency with
+    # asyncio.sleep so concurrent calls overlap.
+
+    def __init__(self, s3):
+        self.exceptions = s3.exceptions
+        self._latency = s3._latency
+        self._inner = FakeS3(s3._calls)
+        self._inner.buckets = s3.buckets
+        self._inner._throughput = s3._throughput
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, operation):
+        method = getattr(self._inner, operation)
+        if isinstance(self._latency, dict):
+            delay = self._latency.get(operation, self._latency.get('default', 0))
+        else:
+            delay = self._latency
+
+        async def call(**kwargs):
+            if delay:
+                await asyncio.sleep(delay)
+            return method(**kwargs)
+        return call
+
+
+class FakeCloudWatch(FakeClient):
+
+    def __init__(self, calls, latency=0):
+        super().__init__('cloudwatch', calls, latency)
+        self.metrics = []
+
+    def put_metric_data(self, Namespace, MetricData):
+        self._call('put_metric_data')
+        if len(MetricData) > 1000:
+            raise ClientError('InvalidParameterValue', 'PutMetricData')
+        self.metrics.extend((Namespace, datum) for datum in MetricData)
+        return {}
+
+
+class FakeSNS(FakeClient):
+
+    def __init__(self, calls, latency=0):
+        super().__init__('sns', calls, latency)
+        self.messages = []
+
+    def publish(self, TopicArn, Message, Subject=None, **kwargs):
+        self._call('publish')
+        self.messages.append((TopicArn, Subject, Message))
+        return {'MessageId': str(len(self.messages))}
+
+    def publish_batch(self, TopicArn, PublishBatchRequestEntries):
+        self._call('publish_batch')
+        if len(PublishBatchRequestEntries) > 10:
+            raise ClientError('TooManyEntriesInBatchRequest', 'PublishBatch')
+        if sum(len(entry['Message'].encode('utf-8')) for entry in PublishBatchRequestEntries) > 256 * 1024:
+            raise ClientError('BatchRequestTooLong', 'PublishBatch')
+        successful = []
+        for entry in PublishBatchRequestEntries:
+            self.messages.append((TopicArn, entry.get('Subject'), entry['Message']))
+            successful.append({'Id': entry['Id'], 'MessageId': str(len(self.messages))})
+        return {'Successful': successful, 'Failed': []}
+
+
+class _Config(object):
+    # Accepts botocore.config.Config arguments when botocore is not installed.
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeClients(object):
+    # One fake per service, sharing a call counter.
+
+    def __init__(self, latency=0, session_latency=0, client_latency=0):
+        self.calls = Counter()
+        self.session_latency = session_latency
+        self.client_latency = client_latency
+        self.clients_created = 0
+        self.s3 = FakeS3(self.calls, latency)
+        self.cloudwatch = FakeCloudWatch(self.calls, latency)
+        self.sns = FakeSNS(self.calls, latency)
+
+    def client(self, service_name, *args, **kwargs):
+        if self.clients_created == 0 and self.session_latency:
+            time.sleep(self.session_latency)
+        if self.client_latency:
+            time.sleep(self.client_latency)
+        self.clients_created += 1
+        return getattr(self, service_name)
+
+    def async_s3(self):
+        # Factory for async_checker.S3_CLIENT_FACTORY.
+        return AsyncFakeS3(self.s3)
+
+    def modules(self):
+        # The sys.modules entries that make `import boto3; boto3.client(...)`
+        # hand out these fakes, for install() or a test's monkeypatch.
+        module = types.ModuleType('boto3')
+        module.client = self.client
+        modules = {'boto3': module}
+        # lambda_function passes a botocore Config to boto3.client().
+        if 'botocore.config' not in sys.modules:
+            config = types.ModuleType('botocore.config')
+            config.Config = _Config
+            botocore = types.ModuleType('botocore')
+            botocore.config = config
+            modules.update({'botocore': botocore, 'botocore.config': config})
+        return modules
+
+    def install(self):
+        # Make `import boto3; boto3.client(...)` hand out these fakes.
+        sys.modules.update(self.modules())
+        return self
+
+    def set_latency(self, latency):
+        # Per-call latency in seconds: a number, or {operation: seconds} with
+        # an optional 'default'.
+        for fake in (self.s3, self.cloudwatch, self.sns):
+            fake._latency = latency
+
+    def set_throughput(self, rates):
+        # Calls per second each service accepts before throttling, as
+        # {service: rate}; None or a missing service means unlimited.
+        rates = rates or {}
+        for fake in (self.s3, self.cloudwatch, self.sns):
+            rate = rates.get(fake._service)
+            fake._throughput = _Throughput(rate) if rate else None
+
+    def reset(self):
+        # Drop all objects, metrics, messages and call counts.
+        self.calls.clear()
+        self.s3.buckets.clear()
+        self.s3._sorted.clear()
+        del self.cloudwatch.metrics[:]
+        del self.sns.messages[:]
+
+    def reset_counts(self):
+        self.calls.clear()
@@ -0,0 +1,99 @@
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytz
+
+import lambda_function
+
+# The synthetic bucket the checker tests and benchmarks run against: a
+# mapping of monthly and daily feeds, with about 70% of the files on time,
+# 20% late and 10% missing at NOW.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUCKET = 'myaatest01'
+ZONE = 'America/Toronto'
+# A Thursday after every synthetic monthly deadline and daily cut-off.
+NOW = pytz.timezone(ZONE).localize(datetime(2025, 3, 20, 15, 0))
+
+EVENT = {
+    'bucket_name': BUCKET,
+    'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+    'holidays_file_key': 'config/holidays.json',
+    'slo_mapping_file_key': 'config/file_slo_mapping.json',
+    'useCanadianHolidays': True,
+    'timezone': ZONE,
+}
+
+
+def frozen_local_time(zone=ZONE):
+    return NOW.astimezone(pytz.timezone(zone))
+
+
+def synthetic_mapping(count):
+    mapping = {}
+    for i in range(count):
+        if i % 3 == 0:
+            mapping[f"FEED_{i:05d}.*.dat.pgp"] = {
+                'slo_days': 1 + i % 10, 'slo_time': f"{8 + i % 10:02d}:00"}
+        else:
+            mapping[f"FEED_{i:05d}_*.xlsx"] = {
+                'slo_days': 0, 'slo_time': f"{8 + i % 4:02d}:{(i % 2) * 30:02d}"}
+    return mapping
+
+
+def seed_bucket(s3, count, seed=11):
+    # Write config and archive objects to a fake S3; return the S3 event
+    # records for arrivals.
+    rng = random.Random(seed)
+    mapping = synthetic_mapping(count)
+    with open(os.path.join(ROOT, 'holidays.json')) as f:
+        s3.add_json(BUCKET, 'config/holidays.json', json.load(f))
+    s3.add_json(BUCKET, 'config/file_slo_mapping.json', mapping)
+
+    parsed = lambda_function.parse_slo_mapping(json.loads(json.dumps(mapping)))
+    holidays = lambda_function.get_holidays({}, 'CA', [NOW.year, NOW.year + 1])
+    records = []
+    for pattern, slo in parsed.items():
+        if "dat.pgp" in pattern:
+            period = NOW.strftime('%Y%m')
+            day = lambda_function.get_nth_business_day(NOW.year, NOW.month, slo['slo_days'], holidays)
+        else:
+            period = NOW.strftime('%Y%m%d')
+            day = NOW.date()
+        deadline = lambda_function.get_expected_arrival_time(day, slo['slo_time'], ZONE)
+        roll = rng.random()
+        if roll < 0.1:
+            continue
+        offset = timedelta(minutes=rng.randint(1, 240))
+        arrived = deadline + offset if roll < 0.3 else deadline - offset
+        key = 'archive/' + pattern.replace('*', period)
+        s3.add_object(BUCKET, key, b'x', arrived)
+        records.append({
+            'eventSource': 'aws:s3',
+            'eventName': 'ObjectCreated:Put',
+            'eventTime': arrived.strftime('%Y-%m-%dT%H:%M:%S.') + f"{arrived.microsecond // 1000:03d}Z",
+            's3': {'bucket': {'name': BUCKET}, 'object': {'key': key}},
+        })
+    return records
+
+
+def metric_totals(cloudwatch):
+    # Published metric values summed as {"Name/reason": total}, for
+    # comparing two runs' output.
+    totals = {}
+    for _, datum in cloudwatch.metrics:
+        if datum['MetricName'].startswith('Client'):
+            continue  # rate limiter metrics, published per invocation
+        if 'Values' in datum:
+            # Lateness distributions: compare the counts per value.
+            for value, count in zip(datum['Values'], datum['Counts']):
+                key = f"{datum['MetricName']}/{value}"
+                totals[key] = totals.get(key, 0) + count
+            continue
+        reason = datum.get('Dimensions', [{}])[0].get('Value')
+        key = f"{datum['MetricName']}/{reason}"
+        totals[key] = totals.get(key, 0) + datum['Value']
+    return totals
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import fakeaws
+from alerts import AlertDispatcher, S3AlertState
+
+TOPIC = 'arn:aws:sns:us-east-1:000000000000:file-slo'
+OTHER_TOPIC = 'arn:aws:sns:us-east-1:000000000000:file-slo-other'
+BUCKET = 'state-bucket'
+NOW = datetime(2025, 3, 20, 19, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clients():
+    return fakeaws.FakeClients()
+
+
+def dispatcher(clients, **kwargs):
+    # A fresh dispatcher per run, as in a new Lambda container; no pacing.
+    return AlertDispatcher(clients.sns, rate=1e6, burst=100, **kwargs)
+
+
+def state(clients):
+    return S3AlertState(clients.s3, BUCKET, 'state/sent_alerts.json')
+
+
+def stored(clients):
+    return json.loads(clients.s3.buckets[BUCKET]['state/sent_alerts.json']['Body'])
+
+
+def queue(alerts, count, topic=TOPIC, prefix='FILE'):
+    for i in range(count):
+        alerts.add(topic, f"{prefix}_{i:03d} is missing.", f"{prefix}_{i:03d}:missing")
+
+
+def test_sent_alerts_are_suppressed_in_later_runs(clients):
+    first = dispatcher(clients)
+    queue(first, 2)
+    assert first.flush(state(clients), NOW) == {'sent': 2, 'suppressed': 0, 'failed': 0, 'publish_calls': 1}
+    assert sorted(stored(clients)) == ['FILE_000:missing', 'FILE_001:missing']
+
+    second = dispatcher(clients)
+    queue(second, 3)
+    result = second.flush(state(clients), NOW + timedelta(minutes=5))
+    assert result == {'sent': 1, 'suppressed': 2, 'failed': 0, 'publish_calls': 1}
+    assert clients.sns.messages[-1][2] == 'FILE_002 is missing.'
+
+    # A run that only suppresses leaves the state alone.
+    clients.reset_counts()
+    third = dispatcher(clients)
+    queue(third, 3)
+    assert third.flush(state(clients), NOW + timedelta(minutes=10))['suppressed'] == 3
+    assert clients.calls == {'s3.get_object': 1}
+
+
+def test_realert_and_retention(clients):
+    first = dispatcher(clients)
+    queue(first, 1)
+    first.flush(state(clients), NOW)
+
+    realert = dispatcher(clients, realert_after=timedelta(hours=1))
+    queue(realert, 1)
+    assert realert.flush(state(clients), NOW + timedelta(minutes=30))['suppressed'] == 1
+    queue(realert, 1)
+    assert realert.flush(state(clients), NOW + timedelta(hours=2))['sent'] == 1
+    assert stored(clients) == {'FILE_000:missing': (NOW + timedelta(hours=2)).isoformat()}
+
+    # Keys sent longer ago than the retention are dropped from the state.
+    later = dispatcher(clients, retention=timedelta(days=1))
+    queue(later, 1, prefix='OTHER')
+    later.flush(state(clients), NOW + timedelta(days=2))
+    assert sorted(stored(clients)) == ['OTHER_000:missing']
+
+
+def test_alerts_are_grouped_into_one_digest_per_topic(clients):
+    alerts = dispatcher(clients)
+    queue(alerts, 3)
+    queue(alerts, 2, topic=OTHER_TOPIC, prefix='OTHER')
+    alerts.add(TOPIC, 'FILE_000 is missing again.', 'FILE_000:missing')  # collapses
+    assert len(alerts) == 5
+    result = alerts.flush(state(clients), NOW)
+    assert result == {'sent': 5, 'suppressed': 0, 'failed': 0, 'publish_calls': 2}
+    assert clients.sns.messages == [
+        (TOPIC, 'File Arrival Alert: 3 files',
+         'FILE_000 is missing.\nFILE_001 is missing.\nFILE_002 is missing.'),
+        (OTHER_TOPIC, 'File Arrival Alert: 2 files', 'OTHER_000 is missing.\nOTHER_001 is missing.'),
+    ]
+    assert len(alerts) == 0
+
+
+def test_large_digests_are_split(clients):
+    # Each line is 21 bytes with its newline, so two fit in 50 bytes.
+    alerts = dispatcher(clients, max_message_bytes=50)
+    queue(alerts, 5)
+    alerts.flush(None, NOW)
+    assert [subject for _, subject, _ in clients.sns.messages] == [
+        'File Arrival Alert: 2 files', 'File Arrival Alert: 2 files', 'File Arrival Alert: 1 file']
+    assert '\n'.join(message for _, _, message in clients.sns.messages).count('is missing') == 5
+
+
+def test_publish_batch_sends_at_most_ten_entries(clients, monkeypatch):
+    sizes = []
+    publish_batch = clients.sns.publish_batch
+
+    def recording(TopicArn, PublishBatchRequestEntries):
+        sizes.append(len(PublishBatchRequestEntries))
+        return publish_batch(TopicArn=TopicArn, PublishBatchRequestEntries=PublishBatchRequestEntries)
+    monkeypatch.setattr(clients.sns, 'publish_batch', recording)
+
+    alerts = dispatcher(clients, max_message_bytes=1)  # one alert per digest
+    queue(alerts, 25)
+    result = alerts.flush(state(clients), NOW)
+    assert sizes == [10, 10, 5]
+    assert result == {'sent': 25, 'suppressed': 0, 'failed': 0, 'publish_calls': 3}
+    assert len(stored(clients)) == 25
+
+
+def test_failed_entries_are_sent_again_next_run(clients, monkeypatch):
+    publish_batch = clients.sns.publish_batch
+
+    def rejecting(TopicArn, PublishBatchRequestEntries):
+        # SNS rejects the second digest of each batch.
+        accepted = [entry for entry in PublishBatchRequestEntries if entry['Id'] != '1']
+        response = publish_batch(TopicArn=TopicArn, PublishBatchRequestEntries=accepted)
+        response['Failed'] = [{'Id': '1', 'Code': 'InternalError', 'SenderFault': False,
+                               'Message': 'Internal error'}]
+        return response
+    monkeypatch.setattr(clients.sns, 'publish_batch', rejecting)
+
+    alerts = dispatcher(clients, max_message_bytes=50)
+    queue(alerts, 5)
+    result = alerts.flush(state(clients), NOW)
+    assert result == {'sent': 3, 'suppressed': 0, 'failed': 2, 'publish_calls': 1}
+    assert sorted(stored(clients)) == ['FILE_000:missing', 'FILE_001:missing', 'FILE_004:missing']
+
+    monkeypatch.setattr(clients.sns, 'publish_batch', publish_batch)
+    retry = dispatcher(clients, max_message_bytes=50)
+    queue(retry, 5)
+    assert retry.flush(state(clients), NOW) == {'sent': 2, 'suppressed': 3, 'failed': 0, 'publish_calls': 1}
+    assert clients.sns.messages[-1][2] == 'FILE_002 is missing.\nFILE_003 is missing.'
+
+
+def test_publish_errors_leave_alerts_unmarked(clients, monkeypatch):
+    def throttled(**kwargs):
+        raise fakeaws.ClientError('Throttling', 'PublishBatch', 400)
+    monkeypatch.setattr(clients.sns, 'publish_batch', throttled)
+
+    alerts = dispatcher(clients)
+    queue(alerts, 2)
+    assert alerts.flush(state(clients), NOW) == {'sent': 0, 'suppressed': 0, 'failed': 2, 'publish_calls': 1}
+    assert BUCKET not in clients.s3.buckets
@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+import fakeaws
+from archivelist import ParallelLister, Partition, prefix_partitions, range_partitions
+
+BUCKET = 'archive-bucket'
+LETTERS = 'ABCDEFGH'
+
+
+@pytest.fixture
+def s3():
+    clients = fakeaws.FakeClients()
+    for letter in LETTERS:
+        for i in range(50):
+            clients.s3.add_object(BUCKET, f'archive/{letter}{i:04d}')
+    clients.s3.add_object(BUCKET, 'tmp/other')
+    return clients.s3
+
+
+def list_keys(lister, partitions, timeout=10):
+    # Run lister.list in a thread so a deadlock fails the test instead of hanging it.
+    result = []
+    thread = threading.Thread(target=lambda: result.append([obj['Key'] for obj in lister.list(partitions)]),
+                              daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert result, f"listing did not finish in {timeout}s"
+    return result[0]
+
+
+EXPECTED = [f'archive/{letter}{i:04d}' for letter in LETTERS for i in range(50)]
+
+
+@pytest.mark.parametrize('workers', [1, 2, 8, 16])
+@pytest.mark.parametrize('max_buffered_pages', [None, 1, 2])
+def test_bounded_buffers_with_more_partitions_than_workers(s3, workers, max_buffered_pages):
+    lister = ParallelLister(s3, BUCKET, workers=workers, page_size=5, max_buffered_pages=max_buffered_pages)
+    assert list_keys(lister, prefix_partitions([f'{letter}*' for letter in LETTERS])) == EXPECTED
+    assert lister.calls == len(LETTERS) * 10
+
+
+def test_range_partitions_cover_every_key_once(s3):
+    lister = ParallelLister(s3, BUCKET, workers=2, page_size=7, max_buffered_pages=1)
+    assert list_keys(lister, range_partitions('archive/', ('B', 'C0025', 'F'))) == EXPECTED
+
+
+def test_buffers_stay_bounded_while_the_consumer_waits(s3):
+    lister = ParallelLister(s3, BUCKET, workers=3, page_size=5, max_buffered_pages=2)
+    stream = lister.list(prefix_partitions([f'{letter}*' for letter in LETTERS]))
+    assert next(stream)['Key'] == 'archive/A0000'
+    time.sleep(0.2)
+    # Each partition holds at most two pages, plus the one being merged.
+    assert lister.calls <= len(LETTERS) * 3
+    stream.close()
+
+
+def test_errors_reach_the_consumer(s3):
+    def failing(**kwargs):
+        if kwargs['Prefix'] == 'archive/C':
+            raise fakeaws.ClientError('AccessDenied', 'ListObjectsV2', 403)
+        return s3.list_objects_v2(**kwargs)
+
+    class Client(object):
+        list_objects_v2 = staticmethod(failing)
+
+    lister = ParallelLister(Client(), BUCKET, workers=2, page_size=5, max_buffered_pages=1)
+    with pytest.raises(fakeaws.ClientError):
+        list(lister.list([Partition(f'archive/{letter}') for letter in LETTERS]))
@@ -0,0 +1,51 @@
+from datetime import date, datetime, time
+
+import pytest
+import pytz
+
+from lambda_function import get_deadline, get_expected_arrival_time, parse_slo_mapping
+
+UTC = pytz.utc
+
+
+@pytest.mark.parametrize('day, slo_time, expected', [
+    (date(2025, 1, 15), time(10, 30), datetime(2025, 1, 15, 15, 30, tzinfo=UTC)),   # EST
+    (date(2025, 7, 15), time(10, 30), datetime(2025, 7, 15, 14, 30, tzinfo=UTC)),   # EDT
+    # March change, 2025-03-09 02:00 EST -> 03:00 EDT.
+    (date(2025, 3, 8), time(10, 30), datetime(2025, 3, 8, 15, 30, tzinfo=UTC)),
+    (date(2025, 3, 9), time(1, 30), datetime(2025, 3, 9, 6, 30, tzinfo=UTC)),
+    (date(2025, 3, 9), time(10, 30), datetime(2025, 3, 9, 14, 30, tzinfo=UTC)),
+    (date(2025, 3, 10), time(10, 30), datetime(2025, 3, 10, 14, 30, tzinfo=UTC)),
+    # November change, 2025-11-02 02:00 EDT -> 01:00 EST.
+    (date(2025, 11, 1), time(10, 30), datetime(2025, 11, 1, 14, 30, tzinfo=UTC)),
+    (date(2025, 11, 2), time(0, 30), datetime(2025, 11, 2, 4, 30, tzinfo=UTC)),
+    (date(2025, 11, 2), time(10, 30), datetime(2025, 11, 2, 15, 30, tzinfo=UTC)),
+    (date(2025, 11, 3), time(10, 30), datetime(2025, 11, 3, 15, 30, tzinfo=UTC)),
+])
+def test_expected_arrival_time_in_toronto(day, slo_time, expected):
+    deadline = get_expected_arrival_time(day, slo_time, 'America/Toronto')
+    assert deadline == expected
+    assert deadline.tzinfo is UTC
+
+
+def test_other_zones():
+    assert (get_expected_arrival_time(date(2025, 1, 15), time(10, 30), 'America/Los_Angeles')
+            == datetime(2025, 1, 15, 18, 30, tzinfo=UTC))
+    assert (get_expected_arrival_time(date(2025, 7, 15), time(10, 30), 'Europe/London')
+            == datetime(2025, 7, 15, 9, 30, tzinfo=UTC))
+
+
+def test_get_deadline_across_the_march_change():
+    config = {'file_slo_mapping': parse_slo_mapping({
+                  'L1_X_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'},
+                  'M_X.*.dat.pgp': {'slo_days': 8, 'slo_time': '17:00'}}),
+              'listed_holidays': {}, 'region': 'CA', 'zone': 'America/Toronto',
+              'holidays': {}, 'deadlines': {}}
+    assert get_deadline(config, 'L1_X_*.xlsx', '20250307') == datetime(2025, 3, 7, 15, 30, tzinfo=UTC)
+    assert get_deadline(config, 'L1_X_*.xlsx', '20250310') == datetime(2025, 3, 10, 14, 30, tzinfo=UTC)
+    assert get_deadline(config, 'L1_X_*.xlsx', '20250309') is None  # a Sunday
+    # The 8th business day of March 2025 is the 12th, after the change.
+    assert get_deadline(config, 'M_X.*.dat.pgp', '202503') == datetime(2025, 3, 12, 21, 0, tzinfo=UTC)
+    # and of November 2025 the 12th, after the change back (Remembrance
+    # Day is not in the CA business calendar).
+    assert get_deadline(config, 'M_X.*.dat.pgp', '202511') == datetime(2025, 11, 12, 22, 0, tzinfo=UTC)
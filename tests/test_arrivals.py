@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import fakeaws
+from arrivals import ArrivalIndex, ArrivalTracker, S3ArrivalIndexStore
+
+BUCKET = 'archive-bucket'
+NOW = datetime(2025, 3, 20, 19, 0, tzinfo=timezone.utc)
+PATTERNS = ['FEED_A_*.xlsx', 'FEED_A_X_*.xlsx', 'FEED_M.*.dat.pgp']
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    # A fake S3 that remembers the arguments of each listing.
+    s3 = fakeaws.FakeClients().s3
+    s3.listings = []
+    list_objects_v2 = s3.list_objects_v2
+
+    def recording(**kwargs):
+        s3.listings.append(kwargs)
+        return list_objects_v2(**kwargs)
+    monkeypatch.setattr(s3, 'list_objects_v2', recording)
+    return s3
+
+
+def arrive(s3, *keys, at=NOW):
+    for key in keys:
+        s3.add_object(BUCKET, key, b'x', at)
+
+
+def test_sorted_layout_lists_after_the_cursor(s3):
+    arrive(s3, 'archive/2025/03/19/FEED_A_20250319.xlsx', 'archive/2025/03/20/FEED_A_20250320.xlsx')
+    tracker = ArrivalTracker(s3, BUCKET, layout='sorted')
+    index = ArrivalIndex()
+    assert tracker.refresh(index, NOW)['listed'] == 2
+    assert index.cursors == {'archive/': 'archive/2025/03/20/FEED_A_20250320.xlsx'}
+    assert index.get('archive/2025/03/19/FEED_A_20250319.xlsx') == NOW
+    assert index.watermark == NOW.isoformat() and index.changed
+
+    # Only keys after the cursor are listed: the late-written older key is not.
+    arrive(s3, 'archive/2025/03/18/FEED_B_20250318.xlsx', 'archive/2025/03/20/FEED_M.202503.dat.pgp')
+    del s3.listings[:]
+    assert tracker.refresh(index, NOW)['listed'] == 1
+    assert s3.listings == [{'Bucket': BUCKET, 'MaxKeys': 1000, 'Prefix': 'archive/',
+                            'StartAfter': 'archive/2025/03/20/FEED_A_20250320.xlsx'}]
+    assert 'archive/2025/03/20/FEED_M.202503.dat.pgp' in index
+    assert 'archive/2025/03/18/FEED_B_20250318.xlsx' not in index
+    assert index.cursors['archive/'] == 'archive/2025/03/20/FEED_M.202503.dat.pgp'
+
+
+def test_sorted_layout_pages_and_skips_when_nothing_is_outstanding(s3):
+    arrive(s3, *[f"archive/2025/03/20/FEED_{i}_20250320.xlsx" for i in range(5)])
+    tracker = ArrivalTracker(s3, BUCKET, layout='sorted', page_size=2)
+    index = ArrivalIndex()
+    result = tracker.refresh(index, NOW)
+    assert (result['listed'], result['list_calls']) == (5, 3)
+    assert [listing.get('ContinuationToken') for listing in s3.listings] == [
+        None, 'archive/2025/03/20/FEED_1_20250320.xlsx', 'archive/2025/03/20/FEED_3_20250320.xlsx']
+
+    del s3.listings[:]
+    result = tracker.refresh(index, NOW, wanted=['archive/2025/03/20/FEED_0_20250320.xlsx'])
+    assert result['list_calls'] == 0 and s3.listings == []
+
+
+def test_window_layout_lists_each_pattern_prefix(s3):
+    arrive(s3, 'archive/FEED_A_20241201.xlsx',  # before the 62-day window
+           'archive/FEED_A_20250319.xlsx', 'archive/FEED_A_20250320.xlsx',
+           'archive/FEED_A_X_20250320.xlsx', 'archive/FEED_M.202503.dat.pgp')
+    tracker = ArrivalTracker(s3, BUCKET, PATTERNS, layout='window')
+    index = ArrivalIndex()
+    result = tracker.refresh(index, NOW)
+    assert result['listed'] == 4
+    assert sorted(index.keys) == ['archive/FEED_A_20250319.xlsx', 'archive/FEED_A_20250320.xlsx',
+                                  'archive/FEED_A_X_20250320.xlsx', 'archive/FEED_M.202503.dat.pgp']
+    # FEED_A_X_ keys are past FEED_A_'s digits and only advance their own cursor.
+    assert index.cursors == {'archive/FEED_A_': 'archive/FEED_A_20250320.xlsx',
+                             'archive/FEED_A_X_': 'archive/FEED_A_X_20250320.xlsx',
+                             'archive/FEED_M.': 'archive/FEED_M.202503.dat.pgp'}
+    starts = {listing['Prefix']: listing.get('StartAfter') for listing in s3.listings}
+    assert starts['archive/FEED_A_'] == 'archive/FEED_A_20250117'
+    assert starts['archive/FEED_M.'] == 'archive/FEED_M.202501'
+
+    arrive(s3, 'archive/FEED_A_20250321.xlsx')
+    del s3.listings[:]
+    assert tracker.refresh(index, NOW)['listed'] == 1
+    starts = {listing['Prefix']: listing.get('StartAfter') for listing in s3.listings}
+    assert starts['archive/FEED_A_'] == 'archive/FEED_A_20250320.xlsx'
+    assert index.cursors['archive/FEED_A_'] == 'archive/FEED_A_20250321.xlsx'
+
+
+def test_window_layout_lists_only_outstanding_prefixes(s3):
+    arrive(s3, 'archive/FEED_A_20250320.xlsx')
+    tracker = ArrivalTracker(s3, BUCKET, PATTERNS, layout='window')
+    index = ArrivalIndex()
+    tracker.refresh(index, NOW)
+
+    del s3.listings[:]
+    missing = 'archive/FEED_M.202503.dat.pgp'
+    tracker.refresh(index, NOW, wanted=['archive/FEED_A_20250320.xlsx', missing])
+    assert [listing['Prefix'] for listing in s3.listings] == ['archive/FEED_M.']
+    # A file that has not arrived is reported missing, not guessed.
+    assert missing not in index and index.get(missing) is None
+
+
+def test_entries_expire_after_the_retention(s3):
+    arrive(s3, 'archive/2025/02/01/FEED_A_20250201.xlsx', at=NOW - timedelta(days=47))
+    arrive(s3, 'archive/2025/03/20/FEED_A_20250320.xlsx')
+    tracker = ArrivalTracker(s3, BUCKET, layout='sorted')
+    index = ArrivalIndex()
+    result = tracker.refresh(index, NOW)
+    assert (result['expired'], result['indexed']) == (1, 1)
+    assert index.get('archive/2025/02/01/FEED_A_20250201.xlsx') is None
+
+
+def test_index_round_trips_through_s3(s3):
+    store = S3ArrivalIndexStore(s3, BUCKET, 'state/arrival_index.json')
+    assert len(store.load()) == 0
+    arrive(s3, 'archive/2025/03/20/FEED_A_20250320.xlsx')
+    index = ArrivalIndex()
+    ArrivalTracker(s3, BUCKET, layout='sorted').refresh(index, NOW)
+    store.save(index)
+    assert not index.changed
+    loaded = store.load()
+    assert loaded.to_json() == index.to_json()
+    assert loaded.get('archive/2025/03/20/FEED_A_20250320.xlsx') == NOW
+
+
+def test_rejects_unknown_layouts(s3):
+    with pytest.raises(ValueError):
+        ArrivalTracker(s3, BUCKET, layout='flat')
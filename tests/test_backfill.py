@@ -0,0 +1,55 @@
+from datetime import date, datetime
+
+import pytest
+import pytz
+
+import backfill
+
+TZ = pytz.timezone('America/Toronto')
+
+
+def write_listing(path, count):
+    with open(path, 'w', newline='') as f:
+        f.write('key,last_modified\n')
+        for i in range(count):
+            f.write(f"archive/FEED_{i % 7}_2025031{i % 10}.xlsx,2025-03-1{i % 10}T13:{i % 60:02d}:00.000Z\n")
+
+
+def scan(sources, expected_keys):
+    backfill._init_worker(frozenset(expected_keys))
+    arrivals = {}
+    for source in sources:
+        for key, last_modified in backfill.scan_listing_file(source).items():
+            arrivals[key] = max(last_modified, arrivals.get(key, last_modified))
+    return arrivals
+
+
+@pytest.mark.parametrize('chunk_bytes', [1, 7, 50, 64, 4096])
+def test_byte_ranges_read_every_row_once(tmp_path, chunk_bytes):
+    path = str(tmp_path / 'listing.csv')
+    write_listing(path, 200)
+    keys = {f"archive/FEED_{i}_2025031{j}.xlsx" for i in range(7) for j in range(10)}
+    whole = scan(backfill.listing_sources(path, chunk_bytes=0), keys)
+    sources = backfill.listing_sources(path, chunk_bytes=chunk_bytes)
+    assert len(sources) > 1 or chunk_bytes == 4096
+    assert scan(sources, keys) == whole
+    assert len(whole) == 70
+    # Each row is counted by exactly one range.
+    rows = sum(sum(1 for _ in backfill._text_rows(path, start, end)) for *_, start, end in sources)
+    assert rows == 201
+
+
+def test_deadlines_compare_aware_with_listed_holidays(tmp_path):
+    path = str(tmp_path / 'listing.csv')
+    with open(path, 'w') as f:
+        f.write('key,last_modified\n'
+                'archive/L1_X_20250310.xlsx,2025-03-10T14:30:00.000Z\n'   # 10:30 EDT, on time
+                'archive/L1_X_20250311.xlsx,2025-03-11T14:31:00.000Z\n')  # 10:31 EDT, late
+    mapping = {'L1_X_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'}}
+    # 2025-03-12 is listed as a holiday, so it has no deadline.
+    rows = backfill.run_backfill(mapping, date(2025, 3, 10), date(2025, 3, 13), path, workers=1,
+                                 as_of=datetime(2025, 3, 20, tzinfo=pytz.utc),
+                                 listed_holidays={'2025': ['2025-03-12']})
+    assert [(row[1], row[-1]) for row in rows] == [
+        ('20250310', 'met'), ('20250311', 'late'), ('20250313', 'missing')]
+    assert rows[0][3] == TZ.localize(datetime(2025, 3, 10, 10, 30))
@@ -0,0 +1,109 @@
+import json
+import os
+from datetime import date, timedelta
+
+import pytest
+
+import businessday
+from businessday import MonthSeries, get_9th_business_day, load_holidays, month_starts, nth_business_days
+from lambda_function import get_nth_business_day
+
+# Computed with pandas CustomBusinessDay by data/generate_pandas_business_days.py.
+with open(os.path.join(os.path.dirname(__file__), 'data', 'pandas_business_days.json')) as f:
+    PANDAS = json.load(f)
+PANDAS_HOLIDAYS = {date.fromisoformat(day) for day in PANDAS['holidays']}
+START_YEAR, END_YEAR = PANDAS['years']
+
+
+def parse(mapping):
+    return {date.fromisoformat(first): date.fromisoformat(day) for first, day in mapping.items()}
+
+
+def is_business_day(day):
+    return day.weekday() < 5 and day not in PANDAS_HOLIDAYS
+
+
+def test_9th_business_days_2025():
+    assert get_9th_business_day(2025, load_holidays()).to_dict() == {
+        date(2025, 1, 1): date(2025, 1, 15),
+        date(2025, 2, 1): date(2025, 2, 13),
+        date(2025, 3, 1): date(2025, 3, 13),
+        date(2025, 4, 1): date(2025, 4, 11),
+        date(2025, 5, 1): date(2025, 5, 13),
+        date(2025, 6, 1): date(2025, 6, 12),
+        date(2025, 7, 1): date(2025, 7, 14),
+        date(2025, 8, 1): date(2025, 8, 14),
+        date(2025, 9, 1): date(2025, 9, 12),
+        date(2025, 10, 1): date(2025, 10, 14),
+        date(2025, 11, 1): date(2025, 11, 13),
+        date(2025, 12, 1): date(2025, 12, 11),
+    }
+
+
+@pytest.mark.parametrize('n', sorted(PANDAS['nth'], key=int))
+@pytest.mark.parametrize('backend', ['stdlib', 'numpy'])
+def test_matches_pandas(n, backend):
+    if backend == 'numpy' and not businessday.HAVE_NUMPY:
+        pytest.skip("NumPy is not installed")
+    result = nth_business_days(int(n), START_YEAR, END_YEAR, PANDAS_HOLIDAYS, backend=backend)
+    assert result.to_dict() == parse(PANDAS['nth'][n])
+
+
+def test_default_holidays_are_the_rule_generated_ca_calendar():
+    # The fixture was generated with holidayrules' 'CA' calendar.
+    assert nth_business_days(9, START_YEAR, END_YEAR).equals(
+        nth_business_days(9, START_YEAR, END_YEAR, PANDAS_HOLIDAYS))
+
+
+def test_9th_business_day_when_the_1st_is_not_a_business_day():
+    # The pandas version computed first + 8 * CustomBusinessDay, which
+    # pandas starts from the business day before a weekend or holiday 1st,
+    # giving the 8th business day. get_9th_business_day now always gives
+    # the 9th, as the checker's get_nth_business_day does, so these months
+    # are one business day later than they were.
+    old = parse(PANDAS['old'])
+    changed = 0
+    for year in range(START_YEAR, END_YEAR + 1):
+        for first_day, ninth in get_9th_business_day(year, PANDAS_HOLIDAYS).items():
+            assert ninth == get_nth_business_day(year, first_day.month, 9, PANDAS_HOLIDAYS).date()
+            if is_business_day(first_day):
+                assert ninth == old[first_day], first_day
+            else:
+                later = old[first_day] + timedelta(days=1)
+                while not is_business_day(later):
+                    later += timedelta(days=1)
+                assert ninth == later, first_day
+                changed += 1
+    assert changed > 30
+    # 2025-02-01 is a Saturday.
+    assert old[date(2025, 2, 1)] == date(2025, 2, 12)
+    assert get_9th_business_day(2025, PANDAS_HOLIDAYS)[date(2025, 2, 1)] == date(2025, 2, 13)
+
+
+def test_series_shape():
+    result = get_9th_business_day(2025, PANDAS_HOLIDAYS)
+    assert result.name == '9th Business Day'
+    assert result.index == month_starts(2025)
+    assert list(result) == result.values == [result[first_day] for first_day in result.index]
+    assert date(2025, 3, 1) in result and date(2025, 3, 2) not in result
+    assert result.get(date(2025, 3, 2)) is None
+    assert result.keys() == result.index
+    assert nth_business_days(1, 2025).name == '1st Business Day'
+    assert nth_business_days(22, 2025).name == '22nd Business Day'
+    assert nth_business_days(13, 2025).name == '13th Business Day'
+    assert isinstance(result.rename('x'), MonthSeries) and result.rename('x').name == 'x'
+
+
+def test_to_series_matches_the_old_series():
+    pd = pytest.importorskip('pandas')
+    series = get_9th_business_day(2025, PANDAS_HOLIDAYS).to_series()
+    assert series.name == '9th Business Day'
+    assert series.index.equals(pd.date_range(start='2025-01-01', end='2025-12-01', freq='MS'))
+    assert series.iloc[1] == date(2025, 2, 13)
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        nth_business_days(0, 2025)
+    with pytest.raises(ValueError):
+        nth_business_days(9, 2025, backend='pandas')
@@ -0,0 +1,112 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytz
+
+import fakeaws
+from compliance import ComplianceRecorder, ComplianceRollup, S3ComplianceState, compliance_ratio
+
+FEED = 'FEED_A_*.xlsx'
+OTHER = 'FEED_B_*.xlsx'
+ZONE = pytz.timezone('America/Toronto')
+BUCKET = 'state-bucket'
+
+
+def test_late_arrival_moves_missing_to_late():
+    rollup = ComplianceRollup()
+    rollup.expire(date(2025, 3, 20))
+    assert rollup.record(FEED, 'missing', date(2025, 3, 20))
+    # Later polls see the same outcome.
+    assert not rollup.record(FEED, 'missing', date(2025, 3, 20))
+    assert rollup.totals('2025-03') == [0, 0, 1]
+
+    rollup.expire(date(2025, 3, 21))
+    assert rollup.record(FEED, 'late', date(2025, 3, 20))
+    assert not rollup.record(FEED, 'late', date(2025, 3, 20))
+    assert rollup.outcome(FEED, date(2025, 3, 20)) == 'late'
+    assert rollup.totals('2025-03') == rollup.totals() == [0, 1, 0]
+    assert rollup.days == {'2025-03-20': {FEED: [0, 1, 0]}}
+
+
+def test_outcomes_settle():
+    rollup = ComplianceRollup(settle=35)
+    rollup.expire(date(2025, 3, 1))
+    rollup.record(FEED, 'missing', date(2025, 3, 1))
+    rollup.expire(date(2025, 4, 5))  # the 36th day
+    assert not rollup.record(FEED, 'late', date(2025, 3, 1))
+    assert not rollup.record(OTHER, 'met', date(2025, 3, 1))
+    assert rollup.totals('2025-03') == [0, 0, 1]
+    assert rollup.outcome(OTHER, date(2025, 3, 1)) is None
+
+
+def test_rolling_window_eviction():
+    rollup = ComplianceRollup(window=7, settle=7)
+    for offset in range(10):
+        day = date(2025, 3, 1) + timedelta(days=offset)
+        rollup.expire(day)
+        rollup.record(FEED, 'met' if offset % 2 else 'late', day)
+    # 2025-03-04 to 03-10 are left: the even days met, the odd ones late.
+    assert sorted(rollup.days) == [f"2025-03-{day:02d}" for day in range(4, 11)]
+    assert rollup.rolling == {FEED: [4, 3, 0]}
+    assert rollup.totals('2025-03') == [5, 5, 0]
+
+    # A feed with no days left in the window drops out of rolling.
+    rollup.expire(date(2025, 3, 30))
+    assert rollup.rolling == {} and rollup.days == {}
+    assert rollup.totals('2025-03') == [5, 5, 0]
+
+
+def test_month_rollover():
+    rollup = ComplianceRollup(months=2)
+    for day in (date(2025, 1, 31), date(2025, 2, 3), date(2025, 3, 3)):
+        rollup.expire(day)
+        rollup.record(FEED, 'met', day)
+    rollup.expire(date(2025, 3, 4))
+    assert sorted(rollup.months) == ['2025-02', '2025-03']
+    assert rollup.totals('2025-03') == [1, 0, 0]
+    assert rollup.summary(FEED)['rolling']['met'] == 3
+
+    # A file due on the last day of February that lands in March counts
+    # under February.
+    rollup.record(OTHER, 'missing', date(2025, 2, 28))
+    rollup.record(OTHER, 'late', date(2025, 2, 28))
+    assert rollup.months['2025-02'][OTHER] == [0, 1, 0]
+    assert rollup.summary(OTHER)['months']['2025-02']['compliance'] == 0.0
+
+
+def test_settle_must_fit_in_the_window():
+    with pytest.raises(ValueError):
+        ComplianceRollup(window=30, settle=35)
+
+
+def test_compliance_ratio():
+    assert compliance_ratio([3, 1, 0]) == 75.0
+    assert compliance_ratio([0, 0, 0]) is None
+
+
+def test_recorder_saves_only_changes():
+    clients = fakeaws.FakeClients()
+    state = S3ComplianceState(clients.s3, BUCKET, 'state/compliance.json')
+    recorder = ComplianceRecorder(clients.cloudwatch)
+    now = ZONE.localize(datetime(2025, 3, 20, 15, 0))
+    deadline = ZONE.localize(datetime(2025, 3, 20, 10, 30))
+
+    def feed_of(s3_key):
+        return FEED if 'FEED_A_' in s3_key else None
+
+    recorder.add('archive/FEED_A_20250320.xlsx', 'missing', deadline)
+    recorder.add('archive/OTHER.csv', 'met', deadline)
+    assert recorder.flush(state, feed_of, ZONE, now) == {'changed': 1, 'unchanged': 1}
+    assert clients.calls['s3.put_object'] == 1
+
+    recorder.add('archive/FEED_A_20250320.xlsx', 'missing', deadline)
+    assert recorder.flush(state, feed_of, ZONE, now) == {'changed': 0, 'unchanged': 1}
+    assert clients.calls['s3.put_object'] == 1
+
+    recorder.add('archive/FEED_A_20250320.xlsx', 'late', deadline)
+    assert recorder.flush(state, feed_of, ZONE, now + timedelta(hours=1)) == {'changed': 1, 'unchanged': 0}
+    rollup = state.load()
+    assert rollup.totals('2025-03') == [0, 1, 0]
+    assert 'files' not in rollup.to_json()
+    published = [datum for _, datum in clients.cloudwatch.metrics if datum['MetricName'] == 'SLOCompliance']
+    assert published[-1]['Value'] == 0.0
@@ -0,0 +1,51 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+import pytz
+
+import deadlines
+from holidayrules import holidays_between
+from lambda_function import get_deadline, parse_slo_mapping
+
+
+MAPPING_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'file_slo_mapping.json')
+
+
+def mapping():
+    with open(MAPPING_FILE) as f:
+        data = json.load(f)
+    data['EARLY_*.xlsx'] = {'slo_days': 0, 'slo_time': '01:30'}
+    data['LATE_MONTHLY.*.dat.pgp'] = {'slo_days': 20, 'slo_time': '23:45'}
+    return data
+
+
+@pytest.mark.parametrize('zone', ['America/Toronto', 'America/Los_Angeles'])
+def test_table_matches_the_checker_across_dst_changes(zone):
+    # 2025-03-09 and 2025-11-02 are the DST changes in both zones; the last
+    # business day before the November one is 2025-10-31.
+    file_slo_mapping = mapping()
+    holidays = holidays_between('CA', 2025, 2026)
+    columns = deadlines.deadline_columns(file_slo_mapping, 2025, 2025, holidays, zone)
+    config = {'file_slo_mapping': parse_slo_mapping(mapping()), 'listed_holidays': {}, 'region': 'CA',
+              'zone': zone, 'holidays': {}, 'deadlines': {}}
+    tz = pytz.timezone(zone)
+    dst = set()
+    for pattern, period, _, _, deadline in deadlines.deadline_rows(columns):
+        if period[4:6] in ('03', '10', '11'):
+            assert deadline == get_deadline(config, pattern, period), (pattern, period)
+            dst.add((period[4:6], bool(deadline.astimezone(tz).dst())))
+    # Deadlines on both sides of each change were compared.
+    assert dst == {('03', False), ('03', True), ('10', True), ('11', False)}
+
+
+def test_deadlines_are_utc_wall_clock_in_the_zone():
+    columns = deadlines.deadline_columns({'L1_X_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'}},
+                                         2025, 2025, holidays_between('CA', 2025, 2026))
+    periods, values = columns['L1_X_*.xlsx']
+    by_period = dict(zip(periods, values))
+    assert by_period['20250307'] == datetime(2025, 3, 7, 15, 30, tzinfo=pytz.utc)   # EST
+    assert by_period['20250310'] == datetime(2025, 3, 10, 14, 30, tzinfo=pytz.utc)  # EDT
+    assert by_period['20251031'] == datetime(2025, 10, 31, 14, 30, tzinfo=pytz.utc)
+    assert by_period['20251103'] == datetime(2025, 11, 3, 15, 30, tzinfo=pytz.utc)
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import async_checker
+import lambda_function
+from synthetic import BUCKET, ZONE, seed_bucket
+
+STATE_KEYS = ('state/compliance.json', 'state/lateness.json', 'state/arrival_model.json', 'state/sent_alerts.json')
+
+
+def metric_totals(clients):
+    totals = {}
+    for _, datum in clients.cloudwatch.metrics:
+        if datum['MetricName'].startswith('Client'):
+            continue
+        if 'Values' in datum:
+            for value, count in zip(datum['Values'], datum['Counts']):
+                key = (datum['MetricName'], value)
+                totals[key] = totals.get(key, 0) + count
+            continue
+        key = (datum['MetricName'], datum.get('Dimensions', [{}])[0].get('Value'))
+        totals[key] = totals.get(key, 0) + datum['Value']
+    return totals
+
+
+def run(clients, engine):
+    clients.reset()
+    seed_bucket(clients.s3, 60)
+    lambda_function.lambda_handler({
+        'bucket_name': BUCKET,
+        'sns_topic_arn': 'arn:aws:sns:us-east-1:000000000000:file-slo',
+        'holidays_file_key': 'config/holidays.json',
+        'slo_mapping_file_key': 'config/file_slo_mapping.json',
+        'useCanadianHolidays': True,
+        'timezone': ZONE,
+        'sendAlerts': True,
+        'engine': engine,
+    }, None)
+    objects = clients.s3.buckets[BUCKET]
+    tags = {key: obj['Tags'] for key, obj in objects.items() if obj['Tags']}
+    state = {key: json.loads(clients.s3.get_object(Bucket=BUCKET, Key=key)['Body'].read())
+             for key in STATE_KEYS if key in objects}
+    # Sent alerts are remembered with the wall-clock time they were sent.
+    state['state/sent_alerts.json'] = sorted(state.get('state/sent_alerts.json', {}))
+    return tags, metric_totals(clients), sorted(clients.sns.messages), state
+
+
+@pytest.fixture
+def async_s3(clients, monkeypatch):
+    monkeypatch.setattr(async_checker, 'S3_CLIENT_FACTORY', clients.async_s3)
+    return clients
+
+
+def test_async_engine_records_what_the_sync_engine_does(async_s3):
+    sync_tags, sync_metrics, sync_alerts, sync_state = run(async_s3, 'sync')
+    async_tags, async_metrics, async_alerts, async_state = run(async_s3, 'async')
+    assert sync_tags and sync_alerts
+    assert async_tags == sync_tags
+    assert async_metrics == sync_metrics
+    assert async_alerts == sync_alerts
+    assert set(sync_state) == set(STATE_KEYS) and sync_state['state/sent_alerts.json']
+    assert async_state == sync_state
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+import fanout
+import lambda_function
+from synthetic import BUCKET, EVENT, metric_totals, seed_bucket
+
+PARTITIONS = 4
+
+
+def slo_totals(clients):
+    return {key: count for key, count in metric_totals(clients.cloudwatch).items() if 'SLO' in key and 'Compliance' not in key}
+
+
+def messages(event):
+    work_queue = fanout.LocalQueue()
+    run_id = fanout.coordinate(event, work_queue)
+    return run_id, [json.loads(body) for body in list(work_queue._queue.queue)]
+
+
+@pytest.fixture
+def bucket(clients):
+    seed_bucket(clients.s3, 40)
+    return clients
+
+
+def test_partitions_record_like_the_sync_checker(bucket):
+    lambda_function.lambda_handler(EVENT, None)
+    expected = slo_totals(bucket)
+    tags = {key: obj['Tags'] for key, obj in bucket.s3.buckets[BUCKET].items() if obj['Tags']}
+    compliance = bucket.s3.buckets[BUCKET]['state/compliance.json']['Body']
+
+    bucket.reset()
+    seed_bucket(bucket.s3, 40)
+    fanout.run_local(dict(EVENT, partitions=PARTITIONS), workers=2)
+    assert slo_totals(bucket) == expected
+    assert {key: obj['Tags'] for key, obj in bucket.s3.buckets[BUCKET].items() if obj['Tags']} == tags
+    assert json.loads(bucket.s3.buckets[BUCKET]['state/compliance.json']['Body']) == json.loads(compliance)
+
+
+def test_failed_reduce_runs_again_on_retry(bucket, monkeypatch):
+    lambda_function.lambda_handler(EVENT, None)
+    expected = slo_totals(bucket)
+    bucket.reset()
+    seed_bucket(bucket.s3, 40)
+
+    calls = []
+    flush_compliance = fanout.flush_compliance
+
+    def failing_once(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise RuntimeError("S3 unavailable")
+        return flush_compliance(*args, **kwargs)
+
+    monkeypatch.setattr(fanout, 'flush_compliance', failing_once)
+    run_id, work = messages(dict(EVENT, partitions=PARTITIONS))
+    for message in work[:-1]:
+        fanout.process_partition(message)
+    with pytest.raises(RuntimeError):
+        fanout.process_partition(work[-1])
+    reduced = f"{fanout.RUNS_PREFIX}{run_id}/reduced"
+    assert reduced not in bucket.s3.buckets[BUCKET]
+    assert slo_totals(bucket) == {}
+
+    # SQS redelivers the failed message; its worker reduces the run.
+    fanout.process_partition(work[-1])
+    assert reduced in bucket.s3.buckets[BUCKET]
+    assert len(calls) == 2
+    assert slo_totals(bucket) == expected
+    assert 'state/compliance.json' in bucket.s3.buckets[BUCKET]
+
+    # A later redelivery does not reduce, or count, the run again.
+    fanout.process_partition(work[0])
+    assert len(calls) == 2
+    assert slo_totals(bucket) == expected
+
+
+def test_reduce_uses_the_run_time_for_holidays(bucket, monkeypatch):
+    years = []
+    get_holidays = fanout.get_holidays
+
+    def recording(listed, region, wanted):
+        years.append(list(wanted))
+        return get_holidays(listed, region, wanted)
+
+    monkeypatch.setattr(fanout, 'get_holidays', recording)
+    run_id, work = messages(dict(EVENT, partitions=1))
+    # A run from another year, reduced now.
+    work[0]['now'] = '2023-03-20T15:00:00-04:00'
+    fanout.process_partition(work[0])
+    assert len(years) == 2
+    assert all(wanted == [2023, 2024] for wanted in years)
@@ -0,0 +1,70 @@
+import json
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from holidayrules import easter, holidays_between, holidays_for
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'holidays.json')) as f:
+    HOLIDAYS_JSON = json.load(f)
+
+
+@pytest.mark.parametrize('region, key', [('US', 'us_public_holidays'), ('CA', 'ca_public_holidays')])
+def test_2025_matches_holidays_json(region, key):
+    assert holidays_for(region, 2025) == {date.fromisoformat(day) for day in HOLIDAYS_JSON[key]['2025']}
+
+
+@pytest.mark.parametrize('year, sunday', [
+    (1961, date(1961, 4, 2)), (2000, date(2000, 4, 23)), (2008, date(2008, 3, 23)),
+    (2011, date(2011, 4, 24)), (2019, date(2019, 4, 21)), (2024, date(2024, 3, 31)),
+    (2025, date(2025, 4, 20)), (2038, date(2038, 4, 25)), (2285, date(2285, 3, 22)),
+])
+def test_easter(year, sunday):
+    assert easter(year) == sunday
+    assert sunday - timedelta(days=2) in holidays_for('CA', year)  # Good Friday
+
+
+def test_us_new_years_day_on_a_saturday_is_observed_the_friday_before():
+    # 2022-01-01 was a Saturday: observed on Friday 2021-12-31.
+    assert date(2021, 12, 31) in holidays_for('US', 2021)
+    assert date(2022, 1, 1) not in holidays_for('US', 2022)
+    assert not any(day.year != 2022 for day in holidays_for('US', 2022))
+    assert date(2021, 12, 31) in holidays_between('US', 2021, 2022)
+
+
+def test_ca_christmas_and_boxing_day_on_a_weekend_move_to_monday_and_tuesday():
+    # 2021: Saturday and Sunday. 2022: Sunday and Monday.
+    assert {date(2021, 12, 27), date(2021, 12, 28)} <= holidays_for('CA', 2021)
+    assert not {date(2021, 12, 25), date(2021, 12, 26)} & holidays_for('CA', 2021)
+    assert {date(2022, 12, 26), date(2022, 12, 27)} <= holidays_for('CA', 2022)
+    assert date(2022, 12, 25) not in holidays_for('CA', 2022)
+
+
+def test_since_cutoffs():
+    # Juneteenth from 2021 (2021-06-19 was a Saturday, observed Friday).
+    assert date(2020, 6, 19) not in holidays_for('US', 2020)
+    assert date(2021, 6, 18) in holidays_for('US', 2021)
+    assert date(2025, 6, 19) in holidays_for('US', 2025)
+    # National Day for Truth and Reconciliation from 2021, in BC from 2023.
+    assert date(2020, 9, 30) not in holidays_for('CA', 2020)
+    assert date(2021, 9, 30) in holidays_for('CA', 2021)
+    assert date(2022, 9, 30) not in holidays_for('CA-BC', 2022)
+    assert date(2024, 9, 30) in holidays_for('CA-BC', 2024)
+
+
+def test_quebec_moves_only_a_sunday_fete_nationale_and_canada_day():
+    # 2023-06-24 was a Saturday: not moved.
+    assert date(2023, 6, 24) in holidays_for('CA-QC', 2023)
+    assert date(2023, 6, 26) not in holidays_for('CA-QC', 2023)
+    # 2018-06-24 and 2018-07-01 were Sundays: held on the Monday.
+    assert {date(2018, 6, 25), date(2018, 7, 2)} <= holidays_for('CA-QC', 2018)
+    assert not {date(2018, 6, 24), date(2018, 7, 1)} & holidays_for('CA-QC', 2018)
+    # Christmas on a Saturday (2021) stays there.
+    assert date(2021, 12, 25) in holidays_for('CA-QC', 2021)
+
+
+def test_cached_and_unknown_regions():
+    assert holidays_for('CA', 2031) is holidays_for('CA', 2031)
+    with pytest.raises(KeyError):
+        holidays_for('FR', 2025)
@@ -0,0 +1,82 @@
+import csv
+import json
+from datetime import date, datetime
+
+import pytest
+import pytz
+
+import backfill
+import deadlines
+import fanout
+import lambda_function
+from synthetic import BUCKET, EVENT, metric_totals
+
+MAPPING = {
+    'L1_NATURAL_GL_*.xlsx': {'slo_days': 0, 'slo_time': '10:30', 'key_template': 'archive/{yyyy}/{mm}/{dd}/{name}'},
+    'L1_POWER_*.xlsx': {'slo_days': 0, 'slo_time': '10:30', 'key_template': 'archive/{yyyy}/{mm}/{dd}/{name}'},
+    'L2_FLAT_*.xlsx': {'slo_days': 0, 'slo_time': '10:30', 'key_template': 'archive/feeds/{name}'},
+    'L3_PLAIN_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'},
+}
+
+# On time (09:00 EDT) for 2025-03-20; L1_POWER has not arrived.
+ARRIVED = ['archive/2025/03/20/L1_NATURAL_GL_20250320.xlsx',
+           'archive/feeds/L2_FLAT_20250320.xlsx',
+           'archive/L3_PLAIN_20250320.xlsx']
+
+
+def slo_totals(clients):
+    return {key: count for key, count in metric_totals(clients.cloudwatch).items() if 'SLO' in key and 'Compliance' not in key}
+
+
+@pytest.fixture
+def bucket(clients):
+    with open('holidays.json') as f:
+        clients.s3.add_json(BUCKET, 'config/holidays.json', json.load(f))
+    clients.s3.add_json(BUCKET, 'config/file_slo_mapping.json', MAPPING)
+    for s3_key in ARRIVED:
+        clients.s3.add_object(BUCKET, s3_key, b'', datetime(2025, 3, 20, 13, 0, tzinfo=pytz.utc))
+    return clients
+
+
+def tagged(clients):
+    return sorted(key for key, obj in clients.s3.buckets[BUCKET].items() if obj['Tags'])
+
+
+@pytest.mark.parametrize('options', [{}, {'arrivalIndex': True},
+                                     {'arrivalIndex': True, 'archiveLayout': 'sorted'}])
+def test_checker_finds_templated_keys(bucket, options):
+    lambda_function.lambda_handler(dict(EVENT, precheck=False, **options), None)
+    assert slo_totals(bucket) == {'DailySLOMet/None': 3, 'DailySLONotMet/FileNotFound': 1}
+    assert tagged(bucket) == sorted(ARRIVED)
+
+
+def test_fanout_finds_templated_keys(bucket):
+    fanout.run_local(dict(EVENT, precheck=False, partitions=2), workers=1)
+    assert slo_totals(bucket) == {'DailySLOMet/None': 3, 'DailySLONotMet/FileNotFound': 1}
+    assert tagged(bucket) == sorted(ARRIVED)
+
+
+def test_backfill_and_deadline_table_use_templates(tmp_path):
+    listing = str(tmp_path / 'listing.csv')
+    with open(listing, 'w') as f:
+        f.write('key,last_modified\n')
+        f.writelines(f"{s3_key},2025-03-20T13:00:00.000Z\n" for s3_key in ARRIVED)
+        # Under archive/ but not where the template puts it.
+        f.write('archive/L1_POWER_20250320.xlsx,2025-03-20T13:00:00.000Z\n')
+    rows = backfill.run_backfill(MAPPING, date(2025, 3, 20), date(2025, 3, 20), listing, workers=1,
+                                 as_of=datetime(2025, 3, 21, tzinfo=pytz.utc))
+    assert sorted((row[0], row[-1]) for row in rows) == [
+        ('L1_NATURAL_GL_*.xlsx', 'met'), ('L1_POWER_*.xlsx', 'missing'),
+        ('L2_FLAT_*.xlsx', 'met'), ('L3_PLAIN_*.xlsx', 'met')]
+
+    holidays = lambda_function.get_holidays({}, 'CA', [2025, 2026])
+    columns = deadlines.deadline_columns(MAPPING, 2025, 2025, holidays)
+    keys = deadlines.deadline_keys(columns, MAPPING, holidays)
+    assert set(keys) == {'L1_NATURAL_GL_*.xlsx', 'L1_POWER_*.xlsx', 'L2_FLAT_*.xlsx'}
+    table = str(tmp_path / 'deadlines.csv')
+    deadlines.write_deadline_table(columns, table, keys)
+    with open(table) as f:
+        written = {(row['expected_file_name'], row['s3_key']) for row in csv.DictReader(f)}
+    for s3_key in ARRIVED:
+        assert (s3_key.rpartition('/')[2], s3_key) in written
+    assert {(row[2], row[3]) for row in deadlines.deadline_rows(columns, keys)} == written
@@ -0,0 +1,155 @@
+import math
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+import fakeaws
+from lateness import LatenessRecorder, QuantileSketch, S3LatenessState, business_days_late
+
+QUANTILES = (0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95, 0.99)
+BUCKET = 'state-bucket'
+DEADLINE = datetime(2025, 3, 20, 14, 0, tzinfo=timezone.utc)
+
+
+def exact(values, q):
+    # The value the sketch's rank q * (n - 1) falls on.
+    return sorted(values)[math.floor(q * (len(values) - 1))]
+
+
+def assert_accurate(sketch, values):
+    for q in QUANTILES:
+        expected = exact(values, q)
+        assert sketch.quantile(q) == pytest.approx(expected, rel=sketch.relative_accuracy + 1e-9, abs=1e-12), q
+
+
+def lateness_values(count, seed):
+    # Mostly early by up to a few hours, with a long late tail.
+    rng = random.Random(seed)
+    return [-rng.lognormvariate(4, 1) if rng.random() < 0.8 else rng.lognormvariate(3, 2) for _ in range(count)]
+
+
+@pytest.mark.parametrize('accuracy', [0.01, 0.05])
+def test_quantiles_are_within_the_relative_accuracy(accuracy):
+    values = lateness_values(5000, seed=1)
+    sketch = QuantileSketch(relative_accuracy=accuracy)
+    for value in values:
+        sketch.add(value)
+    assert sketch.count == len(values)
+    assert_accurate(sketch, values)
+
+
+def test_all_negative_values():
+    values = [-v for v in lateness_values(2000, seed=2) if v > 0] + [-5000.0, -0.5]
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    assert not sketch.positive and not sketch.zero
+    assert_accurate(sketch, values)
+    assert sketch.quantile(0) == pytest.approx(min(values), rel=0.01)
+
+
+def test_values_near_zero_count_as_zero():
+    sketch = QuantileSketch(min_value=0.01)
+    for value in (0.0, 0.005, -0.01, 0.01):
+        sketch.add(value)
+    sketch.add(3.0, count=2)
+    assert (sketch.zero, sketch.count) == (4, 6)
+    assert sketch.quantile(0.5) == 0.0
+    assert sketch.quantile(1) == pytest.approx(3.0, rel=0.01)
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_merged_sketches_match_one_sketch():
+    values = lateness_values(6000, seed=3)
+    whole = QuantileSketch()
+    for value in values:
+        whole.add(value)
+    merged = QuantileSketch()
+    for part in range(3):
+        sketch = QuantileSketch()
+        for value in values[part::3]:
+            sketch.add(value)
+        merged.merge(sketch)
+    assert (merged.positive, merged.negative, merged.zero, merged.count) == (
+        whole.positive, whole.negative, whole.zero, whole.count)
+    assert_accurate(merged, values)
+    restored = QuantileSketch.from_json(merged.to_json())
+    assert [restored.quantile(q) for q in QUANTILES] == [merged.quantile(q) for q in QUANTILES]
+
+
+def test_collapse_keeps_the_tails():
+    # 1% buckets from 0.1 to 10000 minutes need about 580 buckets; keep 100.
+    values = [0.1 * 1.02 ** i for i in range(600)]
+    sketch = QuantileSketch(max_buckets=100)
+    for value in values:
+        sketch.add(value)
+    assert len(sketch.positive) + len(sketch.negative) <= 100
+    assert sketch.count == len(values)
+    # The smallest magnitudes were folded into zero ...
+    assert sketch.zero > 0 and sketch.quantile(0.1) == 0.0
+    # ... while the high quantiles stay accurate.
+    for q in (0.9, 0.95, 0.99):
+        assert sketch.quantile(q) == pytest.approx(exact(values, q), rel=0.01)
+
+    other = QuantileSketch(max_buckets=100)
+    other.merge(sketch)
+    other.merge(sketch)
+    assert len(other.positive) <= 100 and other.count == 2 * len(values)
+
+
+def test_business_days_late():
+    holidays = {date(2025, 4, 18)}  # Good Friday
+    assert business_days_late(date(2025, 4, 17), date(2025, 4, 17), holidays) == 0
+    assert business_days_late(date(2025, 4, 21), date(2025, 4, 17), holidays) == 1
+    assert business_days_late(date(2025, 4, 16), date(2025, 4, 21), holidays) == -2
+
+
+def match(s3_key):
+    # (feed, period) of keys like archive/FEED_A_20250320.xlsx.
+    name = s3_key.rpartition('/')[2]
+    if not name.startswith('FEED_'):
+        return None
+    feed, _, rest = name.rpartition('_')
+    return feed + '_*.xlsx', rest.partition('.')[0]
+
+
+def test_each_period_is_recorded_once():
+    clients = fakeaws.FakeClients()
+    state = S3LatenessState(clients.s3, BUCKET, 'state/lateness.json')
+    recorder = LatenessRecorder(clients.cloudwatch)
+
+    def run(*keys, day=DEADLINE):
+        for key in keys:
+            recorder.add('Daily', key, day + timedelta(minutes=30), day)
+        return recorder.flush(state, match, set(), timezone.utc)
+
+    assert run('archive/FEED_A_20250320.xlsx', 'archive/FEED_B_20250320.xlsx', 'archive/OTHER.csv') == {
+        'recorded': 2, 'skipped': 1}
+    # The next poll sees the same files.
+    assert run('archive/FEED_A_20250320.xlsx', 'archive/FEED_B_20250320.xlsx') == {'recorded': 0, 'skipped': 2}
+    # Two new days of a feed in one run both count; an older day does not.
+    assert run('archive/FEED_A_20250322.xlsx', 'archive/FEED_A_20250321.xlsx', 'archive/FEED_B_20250319.xlsx') == {
+        'recorded': 2, 'skipped': 1}
+
+    feeds, periods = state.load()
+    assert periods == {'FEED_A_*.xlsx': '20250322', 'FEED_B_*.xlsx': '20250320'}
+    assert feeds['FEED_A_*.xlsx'].minutes.count == 3
+    assert feeds['FEED_A_*.xlsx'].minutes.quantile(0.5) == pytest.approx(30, rel=0.01)
+
+
+def test_state_stays_one_entry_per_feed():
+    clients = fakeaws.FakeClients()
+    state = S3LatenessState(clients.s3, BUCKET, 'state/lateness.json')
+    recorder = LatenessRecorder(clients.cloudwatch)
+    sizes = []
+    for day in range(120):
+        deadline = DEADLINE + timedelta(days=day)
+        for feed in ('A', 'B'):
+            recorder.add('Daily', f"archive/FEED_{feed}_{deadline:%Y%m%d}.xlsx", deadline, deadline)
+        recorder.flush(state, match, set(), timezone.utc)
+        sizes.append(len(clients.s3.buckets[BUCKET]['state/lateness.json']['Body']))
+    feeds, periods = state.load()
+    assert len(periods) == 2 and feeds['FEED_A_*.xlsx'].minutes.count == 120
+    # Only the counts' digits grow.
+    assert sizes[-1] - sizes[10] < 10
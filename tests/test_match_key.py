@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+import lambda_function
+from lambda_function import compile_pattern_matcher, match_key
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+with open(os.path.join(ROOT, 'file_slo_mapping.json')) as f:
+    MAPPING = json.load(f)
+MATCHER = compile_pattern_matcher(MAPPING)
+
+
+@pytest.mark.parametrize('s3_key, expected', [
+    ('archive/L1_NATURAL_GL_20250310.xlsx', ('L1_NATURAL_GL_*.xlsx', '20250310')),
+    ('archive/2025/03/10/L1_NATURAL_GL_20250310.xlsx', ('L1_NATURAL_GL_*.xlsx', '20250310')),
+    ('archive/L1_NATURAL_GL_20240229.xlsx', ('L1_NATURAL_GL_*.xlsx', '20240229')),
+    ('archive/BCL_OPR_RISK_SMA_BCAR.202512.dat.pgp', ('BCL_OPR_RISK_SMA_BCAR.*.dat.pgp', '202512')),
+    ('archive/L1_PROFIT_CENTER_HIERARCHY_EXPLOSION_20250310.xlsx',
+     ('L1_PROFIT_CENTER_HIERARCHY_EXPLOSION_*.xlsx', '20250310')),
+])
+def test_matches_real_periods(s3_key, expected):
+    assert match_key(MATCHER, s3_key) == expected
+
+
+@pytest.mark.parametrize('s3_key', [
+    'archive/L1_NATURAL_GL_20251340.xlsx',      # month 13
+    'archive/L1_NATURAL_GL_20250431.xlsx',      # 31 April
+    'archive/L1_NATURAL_GL_20250229.xlsx',      # not a leap year
+    'archive/L1_NATURAL_GL_20250300.xlsx',      # day 0
+    'archive/L1_NATURAL_GL_00000101.xlsx',      # year 0
+    'archive/L1_NATURAL_GL_2025031.xlsx',       # too short
+    'archive/L1_NATURAL_GL_2025031x.xlsx',
+    'archive/L1_NATURAL_GL_２０２５０３１０.xlsx',  # non-ASCII digits
+    'archive/BCL_OPR_RISK_SMA_BCAR.202513.dat.pgp',
+    'archive/BCL_OPR_RISK_SMA_BCAR.202500.dat.pgp',
+    'archive/BCL_OPR_RISK_SMA_BCAR.20251.dat.pgp',
+    'incoming/L1_NATURAL_GL_20250310.xlsx',
+    'archive/UNKNOWN_20250310.xlsx',
+])
+def test_rejects_keys_without_a_real_period(s3_key):
+    assert match_key(MATCHER, s3_key) is None
+
+
+def test_event_handler_skips_invalid_dates(clients, monkeypatch):
+    bucket = 'events'
+    clients.s3.add_json(bucket, 'holidays.json', {'ca_public_holidays': {}})
+    clients.s3.add_json(bucket, 'mapping.json', MAPPING)
+    monkeypatch.setenv('HOLIDAYS_FILE_KEY', 'holidays.json')
+    monkeypatch.setenv('SLO_MAPPING_FILE_KEY', 'mapping.json')
+    monkeypatch.setenv('SLO_CONFIG_BUCKET', bucket)
+    records = [{'eventName': 'ObjectCreated:Put', 'eventTime': '2025-03-10T14:22:05.123Z',
+                's3': {'bucket': {'name': bucket}, 'object': {'key': key}}}
+               for key in ('archive/L1_NATURAL_GL_20251340.xlsx',
+                           'archive/BCL_OPR_RISK_SMA_BCAR.202513.dat.pgp',
+                           'archive/L1_NATURAL_GL_20250310.xlsx')]
+    for record in records:
+        clients.s3.add_object(bucket, record['s3']['object']['key'], b'x')
+    response = lambda_function.s3_event_handler({'Records': records}, None)
+    assert response['body'] == 'Recorded 1 of 3 arrivals.'
+    assert [datum['MetricName'] for _, datum in clients.cloudwatch.metrics
+            if datum['MetricName'].endswith(('SLOMet', 'SLONotMet'))] == ['DailySLOMet']
@@ -0,0 +1,73 @@
+import json
+from datetime import datetime
+
+import pytest
+import pytz
+
+import lambda_function
+from synthetic import BUCKET, EVENT, ROOT, ZONE
+
+# Monday 2025-03-03 is March's first business day.
+BEFORE = pytz.timezone(ZONE).localize(datetime(2025, 3, 3, 7, 0))
+
+DEPLOYED = {'FEED_A.*.dat.pgp': {'slo_days': 1, 'slo_time': '06:00'}}
+NOT_DUE = {'FEED_A.*.dat.pgp': {'slo_days': 9, 'slo_time': '06:00'}}
+
+
+def encode(data):
+    return json.dumps(data).encode('utf-8')
+
+
+@pytest.fixture
+def config(clients, tmp_path, monkeypatch):
+    # The deployed mapping in S3, and a bundled copy of it in tmp_path.
+    with open(f"{ROOT}/holidays.json", 'rb') as f:
+        holidays = f.read()
+    clients.s3.add_object(BUCKET, EVENT['holidays_file_key'], holidays)
+    clients.s3.add_object(BUCKET, EVENT['slo_mapping_file_key'], encode(DEPLOYED))
+    (tmp_path / 'holidays.json').write_bytes(holidays)
+    (tmp_path / 'file_slo_mapping.json').write_bytes(encode(DEPLOYED))
+    monkeypatch.setattr(lambda_function, 'BUNDLED_CONFIG_DIR', str(tmp_path))
+    monkeypatch.setattr(lambda_function, 'get_local_time', lambda zone: BEFORE.astimezone(pytz.timezone(zone)))
+    return tmp_path
+
+
+def missing(clients):
+    return sum(datum['Value'] for _, datum in clients.cloudwatch.metrics
+               if datum['MetricName'] == 'MonthlySLONotMet')
+
+
+def test_skips_when_the_bundle_matches_s3(clients, config):
+    (config / 'file_slo_mapping.json').write_bytes(encode(NOT_DUE))
+    clients.s3.add_object(BUCKET, EVENT['slo_mapping_file_key'], encode(NOT_DUE))
+    response = lambda_function.lambda_handler(EVENT, None)
+    assert response['body'] == 'Nothing to check yet.'
+    assert clients.calls == {'s3.head_object': 2}
+
+
+def test_stale_bundle_runs_the_full_check(clients, config):
+    # The bundle says the feed is due on the 9th business day, but the
+    # deployed mapping moved it to the 1st, which has passed.
+    (config / 'file_slo_mapping.json').write_bytes(encode(NOT_DUE))
+    response = lambda_function.lambda_handler(EVENT, None)
+    assert response['body'] == 'File check completed.'
+    assert clients.calls['s3.get_object'] >= 2
+    assert missing(clients) == 1
+
+
+def test_changed_config_in_a_warm_container_runs_the_full_check(clients, config):
+    clients.s3.add_object(BUCKET, EVENT['slo_mapping_file_key'], encode(NOT_DUE))
+    lambda_function.lambda_handler(dict(EVENT, precheck=False), None)
+    assert lambda_function.lambda_handler(EVENT, None)['body'] == 'Nothing to check yet.'
+
+    clients.s3.add_object(BUCKET, EVENT['slo_mapping_file_key'], encode(DEPLOYED))
+    clients.reset_counts()
+    assert lambda_function.lambda_handler(EVENT, None)['body'] == 'File check completed.'
+    assert missing(clients) == 1
+
+
+def test_missing_bundle_runs_the_full_check(clients, config):
+    (config / 'file_slo_mapping.json').unlink()
+    clients.s3.add_object(BUCKET, EVENT['slo_mapping_file_key'], encode(NOT_DUE))
+    assert lambda_function.lambda_handler(EVENT, None)['body'] == 'File check completed.'
+    assert 's3.head_object' not in clients.calls
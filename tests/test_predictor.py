@@ -0,0 +1,134 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytz
+
+import lambda_function
+from predictor import ArrivalModel, ArrivalPredictor, S3ArrivalModelState
+from synthetic import BUCKET, EVENT, ZONE
+
+DEADLINE = datetime(2025, 3, 20, 14, 30, tzinfo=timezone.utc)
+
+
+def learn(model, offsets, alpha=0.1):
+    for day, offset in enumerate(offsets):
+        assert model.update(offset, DEADLINE + timedelta(days=day), alpha)
+    return model
+
+
+def test_constant_arrivals_have_no_spread():
+    model = learn(ArrivalModel(), [-60.0] * 20)
+    assert (model.mean, model.variance, model.count) == (-60.0, 0.0, 20)
+    assert model.sigma(min_sigma=5.0) == 5.0
+
+
+def test_mean_converges_to_a_shifted_arrival_time():
+    # 30 arrivals two hours early, then 50 half an hour early.
+    model = learn(ArrivalModel(), [-120.0] * 30 + [-30.0] * 50)
+    assert model.mean == pytest.approx(-30 - 90 * 0.9 ** 50)
+    assert model.mean == pytest.approx(-30, abs=0.5)
+
+
+def test_variance_tracks_the_spread():
+    model = learn(ArrivalModel(), [-70.0, -50.0] * 100)
+    assert model.mean == pytest.approx(-60, abs=1.1)
+    assert model.sigma() == pytest.approx(10, rel=0.1)
+
+
+def test_update_learns_each_deadline_once_and_in_order():
+    model = learn(ArrivalModel(), [-60.0, -60.0])
+    assert not model.update(500.0, DEADLINE + timedelta(days=1), 0.1)
+    assert not model.update(500.0, DEADLINE, 0.1)
+    assert model.mean == -60.0 and model.count == 2
+    assert ArrivalModel.from_json(model.to_json()).to_json() == model.to_json()
+
+
+def test_flush_learns_from_state_across_runs(clients):
+    state = S3ArrivalModelState(clients.s3, BUCKET, 'state/arrival_model.json')
+    predictor = ArrivalPredictor()
+
+    def feed_of(s3_key):
+        return 'FEED_A_*.xlsx' if 'FEED_A_' in s3_key else None
+
+    # Queued out of order; learned in deadline order.
+    for day in (1, 0):
+        deadline = DEADLINE + timedelta(days=day)
+        predictor.observe(f"archive/FEED_A_{deadline:%Y%m%d}.xlsx", deadline - timedelta(minutes=30), deadline)
+    predictor.observe('archive/OTHER.csv', DEADLINE, DEADLINE)
+    models, result = predictor.flush(state, feed_of)
+    assert result == {'learned': 2, 'skipped': 1}
+    assert models['FEED_A_*.xlsx'].count == 2
+
+    # The next run sees the newest file again.
+    predictor.observe('archive/FEED_A_20250321.xlsx', DEADLINE, DEADLINE + timedelta(days=1))
+    models, result = predictor.flush(state, feed_of)
+    assert result == {'learned': 0, 'skipped': 1}
+    assert state.load()['FEED_A_*.xlsx'].to_json() == models['FEED_A_*.xlsx'].to_json()
+
+
+def test_cold_start_needs_min_samples():
+    predictor = ArrivalPredictor(min_samples=5)
+    late = DEADLINE - timedelta(minutes=1)
+    for count in range(5):
+        model = learn(ArrivalModel(), [-120.0] * count)
+        assert predictor.at_risk(model, DEADLINE, late) is None
+    assert predictor.at_risk(learn(ArrivalModel(), [-120.0] * 5), DEADLINE, late) is not None
+    assert predictor.at_risk(None, DEADLINE, late) is None
+
+
+def test_at_risk_only_past_the_predicted_arrival_and_margin():
+    predictor = ArrivalPredictor(sigmas=2.0, min_sigma=5.0)
+    model = learn(ArrivalModel(), [-120.0] * 10)
+    predicted = DEADLINE - timedelta(minutes=120)
+    threshold = predicted + timedelta(minutes=10)  # 2 sigmas of the 5-minute floor
+    assert predictor.at_risk(model, DEADLINE, predicted) is None
+    assert predictor.at_risk(model, DEADLINE, threshold) is None
+    assert predictor.at_risk(model, DEADLINE, threshold + timedelta(seconds=1)) == (predicted, 5.0)
+    assert predictor.at_risk(model, DEADLINE, threshold + timedelta(seconds=1), sigmas=3.0) is None
+    # Once the deadline has passed the regular check reports the file.
+    assert predictor.at_risk(model, DEADLINE, DEADLINE) is None
+
+
+MAPPING = {
+    'FEED_A_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'},
+    'FEED_B_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'},
+    'FEED_C_*.xlsx': {'slo_days': 0, 'slo_time': '10:30'},
+}
+
+
+@pytest.fixture
+def early(clients):
+    # 09:00 on a Thursday: every feed usually arrives by 08:30 (+/- 5 min),
+    # so all three are past their margin with 90 minutes to their deadline.
+    now = pytz.timezone(ZONE).localize(datetime(2025, 3, 20, 9, 0))
+    mapping = lambda_function.parse_slo_mapping({pattern: dict(slo) for pattern, slo in MAPPING.items()})
+    models = {pattern: learn(ArrivalModel(), [-120.0] * 10) for pattern in MAPPING}
+    holidays = lambda_function.get_holidays({}, 'CA', [2025])
+    clients.s3.add_object(BUCKET, 'archive/FEED_A_20250320.xlsx', b'x', now - timedelta(hours=1))
+
+    def check(arrivals=None):
+        return lambda_function.check_at_risk(models, holidays, mapping, now, now + timedelta(hours=2), BUCKET,
+                                             EVENT['sns_topic_arn'], arrivals, zone=ZONE)
+    return check
+
+
+def alerted():
+    return sorted(key for _, key in lambda_function._alerts._pending)
+
+
+def test_check_at_risk_skips_files_already_present(clients, early):
+    assert early() == 2
+    assert alerted() == ['FEED_B_20250320.xlsx:at-risk', 'FEED_C_20250320.xlsx:at-risk']
+    assert clients.calls['s3.head_object'] == 3
+    assert [(datum['MetricName'], datum['Value']) for _, datum in clients.cloudwatch.metrics] == [
+        ('DailySLOAtRisk', 2)]
+
+
+def test_check_at_risk_uses_known_arrivals(clients, early):
+    # The arrival index knows FEED_A arrived and FEED_B has not; FEED_C is
+    # not in it and is looked up.
+    arrivals = {'archive/FEED_A_20250320.xlsx': datetime(2025, 3, 20, 12, 0, tzinfo=timezone.utc),
+                'archive/FEED_B_20250320.xlsx': None}
+    assert early(arrivals) == 2
+    assert alerted() == ['FEED_B_20250320.xlsx:at-risk', 'FEED_C_20250320.xlsx:at-risk']
+    assert clients.calls['s3.head_object'] == 1
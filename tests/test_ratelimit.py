@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from fakeaws import ClientError
+from ratelimit import AdaptiveLimiter, LimitedClient, TokenBucket, is_throttle, is_transient
+
+
+class EndpointConnectionError(Exception):
+    # Named like botocore's, which subclasses ConnectionError and BotoCoreError.
+    pass
+
+
+class ReadTimeoutError(Exception):
+    pass
+
+
+class Flaky(object):
+    # Fails with each of errors in turn, then returns 'ok'.
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+def limiter(**kwargs):
+    # No backoff sleeps; a rate high enough that the bucket never waits.
+    return AdaptiveLimiter(1e6, backoff_base=0, **kwargs)
+
+
+@pytest.mark.parametrize('error', [
+    ClientError('SlowDown', 'HeadObject', 503),
+    ClientError('Throttling', 'PutMetricData', 400),
+    ClientError('TooManyRequestsException', 'Publish', 429),
+])
+def test_throttles_are_retried_and_cut_the_rate(error):
+    limit = limiter()
+    fn = Flaky(error, error)
+    assert limit.call(fn) == 'ok'
+    assert fn.calls == 3
+    snapshot = limit.snapshot()
+    assert snapshot['throttles'] == 2 and snapshot['retries'] == 2
+    assert snapshot['rate'] < 1e6
+
+
+@pytest.mark.parametrize('error', [
+    ClientError('InternalError', 'HeadObject', 500),
+    ClientError('BadGateway', 'HeadObject', 502),
+    ClientError('SomethingNew', 'HeadObject', 504),
+    ClientError('RequestTimeout', 'GetObject', 400),
+    EndpointConnectionError('Could not connect to the endpoint URL'),
+    ReadTimeoutError('Read timeout on endpoint URL'),
+    ConnectionResetError(104, 'Connection reset by peer'),
+    TimeoutError(),
+])
+def test_transient_errors_are_retried_without_cutting_the_rate(error):
+    assert is_transient(error) and not is_throttle(error)
+    limit = limiter()
+    fn = Flaky(error)
+    assert limit.call(fn) == 'ok'
+    assert fn.calls == 2
+    snapshot = limit.snapshot()
+    assert snapshot['retries'] == 1 and snapshot['throttles'] == 0
+    assert snapshot['rate'] == 1e6
+
+
+def test_transient_errors_give_up_after_transient_attempts():
+    limit = limiter(transient_attempts=3)
+    error = ClientError('InternalError', 'HeadObject', 500)
+    fn = Flaky(error, error, error, error)
+    with pytest.raises(ClientError):
+        limit.call(fn)
+    assert fn.calls == 3
+    assert limit.snapshot()['failures'] == 1
+
+
+@pytest.mark.parametrize('error', [
+    ClientError('404', 'HeadObject', 404),
+    ClientError('NoSuchKey', 'GetObject', 404),
+    ClientError('AccessDenied', 'GetObject', 403),
+    ClientError('PreconditionFailed', 'PutObject', 412),
+    ValueError('not an AWS error'),
+])
+def test_other_errors_are_raised_at_once(error):
+    limit = limiter()
+    fn = Flaky(error)
+    with pytest.raises(type(error)):
+        limit.call(fn)
+    assert fn.calls == 1
+    assert limit.snapshot()['retries'] == 0
+
+
+def test_async_calls_retry_the_same_classes():
+    limit = limiter()
+    errors = [ClientError('SlowDown', 'HeadObject', 503), EndpointConnectionError()]
+
+    async def flaky():
+        if errors:
+            raise errors.pop(0)
+        return 'ok'
+
+    assert asyncio.run(limit.call_async(flaky)) == 'ok'
+    assert limit.snapshot()['retries'] == 2
+
+    errors[:] = [ValueError()]
+    with pytest.raises(ValueError):
+        asyncio.run(limit.call_async(flaky))
+    assert limit.snapshot()['retries'] == 2
+
+
+def test_limited_client_proxies_calls_through_the_limiter():
+    class Client(object):
+        exceptions = object()
+
+        def __init__(self):
+            self.head_object = Flaky(ClientError('InternalError', 'HeadObject', 500))
+
+    raw = Client()
+    client = LimitedClient(raw, limiter())
+    assert client.head_object() == 'ok'
+    assert client.exceptions is raw.exceptions
+    assert raw.head_object.calls == 2
+
+
+def test_token_bucket_waits_for_tokens():
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(10, 2, clock=lambda: now[0], sleep=sleep)
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+    bucket.acquire()
+    assert slept == [pytest.approx(0.1)]
@@ -0,0 +1,48 @@
+import io
+import json
+import logging
+import types
+
+import pytest
+
+import tracing
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(tracing.JsonFormatter())
+    monkeypatch.setattr(tracing.logger, 'handlers', [handler])
+    level = tracing.logger.level
+    tracing.logger.setLevel(logging.INFO)
+    tracing.reset()
+    yield stream
+    tracing.reset()
+    tracing.logger.setLevel(level)
+
+
+def test_emit_logs_one_json_line(stream):
+    with tracing._Span('check_daily_files'):
+        pass
+    tracing.emit('lambda_handler', types.SimpleNamespace(aws_request_id='req-1'), 0.25)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record['record'] == 'slo_trace' and record['request_id'] == 'req-1'
+    assert record['total_ms'] == 250.0
+    assert record['phases']['check_daily_files']['count'] == 1
+    assert tracing.summary() == {'phases': {}, 'aws_calls': {}}
+
+
+def test_emit_follows_the_logger_level(stream):
+    tracing.logger.setLevel(logging.WARNING)
+    tracing.emit('lambda_handler', None, 0.1)
+    assert stream.getvalue() == ''
+
+
+def test_default_handler_writes_bare_json():
+    assert not tracing.logger.propagate
+    formatter = tracing.logger.handlers[0].formatter
+    record = logging.LogRecord('slo.trace', logging.INFO, __file__, 1, 'plain %s', ('text',), None)
+    assert json.loads(formatter.format(record)) == {'message': 'plain text'}
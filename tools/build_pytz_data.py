@@ -0,0 +1,233 @@
+"""Regenerate the precomputed lookup tables shipped with the vendored pytz.
+
+Run this whenever python/pytz/zoneinfo is refreshed:
+
+    python tools/build_pytz_data.py
+
+Writes python/pytz/_zoneindex.py, which maps lower-cased zone names to
+their canonical spelling and link names (US/Eastern) to the zone they
+point at (America/New_York), so pytz.timezone() never has to walk
+all_timezones to resolve a name.
+
+Also writes python/pytz/_manifest.py, the zone lists and country tables
+behind all_timezones, common_timezones, country_timezones and
+country_names, so none of them stat or parse zoneinfo/ at runtime.
+
+Optionally packs the layer:
+
+    --blob PATH       all of zoneinfo/ in one file, for PYTZ_TZDATABLOB
+    --layer-zip PATH  the python/ tree as a Lambda layer (pytz_layer.zip)
+"""
+import argparse
+import hashlib
+import os
+import pprint
+import struct
+import sys
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PYTZ_DIR = os.path.join(ROOT, 'python', 'pytz')
+ZONEINFO_DIR = os.path.join(PYTZ_DIR, 'zoneinfo')
+
+# Placeholder zone shipped by tzdata that pytz has never exposed.
+EXCLUDED_ZONES = ('Factory',)
+
+# Legacy names pytz lists in common_timezones on top of zone.tab.
+EXTRA_COMMON_ZONES = (
+    'Canada/Atlantic', 'Canada/Central', 'Canada/Eastern',
+    'Canada/Mountain', 'Canada/Newfoundland', 'Canada/Pacific',
+    'GMT',
+    'US/Alaska', 'US/Arizona', 'US/Central', 'US/Eastern', 'US/Hawaii',
+    'US/Mountain', 'US/Pacific',
+    'UTC',
+)
+
+# Must match _BLOB_MAGIC/_BLOB_HEADER in python/pytz/__init__.py.
+BLOB_MAGIC = b'PYTZBLOB'
+BLOB_HEADER = '>8sI'
+
+HEADER = '''\
+# Generated by tools/build_pytz_data.py from the tzdata %(version)s files
+# in zoneinfo/. Do not edit by hand.
+'''
+
+
+def read_olson_version():
+    # Read OLSON_VERSION from pytz/__init__.py without importing pytz.
+    with open(os.path.join(PYTZ_DIR, '__init__.py')) as f:
+        for line in f:
+            if line.startswith('OLSON_VERSION'):
+                return line.split('=', 1)[1].strip().strip('\'"')
+    raise RuntimeError('OLSON_VERSION not found in pytz/__init__.py')
+
+
+def list_zone_files():
+    # Return the sorted names of every TZif file under zoneinfo/.
+    zones = []
+    for dirpath, dirnames, filenames in os.walk(ZONEINFO_DIR):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, 'rb') as f:
+                if f.read(4) != b'TZif':
+                    continue
+            zone = os.path.relpath(path, ZONEINFO_DIR).replace(os.sep, '/')
+            if zone not in EXCLUDED_ZONES:
+                zones.append(zone)
+    return sorted(zones)
+
+
+def read_zone_bytes(zone):
+    with open(os.path.join(ZONEINFO_DIR, *zone.split('/')), 'rb') as f:
+        return f.read()
+
+
+def build_zone_aliases(zones):
+    # Map link names to their target zone using the 'L' lines in tzdata.zi.
+    # Only links whose compiled file is byte-identical to the target are
+    # kept, so resolving through the alias can never change behaviour.
+    known = set(zones)
+    aliases = {}
+    with open(os.path.join(ZONEINFO_DIR, 'tzdata.zi')) as f:
+        for line in f:
+            if not line.startswith('L '):
+                continue
+            target, link = line.split()[1:3]
+            if target not in known or link not in known:
+                continue
+            if read_zone_bytes(target) == read_zone_bytes(link):
+                aliases[link] = target
+    return aliases
+
+
+def build_zone_index(zones):
+    return dict((zone.lower(), zone) for zone in zones)
+
+
+def read_tab(filename):
+    # Yield the whitespace-separated fields of each non-comment line.
+    with open(os.path.join(ZONEINFO_DIR, filename), encoding='utf-8') as f:
+        for line in f:
+            if not line.startswith('#'):
+                yield line.rstrip('\n').split('\t')
+
+
+def build_country_timezones(zones):
+    # Same grouping as pytz's runtime zone.tab parser, in file order.
+    known = set(zones)
+    country_timezones = {}
+    for fields in read_tab('zone.tab'):
+        code, zone = fields[0], fields[2]
+        if zone in known:
+            country_timezones.setdefault(code, []).append(zone)
+    return dict((code, tuple(tzs)) for code, tzs in country_timezones.items())
+
+
+def build_country_names():
+    return dict((fields[0], fields[1].strip()) for fields in read_tab('iso3166.tab'))
+
+
+def build_common_timezones(zones, country_timezones):
+    known = set(zones)
+    common = set(EXTRA_COMMON_ZONES)
+    for tzs in country_timezones.values():
+        common.update(tzs)
+    return tuple(sorted(tz for tz in common if tz in known))
+
+
+def write_module(filename, version, imports, values):
+    # Write a generated module of NAME = value assignments into pytz/.
+    path = os.path.join(PYTZ_DIR, filename)
+    with open(path, 'w') as f:
+        f.write(HEADER % {'version': version})
+        for line in imports:
+            f.write(line + '\n')
+        for name, value, wrapper in values:
+            body = pprint.pformat(value, indent=1, width=79)
+            if wrapper:
+                body = '%s(%s)' % (wrapper, body)
+            f.write('\n%s = %s\n' % (name, body))
+    return path
+
+
+def build_zoneinfo_blob(path):
+    # Pack every file under zoneinfo/ into one blob. Files with identical
+    # contents (links) share a single copy of the data.
+    index = []
+    chunks = []
+    offsets = {}
+    size = 0
+    for dirpath, dirnames, filenames in sorted(os.walk(ZONEINFO_DIR)):
+        for filename in sorted(filenames):
+            full_path = os.path.join(dirpath, filename)
+            name = os.path.relpath(full_path, ZONEINFO_DIR).replace(os.sep, '/')
+            with open(full_path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha1(data).digest()
+            if digest not in offsets:
+                offsets[digest] = size
+                chunks.append(data)
+                size += len(data)
+            index.append('%s %d %d' % (name, offsets[digest], len(data)))
+    index_data = '\n'.join(index).encode('ascii')
+    with open(path, 'wb') as f:
+        f.write(struct.pack(BLOB_HEADER, BLOB_MAGIC, len(index_data)))
+        f.write(index_data)
+        for data in chunks:
+            f.write(data)
+    return len(index), size
+
+
+def build_layer_zip(path):
+    # Zip python/ the way Lambda expects a layer: python/<package>/...
+    layer_dir = os.path.join(ROOT, 'python')
+    count = 0
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for dirpath, dirnames, filenames in os.walk(layer_dir):
+            dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+            for filename in sorted(filenames):
+                full_path = os.path.join(dirpath, filename)
+                zf.write(full_path, os.path.relpath(full_path, ROOT))
+                count += 1
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--blob', metavar='PATH')
+    parser.add_argument('--layer-zip', metavar='PATH')
+    args = parser.parse_args(argv)
+
+    version = read_olson_version()
+    zones = list_zone_files()
+
+    path = write_module('_zoneindex.py', version, [
+        'from types import MappingProxyType',
+    ], [
+        ('ZONE_INDEX', build_zone_index(zones), 'MappingProxyType'),
+        ('ZONE_ALIASES', build_zone_aliases(zones), 'MappingProxyType'),
+    ])
+    print('Wrote %s (%d zones)' % (path, len(zones)))
+
+    country_timezones = build_country_timezones(zones)
+    path = write_module('_manifest.py', version, [
+        'from types import MappingProxyType',
+    ], [
+        ('ALL_TIMEZONES', tuple(zones), None),
+        ('COMMON_TIMEZONES',
+         build_common_timezones(zones, country_timezones), None),
+        ('COUNTRY_TIMEZONES', country_timezones, 'MappingProxyType'),
+        ('COUNTRY_NAMES', build_country_names(), 'MappingProxyType'),
+    ])
+    print('Wrote %s' % path)
+
+    if args.blob:
+        files, size = build_zoneinfo_blob(args.blob)
+        print('Wrote %s (%d files, %d bytes of data)' % (args.blob, files, size))
+    if args.layer_zip:
+        count = build_layer_zip(args.layer_zip)
+        print('Wrote %s (%d files)' % (args.layer_zip, count))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Print per-feed SLO compliance from the compliance rollups.
+
+    python tools/compliance_report.py BUCKET [--key state/compliance.json]
+                                     [--month 2025-03] [--json]
+
+Reads the rollup object maintained by the checker (see compliance.py) and
+prints, per feed pattern, met/late/missing counts and the percentage that
+met the SLO over the rolling window and for one month (the latest by
+default). The least compliant feeds sort first. This replaces running
+Logs Insights over the "SLO met" log lines.
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import boto3  # noqa: E402
+
+from compliance import DEFAULT_COMPLIANCE_STATE_KEY, OUTCOMES, S3ComplianceState, compliance_ratio  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('bucket')
+    parser.add_argument('--key', default=DEFAULT_COMPLIANCE_STATE_KEY)
+    parser.add_argument('--month', help="YYYY-MM; defaults to the latest month in the rollup")
+    parser.add_argument('--json', action='store_true', help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    rollup = S3ComplianceState(boto3.client('s3'), args.bucket, args.key).load()
+    month = args.month or max(rollup.months, default=None)
+    rows = {}
+    for feed in rollup.feeds():
+        rows[feed] = {'rolling': rollup.rolling.get(feed, [0, 0, 0]),
+                      'month': rollup.months.get(month, {}).get(feed, [0, 0, 0])}
+    order = sorted(rows, key=lambda feed: (compliance_ratio(rows[feed]['rolling']) or 0, feed))
+
+    if args.json:
+        print(json.dumps({
+            'as_of': rollup.as_of, 'window_days': rollup.window, 'month': month,
+            'totals': {'rolling': dict(zip(OUTCOMES, rollup.totals())),
+                       'month': dict(zip(OUTCOMES, rollup.totals(month)))},
+            'feeds': {feed: {window: dict(zip(OUTCOMES, counts), compliance=compliance_ratio(counts))
+                             for window, counts in rows[feed].items()} for feed in order},
+        }, indent=2))
+        return
+
+    def cells(counts):
+        ratio = compliance_ratio(counts)
+        return f"{counts[0]:>5} {counts[1]:>5} {counts[2]:>5} {'-' if ratio is None else f'{ratio:.1f}%':>7}"
+
+    heading = f"{'met':>5} {'late':>5} {'miss':>5} {'SLO':>7}"
+    print(f"As of {rollup.as_of}: rolling {rollup.window} days | {month}")
+    print(f"{'feed':<40} {heading} | {heading}")
+    for feed in order:
+        print(f"{feed:<40} {cells(rows[feed]['rolling'])} | {cells(rows[feed]['month'])}")
+    print(f"{'all feeds':<40} {cells(rollup.totals())} | {cells(rollup.totals(month))}")
+
+
+if __name__ == '__main__':
+    main()
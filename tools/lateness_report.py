@@ -0,0 +1,55 @@
+"""Print per-feed arrival lateness percentiles from the lateness state.
+
+    python tools/lateness_report.py BUCKET [--key state/lateness.json]
+                                    [--quantiles 0.5 0.95 0.99] [--json]
+
+Reads the state object written by the checker (see lateness.py) and prints,
+per feed pattern, the number of arrivals recorded and the requested
+quantiles of their lateness in minutes (negative is early) and in business
+days. Feeds whose p99 is late sort first, so the feeds with the thinnest
+margin against their SLO are at the top.
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import boto3  # noqa: E402
+
+from lateness import DEFAULT_LATENESS_STATE_KEY, S3LatenessState  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('bucket')
+    parser.add_argument('--key', default=DEFAULT_LATENESS_STATE_KEY)
+    parser.add_argument('--quantiles', type=float, nargs='+', default=[0.5, 0.95, 0.99])
+    parser.add_argument('--json', action='store_true', help="print JSON instead of a table")
+    args = parser.parse_args()
+
+    feeds, _ = S3LatenessState(boto3.client('s3'), args.bucket, args.key).load()
+    summaries = {feed: lateness.summary(args.quantiles) for feed, lateness in feeds.items()}
+    last = f"p{args.quantiles[-1] * 100:g}_minutes"
+    order = sorted(summaries, key=lambda feed: -(summaries[feed][last] or 0))
+
+    if args.json:
+        print(json.dumps({'arrivals': sum(lateness.minutes.count for lateness in feeds.values()),
+                          'feeds': {feed: summaries[feed] for feed in order}}, indent=2))
+        return
+    columns = [f"p{q * 100:g}" for q in args.quantiles]
+    print(f"{'feed':<40} {'count':>6} " + ' '.join(f"{c + ' min':>10} {c + ' bd':>6}" for c in columns))
+    for feed in order:
+        summary = summaries[feed]
+        cells = []
+        for column in columns:
+            minutes = summary[f"{column}_minutes"]
+            days = summary[f"{column}_business_days"]
+            cells.append(f"{'-' if minutes is None else f'{minutes:.1f}':>10} {'-' if days is None else days:>6}")
+        print(f"{feed:<40} {summary['count']:>6} " + ' '.join(cells))
+
+
+if __name__ == '__main__':
+    main()
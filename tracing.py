@@ -0,0 +1,203 @@
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+# Lightweight per-invocation tracing for the SLO checker.
+#
+# Turned on per container with SLO_TRACE=1. When it is off, span() hands out
+# a shared no-op context manager, and traced(), traced_handler() and
+# instrument() return what they were given, so the hot path is unchanged.
+#
+#     @traced('business_days')
+#     def get_nth_business_day(...): ...
+#
+#     with span('check_monthly_files'):
+#         ...
+#
+#     s3 = instrument(boto3.client('s3'), 's3')   # times every API call
+#
+# A handler decorated with traced_handler() logs one JSON line per
+# invocation to the 'slo.trace' logger when it returns, which CloudWatch
+# Logs Insights can query:
+#
+#     {"record": "slo_trace", "handler": "lambda_handler", "request_id": "...",
+#      "total_ms": 812.4,
+#      "phases": {"load_json_from_s3": {"count": 2, "ms": 41.0}, ...},
+#      "aws_calls": {"s3.head_object": {"count": 9, "errors": 1, "ms": 230.7}, ...}}
+#
+#     filter record = "slo_trace" | stats avg(phases.check_daily_files.ms) by bin(1h)
+#
+# The logger writes bare JSON to stdout, without the Lambda runtime's
+# prefix, and does not propagate to the root logger. Its level, or the
+# root's when it has none, decides whether summaries are written; a
+# handler configured on it before this module is imported replaces the
+# default one.
+
+ENABLED = os.environ.get('SLO_TRACE', '').lower() in ('1', 'true', 'yes')
+
+logger = logging.getLogger('slo.trace')
+
+_lock = threading.Lock()
+_phases = defaultdict(lambda: [0, 0.0])
+_aws_calls = defaultdict(lambda: [0, 0, 0.0])
+
+
+class JsonFormatter(logging.Formatter):
+    # Formats a record whose message is a dict as that dict in one line of
+    # JSON, and any other record as {"message": ...}.
+
+    def format(self, record):
+        data = record.msg if isinstance(record.msg, dict) else {'message': record.getMessage()}
+        return json.dumps(data, separators=(',', ':'))
+
+
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(JsonFormatter())
+    logger.addHandler(_handler)
+    logger.propagate = False
+
+
+class _NoopSpan(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span(object):
+    # Adds its wall time to the named phase. Nested spans each count their
+    # own, inclusive, time.
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        with _lock:
+            phase = _phases[self.name]
+            phase[0] += 1
+            phase[1] += elapsed
+        return False
+
+
+def span(name):
+    # Context manager timing one phase.
+    if not ENABLED:
+        return _NOOP_SPAN
+    return _Span(name)
+
+
+def traced(name=None):
+    # Decorator timing every call of a function as phase name (default: the
+    # function's name).
+    def decorate(fn):
+        if not ENABLED:
+            return fn
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _Span(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class _InstrumentedClient(object):
+    # Proxy for a boto3 client timing each API method call.
+
+    def __init__(self, client, service):
+        self._client = client
+        self._service = service
+
+    def __getattr__(self, attr):
+        value = getattr(self._client, attr)
+        if attr.startswith('_') or attr in ('exceptions', 'meta') or not callable(value):
+            return value
+        key = f'{self._service}.{attr}'
+
+        @functools.wraps(value)
+        def call(*args, **kwargs):
+            start = time.perf_counter()
+            failed = 0
+            try:
+                return value(*args, **kwargs)
+            except Exception:
+                failed = 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                with _lock:
+                    stats = _aws_calls[key]
+                    stats[0] += 1
+                    stats[1] += failed
+                    stats[2] += elapsed
+        return call
+
+
+def instrument(client, service):
+    # Return client, wrapped so each API call is timed and counted.
+    if not ENABLED:
+        return client
+    return _InstrumentedClient(client, service)
+
+
+def reset():
+    with _lock:
+        _phases.clear()
+        _aws_calls.clear()
+
+
+def summary():
+    # Snapshot of the current invocation's phases and API calls.
+    with _lock:
+        return {
+            'phases': {name: {'count': count, 'ms': round(seconds * 1e3, 3)}
+                       for name, (count, seconds) in sorted(_phases.items())},
+            'aws_calls': {name: {'count': count, 'errors': errors, 'ms': round(seconds * 1e3, 3)}
+                          for name, (count, errors, seconds) in sorted(_aws_calls.items())},
+        }
+
+
+def emit(handler, context, total):
+    # Log the summary as one JSON line and start afresh.
+    record = {
+        'record': 'slo_trace',
+        'handler': handler,
+        'request_id': getattr(context, 'aws_request_id', None),
+        'total_ms': round(total * 1e3, 3),
+    }
+    record.update(summary())
+    reset()
+    logger.info(record)
+
+
+def traced_handler(fn):
+    # Decorator for Lambda handlers: trace one invocation and emit its summary.
+    if not ENABLED:
+        return fn
+
+    @functools.wraps(fn)
+    def handler(event, context):
+        reset()
+        start = time.perf_counter()
+        try:
+            return fn(event, context)
+        finally:
+            emit(fn.__name__, context, time.perf_counter() - start)
+    return handler